@@ -123,6 +123,7 @@ TCO_RANK_2_SCALER = 1.3
 TCO_RANK_1_SCALER = 1.1
 ABATEMENT_RANK_2 = 2.37656461606311  # Switching from Avg BF-BOF to BAT BF-BOF+CCUS
 ABATEMENT_RANK_3 = 0.932690243851946  # Switching from Avg BF-BOF to BAT BF-BOF_bio PCI
+RANKING_CACHE_MAX_ENTRIES = 5000
 
 # LEVELIZED COST PARAMETERS
 AVERAGE_CAPACITY_MT = 2.5
@@ -154,6 +155,25 @@ TRADE_PCT_BOUNDARY_FACTOR_DICT = {
     "Japan, South Korea, and Taiwan": 0,
 }
 
+# TRADE LP ENGINE PARAMETERS (multiples of the mean regional cost of steelmaking, per Mt)
+TRADE_LP_NEW_CAPACITY_COST_FACTOR = 1
+TRADE_LP_CLOSED_CAPACITY_COST_FACTOR = 1
+TRADE_LP_EXPORT_COST_FACTOR = 0.01
+
+# VALIDATION PARAMETERS
+# rebuild the capacity totals from the active plants every year and compare them to the running totals (slow)
+VALIDATE_CAPACITY_RUNNING_TOTALS = False
+
+# RANDOMNESS PARAMETERS
+MODEL_RANDOM_SEED = 0
+
+# SOLVER CHECKPOINT PARAMETERS
+SOLVER_CHECKPOINT_INTERVAL_YEARS = 0  # off by default, checkpoints are kept after the run
+
+# LOGGING PARAMETERS
+LOG_LEVEL = "DEBUG"
+BATCH_RUN_LOG_LEVEL = "WARNING"
+
 UNDERSCORE_NUMBER_REGEX = r"\_\d+"
 NUMBER_REGEX = r"\d+"
 
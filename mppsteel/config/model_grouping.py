@@ -23,7 +23,7 @@ from mppsteel.utility.file_handling_utility import (
     return_pkl_paths,
 )
 
-from mppsteel.utility.log_utility import get_logger
+from mppsteel.utility.log_utility import get_logger, set_log_run_name
 
 from mppsteel.data_load_and_format.data_import import load_import_data
 from mppsteel.data_load_and_format.reg_steel_demand_formatter import get_steel_demand
@@ -51,6 +51,7 @@ from mppsteel.data_preprocessing.total_opex_reference import (
 )
 from mppsteel.data_preprocessing.levelized_cost import generate_levelized_cost_results
 from mppsteel.model_solver.solver_flow import main_solver_flow
+from mppsteel.model_solver.solver_flow_helpers import return_unrecorded_files
 from mppsteel.data_preprocessing.tco_abatement_switch import (
     tco_presolver_reference,
     abatement_presolver_reference,
@@ -155,6 +156,7 @@ def add_currency_rates_to_scenarios(
 def data_preprocessing_scenarios(
     scenario_dict: MYPY_SCENARIO_TYPE, pkl_paths: MYPY_PKL_PATH_OPTIONAL = None
 ) -> None:
+    set_log_run_name(str(scenario_dict["scenario_name"]))
     get_steel_demand(scenario_dict=scenario_dict, pkl_paths=pkl_paths, serialize=True)
     generate_timeseries(
         scenario_dict=scenario_dict, pkl_paths=pkl_paths, serialize=True
@@ -190,6 +192,7 @@ def scenario_batch_run(
     include_outputs: bool = True,
 ) -> None:
     scenario_name = str(scenario_dict["scenario_name"])
+    set_log_run_name(scenario_name)
     # create new folders for path
     intermediate_path = get_scenario_pkl_path(
         scenario=scenario_name,
@@ -340,8 +343,10 @@ def model_outputs_phase(
     for pkl_file in FORMATTED_PKL_FILES:
         pickle_to_csv(save_path, PKL_DATA_FORMATTED, pkl_file, reset_index=True)
     # Save Intermediate Pickle Files
+    unrecorded_files = return_unrecorded_files(scenario_dict)
     for pkl_file in INTERMEDIATE_RESULT_PKL_FILES:
-        pickle_to_csv(save_path, intermediate_path, pkl_file)
+        if pkl_file not in unrecorded_files:
+            pickle_to_csv(save_path, intermediate_path, pkl_file)
     # Save Final Pickle Files
     for pkl_file in FINAL_RESULT_PKL_FILES:
         pickle_to_csv(save_path, final_path, pkl_file)
@@ -453,6 +458,7 @@ def core_run_function(
         model_run (str): The number of the scenario run.
         pkl_paths (Union[dict, None], optional): The path where the multiple runs will be stored. Defaults to None.
     """
+    set_log_run_name(str(scenario_dict["scenario_name"]), model_run)
     # Create folders where the multiple runs will be saved.
     generate_files_to_path_dict(
         scenarios=[
@@ -1,6 +1,12 @@
 """Scenario references for model runs"""
 
 from typing import Dict, List, MutableMapping, Sequence, Tuple, Union
+from mppsteel.config.model_config import (
+    MODEL_RANDOM_SEED,
+    MODEL_YEAR_END,
+    MODEL_YEAR_START,
+    SOLVER_CHECKPOINT_INTERVAL_YEARS,
+)
 from mppsteel.config.mypy_config_settings import (
     MYPY_SCENARIO_SETTINGS_DICT,
     MYPY_SCENARIO_SETTINGS_SEQUENCE,
@@ -61,6 +67,20 @@ SOLVER_LOGICS: MYPY_STR_DICT = {
     "bins": "scaled_bins",
 }
 
+# The solver audit records kept by each recording mode
+RECORDING_MODES: Dict[str, Dict[str, bool]] = {
+    "full": {"choice_records": True, "rank_records": True, "material_records": True},
+    "summary": {
+        "choice_records": True,
+        "rank_records": False,
+        "material_records": False,
+    },
+    "off": {"choice_records": False, "rank_records": False, "material_records": False},
+}
+
+# The engines that can balance trade: the regional cascade (trade_flow) or a linear program (trade_flow_lp)
+TRADE_ENGINES: MYPY_STR_DICT = {"cascade": "cascade", "lp": "lp"}
+
 SCENARIO_SETTINGS: MYPY_SCENARIO_SETTINGS_SEQUENCE = {
     "tech_moratorium": [True, False],
     "enforce_constraints": [True, False],
@@ -81,6 +101,10 @@ SCENARIO_SETTINGS: MYPY_SCENARIO_SETTINGS_SEQUENCE = {
     "regional_scrap_constraint": [True, False],
     "investment_cycle_randomness": [True, False],
     "start_year_randomness": [True, False],
+    "recording_mode": list(RECORDING_MODES.keys()),
+    "trade_engine": list(TRADE_ENGINES.keys()),
+    "checkpoint_interval": range(0, MODEL_YEAR_END - MODEL_YEAR_START + 1),
+    "random_seed": range(0, 2**32),
 }
 
 ## RECCOMMENDED TO RUN MODEL WITH green_premium_scenario SWITCHED OFF AS THIS FEATURE IS NOT FULLY TESTED.
@@ -106,6 +130,10 @@ DEFAULT_SCENARIO: MYPY_SCENARIO_TYPE = {
     "regional_scrap_constraint": True,  # bool
     "investment_cycle_randomness": False,  # bool
     "start_year_randomness": False,  # bool
+    "recording_mode": "full",  # full / summary / off
+    "trade_engine": "cascade",  # cascade / lp
+    "checkpoint_interval": SOLVER_CHECKPOINT_INTERVAL_YEARS,  # years between solver checkpoints (0 is off)
+    "random_seed": MODEL_RANDOM_SEED,  # seed of the random streams of the model
 }
 TECH_MORATORIUM: MYPY_SCENARIO_TYPE = {
     "scenario_name": "tech_moratorium",
@@ -128,6 +156,10 @@ TECH_MORATORIUM: MYPY_SCENARIO_TYPE = {
     "regional_scrap_constraint": True,
     "investment_cycle_randomness": False,
     "start_year_randomness": False,
+    "recording_mode": "full",
+    "trade_engine": "cascade",
+    "checkpoint_interval": SOLVER_CHECKPOINT_INTERVAL_YEARS,
+    "random_seed": MODEL_RANDOM_SEED,
 }
 CARBON_COST: MYPY_SCENARIO_TYPE = {
     "scenario_name": "carbon_cost",
@@ -150,6 +182,10 @@ CARBON_COST: MYPY_SCENARIO_TYPE = {
     "regional_scrap_constraint": True,
     "investment_cycle_randomness": False,
     "start_year_randomness": False,
+    "recording_mode": "full",
+    "trade_engine": "cascade",
+    "checkpoint_interval": SOLVER_CHECKPOINT_INTERVAL_YEARS,
+    "random_seed": MODEL_RANDOM_SEED,
 }
 BAU_SCENARIO: MYPY_SCENARIO_TYPE = {
     "scenario_name": "baseline",
@@ -172,6 +208,10 @@ BAU_SCENARIO: MYPY_SCENARIO_TYPE = {
     "regional_scrap_constraint": True,
     "investment_cycle_randomness": False,
     "start_year_randomness": False,
+    "recording_mode": "full",
+    "trade_engine": "cascade",
+    "checkpoint_interval": SOLVER_CHECKPOINT_INTERVAL_YEARS,
+    "random_seed": MODEL_RANDOM_SEED,
 }
 BAU_HIGH_CIRC_SCENARIO: MYPY_SCENARIO_TYPE = {
     "scenario_name": "baseline_high_circ",
@@ -194,6 +234,10 @@ BAU_HIGH_CIRC_SCENARIO: MYPY_SCENARIO_TYPE = {
     "regional_scrap_constraint": True,
     "investment_cycle_randomness": False,
     "start_year_randomness": False,
+    "recording_mode": "full",
+    "trade_engine": "cascade",
+    "checkpoint_interval": SOLVER_CHECKPOINT_INTERVAL_YEARS,
+    "random_seed": MODEL_RANDOM_SEED,
 }
 ABATEMENT_SCENARIO: MYPY_SCENARIO_TYPE = {
     "scenario_name": "abatement",
@@ -216,6 +260,10 @@ ABATEMENT_SCENARIO: MYPY_SCENARIO_TYPE = {
     "regional_scrap_constraint": True,
     "investment_cycle_randomness": False,
     "start_year_randomness": False,
+    "recording_mode": "full",
+    "trade_engine": "cascade",
+    "checkpoint_interval": SOLVER_CHECKPOINT_INTERVAL_YEARS,
+    "random_seed": MODEL_RANDOM_SEED,
 }
 ABATEMENT_HIGH_CIRC_SCENARIO: MYPY_SCENARIO_TYPE = {
     "scenario_name": "fastest_abatement",
@@ -238,6 +286,10 @@ ABATEMENT_HIGH_CIRC_SCENARIO: MYPY_SCENARIO_TYPE = {
     "regional_scrap_constraint": True,
     "investment_cycle_randomness": False,
     "start_year_randomness": False,
+    "recording_mode": "full",
+    "trade_engine": "cascade",
+    "checkpoint_interval": SOLVER_CHECKPOINT_INTERVAL_YEARS,
+    "random_seed": MODEL_RANDOM_SEED,
 }
 
 SCENARIO_OPTIONS: Dict[str, MYPY_SCENARIO_TYPE] = {
@@ -42,7 +42,7 @@ from mppsteel.model_results.cost_of_steelmaking import (
 from mppsteel.model_results.global_metaresults import metaresults_flow
 from mppsteel.model_results.investments import investment_results
 from mppsteel.config.mypy_config_settings import MYPY_SCENARIO_TYPE
-from mppsteel.utility.function_timer_utility import TIME_CONTAINER
+from mppsteel.utility.function_timer_utility import SPAN_PROFILER, TIME_CONTAINER
 from mppsteel.utility.file_handling_utility import (
     create_folders_if_nonexistant,
     get_scenario_pkl_path,
@@ -62,13 +62,15 @@ from mppsteel.config.model_scenarios import (
     MAIN_SCENARIO_RUNS,
     DEFAULT_SCENARIO,
     SCENARIO_SETTINGS,
+    RECORDING_MODES,
+    TRADE_ENGINES,
     SCENARIO_OPTIONS,
     ABATEMENT_SCENARIO,
     BAU_SCENARIO,
     CARBON_COST,
     TECH_MORATORIUM,
 )
-from mppsteel.utility.log_utility import get_logger
+from mppsteel.utility.log_utility import LOG_LEVELS, LOG_PIPELINE, get_logger
 
 logger = get_logger(__name__)
 
@@ -81,6 +83,7 @@ class ModelStateControl:
 
     def initialize_args(self, args, timestamp: str, create_folder: bool = True) -> None:
         self.scenario_dict = DEFAULT_SCENARIO
+        self.scenario_overrides = {}
         self.number_of_runs = DEFAULT_NUMBER_OF_RUNS
         self.timestamp = timestamp
         self.initial_args_management(args)
@@ -108,6 +111,18 @@ class ModelStateControl:
         )
 
     def initial_args_management(self, args) -> None:
+        log_level_settings = {"log_level": "level", "batch_log_level": "batch_level"}
+        for log_level_arg, log_level_setting in log_level_settings.items():
+            log_level = getattr(args, log_level_arg)
+            if log_level:
+                if log_level.upper() in LOG_LEVELS:
+                    LOG_PIPELINE.configure(**{log_level_setting: log_level})
+                else:
+                    logger.warning(
+                        "INVALID LOG LEVEL INPUT: %s, please choose from %s",
+                        log_level,
+                        LOG_LEVELS,
+                    )
         logger.info("""Establishing base args...""")
         # Manage localhost app for modin operations
         if (
@@ -123,14 +138,16 @@ class ModelStateControl:
 
         if args.choose_scenario:
             if args.choose_scenario in SCENARIO_OPTIONS.keys():
-                logger.info(f"CORRECT SCENARIO CHOSEN: {args.choose_scenario}")
+                logger.info("CORRECT SCENARIO CHOSEN: %s", args.choose_scenario)
                 scenario_dict = SCENARIO_OPTIONS[args.choose_scenario]
                 self.scenario_dict = scenario_dict
                 self.scenario_name = str(scenario_dict["scenario_name"])
             else:
                 scenario_name_options = list(SCENARIO_OPTIONS.keys())
-                logger.info(
-                    f"INVALID SCENARIO INPUT: {args.choose_scenario}, please choose from {scenario_name_options}"
+                logger.warning(
+                    "INVALID SCENARIO INPUT: %s, please choose from %s",
+                    args.choose_scenario,
+                    scenario_name_options,
                 )
 
         if args.custom_scenario:
@@ -141,14 +158,80 @@ class ModelStateControl:
             self.scenario_dict = scenario_dict
             self.scenario_name = str(scenario_dict["scenario_name"])
 
+        self.scenario_overrides = self.return_scenario_overrides(args)
+        if self.scenario_overrides:
+            self.scenario_dict = {**self.scenario_dict, **self.scenario_overrides}
+
         self.scenario_dict = add_currency_rates_to_scenarios(self.scenario_dict)
         self.set_scenario_name()
         self.set_path()
 
+        if args.profile_spans:
+            logger.info(
+                "Recording timing spans (worker processes write theirs to %s)",
+                self.paths["intermediate_path"],
+            )
+            SPAN_PROFILER.enable(worker_folder=self.paths["intermediate_path"])
+
+    def return_scenario_overrides(self, args) -> MYPY_SCENARIO_TYPE:
+        """Returns the scenario settings that are set from the command line. They are applied to the scenario of the run and to the base scenario of a warm start.
+
+        Args:
+            args: The parsed command line arguments.
+
+        Returns:
+            MYPY_SCENARIO_TYPE: The valid scenario settings entered on the command line.
+        """
+        scenario_overrides = {}
+        if args.recording_mode:
+            if args.recording_mode in RECORDING_MODES:
+                logger.info("Solver recording mode: %s", args.recording_mode)
+                scenario_overrides["recording_mode"] = args.recording_mode
+            else:
+                logger.warning(
+                    "INVALID RECORDING MODE INPUT: %s, please choose from %s",
+                    args.recording_mode,
+                    list(RECORDING_MODES.keys()),
+                )
+
+        if args.trade_engine:
+            if args.trade_engine in TRADE_ENGINES:
+                logger.info("Trade engine: %s", args.trade_engine)
+                scenario_overrides["trade_engine"] = args.trade_engine
+            else:
+                logger.warning(
+                    "INVALID TRADE ENGINE INPUT: %s, please choose from %s",
+                    args.trade_engine,
+                    list(TRADE_ENGINES.keys()),
+                )
+
+        if args.checkpoint_interval:
+            if args.checkpoint_interval.isdigit():
+                logger.info("Solver checkpoint interval: %s", args.checkpoint_interval)
+                scenario_overrides["checkpoint_interval"] = int(
+                    args.checkpoint_interval
+                )
+            else:
+                logger.warning(
+                    "INVALID CHECKPOINT INTERVAL INPUT: %s, please enter a whole number of years",
+                    args.checkpoint_interval,
+                )
+
+        if args.random_seed:
+            if args.random_seed.isdigit():
+                logger.info("Random seed: %s", args.random_seed)
+                scenario_overrides["random_seed"] = int(args.random_seed)
+            else:
+                logger.warning(
+                    "INVALID RANDOM SEED INPUT: %s, please enter a whole number",
+                    args.random_seed,
+                )
+        return scenario_overrides
+
     def parse_multiprocessing_scenarios(self, args) -> None:
         logger.info("""Parsing args for multiprocessing scenario runs...""")
         if args.main_scenarios:
-            logger.info(f"Running {MAIN_SCENARIO_RUNS} scenario options")
+            logger.info("Running %s scenario options", MAIN_SCENARIO_RUNS)
             full_multiple_run_flow(
                 scenario_name=self.scenario_name,
                 main_scenario_runs=MAIN_SCENARIO_RUNS,
@@ -157,7 +240,9 @@ class ModelStateControl:
 
         if args.multi_run_multi_scenario:
             logger.info(
-                f"Running {MAIN_SCENARIO_RUNS} scenario options, {self.number_of_runs} times"
+                "Running %s scenario options, %s times",
+                MAIN_SCENARIO_RUNS,
+                self.number_of_runs,
             )
             multi_run_multi_scenario(
                 main_scenario_runs=MAIN_SCENARIO_RUNS,
@@ -167,7 +252,9 @@ class ModelStateControl:
 
         if args.model_iterations_run:
             logger.info(
-                f"Running {BATCH_ITERATION_SCENARIOS} scenarios, by iterating the following scenarios {SCENARIO_SETTINGS_TO_ITERATE}"
+                "Running %s scenarios, by iterating the following scenarios %s",
+                BATCH_ITERATION_SCENARIOS,
+                SCENARIO_SETTINGS_TO_ITERATE,
             )
             full_model_iteration_run(
                 batch_iteration_scenarios=BATCH_ITERATION_SCENARIOS,
@@ -212,6 +299,31 @@ class ModelStateControl:
         if args.solver:
             main_solver_flow(scenario_dict=self.scenario_dict, serialize=True)
 
+        if args.resume:
+            main_solver_flow(
+                scenario_dict=self.scenario_dict, serialize=True, resume=True
+            )
+
+        if args.warm_start:
+            if args.warm_start in SCENARIO_OPTIONS.keys():
+                logger.info("Warm-starting the solver from %s", args.warm_start)
+                main_solver_flow(
+                    scenario_dict=self.scenario_dict,
+                    serialize=True,
+                    warm_start_scenario=add_currency_rates_to_scenarios(
+                        {
+                            **SCENARIO_OPTIONS[args.warm_start],
+                            **self.scenario_overrides,
+                        }
+                    ),
+                )
+            else:
+                logger.warning(
+                    "INVALID WARM START SCENARIO INPUT: %s, please choose from %s",
+                    args.warm_start,
+                    list(SCENARIO_OPTIONS.keys()),
+                )
+
         if args.output:
             outputs_only(
                 scenario_dict=self.scenario_dict,
@@ -313,6 +425,13 @@ class ModelStateControl:
 
         time_container = TIME_CONTAINER.return_time_container()
         logger.info(time_container)
+        if SPAN_PROFILER.enabled:
+            logger.info(
+                "Writing %s timing spans to %s",
+                len(SPAN_PROFILER.records),
+                self.paths["intermediate_path"],
+            )
+            SPAN_PROFILER.export_spans(self.paths["intermediate_path"])
 
     def parse_runtime_args(self, args) -> None:
         self.parse_multiprocessing_scenarios(args)
@@ -527,6 +527,13 @@ INTERMEDIATE_RESULT_PKL_FILES = [
     "tech_rank_records",
 ]
 
+# The solver records (see RECORDING_MODES) and the files they are serialized to
+SOLVER_RECORD_PKL_FILES = {
+    "choice_records": "tech_choice_records",
+    "rank_records": "tech_rank_records",
+    "material_records": "material_usage_results",
+}
+
 FINAL_RESULT_PKL_FILES = [
     "production_resource_usage",
     "production_emissions",
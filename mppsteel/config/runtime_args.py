@@ -34,11 +34,56 @@ parser.add_argument(
     action="store",
     help="The number of runs that the model should run for a multi-model run",
 )
+parser.add_argument(
+    "--recording_mode",
+    action="store",
+    help="Sets how much the solver records: full, summary (no rank or material usage records) or off",
+)
+parser.add_argument(
+    "--trade_engine",
+    action="store",
+    help="Sets the engine that balances trade: cascade (regional trade rules) or lp (a linear program over all regions)",
+)
+parser.add_argument(
+    "--checkpoint_interval",
+    action="store",
+    help="The number of years between solver checkpoints (0 switches checkpoints off)",
+)
+parser.add_argument(
+    "--log_level",
+    action="store",
+    help="Sets the level of the model's log: DEBUG, INFO, WARNING, ERROR or CRITICAL",
+)
+parser.add_argument(
+    "--batch_log_level",
+    action="store",
+    help="Sets the (quieter) log level of the worker processes of multiprocessing runs",
+)
+parser.add_argument(
+    "--profile_spans",
+    action="store_true",
+    help="Records timing spans of the model (e.g. the phases of each solver year) and writes them as a Chrome trace and a CSV summary to the intermediate folder (one set of files per worker process for multiprocessing runs)",
+)
+parser.add_argument(
+    "--random_seed",
+    action="store",
+    help="The seed of the random streams of the model (runs with the same seed make the same random choices)",
+)
 
 ### THESE ARGUMENTS ARE FOR DEVELOPMENT PRUPORSES: RUNNING SECTIONS OF THE MODEL IN ISOLATION
 parser.add_argument(
     "-s", "--solver", action="store_true", help="Runs the solver scripts directly"
 )  # main_solver_flow
+parser.add_argument(
+    "--resume",
+    action="store_true",
+    help="Continues the solver from its last checkpoint and serializes the outputs",
+)  # main_solver_flow(resume=True)
+parser.add_argument(
+    "--warm_start",
+    action="store",
+    help="Runs the solver from the checkpoints of a base scenario (specified by name), skipping the years before the scenarios diverge",
+)  # main_solver_flow(warm_start_scenario=...)
 parser.add_argument(
     "-p",
     "--preprocessing",
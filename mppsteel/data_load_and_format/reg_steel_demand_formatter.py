@@ -1,7 +1,8 @@
 """Formats Regional Steel Demand and defines getter function"""
 
 import itertools
-from typing import Union
+from typing import Sequence, Union
+import numpy as np
 import pandas as pd
 import pandera as pa
 
@@ -35,6 +36,11 @@ RMI_MATCHER = {
     "World": ["RoW"],
 }
 
+STEEL_DEMAND_METRIC_MAPPER = {
+    "crude": "Crude steel demand",
+    "scrap": "Scrap availability",
+}
+
 
 def steel_demand_region_assignor(
     region: str, country_ref: pd.DataFrame, rmi_matcher: dict
@@ -269,14 +275,178 @@ def steel_demand_getter(
             columns=["year", "region", "value", "country_code", "metric"],
         ).set_index(["year", "metric"])
 
-    metric_mapper = {
-        "crude": "Crude steel demand",
-        "scrap": "Scrap availability",
-    }
     df_c = df_c.xs(
-        key=(year, metric_mapper[metric]),
+        key=(year, STEEL_DEMAND_METRIC_MAPPER[metric]),
         level=["year", "metric"],
     )
     df_c.reset_index(drop=True, inplace=True)
     # Return the value figure
     return df_c.value.values[0]
+
+
+class SteelDemandIndex:
+    """Description
+    Class for constant time lookups of the regional steel demand data.
+
+    Important Points
+    1) The index is built once per scenario from the preprocessed Regional Steel Demand DataFrame and replaces repeated `steel_demand_getter` calls, which scan the whole DataFrame on every lookup.
+    2) Lookups follow the same rules as `steel_demand_getter`: exactly one of `region` or `country_code` must be entered, and invalid entries revert to the default region or country when `force_default` is True.
+    3) A country code is mapped to the first region that lists it.
+
+    Main Class Attributes
+        values (np.ndarray): A dense array of demand values with the dimensions [year, metric, region]. Missing entries are NaN.
+        year_index, metric_index, region_index (dict): The positions of each year, metric and region in `values`.
+        country_regions (dict): The region that each country code is mapped to.
+    """
+
+    def __init__(self, steel_demand_df: pd.DataFrame):
+        demand_df = steel_demand_df.reset_index().drop_duplicates(
+            ["year", "metric", "region"], keep="first"
+        )
+        self.year_index = {
+            year: idx for idx, year in enumerate(sorted(demand_df["year"].unique()))
+        }
+        self.metric_index = {
+            metric: idx for idx, metric in enumerate(demand_df["metric"].unique())
+        }
+        self.region_index = {
+            region: idx for idx, region in enumerate(demand_df["region"].unique())
+        }
+        self.values = np.full(
+            (len(self.year_index), len(self.metric_index), len(self.region_index)),
+            np.nan,
+        )
+        self.values[
+            demand_df["year"].map(self.year_index).values,
+            demand_df["metric"].map(self.metric_index).values,
+            demand_df["region"].map(self.region_index).values,
+        ] = demand_df["value"].values
+        self.country_regions: dict = {}
+        for region, country_codes in zip(
+            demand_df["region"], demand_df["country_code"]
+        ):
+            if isinstance(country_codes, str):
+                country_codes = [country_codes]
+            elif not isinstance(country_codes, (list, tuple, np.ndarray)):
+                continue
+            for country_code in country_codes:
+                self.country_regions.setdefault(country_code, region)
+
+    def return_regions(self) -> list:
+        return list(self.region_index.keys())
+
+    def resolve_region(
+        self,
+        region: str = "",
+        country_code: str = "",
+        force_default: bool = True,
+        default_region: str = "RoW",
+        default_country: str = "GBL",
+    ) -> str:
+        if region and region not in self.region_index:
+            if not force_default:
+                raise AttributeError(
+                    f"You entered an incorrect region. Valid entries here: {self.return_regions()}."
+                )
+            logger.warning(
+                "Invalid region string entered: %s. Reverting to default region: %s. Valid entries here: %s.",
+                region,
+                default_region,
+                self.return_regions(),
+            )
+            region = default_region
+        if country_code:
+            if country_code not in self.country_regions:
+                if not force_default:
+                    raise AttributeError(
+                        f"You entered an incorrect country_code. Valid entries here: {list(self.country_regions.keys())}."
+                    )
+                logger.warning(
+                    "Invalid country string entered: %s. Reverting to default country_code: %s.",
+                    country_code,
+                    default_country,
+                )
+                country_code = default_country
+            region = self.country_regions.get(country_code, "")
+        return region
+
+    def get_steel_demand(
+        self,
+        year: int,
+        metric: str,
+        region: str = "",
+        country_code: str = "",
+        force_default: bool = True,
+        default_region: str = "RoW",
+        default_country: str = "GBL",
+    ) -> float:
+        """A getter method for the regional steel demand data.
+
+        Args:
+            year (int): The year of the demand data you want.
+            metric (str): The metric you want to access (crude or scrap).
+            region (str, optional): The region you want to get the data for. Either region OR country_code should be entered, not both. Defaults to "".
+            country_code (str, optional): The country code you want to get the data for. Either region OR country_code should be entered, not both. Defaults to "".
+            force_default (bool): If True, will defer to defaults if incorrect region or country codes are entered. If False, invalid entries will raise an error. Defaults to True.
+            default_region (str, optional): The default region you want to get the data for. Defaults to "RoW".
+            default_country (str, optional): The default country you want to get the data for. Defaults to "GBL" for global.
+
+        Raises:
+            AttributeError: If neither or both of `region` and `country_code` are entered, or if an invalid entry is entered and `force_default` is False.
+            KeyError: If there is no demand data for the year and metric of the region.
+
+        Returns:
+            float: The demand value for the inputted data. Zero if neither the entry nor the default have demand data.
+        """
+        if not region and not country_code:
+            raise AttributeError(
+                "Neither `region` or `country_code` attributes were entered. Enter a valid option for one."
+            )
+        if region and country_code:
+            raise AttributeError(
+                "You entered both region and country_code attributes were entered. Enter a valid option for one."
+            )
+
+        region = self.resolve_region(
+            region, country_code, force_default, default_region, default_country
+        )
+        if region not in self.region_index:
+            return np.float64(0)
+        value = self.values[
+            self.year_index[year],
+            self.metric_index[STEEL_DEMAND_METRIC_MAPPER[metric]],
+            self.region_index[region],
+        ]
+        if np.isnan(value):
+            raise KeyError(f"No {metric} demand data for {region} in {year}")
+        return value
+
+    def get_steel_demand_values(
+        self, years: Sequence[int], metric: str, regions: Sequence[str]
+    ) -> np.ndarray:
+        """Returns the demand of several years and regions at once, with the same rules as `get_steel_demand`.
+
+        Args:
+            years (Sequence[int]): The years of the demand data you want.
+            metric (str): The metric you want to access (crude or scrap).
+            regions (Sequence[str]): The regions you want to get the data for.
+
+        Raises:
+            KeyError: If there is no demand data for one of the years and regions.
+
+        Returns:
+            np.ndarray: The demand values with the dimensions [year, region].
+        """
+        region_positions = [
+            self.region_index.get(self.resolve_region(region), -1) for region in regions
+        ]
+        year_values = self.values[
+            [self.year_index[year] for year in years],
+            self.metric_index[STEEL_DEMAND_METRIC_MAPPER[metric]],
+        ]
+        demand_values = np.where(
+            np.array(region_positions) >= 0, year_values[:, region_positions], 0
+        )
+        if np.isnan(demand_values).any():
+            raise KeyError(f"Missing {metric} demand data for {years} and {regions}")
+        return demand_values
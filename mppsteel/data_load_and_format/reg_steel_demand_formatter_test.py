@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from mppsteel.data_load_and_format.reg_steel_demand_formatter import (
+    SteelDemandIndex,
+    steel_demand_getter,
+)
+
+
+def create_steel_demand_df() -> pd.DataFrame:
+    region_countries = {
+        "Europe": ["DEU", "FRA"],
+        "Japan, South Korea, and Taiwan": ["JPN", "KOR", "TWN"],
+        "RoW": ["GBL"],
+        "World": ["RoW"],
+    }
+    rows = [
+        [year, metric, region, country_codes, (year - 2019) * (idx + 1) * factor]
+        for year in [2020, 2021, 2022]
+        for metric, factor in [("Crude steel demand", 10), ("Scrap availability", 3)]
+        for idx, (region, country_codes) in enumerate(region_countries.items())
+    ]
+    return pd.DataFrame(
+        rows, columns=["year", "metric", "region", "country_code", "value"]
+    ).set_index(["year", "metric"])
+
+
+def test_steel_demand_index_matches_getter():
+    steel_demand_df = create_steel_demand_df()
+    steel_demand_index = SteelDemandIndex(steel_demand_df)
+    for year in [2020, 2021, 2022]:
+        for metric in ["crude", "scrap"]:
+            for region in ["Europe", "World", "Not a region"]:
+                assert steel_demand_index.get_steel_demand(
+                    year, metric, region=region
+                ) == steel_demand_getter(steel_demand_df, year, metric, region=region)
+            assert steel_demand_index.get_steel_demand(
+                year, metric, country_code="KOR"
+            ) == steel_demand_getter(
+                steel_demand_df,
+                year,
+                metric,
+                region="Japan, South Korea, and Taiwan",
+            )
+            assert steel_demand_index.get_steel_demand(
+                year, metric, country_code="XXX"
+            ) == steel_demand_getter(steel_demand_df, year, metric, region="RoW")
+    with pytest.raises(AttributeError):
+        steel_demand_index.get_steel_demand(2020, "crude")
+    with pytest.raises(AttributeError):
+        steel_demand_index.get_steel_demand(
+            2020, "crude", region="Not a region", force_default=False
+        )
+    with pytest.raises(KeyError):
+        steel_demand_index.get_steel_demand(2030, "crude", region="Europe")
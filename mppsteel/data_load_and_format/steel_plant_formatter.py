@@ -1,5 +1,7 @@
 """Function to create a steel plant class."""
-import random
+from typing import Union
+
+import numpy as np
 import pandas as pd
 
 from tqdm.auto import tqdm as tqdma
@@ -18,6 +20,11 @@ from mppsteel.utility.file_handling_utility import (
     serialize_file,
 )
 from mppsteel.utility.log_utility import get_logger
+from mppsteel.utility.random_utility import (
+    RandomStreams,
+    random_range,
+    return_scenario_random_streams,
+)
 from mppsteel.config.model_config import (
     IMPORT_DATA_PATH,
     MODEL_YEAR_START,
@@ -30,6 +37,8 @@ from mppsteel.config.model_config import (
 
 logger = get_logger(__name__)
 
+ACTIVE_PLANT_STATUSES = ["operating", "new model plant"]
+
 NEW_COLUMN_NAMES = [
     "plant_id",
     "plant_name",
@@ -237,20 +246,25 @@ def convert_start_year(
     row,
     steel_plant_start_year_assignor: PlantStartYearAssignor,
     start_year_randomness: bool = False,
+    random_streams: Union[RandomStreams, None] = None,
 ) -> int:
     """Converts a string or int year value to an int year value.
     If the initial year value is the value `unknown`, return a integer within a range set by configurable parameters.
 
     Args:
         year_value (str): A variable containing the initial year value.
+        random_streams (Union[RandomStreams, None], optional): The random streams to draw random start years from, keyed by plant id. The global `random` module is used if None. Defaults to None.
 
     Returns:
         int: An integer containing the year value.
     """
     if row.start_of_operation == "unknown":
         if start_year_randomness:
-            return random.randrange(
-                STEEL_PLANT_EARLIEST_START_DATE, STEEL_PLANT_LATEST_START_DATE, 1
+            return random_range(
+                STEEL_PLANT_EARLIEST_START_DATE,
+                STEEL_PLANT_LATEST_START_DATE,
+                random_streams,
+                ("start_year", row.plant_id),
             )
         return steel_plant_start_year_assignor.return_start_year()
     return int(row.start_of_operation)
@@ -267,11 +281,27 @@ def create_active_check_col(row: pd.Series, year: int) -> bool:
         bool: A boolean value depending on the logic check.
     """
     return (
-        row.status in ["operating", "new model plant"]
+        row.status in ACTIVE_PLANT_STATUSES
         and row.start_of_operation <= year
     )
 
 
+def create_active_check_mask(steel_plant_df: pd.DataFrame, year: int) -> np.ndarray:
+    """Vectorized version of `create_active_check_col` that checks every plant in a steel plant DataFrame at once.
+
+    Args:
+        steel_plant_df (pd.DataFrame): The steel plant DataFrame.
+        year (int): The current year to check against the start_of_operation column.
+
+    Returns:
+        np.ndarray: A boolean array with one value per row of `steel_plant_df`.
+    """
+    return (
+        steel_plant_df["status"].isin(ACTIVE_PLANT_STATUSES).to_numpy()
+        & (steel_plant_df["start_of_operation"] <= year).to_numpy()
+    )
+
+
 @timer_func
 def steel_plant_processor(
     scenario_dict: dict, serialize: bool = False, from_csv: bool = False
@@ -303,11 +333,14 @@ def steel_plant_processor(
         convert_start_year,
         start_year_randomness=start_year_randomness,
         steel_plant_start_year_assignor=steel_plant_start_year_assignor,
+        random_streams=return_scenario_random_streams(scenario_dict).child(
+            "steel_plants"
+        ),
         axis=1,
     )
     steel_plants["end_of_operation"] = ""
-    steel_plants["active_check"] = steel_plants.apply(
-        create_active_check_col, year=MODEL_YEAR_START, axis=1
+    steel_plants["active_check"] = create_active_check_mask(
+        steel_plants, MODEL_YEAR_START
     )
     if serialize:
         serialize_file(steel_plants, PKL_DATA_FORMATTED, "steel_plants_processed")
@@ -10,6 +10,7 @@ from mppsteel.config.model_config import (
 from mppsteel.utility.function_timer_utility import timer_func
 from mppsteel.utility.file_handling_utility import read_pickle_folder, serialize_file
 from mppsteel.utility.log_utility import get_logger
+from mppsteel.utility.random_utility import return_scenario_random_streams
 
 from mppsteel.plant_classes.plant_investment_cycle_class import PlantInvestmentCycle
 
@@ -36,7 +37,10 @@ def investment_cycle_flow(scenario_dict: dict, serialize: bool = False) -> pd.Da
     steel_plant_names = steel_plant_df["plant_name"].to_list()
     start_plant_years = steel_plant_df["start_of_operation"].to_list()
     PlantInvestmentCycles.instantiate_plants(
-        steel_plant_names, start_plant_years, investment_cycle_randomness
+        steel_plant_names,
+        start_plant_years,
+        investment_cycle_randomness,
+        return_scenario_random_streams(scenario_dict).child("investment_cycles"),
     )
     PlantInvestmentCycles.test_cycle_lengths()
 
@@ -7,7 +7,7 @@ from mppsteel.config.model_config import (
     MODEL_YEAR_RANGE,
     SCRAP_CONSTRAINT_TOLERANCE_FACTOR,
 )
-from mppsteel.data_load_and_format.reg_steel_demand_formatter import steel_demand_getter
+from mppsteel.data_load_and_format.reg_steel_demand_formatter import SteelDemandIndex
 from mppsteel.utility.function_timer_utility import timer_func
 from mppsteel.utility.dataframe_utility import add_results_metadata
 from mppsteel.utility.file_handling_utility import (
@@ -44,6 +44,7 @@ def global_metaresults_calculator(
     logger.info("- Generating Global Metaresults")
     production_results_df_c = production_results_df.copy()
     production_results_df_c.set_index("year", inplace=True)
+    steel_demand_index = SteelDemandIndex(steel_market_df)
     # Base DataFrame
     year_range = list(MODEL_YEAR_RANGE)
     df = pd.DataFrame({"year": year_range})
@@ -51,8 +52,8 @@ def global_metaresults_calculator(
     df["steel_demand"] = (
         df["year"]
         .apply(
-            lambda year: steel_demand_getter(
-                steel_market_df, year, "crude", region="World"
+            lambda year: steel_demand_index.get_steel_demand(
+                year, "crude", region="World"
             )  # Mt
         )
         .round(rounding)
@@ -80,8 +81,8 @@ def global_metaresults_calculator(
     df["scrap_availability"] = (
         df["year"]
         .apply(
-            lambda year: steel_demand_getter(
-                steel_market_df, year, "scrap", region="World"
+            lambda year: steel_demand_index.get_steel_demand(
+                year, "scrap", region="World"
             )
         )
         .round(rounding)
@@ -1,8 +1,14 @@
 from . import (
     plant_open_close_flow,
+    solver_checkpoint,
     solver_flow,
     solver_flow_helpers,
+    solver_warm_start,
     tco_and_abatement_optimizer,
+    tco_abatement_tensor_class,
+    tco_adjustment_overlay_class,
+    ranking_cache_class,
+    min_cost_tech_table_class,
     plant_open_close_helpers,
     material_usage_class,
     market_container_class,
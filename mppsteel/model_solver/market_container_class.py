@@ -1,13 +1,15 @@
 """Classes to manage market trade"""
 
-from copy import deepcopy
+from typing import Union
+
+import numpy as np
 import pandas as pd
 
 from mppsteel.config.model_config import (
     TRADE_ROUNDING_NUMBER,
 )
 
-from mppsteel.data_load_and_format.reg_steel_demand_formatter import steel_demand_getter
+from mppsteel.data_load_and_format.reg_steel_demand_formatter import SteelDemandIndex
 
 from mppsteel.utility.log_utility import get_logger
 
@@ -23,12 +25,14 @@ class MarketContainerClass:
     2) All production deficits below the regional demand is registered as a negative number.
 
     Main Class Attributes
-        It maintains a trade container as an attirbute called `trade_container`
+        It maintains a trade array as an attribute called `trade_array` structured as [year, region, account] -> value, where the accounts are `regional_demand_minus_imports`, `exports` and `imports`
         It also maintains more detail on the years transactions as a dictionary of DataFrames called `market_results`
     """
 
     def __init__(self):
-        self.trade_container = {}
+        self.year_index = {}
+        self.region_index = {}
+        self.trade_array = np.zeros((0, 0, 0))
         self.market_results = {}
         self.regional_competitiveness = {}
         self.account_dictionary = {
@@ -37,6 +41,9 @@ class MarketContainerClass:
             "consumption": ["regional_demand_minus_imports", "imports"],
             "production": ["regional_demand_minus_imports", "exports"],
         }
+        self.account_index = {
+            account: idx for idx, account in enumerate(self.account_dictionary["all"])
+        }
 
     def __repr__(self):
         return "Trade Container"
@@ -45,19 +52,29 @@ class MarketContainerClass:
         return "Trade Container Class"
 
     def initiate_years(self, year_range: range):
-        self.trade_container = {year: {} for year in year_range}
+        self.year_index = {year: idx for idx, year in enumerate(year_range)}
+        self.trade_array = np.zeros((len(self.year_index), 0, len(self.account_index)))
         self.market_results = {year: {} for year in year_range}
         self.regional_competitiveness = {year: {} for year in year_range}
 
     def initiate_regions(self, region_list: list):
-        production_account = {key: 0 for key in self.account_dictionary["all"]}
-        for year in self.trade_container:
-            self.trade_container[year] = {
-                region: deepcopy(production_account) for region in region_list
-            }
+        self.region_index = {region: idx for idx, region in enumerate(region_list)}
+        self.trade_array = np.zeros(
+            (len(self.year_index), len(self.region_index), len(self.account_index))
+        )
+
+    def return_region_accounts(self, year: int, region: str) -> dict:
+        return dict(
+            zip(
+                self.account_index,
+                self.trade_array[
+                    self.year_index[year], self.region_index[region]
+                ].tolist(),
+            )
+        )
 
     def return_container(self):
-        return self.trade_container
+        return {year: self.trade_container_getter(year) for year in self.year_index}
 
     def full_instantiation(self, year_range: range, region_list: list):
         self.initiate_years(year_range)
@@ -90,69 +107,79 @@ class MarketContainerClass:
         self, year: int, region: str = None, account_type: str = None
     ):
         if account_type:
-            return self.trade_container[year][region][account_type]
+            return self.return_current_account_balance(year, region, account_type)
         if region:
-            return self.trade_container[year][region]
-        return self.trade_container[year]
+            return self.return_region_accounts(year, region)
+        return {
+            region: self.return_region_accounts(year, region)
+            for region in self.region_index
+        }
 
-    def return_trade_balance(self, year: int, region: str, account_type: str) -> float:
-        imports = self.trade_container[year][region]["imports"]
-        exports = self.trade_container[year][region]["exports"]
-        regional_demand_minus_imports = self.trade_container[year][region][
-            "regional_demand_minus_imports"
+    def return_account_values(self, year: int, account_type: str) -> np.ndarray:
+        return self.trade_array[
+            self.year_index[year], :, self.account_index[account_type]
         ]
-        if account_type == "trade":
-            return exports - imports
-        elif account_type == "all":
-            return regional_demand_minus_imports + exports + imports
-        elif account_type == "consumption":
-            return regional_demand_minus_imports + imports
-        elif account_type == "production":
-            return regional_demand_minus_imports + exports
-        return regional_demand_minus_imports + exports + imports  # defaults to all
+
+    def return_trade_balance(self, year: int, region: str, account_type: str) -> float:
+        regional_demand_minus_imports, exports, imports = self.trade_array[
+            self.year_index[year], self.region_index[region]
+        ].tolist()
+        return combine_trade_accounts(
+            account_type, regional_demand_minus_imports, exports, imports
+        )
 
     def trade_container_aggregator(
         self, year: int, agg_type: str, region: str = None
     ) -> float:
         if region:
             return self.return_trade_balance(year, region, agg_type)
-        container = [
-            self.return_trade_balance(year, region, agg_type)
-            for region in self.trade_container[year].keys()
-        ]
-        return sum(container)
+        trade_balances = combine_trade_accounts(
+            agg_type,
+            self.return_account_values(year, "regional_demand_minus_imports"),
+            self.return_account_values(year, "exports"),
+            self.return_account_values(year, "imports"),
+        )
+        # summed in region order to match the sum of the regional balances exactly
+        return sum(trade_balances.tolist())
 
     def list_regional_types(self, year: int, account_type: str) -> list:
         return [
             region
-            for region in self.trade_container[year]
-            if round(
-                self.trade_container[year][region][account_type], TRADE_ROUNDING_NUMBER
+            for region, value in zip(
+                self.region_index,
+                self.return_account_values(year, account_type).tolist(),
             )
-            > 0
+            if round(value, TRADE_ROUNDING_NUMBER) > 0
         ]
 
     def check_if_trade_balance(self, year: int) -> list:
-        balance_list = []
-        for region in self.trade_container[year]:
-            imports = self.trade_container[year][region]["imports"]
-            exports = self.trade_container[year][region]["exports"]
-            if (
-                round(exports, TRADE_ROUNDING_NUMBER)
-                - round(imports, TRADE_ROUNDING_NUMBER)
-                == 0
-            ):
-                balance_list.append(region)
-        return balance_list
+        return [
+            region
+            for region, imports, exports in zip(
+                self.region_index,
+                self.return_account_values(year, "imports").tolist(),
+                self.return_account_values(year, "exports").tolist(),
+            )
+            if round(exports, TRADE_ROUNDING_NUMBER)
+            - round(imports, TRADE_ROUNDING_NUMBER)
+            == 0
+        ]
 
     def return_current_account_balance(self, year: int, region: str, account_type: str):
-        return self.trade_container[year][region][account_type]
+        return self.trade_array[
+            self.year_index[year],
+            self.region_index[region],
+            self.account_index[account_type],
+        ].item()
 
     def assign_trade_balance(
         self, year: int, region: str, account_type: str, value: float
     ) -> None:
-        current_value = self.return_current_account_balance(year, region, account_type)
-        self.trade_container[year][region][account_type] = current_value + value
+        self.trade_array[
+            self.year_index[year],
+            self.region_index[region],
+            self.account_index[account_type],
+        ] += value
         return None
 
     def store_results(self, year: int, results_df: pd.DataFrame, store_type: str):
@@ -168,22 +195,21 @@ class MarketContainerClass:
             return self.regional_competitiveness[year]
 
     def create_trade_balance_summary(self, demand_df: pd.DataFrame):
-        def map_demand(row, demand_df: pd.DataFrame):
-            return steel_demand_getter(
-                df=demand_df, year=row.year, metric="crude", region=row.region
-            )
-
-        market_dict = self.trade_container
-        df = pd.DataFrame.from_dict(
-            {
-                (i, j): market_dict[i][j]
-                for i in market_dict.keys()
-                for j in market_dict[i].keys()
-            },
-            orient="index",
-        ).rename_axis(index=["year", "region"])
+        years = list(self.year_index)
+        regions = list(self.region_index)
+        df = pd.DataFrame(
+            self.trade_array.reshape(-1, len(self.account_index)),
+            index=pd.MultiIndex.from_product(
+                [years, regions], names=["year", "region"]
+            ),
+            columns=list(self.account_index),
+        )
         df.reset_index(inplace=True)
-        df["demand"] = df.apply(map_demand, demand_df=demand_df, axis=1)
+        df["demand"] = (
+            SteelDemandIndex(demand_df)
+            .get_steel_demand_values(years, "crude", regions)
+            .reshape(-1)
+        )
         df["trade_balance"] = df["exports"] - df["imports"]
         df["result_validity_check"] = (
             round(
@@ -251,6 +277,34 @@ class MarketContainerClass:
             )
 
 
+def combine_trade_accounts(
+    account_type: str,
+    regional_demand_minus_imports: Union[float, np.ndarray],
+    exports: Union[float, np.ndarray],
+    imports: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
+    """Combines the trade accounts of one or several regions into a trade balance.
+
+    Args:
+        account_type (str): The balance to calculate: `trade`, `consumption`, `production` or `all`.
+        regional_demand_minus_imports (Union[float, np.ndarray]): The regional demand that is not imported.
+        exports (Union[float, np.ndarray]): The exports.
+        imports (Union[float, np.ndarray]): The imports.
+
+    Returns:
+        Union[float, np.ndarray]: The trade balance of each region.
+    """
+    if account_type == "trade":
+        return exports - imports
+    elif account_type == "all":
+        return regional_demand_minus_imports + exports + imports
+    elif account_type == "consumption":
+        return regional_demand_minus_imports + imports
+    elif account_type == "production":
+        return regional_demand_minus_imports + exports
+    return regional_demand_minus_imports + exports + imports  # defaults to all
+
+
 def merge_competitiveness_with_trade_account(
     competitiveness_df: pd.DataFrame, trade_account_df: pd.DataFrame
 ) -> pd.DataFrame:
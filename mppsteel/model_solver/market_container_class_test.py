@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+from mppsteel.model_solver.market_container_class import MarketContainerClass
+
+
+def test_market_container_trade_balances():
+    market_container = MarketContainerClass()
+    market_container.full_instantiation(range(2020, 2022), ["Europe", "India"])
+    market_container.assign_market_tuple(
+        2021, "Europe", market_container.return_market_entry(90, 10, 0)
+    )
+    market_container.assign_market_tuple(
+        2021, "India", market_container.return_market_entry(50, 0, 10)
+    )
+    assert market_container.trade_container_getter(2021, "Europe", "imports") == 10
+    assert market_container.trade_container_getter(2021, "India") == {
+        "regional_demand_minus_imports": 50,
+        "exports": 10,
+        "imports": 0,
+    }
+    assert market_container.return_trade_balance(2021, "Europe", "consumption") == 100
+    assert market_container.trade_container_aggregator(2021, "trade") == 0
+    assert market_container.trade_container_aggregator(2021, "production") == 150
+    assert market_container.list_regional_types(2021, "imports") == ["Europe"]
+    assert market_container.check_if_trade_balance(2020) == ["Europe", "India"]
+
+    demand_df = pd.DataFrame(
+        [
+            [year, "Crude steel demand", region, [], value]
+            for year in [2020, 2021]
+            for region, value in [("Europe", 100), ("India", 50)]
+        ],
+        columns=["year", "metric", "region", "country_code", "value"],
+    ).set_index(["year", "metric"])
+    trade_account_df = market_container.create_trade_balance_summary(demand_df)
+    assert list(trade_account_df["demand"]) == [100, 50, 100, 50]
+    assert trade_account_df.set_index(["year", "region"]).loc[
+        (2021, "Europe"), "trade_balance"
+    ] == pytest.approx(-10)
@@ -1,8 +1,10 @@
 """Class and functions to manage Material Usage"""
 
 import itertools
-from typing import Sequence
+import logging
+from typing import Dict, List, Sequence
 
+import numpy as np
 import pandas as pd
 
 from mppsteel.config.model_config import (
@@ -15,6 +17,108 @@ from mppsteel.utility.log_utility import get_logger
 
 logger = get_logger(__name__)
 
+REGIONAL_RESOURCES = ["scrap"]
+
+
+class ResourceIntensityMatrix:
+    """Description
+    Class that compiles the business case reference into a dense technology x resource group intensity matrix.
+    Resource usage for a set of plants is then one vectorized product of intensities and capacity x `CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION`.
+
+    Important Points
+    1) Resource groups are the groups of materials in `RESOURCE_CONTAINER_REF` (e.g. biomass is Biomass + Biomethane).
+    2) The intensity of each material is kept in its own slot and the slots are summed after multiplying by the capacity, so the usage values match `return_projected_usage`.
+    3) Technology / material pairs that are not in the business case reference are NaN, and `return_usage` raises a KeyError if it is asked for the usage of a technology with missing pairs (as `return_projected_usage` does).
+
+    Main Class Attributes
+        technologies: The technologies of the business case reference.
+        resources: The resource groups.
+        material_intensities: The intensities in the form [technology][resource][material slot].
+        missing_pairs: The technology / material pairs of each technology that are not in the business case reference.
+    """
+
+    def __init__(
+        self,
+        business_case_ref: dict,
+        resource_groups: Dict[str, list] = RESOURCE_CONTAINER_REF,
+    ):
+        self.technologies = list(
+            dict.fromkeys(technology for technology, _ in business_case_ref)
+        )
+        self.tech_index = {
+            technology: idx for idx, technology in enumerate(self.technologies)
+        }
+        self.resources = list(resource_groups)
+        self.resource_index = {
+            resource: idx for idx, resource in enumerate(self.resources)
+        }
+        self.material_intensities = np.zeros(
+            (
+                len(self.technologies),
+                len(self.resources),
+                max([len(materials) for materials in resource_groups.values()]),
+            )
+        )
+        for (tech_idx, technology), (resource_idx, resource) in itertools.product(
+            enumerate(self.technologies), enumerate(self.resources)
+        ):
+            for slot, material in enumerate(resource_groups[resource]):
+                self.material_intensities[tech_idx, resource_idx, slot] = (
+                    business_case_ref.get((technology, material), np.nan)
+                )
+        self.missing_pairs = {
+            technology: [
+                (technology, material)
+                for materials in resource_groups.values()
+                for material in materials
+                if (technology, material) not in business_case_ref
+            ]
+            for technology in self.technologies
+        }
+        self.incomplete_technologies = np.array(
+            [bool(self.missing_pairs[technology]) for technology in self.technologies],
+            dtype=bool,
+        )
+
+    def return_usage(
+        self, technologies: Sequence[str], capacities: np.ndarray
+    ) -> np.ndarray:
+        """Returns the projected resource usage of a set of plants.
+
+        Args:
+            technologies (Sequence[str]): The technology of each plant.
+            capacities (np.ndarray): The capacity of each plant.
+
+        Raises:
+            KeyError: If a technology is not in the business case reference or has technology / material pairs missing from it.
+
+        Returns:
+            np.ndarray: The usage in the form [plant][resource].
+        """
+        tech_idx = np.array(
+            [self.tech_index[technology] for technology in technologies],
+            dtype=np.int64,
+        )
+        if self.incomplete_technologies[tech_idx].any():
+            missing_pairs = [
+                pair
+                for technology_idx in np.unique(
+                    tech_idx[self.incomplete_technologies[tech_idx]]
+                )
+                for pair in self.missing_pairs[self.technologies[technology_idx]]
+            ]
+            raise KeyError(
+                f"Technology / material pairs missing from the business case reference: {missing_pairs}"
+            )
+        utilized_capacities = (
+            np.asarray(capacities, dtype=float)
+            * CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION
+        )
+        return (
+            self.material_intensities[tech_idx]
+            * utilized_capacities[:, np.newaxis, np.newaxis]
+        ).sum(axis=2)
+
 
 class MaterialUsage:
     """Description
@@ -24,29 +128,53 @@ class MaterialUsage:
     1) Only resources that have constraints are tracked in this class
     2) There are several attributes that interact to manage the resource consumptions
     3) There are states that usage might exceed the constraint - Not by error. The class has functionality to manage these cases.
+    4) Usage and balances are held in NumPy ledgers in the form [year][resource][region] with a running global total in the form [year][resource]. Only regional resources (scrap) use the region axis.
 
     Main Class Attributes
         Constraint: The amount of the reosurce available. In the form [model_type][year] -> constraint value
-        Usage: The amount of the reosurce that has been used. Should be lower than the constraint. In the form [model_type][year] -> usage value
-        Balance: The amount of the reosurce still available for the year. Should be lower or equal to the constraint. In the form [model_type][year] -> constraint value
+        Usage ledger / totals: The amount of the reosurce that has been used. Should be lower than the constraint.
+        Balance ledger / totals: The amount of the reosurce still available for the year. Should be lower or equal to the constraint.
         Resources: The list of resources to track.
+        Intensity matrix: The ResourceIntensityMatrix of the business case reference used for the projected usage. It is compiled on first use.
+        Recording: Flag that determines whether the result of each constraint check is recorded (set by the scenario's recording mode).
     """
 
-    def __init__(self):
+    def __init__(self, recording: bool = True):
         self.constraint = {}
-        self.usage = {}
-        self.balance = {}
         self.results = []
+        self.recording = recording
         self.resources = ["biomass", "scrap", "ccs", "co2"]
+        self.year_index: Dict[int, int] = {}
+        self.resource_index: Dict[str, int] = {}
+        self.region_index: Dict[str, int] = {}
+        self.usage_ledger = np.zeros((0, 0, 0))
+        self.balance_ledger = np.zeros((0, 0, 0))
+        self.usage_totals = np.zeros((0, 0))
+        self.balance_totals = np.zeros((0, 0))
+        self.intensity_matrix = None
+        self.intensity_matrix_source = None
+
+    def return_intensity_matrix(
+        self, business_case_ref: dict
+    ) -> ResourceIntensityMatrix:
+        if self.intensity_matrix_source is not business_case_ref:
+            self.intensity_matrix = ResourceIntensityMatrix(business_case_ref)
+            self.intensity_matrix_source = business_case_ref
+        return self.intensity_matrix
 
     def initiate_years_and_regions(
         self, year_range: range, resource_list: Sequence, region_list: Sequence
     ):
-        for year in year_range:
-            self.usage[year] = {resource: 0 for resource in resource_list}
-            self.balance[year] = {resource: 0 for resource in resource_list}
-            self.usage[year]["scrap"] = {region: 0 for region in region_list}
-            self.balance[year]["scrap"] = {region: 0 for region in region_list}
+        self.year_index = {year: idx for idx, year in enumerate(year_range)}
+        self.resource_index = {
+            resource: idx for idx, resource in enumerate(resource_list)
+        }
+        self.region_index = {region: idx for idx, region in enumerate(region_list)}
+        ledger_shape = (len(year_range), len(resource_list), len(region_list))
+        self.usage_ledger = np.zeros(ledger_shape)
+        self.balance_ledger = np.zeros(ledger_shape)
+        self.usage_totals = np.zeros(ledger_shape[:2])
+        self.balance_totals = np.zeros(ledger_shape[:2])
 
     def load_constraint(self, model: pd.DataFrame, model_type: str):
         if model_type == "biomass":
@@ -59,88 +187,101 @@ class MaterialUsage:
             self.constraint[model_type] = create_co2_use_constraint(model)
 
     def set_year_balance(self, year: int, model_type: str, region_list: list):
-        if model_type == "scrap":
+        year_idx = self.year_index[year]
+        resource_idx = self.resource_index[model_type]
+        if model_type in REGIONAL_RESOURCES:
             for region in region_list:
-                self.balance[year][model_type][region] = self.constraint[model_type][
-                    year
-                ][region]
+                self.balance_ledger[
+                    year_idx, resource_idx, self.region_index[region]
+                ] = self.constraint[model_type][year][region]
+            self.balance_totals[year_idx, resource_idx] = sum(
+                self.balance_ledger[year_idx, resource_idx].tolist()
+            )
         else:
-            self.balance[year][model_type] = self.constraint[model_type][year]
+            self.balance_totals[year_idx, resource_idx] = self.constraint[
+                model_type
+            ][year]
 
     def get_current_balance(self, year: int, model_type: str, region: str = ""):
-        if model_type == "scrap":
-            if region:
-                return self.balance[year][model_type][region]
-            else:
-                return sum(self.balance[year][model_type].values())
-        return self.balance[year][model_type]
+        year_idx = self.year_index[year]
+        resource_idx = self.resource_index[model_type]
+        if (model_type in REGIONAL_RESOURCES) and region:
+            return self.balance_ledger[
+                year_idx, resource_idx, self.region_index[region]
+            ]
+        return self.balance_totals[year_idx, resource_idx]
 
     def get_current_usage(self, year: int, model_type: str):
-        if model_type == "scrap":
-            return sum(self.usage[year][model_type].values())
-        return self.usage[year][model_type]
+        return self.usage_totals[self.year_index[year], self.resource_index[model_type]]
 
     def record_results(self, dict_entry: dict):
-        self.results.append(dict_entry)
+        if self.recording:
+            self.results.append(dict_entry)
+
+    def record_result_entries(self, dict_entries: List[dict]):
+        if self.recording:
+            self.results.extend(dict_entries)
 
     def print_year_summary(self, year: int, regional_scrap: bool):
         for model_type in self.resources:
-            if model_type == "scrap":
-                constraint: MYPY_NUMERICAL = sum(
-                    self.constraint[model_type][year].values()
-                )
-                usage: MYPY_NUMERICAL = sum(self.usage[year][model_type].values())
-                balance: MYPY_NUMERICAL = sum(self.balance[year][model_type].values())
-            else:
-                constraint = self.constraint[model_type][year]
-                usage = self.usage[year][model_type]
-                balance = self.balance[year][model_type]
+            constraint: MYPY_NUMERICAL = self.get_constraint(year, model_type)
+            usage: MYPY_NUMERICAL = self.get_current_usage(year, model_type)
+            balance: MYPY_NUMERICAL = self.get_current_balance(year, model_type)
             pct_used: MYPY_NUMERICAL = 100
             pct_remaining: MYPY_NUMERICAL = 0
-            try:
+            # the ledger values are NumPy floats, which do not raise ZeroDivisionError
+            if constraint != 0:
                 pct_used = (usage / constraint) * 100
                 pct_remaining = (balance / constraint) * 100
-            except ZeroDivisionError:
-                pct_used = 100
-                pct_remaining = 0
             logger.info(
-                f"""{model_type.upper()} USAGE SUMMARY {year}  -> Constraint: {constraint :0.4f} | Usage: {usage :0.4f} ({pct_used :0.1f}%) | Balance: {balance :0.4f} ({pct_remaining :0.1f}%)"""
+                "%s USAGE SUMMARY %s  -> Constraint: %0.4f | Usage: %0.4f (%0.1f%%) | Balance: %0.4f (%0.1f%%)",
+                model_type.upper(),
+                year,
+                constraint,
+                usage,
+                pct_used,
+                balance,
+                pct_remaining,
             )
-            if (model_type == "scrap") and regional_scrap:
+            if (
+                (model_type == "scrap")
+                and regional_scrap
+                and logger.isEnabledFor(logging.INFO)
+            ):
+                regional_balances = {
+                    region: self.get_current_balance(year, model_type, region)
+                    for region in self.region_index
+                }
                 limit_bursting_regions = {
-                    region: round(self.balance[year][model_type][region], 2)
-                    for region in self.balance[year][model_type]
-                    if self.balance[year][model_type][region] < 0
+                    region: round(balance, 2)
+                    for region, balance in regional_balances.items()
+                    if balance < 0
                 }
                 limit_keeping_regions = {
-                    region: round(self.balance[year][model_type][region], 2)
-                    for region in self.balance[year][model_type]
-                    if self.balance[year][model_type][region] >= 0
+                    region: round(balance, 2)
+                    for region, balance in regional_balances.items()
+                    if balance >= 0
                 }
                 logger.info(
-                    f"SCRAP USAGE SUMMARY {year} - Scrap Limit Bursting Regions -> {limit_bursting_regions}"
+                    "SCRAP USAGE SUMMARY %s - Scrap Limit Bursting Regions -> %s",
+                    year,
+                    limit_bursting_regions,
                 )
                 logger.info(
-                    f"SCRAP USAGE SUMMARY {year} - Scrap Limit Keeping Regions -> {limit_keeping_regions}"
+                    "SCRAP USAGE SUMMARY %s - Scrap Limit Keeping Regions -> %s",
+                    year,
+                    limit_keeping_regions,
                 )
 
     def output_constraints_summary(self, year_range: range):
         results = []
         for year, model_type in itertools.product(year_range, self.resources):
-            if model_type == "scrap":
-                constraint = sum(self.constraint[model_type][year].values())
-                usage = sum(self.usage[year][model_type].values())
-                balance = sum(self.balance[year][model_type].values())
-            else:
-                constraint = self.constraint[model_type][year]
-                usage = self.usage[year][model_type]
-                balance = self.balance[year][model_type]
             entry = {
                 "resource": model_type,
                 "year": year,
-                "constraint": constraint,
-                "usage": usage,
-                "balance": balance,
+                "constraint": self.get_constraint(year, model_type),
+                "usage": self.get_current_usage(year, model_type),
+                "balance": self.get_current_balance(year, model_type),
             }
             results.append(entry)
         return (
@@ -152,6 +293,56 @@ class MaterialUsage:
     def output_results_to_df(self):
         return pd.DataFrame(self.results)
 
+    def get_constraint(self, year: int, model_type: str):
+        if model_type in REGIONAL_RESOURCES:
+            return sum(self.constraint[model_type][year].values())
+        return self.constraint[model_type][year]
+
+    def return_check_balance(
+        self, year: int, model_type: str, region: str, regional_scrap: bool
+    ) -> float:
+        if model_type == "scrap" and regional_scrap:
+            return self.get_current_balance(year, model_type, region)
+        return self.get_current_balance(year, model_type)
+
+    def check_amounts(
+        self,
+        year: int,
+        resources: Sequence[str],
+        amounts: np.ndarray,
+        region: str = None,
+        regional_scrap: bool = False,
+    ) -> np.ndarray:
+        """Checks whether a set of resource amounts fit within the current balances, without applying them.
+
+        Args:
+            year (int): The year of the balances.
+            resources (Sequence[str]): The resources of the columns of `amounts`.
+            amounts (np.ndarray): The amounts to check in the form [candidate][resource].
+            region (str, optional): The region of the candidates (used for regional resources). Defaults to None.
+            regional_scrap (bool, optional): Boolean flag to determine whether scrap is checked against the regional or the global balance. Defaults to False.
+
+        Returns:
+            np.ndarray: A boolean array in the form [candidate][resource] that is True if the amount passes the constraint check.
+        """
+        balances = np.array(
+            [
+                self.return_check_balance(year, resource, region, regional_scrap)
+                for resource in resources
+            ]
+        )
+        return ~((amounts > 0) & (balances < amounts))
+
+    def apply_amount(self, year: int, model_type: str, amount: float, region: str):
+        year_idx = self.year_index[year]
+        resource_idx = self.resource_index[model_type]
+        if model_type in REGIONAL_RESOURCES:
+            region_idx = self.region_index[region]
+            self.balance_ledger[year_idx, resource_idx, region_idx] -= amount
+            self.usage_ledger[year_idx, resource_idx, region_idx] += amount
+        self.balance_totals[year_idx, resource_idx] -= amount
+        self.usage_totals[year_idx, resource_idx] += amount
+
     def constraint_transaction(
         self,
         year: int,
@@ -161,79 +352,53 @@ class MaterialUsage:
         override_constraint: bool = False,
         apply_transaction: bool = True,
         regional_scrap: bool = False,
+    ) -> bool:
+        # The transaction passes if it is overridden, or if the balance is sufficient for the amount
+        passed = override_constraint or bool(
+            self.check_amounts(
+                year, [model_type], np.array([amount]), region, regional_scrap
+            )[0]
+        )
+        if apply_transaction and passed:
+            self.apply_amount(year, model_type, amount, region)
+        return passed
+
+    def apply_amounts(
+        self,
+        year: int,
+        resources: Sequence[str],
+        amounts: np.ndarray,
+        regions: Sequence[str],
     ):
-        def function_to_apply_transaction(
-            self,
-            current_balance: float,
-            current_usage: float,
-            current_balance_regional: float,
-            current_usage_regional: float,
-        ) -> None:
-            if model_type == "scrap" and regional_scrap:
-                self.balance[year][model_type][region] = current_balance - amount
-                self.usage[year][model_type][region] = current_usage + amount
-            elif model_type == "scrap" and not regional_scrap:
-                self.balance[year][model_type][region] = (
-                    current_balance_regional - amount
+        """Applies the usage of a set of plants to the ledger in one transaction (without checking the constraints).
+        The amounts are applied in plant order, so the balances are the same as applying one plant at a time.
+
+        Args:
+            year (int): The year of the transaction.
+            resources (Sequence[str]): The resources of the columns of `amounts`.
+            amounts (np.ndarray): The amounts in the form [plant][resource].
+            regions (Sequence[str]): The region of each plant.
+        """
+        year_idx = self.year_index[year]
+        region_idx = np.array(
+            [self.region_index[region] for region in regions], dtype=np.int64
+        )
+        for column, model_type in enumerate(resources):
+            resource_idx = self.resource_index[model_type]
+            if model_type in REGIONAL_RESOURCES:
+                np.subtract.at(
+                    self.balance_ledger[year_idx, resource_idx],
+                    region_idx,
+                    amounts[:, column],
                 )
-                self.usage[year][model_type][region] = current_usage_regional + amount
-            else:
-                self.balance[year][model_type] = current_balance - amount
-                self.usage[year][model_type] = current_usage + amount
-            return None
-
-        # set up balance and usage
-        current_balance_regional = 0
-        current_usage_regional = 0
-        if model_type == "scrap" and regional_scrap:
-            current_balance = self.balance[year][model_type][region]
-            current_usage = self.usage[year][model_type][region]
-
-        elif model_type == "scrap" and not regional_scrap:
-            current_balance_regional = self.balance[year][model_type][region]
-            current_usage_regional = self.usage[year][model_type][region]
-            current_balance = sum(self.balance[year][model_type].values())
-            current_usage = sum(self.usage[year][model_type].values())
-
-        else:
-            current_balance = self.balance[year][model_type]
-            current_usage = self.usage[year][model_type]
-
-        # CASE 1: Apply and override
-        if apply_transaction and override_constraint:
-            function_to_apply_transaction(
-                self,
-                current_balance,
-                current_usage,
-                current_balance_regional,
-                current_usage_regional,
-            )
-            return True
-
-        # CASE 2: Apply, but don't override
-        elif apply_transaction and not override_constraint:
-            # check that an amount is required but the constraint is insufficient
-            if (amount > 0) and (current_balance < amount):
-                return False
-            else:
-                function_to_apply_transaction(
-                    self,
-                    current_balance,
-                    current_usage,
-                    current_balance_regional,
-                    current_usage_regional,
+                np.add.at(
+                    self.usage_ledger[year_idx, resource_idx],
+                    region_idx,
+                    amounts[:, column],
                 )
-                return True
-
-        # CASE 3: Don't apply, but and override
-        elif not apply_transaction and override_constraint:
-            return True
-
-        # CASE 4: Don't apply or override
-        elif not apply_transaction and not override_constraint:
-            if (amount > 0) and (current_balance < amount):
-                return False
-            return True
+            total_idx = np.full(len(amounts), resource_idx)
+            np.subtract.at(self.balance_totals[year_idx], total_idx, amounts[:, column])
+            np.add.at(self.usage_totals[year_idx], total_idx, amounts[:, column])
 
 
 def create_material_usage_dict(
@@ -270,15 +435,14 @@ def create_material_usage_dict(
         dict: A dictionary that has the resource as a key and a boolean check as the value.
     """
     material_check_container = {}
-    for resource in RESOURCE_CONTAINER_REF:
-        projected_usage = return_projected_usage(
-            plant_name,
-            switch_technology,
-            plant_capacities,
-            business_case_ref,
-            RESOURCE_CONTAINER_REF[resource],
-            capacity_value=capacity_value,
-        )
+    intensity_matrix = material_usage_dict_container.return_intensity_matrix(
+        business_case_ref
+    )
+    plant_usage = intensity_matrix.return_usage(
+        [switch_technology],
+        [capacity_value if capacity_value else plant_capacities[plant_name]],
+    )
+    for resource, projected_usage in zip(RESOURCE_CONTAINER_REF, plant_usage[0]):
         if negative_amount:
             projected_usage = projected_usage * -1
         material_check_container[
@@ -295,6 +459,135 @@ def create_material_usage_dict(
     return material_check_container
 
 
+def apply_material_usage_transactions(
+    material_usage_dict_container: MaterialUsage,
+    plant_capacities: dict,
+    business_case_ref: dict,
+    plant_names: Sequence[str],
+    regions: Sequence[str],
+    year: int,
+    technologies: Sequence[str],
+    capacity_values: Sequence[float],
+) -> None:
+    """Vectorized version of `create_material_usage_dict` with `override_constraint` and `apply_transaction` set to True.
+    The resource usage of every plant is applied to the ledger in a single transaction.
+
+    Args:
+        material_usage_dict_container (MaterialUsage): The MaterialUsage Instance containing the material consumption state.
+        plant_capacities (dict): A dictionary of plant names and capacity values.
+        business_case_ref (dict): The Business Cases of resourse usage.
+        plant_names (Sequence[str]): The names of the plants.
+        regions (Sequence[str]): The region of each plant.
+        year (int): The current model cycle year.
+        technologies (Sequence[str]): The technology of each plant.
+        capacity_values (Sequence[float]): The capacity of each plant (if the value is 0, the capacity in `plant_capacities` is used instead).
+    """
+    capacities = [
+        capacity_value if capacity_value else plant_capacities[plant_name]
+        for plant_name, capacity_value in zip(plant_names, capacity_values)
+    ]
+    intensity_matrix = material_usage_dict_container.return_intensity_matrix(
+        business_case_ref
+    )
+    material_usage_dict_container.apply_amounts(
+        year,
+        intensity_matrix.resources,
+        intensity_matrix.return_usage(technologies, capacities),
+        regions,
+    )
+
+
+def create_material_check_matrix(
+    material_usage_dict_container: MaterialUsage,
+    plant_capacities: dict,
+    business_case_ref: dict,
+    plant_name: str,
+    region: str,
+    year: int,
+    technologies: Sequence[str],
+    regional_scrap: bool,
+    capacity_value: float = None,
+    override_constraint: bool = False,
+) -> np.ndarray:
+    """Batched version of `create_material_usage_dict` that checks every resource constraint for a list of candidate technologies in one call.
+    No transactions are applied.
+
+    Args:
+        material_usage_dict_container (MaterialUsage): The MaterialUsage Instance containing the material consumption state.
+        plant_capacities (dict): A dictionary of plant names and capacity values.
+        business_case_ref (dict): The Business Cases of resourse usage.
+        plant_name (str): The name of the plant.
+        region (str): The region of the plant.
+        year (int): The current model cycle year.
+        technologies (Sequence[str]): The candidate technologies.
+        regional_scrap (bool): Scenario boolean flag to determine whether scrap is checked against the regional balance.
+        capacity_value (float, optional): The capacity of the plant (if the value is availabile, otherwise to be found in `plant_capacities`). Defaults to None.
+        override_constraint (bool, optional): Boolean flag to determine whether the current constraint should be overwritten. Defaults to False.
+
+    Returns:
+        np.ndarray: A boolean array in the form [technology][resource] (resources in the order of `RESOURCE_CONTAINER_REF`).
+    """
+    resources = list(RESOURCE_CONTAINER_REF)
+    if override_constraint or not technologies:
+        return np.ones((len(technologies), len(resources)), dtype=bool)
+    amounts = material_usage_dict_container.return_intensity_matrix(
+        business_case_ref
+    ).return_usage(
+        technologies,
+        np.full(
+            len(technologies),
+            capacity_value if capacity_value else plant_capacities[plant_name],
+            dtype=float,
+        ),
+    )
+    return material_usage_dict_container.check_amounts(
+        year, resources, amounts, region, regional_scrap
+    )
+
+
+def create_material_check_entries(
+    material_check_matrix: np.ndarray,
+    technologies: Sequence[str],
+    entry_values: dict,
+    list_failed_resources: bool = True,
+) -> List[dict]:
+    """Creates the audit entries of a constraint check matrix, one entry per candidate technology.
+
+    Args:
+        material_check_matrix (np.ndarray): The output of `create_material_check_matrix`.
+        technologies (Sequence[str]): The candidate technologies of the rows of `material_check_matrix`.
+        entry_values (dict): Values that are the same for every entry (e.g. plant, region, year).
+        list_failed_resources (bool, optional): Boolean flag to determine whether `failure_resources` lists the resources that failed (True) or passed (False) the check. Defaults to True.
+
+    Returns:
+        List[dict]: The list of entries.
+    """
+    entries = []
+    for technology, resource_checks in zip(technologies, material_check_matrix):
+        material_check_container = {
+            resource: bool(check)
+            for resource, check in zip(RESOURCE_CONTAINER_REF, resource_checks)
+        }
+        entries.append(
+            {
+                "plant": entry_values["plant"],
+                "region": entry_values["region"],
+                "start_technology": entry_values["start_technology"],
+                "switch_technology": technology,
+                "year": entry_values["year"],
+                "assign_case": entry_values["assign_case"],
+                "result": "PASS" if resource_checks.all() else "FAIL",
+                "failure_resources": [
+                    resource
+                    for resource, check in material_check_container.items()
+                    if check != list_failed_resources
+                ],
+                "pass_boolean_check": material_check_container,
+            }
+        )
+    return entries
+
+
 def create_co2_use_constraint(model: pd.DataFrame) -> dict:
     """Creates a dictionary of years as keys and constraint amounts as values (in Mt CO2) for CO2 Use.
 
@@ -394,25 +687,23 @@ def return_current_usage(
     plant_list: list,
     technology_choices: dict,
     capacities_dict: dict,
-    business_case_ref: dict,
-    materials: list,
+    intensity_matrix: ResourceIntensityMatrix,
+    resource: str,
 ) -> float:
-    """Returns the project usage for a a list of plants in `plant_list` given their `technology_choices` and capacities for resources specified in `materials`.
+    """Returns the project usage for a a list of plants in `plant_list` given their `technology_choices` and capacities for a `resource` group.
 
     Args:
         plant_list (list): The names of the plants.
         technology_choices (dict): The plants' technology choices.
         capacities_dict (dict): The plants' capacities.
-        business_case_ref (dict): The business case reference dictionary.
-        materials (list): The materials to summ usage for.
+        intensity_matrix (ResourceIntensityMatrix): The intensity matrix of the business case reference.
+        resource (str): The resource group to sum usage for (a key of `RESOURCE_CONTAINER_REF`).
 
     Returns:
-        float: The sum of the usage across the plants and materials specified in `materials`
+        float: The sum of the usage across the plants for the `resource` group.
     """
-    usage_sum = []
-    for material, plant_name in list(itertools.product(materials, plant_list)):
-        capacity = capacities_dict[plant_name]
-        consumption_rate = business_case_ref[(technology_choices[plant_name], material)]
-        utilization = CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION
-        usage_sum.append(consumption_rate * (capacity * utilization))
-    return sum(usage_sum)
+    usage = intensity_matrix.return_usage(
+        [technology_choices[plant_name] for plant_name in plant_list],
+        [capacities_dict[plant_name] for plant_name in plant_list],
+    )
+    return usage[:, intensity_matrix.resource_index[resource]].sum()
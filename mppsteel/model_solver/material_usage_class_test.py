@@ -0,0 +1,150 @@
+import numpy as np
+import pytest
+
+from mppsteel.config.reference_lists import RESOURCE_CONTAINER_REF
+from mppsteel.model_solver.material_usage_class import (
+    MaterialUsage,
+    ResourceIntensityMatrix,
+    apply_material_usage_transactions,
+    create_material_check_matrix,
+    create_material_usage_dict,
+    return_projected_usage,
+)
+
+BUSINESS_CASE_REF = {
+    (technology, material): value
+    for technology, values in {
+        "EAF": [1.0, 0.0, 0.0, 0.0, 0.0],
+        "BF": [0.2, 0.0, 0.0, 0.0, 0.0],
+        "Biomass": [0.0, 3.0, 1.0, 0.0, 0.0],
+    }.items()
+    for material, value in zip(
+        ["Scrap", "Biomass", "Biomethane", "Captured CO2", "Used CO2"], values
+    )
+}
+
+
+def create_material_usage(regional_scrap_balances: dict) -> MaterialUsage:
+    material_usage = MaterialUsage()
+    material_usage.initiate_years_and_regions(
+        range(2020, 2021), ["biomass", "scrap", "co2", "ccs"], ["Europe", "India"]
+    )
+    material_usage.constraint = {
+        "biomass": {2020: 3.0},
+        "scrap": {2020: regional_scrap_balances},
+        "co2": {2020: 0.0},
+        "ccs": {2020: 0.0},
+    }
+    for resource in material_usage.constraint:
+        material_usage.set_year_balance(2020, resource, ["Europe", "India"])
+    return material_usage
+
+
+def test_check_matrix_matches_transactions():
+    material_usage = create_material_usage({"Europe": 1.0, "India": 0.5})
+    technologies = ["EAF", "BF", "Biomass"]
+    for regional_scrap in [True, False]:
+        check_matrix = create_material_check_matrix(
+            material_usage,
+            {"plant_a": 1.5},
+            BUSINESS_CASE_REF,
+            "plant_a",
+            "India",
+            2020,
+            technologies,
+            regional_scrap,
+        )
+        expected = [
+            list(
+                create_material_usage_dict(
+                    material_usage,
+                    {"plant_a": 1.5},
+                    BUSINESS_CASE_REF,
+                    "plant_a",
+                    "India",
+                    2020,
+                    technology,
+                    regional_scrap,
+                ).values()
+            )
+            for technology in technologies
+        ]
+        np.testing.assert_array_equal(check_matrix, expected)
+
+
+def test_transactions_update_regional_and_global_totals():
+    material_usage = create_material_usage({"Europe": 1.0, "India": 0.5})
+    material_usage.constraint_transaction(
+        2020, "scrap", 0.75, "Europe", override_constraint=True
+    )
+    assert material_usage.get_current_balance(2020, "scrap", "Europe") == 0.25
+    assert material_usage.get_current_balance(2020, "scrap") == 0.75
+    assert material_usage.get_current_usage(2020, "scrap") == 0.75
+    assert not material_usage.constraint_transaction(
+        2020, "scrap", 0.5, "Europe", regional_scrap=True
+    )
+
+
+def test_intensity_matrix_matches_projected_usage():
+    intensity_matrix = ResourceIntensityMatrix(BUSINESS_CASE_REF)
+    technologies = ["EAF", "Biomass", "BF"]
+    usage = intensity_matrix.return_usage(technologies, [1.5, 0.3, 2.0])
+    for (technology, capacity), plant_usage in zip(
+        zip(technologies, [1.5, 0.3, 2.0]), usage
+    ):
+        assert list(plant_usage) == [
+            return_projected_usage(
+                "plant_a", technology, {}, BUSINESS_CASE_REF, materials, capacity
+            )
+            for materials in RESOURCE_CONTAINER_REF.values()
+        ]
+
+
+def test_vectorized_transactions_match_plant_transactions():
+    plants = {"plant_a": "Europe", "plant_b": "India", "plant_c": "Europe"}
+    technologies = ["EAF", "Biomass", "BF"]
+    capacities = {"plant_a": 0.7, "plant_b": 0.3, "plant_c": 1.1}
+    expected = create_material_usage({"Europe": 1.0, "India": 0.5})
+    for (plant_name, region), technology in zip(plants.items(), technologies):
+        create_material_usage_dict(
+            expected,
+            capacities,
+            BUSINESS_CASE_REF,
+            plant_name,
+            region,
+            2020,
+            technology,
+            False,
+            override_constraint=True,
+            apply_transaction=True,
+        )
+    material_usage = create_material_usage({"Europe": 1.0, "India": 0.5})
+    apply_material_usage_transactions(
+        material_usage,
+        capacities,
+        BUSINESS_CASE_REF,
+        list(plants),
+        list(plants.values()),
+        2020,
+        technologies,
+        [0, 0, 0],
+    )
+    np.testing.assert_array_equal(
+        material_usage.balance_ledger, expected.balance_ledger
+    )
+    np.testing.assert_array_equal(material_usage.usage_totals, expected.usage_totals)
+
+
+def test_intensity_matrix_raises_on_missing_pairs():
+    business_case_ref = {
+        pair: value
+        for pair, value in BUSINESS_CASE_REF.items()
+        if pair != ("BF", "Biomass")
+    }
+    intensity_matrix = ResourceIntensityMatrix(business_case_ref)
+    assert intensity_matrix.return_usage(["EAF"], [1.0]).shape == (
+        1,
+        len(RESOURCE_CONTAINER_REF),
+    )
+    with pytest.raises(KeyError):
+        intensity_matrix.return_usage(["EAF", "BF"], [1.0, 1.0])
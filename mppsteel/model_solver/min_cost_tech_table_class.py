@@ -0,0 +1,105 @@
+"""Class to look up the lowest levelized cost technologies and regions for new plants"""
+
+from typing import Dict, Sequence, Tuple, Union
+
+import pandas as pd
+
+from mppsteel.utility.log_utility import get_logger
+
+logger = get_logger(__name__)
+
+
+class MinCostTechTable:
+    """Description
+    Class that ranks the technologies of every year and region by their mean levelized cost once, so that new plants do not have to aggregate the levelized cost DataFrame every time they are opened.
+
+    Important Points
+    1) The technologies of a (year, region) pair are sorted by mean levelized cost. Technologies with the same cost keep their alphabetical order, so the first technology is the same as `idxmin` over the technology means.
+    2) (year, region) pairs where any of the technology means is null are kept, but raise an AssertionError when they are looked up.
+    3) The table is built from the full levelized cost DataFrame and is not modified by the solver.
+
+    Main Class Attributes
+        sorted_technologies: A dictionary of (year, region): technologies sorted by mean levelized cost.
+        null_entries: A set of the (year, region) pairs with null technology means.
+        min_cost_regions: A dictionary of year: the region with the lowest mean levelized cost.
+    """
+
+    def __init__(self, lcost_df: pd.DataFrame):
+        self.sorted_technologies: Dict[Tuple[int, str], Tuple[str, ...]] = {}
+        self.null_entries: set = set()
+        self.min_cost_regions: Dict[int, str] = {}
+        if lcost_df.empty:
+            return
+        lcost_df_c = lcost_df.set_index(["year", "region", "technology"]).sort_index(
+            ascending=True
+        )
+        tech_means = lcost_df_c.groupby(level=[0, 1, 2]).mean(numeric_only=True)
+        null_check = tech_means.isnull().any(axis=1).groupby(level=[0, 1]).any()
+        self.null_entries = set(null_check[null_check].index)
+        for (year, region), tech_costs in tech_means["levelized_cost"].groupby(
+            level=[0, 1]
+        ):
+            self.sorted_technologies[(year, region)] = tuple(
+                tech_costs.droplevel([0, 1]).sort_values(kind="stable").index
+            )
+        region_means = (
+            lcost_df.set_index(["year", "region"])
+            .sort_index(ascending=True)
+            .groupby(level=[0, 1])["levelized_cost"]
+            .mean()
+        )
+        for year, region_costs in region_means.groupby(level=0):
+            self.min_cost_regions[year] = region_costs.droplevel(0).idxmin()
+
+    def return_sorted_technologies(self, year: int, region: str) -> Tuple[str, ...]:
+        """Returns the technologies of a year and region sorted from the lowest to the highest mean levelized cost.
+
+        Args:
+            year (int): The current model year.
+            region (str): The region for consideration.
+
+        Raises:
+            KeyError: If there are no levelized costs for the `year` and `region`.
+
+        Returns:
+            Tuple[str, ...]: The sorted technologies.
+        """
+        assert (
+            year,
+            region,
+        ) not in self.null_entries, f"DF entry has nans: {year} | {region}"
+        return self.sorted_technologies[(year, region)]
+
+    def return_min_cost_tech(
+        self,
+        year: int,
+        region: str,
+        potential_technologies: Union[Sequence[str], None] = None,
+    ) -> str:
+        """Returns the technology with the lowest mean levelized cost in a year and region, optionally out of a subset of `potential_technologies`.
+
+        Args:
+            year (int): The current model year.
+            region (str): The region for consideration.
+            potential_technologies (Union[Sequence[str], None], optional): The technologies to choose from. Defaults to None (all technologies).
+
+        Raises:
+            ValueError: If none of the `potential_technologies` have a levelized cost.
+
+        Returns:
+            str: The name of the lowest cost technology.
+        """
+        sorted_technologies = self.return_sorted_technologies(year, region)
+        if potential_technologies is not None:
+            potential_technologies = set(potential_technologies)
+        for technology in sorted_technologies:
+            if (potential_technologies is None) or (
+                technology in potential_technologies
+            ):
+                return technology
+        raise ValueError(
+            f"No levelized costs for the potential technologies in {year} | {region}: {potential_technologies}"
+        )
+
+    def return_min_cost_region(self, year: int) -> str:
+        return self.min_cost_regions[year]
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mppsteel.model_solver.min_cost_tech_table_class import MinCostTechTable
+
+
+def create_lcost_df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    rows = []
+    for year in [2020, 2021]:
+        for region, country_codes in [("Europe", ["DEU", "FRA"]), ("Japan", ["JPN"])]:
+            for country_code in country_codes:
+                for technology in ["EAF", "DRI-EAF", "Avg BF-BOF", "BAT BF-BOF"]:
+                    rows.append(
+                        [
+                            year,
+                            country_code,
+                            technology,
+                            region,
+                            rng.integers(4, 8) * 100.0,
+                        ]
+                    )
+    return pd.DataFrame(
+        rows,
+        columns=["year", "country_code", "technology", "region", "levelized_cost"],
+    )
+
+
+def test_min_cost_tech_matches_levelized_cost_means():
+    lcost_df = create_lcost_df()
+    min_cost_tech_table = MinCostTechTable(lcost_df)
+    lcost_df_c = lcost_df.set_index(["year", "region", "technology"]).sort_index()
+    for year in [2020, 2021]:
+        for region in ["Europe", "Japan"]:
+            tech_means = lcost_df_c.loc[year, region].groupby("technology")[
+                "levelized_cost"
+            ].mean()
+            assert (
+                min_cost_tech_table.return_min_cost_tech(year, region)
+                == tech_means.idxmin()
+            )
+            potential_technologies = ["EAF", "BAT BF-BOF"]
+            assert (
+                min_cost_tech_table.return_min_cost_tech(
+                    year, region, potential_technologies
+                )
+                == tech_means[tech_means.index.isin(potential_technologies)].idxmin()
+            )
+        region_means = lcost_df[lcost_df["year"] == year].groupby("region")[
+            "levelized_cost"
+        ].mean()
+        assert min_cost_tech_table.return_min_cost_region(year) == region_means.idxmin()
+    with pytest.raises(ValueError):
+        min_cost_tech_table.return_min_cost_tech(2020, "Europe", ["Not a tech"])
@@ -1,14 +1,15 @@
 """Module that determines functionality for opening and closing plants"""
 
-import pandas as pd
+from typing import List, Union
 
-import random
+import numpy as np
+import pandas as pd
 
 from mppsteel.plant_classes.plant_investment_cycle_class import PlantInvestmentCycle
 from mppsteel.utility.utils import join_list_as_string
 from mppsteel.plant_classes.plant_container_class import PlantIdContainer
 from mppsteel.plant_classes.capacity_constraint_class import PlantCapacityConstraint
-from mppsteel.data_load_and_format.reg_steel_demand_formatter import steel_demand_getter
+from mppsteel.data_load_and_format.reg_steel_demand_formatter import SteelDemandIndex
 from mppsteel.model_solver.plant_open_close_helpers import (
     create_and_test_market_df,
     create_new_plant,
@@ -17,21 +18,24 @@ from mppsteel.model_solver.plant_open_close_helpers import (
     ng_flag_mapper,
     production_demand_gap,
     return_modified_plants,
-    return_oldest_plant,
-    return_plants_from_region,
+    return_plant_age_year,
 )
 
 from mppsteel.config.model_config import (
     CAPACITY_UTILIZATION_CUTOFF_FOR_CLOSING_PLANT_DECISION,
     CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION,
+    MAIN_REGIONAL_SCHEMA,
     MEGATON_TO_KILOTON_FACTOR,
     TRADE_ROUNDING_NUMBER,
     UTILIZATION_ROUNDING_NUMBER,
 )
 
 from mppsteel.plant_classes.plant_choices_class import PlantChoices
+from mppsteel.plant_classes.plant_registry_class import PlantRegistry
+from mppsteel.plant_classes.plant_age_queue_class import PlantAgeQueue
 from mppsteel.plant_classes.capacity_container_class import CapacityContainerClass
 from mppsteel.model_solver.market_container_class import MarketContainerClass
+from mppsteel.model_solver.min_cost_tech_table_class import MinCostTechTable
 from mppsteel.plant_classes.regional_utilization_class import UtilizationContainerClass
 from mppsteel.model_solver.material_usage_class import (
     MaterialUsage,
@@ -39,8 +43,11 @@ from mppsteel.model_solver.material_usage_class import (
 )
 from mppsteel.trade_module.trade_helpers import test_utilization_values
 from mppsteel.trade_module.trade_flow import trade_flow
+from mppsteel.trade_module.trade_lp_engine import trade_flow_lp
 
+from mppsteel.utility.function_timer_utility import SPAN_PROFILER
 from mppsteel.utility.log_utility import get_logger
+from mppsteel.utility.random_utility import RandomStreams
 
 
 logger = get_logger(__name__)
@@ -53,7 +60,8 @@ def open_real_plants(
     capacity_container: CapacityContainerClass,
     capacity_constraint_container: PlantCapacityConstraint,
     tech_choices_container: PlantChoices,
-    lev_cost_df: pd.DataFrame,
+    min_cost_tech_table: MinCostTechTable,
+    plant_registry: PlantRegistry,
     steel_plant_df: pd.DataFrame,
     tech_availability: pd.DataFrame,
     country_df: pd.DataFrame,
@@ -62,8 +70,9 @@ def open_real_plants(
     regional_scrap: bool,
     tech_moratorium: bool,
     enforce_constraints: bool,
-) -> pd.DataFrame:
-    """Open plants based on cost competitiveness of technologies.
+    random_streams: Union[RandomStreams, None] = None,
+) -> np.ndarray:
+    """Open plants based on cost competitiveness of technologies. The new plants are appended to the plant registry.
 
     Args:
         production_demand_gap_analysis (pd.DataFrame): A DataFrame containing the analysis of past state and current state of demand, capacity and trade data.
@@ -72,8 +81,9 @@ def open_real_plants(
         capacity_container (CapacityContainerClass): The CapacityContainerClass Instance containing the capacity state.
         capacity_constraint_container (PlantCapacityConstraint): The PlantCapacityConstraint Instance containing the capacity constraint state.
         tech_choices_container (PlantChoices): The PlantChoices Instance containing the Technology Choices state.
-        lev_cost_df (pd.DataFrame): A levelized cost reference DataFrame.
-        steel_plant_df (pd.DataFrame): The steel plant DataFrame.
+        min_cost_tech_table (MinCostTechTable): The technologies of each year and region sorted by levelized cost.
+        plant_registry (PlantRegistry): The PlantRegistry Instance containing the metadata of every plant.
+        steel_plant_df (pd.DataFrame): The steel plant DataFrame of the plants in the current year.
         tech_availability (pd.DataFrame): The technology availability reference.
         country_df (pd.DataFrame): The Country Metadata DataFrame.
         business_case_ref (dict): The business cases reference dictionary.
@@ -81,49 +91,41 @@ def open_real_plants(
         regional_scrap (bool): The scenario boolean value that determines whether there is a regional or global scrap constraints.
         tech_moratorium (bool): The scenario boolean value that determines whether there is a technology moratorium.
         enforce_constraints (bool): The scenario boolean value that determines if all constraints are enforced.
+        random_streams (Union[RandomStreams, None], optional): The random streams of the year, used for the ids and countries of the new plants. The global `random` module is used if None. Defaults to None.
 
     Returns:
-        pd.DataFrame: The modified Steel Plant DataFrame.
+        np.ndarray: The plant registry row numbers of the new plants.
     """
-    if lev_cost_df.empty:
-        lev_cost_df = pd.DataFrame(columns=["year", "region", "technology"])
-    levelized_cost_for_regions = (
-        lev_cost_df.set_index(["year", "region"]).sort_index(ascending=True).copy()
-    )
-    levelized_cost_for_tech = (
-        lev_cost_df.set_index(["year", "region", "technology"])
-        .sort_index(ascending=True)
-        .copy()
-    )
-
     active_steel_plants_df = steel_plant_df[
         steel_plant_df["active_check"] == True
     ].copy()
     region_list = list(production_demand_gap_analysis.keys())
     steel_plant_cols = steel_plant_df.columns
     ng_mapper = ng_flag_mapper(steel_plant_df, country_df)
-    updated_steel_plant_df = steel_plant_df.copy()
+    new_plant_rows = [np.array([], dtype=np.int64)]
 
     for region in region_list:
         plants_required = production_demand_gap_analysis[region]["plants_required"]
 
         if plants_required > 0:
             metadata_container = []
-            for _ in range(plants_required):
+            for new_plant_number in range(plants_required):
                 new_plant_meta = new_plant_metadata(
                     plant_id_container,
                     production_demand_gap_analysis,
-                    levelized_cost_for_regions,
+                    min_cost_tech_table,
                     active_steel_plants_df,
                     ng_mapper,
                     year=year,
                     region=region,
+                    random_streams=random_streams,
+                    stream_key=("new_plant", region, new_plant_number),
                 )
                 new_plant_capacity = new_plant_meta["plant_capacity"]
                 new_plant_name = new_plant_meta["plant_name"]
                 dict_entry = create_new_plant(new_plant_meta, steel_plant_cols)
                 xcost_tech = get_min_cost_tech_for_region(
-                    levelized_cost_for_tech,
+                    min_cost_tech_table,
                     business_case_ref,
                     capacity_container.return_plant_capacity(year=year),
                     tech_availability,
@@ -167,70 +169,111 @@ def open_real_plants(
                     apply_transaction=True,
                 )
 
-            updated_steel_plant_df = pd.concat(
-                [updated_steel_plant_df, pd.DataFrame(metadata_container)]
-            ).reset_index(drop=True)
+            new_plant_rows.append(plant_registry.append_plants(metadata_container))
+
+    return np.concatenate(new_plant_rows)
 
-    return updated_steel_plant_df
 
+def update_plant_age_queue(
+    plant_age_queue: PlantAgeQueue,
+    investment_container: PlantInvestmentCycle,
+    region_plants: List[str],
+    region: str,
+    year: int,
+) -> None:
+    """Brings the plant age queue up to date for the current year before plants are closed in a region.
+    The age years of the queued plants that are due a refresh or whose investment cycles have been updated are recalculated, and the active plants of the region that are not in the queue yet are added in the order of `region_plants`.
+    The plants of a region are only added to the queue once the region has to close plants.
 
-def return_len_closed_plants_closed_in_year(
-    steel_plant_df: pd.DataFrame, year: int
-) -> int:
-    return len(steel_plant_df[steel_plant_df["end_of_operation"] == year])
+    Args:
+        plant_age_queue (PlantAgeQueue): The PlantAgeQueue Instance containing the age years of the active plants.
+        investment_container (PlantInvestmentCycle): The PlantInvestmentCycle Instance containing the investment cycle state.
+        region_plants (List[str]): The names of the active plants in the region, in solver order.
+        region (str): The region that plants are closed in.
+        year (int): The current model year.
+    """
+    investment_dict = investment_container.return_investment_dict()
+    trans_switch_years = investment_container.return_transitional_switch_years()
+    plant_start_years = investment_container.plant_start_years
+    plant_cycle_lengths = investment_container.return_cycle_lengths()
 
+    def return_age_year(plant_name: str) -> int:
+        age_year, refresh_year = return_plant_age_year(
+            investment_dict,
+            trans_switch_years,
+            plant_start_years,
+            plant_cycle_lengths,
+            plant_name,
+            year,
+        )
+        plant_age_queue.schedule_refresh(plant_name, refresh_year)
+        return age_year
 
-def return_len_inactive_plants(steel_plant_df: pd.DataFrame) -> int:
-    return len(steel_plant_df[steel_plant_df["active_check"] == False])
+    cycle_updates = investment_container.return_cycle_updates(
+        plant_age_queue.cycle_updates_seen
+    )
+    plant_age_queue.cycle_updates_seen += len(cycle_updates)
+    plants_to_refresh = plant_age_queue.pop_plants_to_refresh(year)
+    for plant_name in dict.fromkeys(plants_to_refresh + cycle_updates):
+        if plant_name in plant_age_queue:
+            plant_age_queue.update_plant(plant_name, return_age_year(plant_name))
+
+    new_plants = [
+        plant_name for plant_name in region_plants if plant_name not in plant_age_queue
+    ]
+    plant_age_queue.add_plants(
+        region, new_plants, [return_age_year(plant_name) for plant_name in new_plants]
+    )
 
 
 def close_real_plants(
     production_demand_gap_analysis: pd.DataFrame,
     utilization_container: UtilizationContainerClass,
     investment_container: PlantInvestmentCycle,
+    plant_age_queue: PlantAgeQueue,
     material_container: MaterialUsage,
     capacity_container: CapacityContainerClass,
     capacity_constraint_container: PlantCapacityConstraint,
     tech_choices_container: PlantChoices,
-    steel_plant_df: pd.DataFrame,
+    plant_registry: PlantRegistry,
+    plant_rows: np.ndarray,
     business_case_ref: dict,
     year: int,
     util_max: float,
     util_min: float,
     regional_scrap: bool,
-) -> pd.DataFrame:
-    """Closes plants from a Steel Plant DataFrame based on capacity constraint considerations, regional cost competitveness and plant age.
+    random_streams: Union[RandomStreams, None] = None,
+) -> List[str]:
+    """Closes plants in the plant registry based on capacity constraint considerations, regional cost competitveness and plant age.
 
     Args:
         production_demand_gap_analysis (pd.DataFrame): A DataFrame containing the analysis of past state and current state of demand, capacity and trade data.
         utilization_container (UtilizationContainerClass): The UtilizationContainerClass Instance containing the utilization state.
         investment_container (PlantInvestmentCycle): The PlantInvestmentCycle Instance containing the investment cycle state.
+        plant_age_queue (PlantAgeQueue): The PlantAgeQueue Instance containing the age years of the active plants. It is kept across the model years.
         material_container (MaterialUsage): The MaterialUsage Instance containing the material usage state.
         capacity_container (CapacityContainerClass): The CapacityContainerClass Instance containing the capacity state.
         capacity_constraint_container (PlantCapacityConstraint): The PlantCapacityConstraint Instance containing the capacity constraint state.
         tech_choices_container (PlantChoices): The PlantChoices Instance containing the Technology Choices state.
-        steel_plant_df (pd.DataFrame): The steel plant DataFrame.
+        plant_registry (PlantRegistry): The PlantRegistry Instance containing the metadata of every plant.
+        plant_rows (np.ndarray): The plant registry row numbers of the plants in the current year.
         business_case_ref (dict): The business cases reference dictionary.
         year (int): The current model year.
         util_max (float): The maximum capacity utilization that plants are allowed to reach before having to open new plants.
         util_min (float): The minimum capacity utilization that plants are allowed to reach before having to close existing plants.
         regional_scrap (bool): The scenario boolean value that determines whether there is a regional or global scrap constraints.
+        random_streams (Union[RandomStreams, None], optional): The random streams of the year, used to choose between plants of the same age. The global `random` module is used if None. Defaults to None.
 
     Returns:
-        pd.DataFrame: The modified Steel Plant DataFrame.
+        List[str]: The names of the closed plants.
     """
-    investment_dict = investment_container.return_investment_dict()
-    plant_start_years = investment_container.plant_start_years
-    plant_cycle_lengths = investment_container.return_cycle_lengths()
-    active_steel_plants_df = steel_plant_df[
-        steel_plant_df["active_check"] == True
-    ].copy()
-    updated_steel_plant_df = steel_plant_df.copy()
+    active_plant_rows = plant_registry.return_active_rows(plant_rows)
+    closed_plants = []
 
     for region in list(production_demand_gap_analysis.keys()):
         plants_to_close = production_demand_gap_analysis[region]["plants_to_close"]
-        initial_number_of_closed_plants = return_len_inactive_plants(
-            updated_steel_plant_df
+        initial_number_of_closed_plants = plant_registry.return_value_count(
+            plant_rows, "active_check", False
         )
 
         if plants_to_close > 0:
@@ -245,43 +288,38 @@ def close_real_plants(
             production_dict_value = production_demand_gap_analysis[region][
                 "new_utilized_capacity"
             ]
-            potential_plants_to_close = return_plants_from_region(
-                active_steel_plants_df, region
-            )
             initial_utilization = production_demand_gap_analysis[region][
                 "new_utilization"
             ]
-            closed_plants_prior = return_len_closed_plants_closed_in_year(
-                updated_steel_plant_df, year
+            closed_plants_prior = plant_registry.return_value_count(
+                plant_rows, "end_of_operation", year
             )
-            actual_plants_to_close = []
-            actual_closed_plants = 0
-            capacity_removed = 0
-
-            while capacity_removed <= min_capacity_to_close:
-                plant_to_close = return_oldest_plant(
-                    investment_dict,
-                    tech_choices_container.output_records_to_df("choice"),
-                    plant_start_years,
-                    plant_cycle_lengths,
-                    year,
-                    potential_plants_to_close,
-                )
-                potential_plants_to_close.remove(plant_to_close)
-                plant_capacity = capacity_container.return_plant_capacity(
-                    year, plant_to_close
-                )
-                actual_closed_plants += 1
-                capacity_removed += plant_capacity
-                actual_plants_to_close.append(plant_to_close)
+            update_plant_age_queue(
+                plant_age_queue,
+                investment_container,
+                plant_registry.return_plants_from_region(active_plant_rows, region),
+                region,
+                year,
+            )
+
+            (
+                actual_plants_to_close,
+                capacity_removed,
+            ) = plant_age_queue.pop_plants_to_close(
+                region,
+                min_capacity_to_close,
+                lambda plant_name: capacity_container.return_plant_capacity(
+                    year, plant_name
+                ),
+                random_streams,
+                ("close_plant", region),
+            )
+            # False if the region ran out of plants before enough capacity was closed
+            capacity_target_reached = capacity_removed > min_capacity_to_close
 
+            closed_plants.extend(actual_plants_to_close)
             for plant_to_close in actual_plants_to_close:
-                idx_close = updated_steel_plant_df.index[
-                    updated_steel_plant_df["plant_name"] == plant_to_close
-                ].tolist()[0]
-                updated_steel_plant_df.loc[idx_close, "status"] = "decomissioned"
-                updated_steel_plant_df.loc[idx_close, "end_of_operation"] = year
-                updated_steel_plant_df.loc[idx_close, "active_check"] = False
+                plant_registry.close_plant(plant_to_close, year)
                 tech_choices_container.update_choice(
                     year, plant_to_close, "Close plant"
                 )
@@ -313,49 +351,56 @@ def close_real_plants(
             capacity_removal_actual_minus_indicative = (
                 capacity_removed - min_capacity_to_close
             )
-            closed_plants_post = return_len_closed_plants_closed_in_year(
-                updated_steel_plant_df, year
+            closed_plants_post = plant_registry.return_value_count(
+                plant_rows, "end_of_operation", year
             )
-            new_number_of_closed_plants = return_len_inactive_plants(
-                updated_steel_plant_df
+            new_number_of_closed_plants = plant_registry.return_value_count(
+                plant_rows, "active_check", False
             )
             new_total_capacity = initial_capacity - capacity_removed
-            new_utilization = production_dict_value / new_total_capacity
+            new_utilization = (
+                production_dict_value / new_total_capacity
+                if new_total_capacity > 0
+                else 0
+            )
             utilization_container.update_region(year, region, new_utilization)
             production_demand_gap_analysis[region][
                 "new_total_capacity"
             ] = new_total_capacity
             production_demand_gap_analysis[region]["new_utilization"] = new_utilization
 
-            assert round(capacity_removed, TRADE_ROUNDING_NUMBER) >= round(
-                min_capacity_to_close, TRADE_ROUNDING_NUMBER
-            ), f"{region}: Capacity Removed {capacity_removed} is less than Indicative Capacity Removed {min_capacity_to_close}"
             assert round(initial_capacity, TRADE_ROUNDING_NUMBER) >= round(
                 new_total_capacity, TRADE_ROUNDING_NUMBER
             ), f"{region}: New Capacity {new_total_capacity} is greater than Old Capacity {initial_capacity}"
-            assert round(initial_utilization, UTILIZATION_ROUNDING_NUMBER) <= round(
-                new_utilization, UTILIZATION_ROUNDING_NUMBER
-            ), f"{region}: Initial Utilization {initial_utilization} is smaller than the New Utilization {new_utilization}"
-            assert (
-                round(util_min, UTILIZATION_ROUNDING_NUMBER)
-                <= round(new_utilization, UTILIZATION_ROUNDING_NUMBER)
-                <= round(util_max, UTILIZATION_ROUNDING_NUMBER)
-            ), f"{region}: utilization {new_utilization} is out of bounds -> capacity_removed: {capacity_removed} | capacity removal gap: {capacity_removal_actual_minus_indicative} | {production_demand_gap_analysis[region]}"
+            if capacity_target_reached:
+                assert round(capacity_removed, TRADE_ROUNDING_NUMBER) >= round(
+                    min_capacity_to_close, TRADE_ROUNDING_NUMBER
+                ), f"{region}: Capacity Removed {capacity_removed} is less than Indicative Capacity Removed {min_capacity_to_close}"
+                assert round(
+                    initial_utilization, UTILIZATION_ROUNDING_NUMBER
+                ) <= round(
+                    new_utilization, UTILIZATION_ROUNDING_NUMBER
+                ), f"{region}: Initial Utilization {initial_utilization} is smaller than the New Utilization {new_utilization}"
+                assert (
+                    round(util_min, UTILIZATION_ROUNDING_NUMBER)
+                    <= round(new_utilization, UTILIZATION_ROUNDING_NUMBER)
+                    <= round(util_max, UTILIZATION_ROUNDING_NUMBER)
+                ), f"{region}: utilization {new_utilization} is out of bounds -> capacity_removed: {capacity_removed} | capacity removal gap: {capacity_removal_actual_minus_indicative} | {production_demand_gap_analysis[region]}"
             assert (
                 new_number_of_closed_plants > initial_number_of_closed_plants
             ), f"Closed Plants not being updated -> plants_to_close: {plants_to_close} | initial_active_checks: {initial_number_of_closed_plants} | new_active_checks: {new_number_of_closed_plants} | plants: {join_list_as_string(actual_plants_to_close)}"
             assert (
                 closed_plants_prior + len(actual_plants_to_close) == closed_plants_post
             ), f"Closed plants prior: {closed_plants_prior} | Actual closed plants to add: {len(actual_plants_to_close)} | Closed plants post: {closed_plants_post}"
-
-    return updated_steel_plant_df
+    return closed_plants
 
 
 def open_close_plants(
-    steel_demand_df: pd.DataFrame,
-    steel_plant_df: pd.DataFrame,
+    steel_demand_index: SteelDemandIndex,
+    plant_registry: PlantRegistry,
+    plant_rows: np.ndarray,
     country_df: pd.DataFrame,
-    lev_cost_df: pd.DataFrame,
+    min_cost_tech_table: MinCostTechTable,
     business_case_ref: pd.DataFrame,
     tech_availability: pd.DataFrame,
     variable_costs_df: pd.DataFrame,
@@ -368,25 +413,29 @@ def open_close_plants(
     plant_id_container: PlantIdContainer,
     market_container: MarketContainerClass,
     investment_container: PlantInvestmentCycle,
+    plant_age_queue: PlantAgeQueue,
     year: int,
     trade_scenario: bool = False,
+    trade_engine: str = "cascade",
     tech_moratorium: bool = False,
     regional_scrap: bool = False,
     enforce_constraints: bool = False,
     investment_cycle_randomness: bool = False,
     util_max: float = CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION,
     util_min: float = CAPACITY_UTILIZATION_CUTOFF_FOR_CLOSING_PLANT_DECISION,
-) -> pd.DataFrame:
-    """Adjusts a Plant Dataframe by determining how each region should achieve its demand for the year.
+    random_streams: Union[RandomStreams, None] = None,
+) -> np.ndarray:
+    """Adjusts the plants in the plant registry by determining how each region should achieve its demand for the year.
     The function works by either
     1) Ensuring that each region can only fulfill its own demand (if `trade_scenario` is set to `False`)
     2) Using Trade rules to allow demand to be partially filled by other region's production capacity (if `trade_scenario` is set to `True`)
     3) Opens and/or closes plants based on steps 1 & 2.
 
     Args:
-        steel_demand_df (pd.DataFrame): The steel demand DataFrame.
-        steel_plant_df (pd.DataFrame): The steel plant DataFrame.
-        lev_cost_df (pd.DataFrame): A levelized cost reference DataFrame.
+        steel_demand_index (SteelDemandIndex): The SteelDemandIndex Instance containing the steel demand data.
+        plant_registry (PlantRegistry): The PlantRegistry Instance containing the metadata of every plant. New plants are appended and closed plants are updated in place.
+        plant_rows (np.ndarray): The plant registry row numbers of the active plants at the start of the year.
+        min_cost_tech_table (MinCostTechTable): The technologies of each year and region sorted by levelized cost.
         business_case_ref (dict): The business cases reference dictionary.
         tech_availability (pd.DataFrame): The technology availability reference.
         variable_costs_df (pd.DataFrame): The variable costs reference DataFrame.
@@ -399,60 +448,66 @@ def open_close_plants(
         plant_id_container (PlantIdContainer): plant_container (PlantIdContainer): Plant Container class containing a track of plants and their unique IDs.
         market_container (MarketContainerClass): The MarketContainerClass Instance containing the Trade state.
         investment_container (PlantInvestmentCycle): The PlantInvestmentCycle Instance containing the investment cycle state.
+        plant_age_queue (PlantAgeQueue): The PlantAgeQueue Instance containing the age years of the active plants. It is kept across the model years.
         year (int): The current model year.
         trade_scenario (bool, optional): The scenario boolean value that determines whether there is a trade scenario. Defaults to False.
+        trade_engine (str, optional): The engine that balances trade if `trade_scenario` is True: `cascade` (trade_flow) or `lp` (trade_flow_lp). Defaults to "cascade".
         tech_moratorium (bool, optional): The scenario boolean value that determines whether there is a technology moratorium. Defaults to False.
         regional_scrap (bool, optional): The scenario boolean value that determines whether there is a regional or global scrap constraints. Defaults to False.
         enforce_constraints (bool, optional): The scenario boolean value that determines if all constraints are enforced. Defaults to False.
         util_max (float, optional): The maximum capacity utilization that plants are allowed to reach before having to open new plants. Defaults to CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION.
         util_min (float, optional): The minimum capacity utilization that plants are allowed to reach before having to close existing plants. Defaults to CAPACITY_UTILIZATION_CUTOFF_FOR_CLOSING_PLANT_DECISION.
+        random_streams (Union[RandomStreams, None], optional): The random streams of the year, used for the new plants, the plant closures and the investment cycles of the new plants. The global `random` module is used if None. Defaults to None.
 
     Returns:
-        pd.DataFrame: The initial DataFrame passed to the function with the plants that have been opened and close updated.
+        np.ndarray: The plant registry row numbers of `plant_rows` and the plants that have been opened.
     """
 
-    logger.info(f"Running open and close decisions for {year}")
-    updated_steel_plant_df = steel_plant_df.copy()
+    logger.info("Running open and close decisions for %s", year)
+    steel_plant_df = plant_registry.to_dataframe(plant_rows)
     active_steel_plants_df = steel_plant_df[
         steel_plant_df["active_check"] == True
     ].copy()
-    capacity_container.map_capacities(active_steel_plants_df, year)
 
     if trade_scenario:
-        logger.info(f"Starting the trade flow for {year}")
-        production_demand_gap_analysis = trade_flow(
-            market_container=market_container,
-            utilization_container=utilization_container,
-            capacity_container=capacity_container,
-            steel_demand_df=steel_demand_df,
-            variable_cost_df=variable_costs_df,
-            plant_df=active_steel_plants_df,
-            capex_dict=capex_dict,
-            tech_choices_ref=tech_choices_container.return_choices(),
-            year=year,
-            util_min=util_min,
-            util_max=util_max,
-        )
+        logger.info("Starting the %s trade flow for %s", trade_engine, year)
+        trade_function = trade_flow_lp if trade_engine == "lp" else trade_flow
+        with SPAN_PROFILER.span("trade_flow"):
+            production_demand_gap_analysis = trade_function(
+                market_container=market_container,
+                utilization_container=utilization_container,
+                capacity_container=capacity_container,
+                steel_demand_index=steel_demand_index,
+                variable_cost_df=variable_costs_df,
+                plant_df=active_steel_plants_df,
+                capex_dict=capex_dict,
+                tech_choices_ref=tech_choices_container.return_choices(),
+                year=year,
+                util_min=util_min,
+                util_max=util_max,
+            )
     else:
-        logger.info(f"Starting the non-trade flow for {year}")
-        production_demand_gap_analysis = production_demand_gap(
-            steel_demand_df=steel_demand_df,
-            capacity_container=capacity_container,
-            utilization_container=utilization_container,
-            year=year,
-            util_max=util_max,
-            util_min=util_min,
-        )
+        logger.info("Starting the non-trade flow for %s", year)
+        with SPAN_PROFILER.span("production_demand_gap"):
+            production_demand_gap_analysis = production_demand_gap(
+                steel_demand_index=steel_demand_index,
+                capacity_container=capacity_container,
+                utilization_container=utilization_container,
+                year=year,
+                util_max=util_max,
+                util_min=util_min,
+            )
 
-    updated_steel_plant_df = open_real_plants(
+    new_plant_rows = open_real_plants(
         production_demand_gap_analysis,
         plant_id_container,
         material_container,
         capacity_container,
         capacity_constraint_container,
         tech_choices_container,
-        lev_cost_df,
-        updated_steel_plant_df,
+        min_cost_tech_table,
+        plant_registry,
+        steel_plant_df,
         tech_availability,
         country_df,
         business_case_ref,
@@ -460,22 +515,27 @@ def open_close_plants(
         regional_scrap,
         tech_moratorium,
         enforce_constraints,
+        random_streams,
     )
 
-    updated_steel_plant_df = close_real_plants(
+    plant_rows = np.concatenate([plant_rows, new_plant_rows])
+    closed_plants = close_real_plants(
         production_demand_gap_analysis,
         utilization_container,
         investment_container,
+        plant_age_queue,
         material_container,
         capacity_container,
         capacity_constraint_container,
         tech_choices_container,
-        updated_steel_plant_df,
+        plant_registry,
+        plant_rows,
         business_case_ref,
         year,
         util_max,
         util_min,
         regional_scrap,
+        random_streams,
     )
 
     test_utilization_values(
@@ -488,13 +548,20 @@ def open_close_plants(
         year, production_demand_gap_analysis_df, "market_results"
     )
 
-    new_active_plants = updated_steel_plant_df[
-        updated_steel_plant_df["active_check"] == True
-    ].copy()
-    capacity_container.map_capacities(new_active_plants, year)
+    new_active_plants = plant_registry.to_dataframe(
+        plant_registry.return_active_rows(plant_rows)
+    )
+    new_active_plant_rows = plant_registry.return_active_rows(new_plant_rows)
+    capacity_container.add_plants(
+        year,
+        plant_registry.return_column("plant_name", new_active_plant_rows),
+        plant_registry.return_column(MAIN_REGIONAL_SCHEMA, new_active_plant_rows),
+        plant_registry.return_column("plant_capacity", new_active_plant_rows),
+    )
+    capacity_container.remove_plants(year, closed_plants)
     regional_capacities = capacity_container.return_regional_capacity(year)
-    global_demand = steel_demand_getter(
-        steel_demand_df, year=year, metric="crude", region="World"
+    global_demand = steel_demand_index.get_steel_demand(
+        year=year, metric="crude", region="World"
     )
     utilization_container.calculate_world_utilization(
         year, regional_capacities, global_demand
@@ -503,12 +570,16 @@ def open_close_plants(
         regional_capacities.values()
     ) * utilization_container.get_utilization_values(year, region="World")
     logger.info(
-        f"Balanced Supply Demand results for {year}: Demand: {global_demand :0.2f}  | Production: {global_production :0.2f}"
+        "Balanced Supply Demand results for %s: Demand: %0.2f  | Production: %0.2f",
+        year,
+        global_demand,
+        global_production,
     )
     new_open_plants = return_modified_plants(new_active_plants, year, "open")
     investment_container.add_new_plants(
         new_open_plants["plant_name"],
         new_open_plants["start_of_operation"],
         investment_cycle_randomness,
+        random_streams,
     )
-    return updated_steel_plant_df
+    return plant_rows
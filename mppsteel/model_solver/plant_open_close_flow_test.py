@@ -0,0 +1,172 @@
+import random
+
+import pandas as pd
+
+from mppsteel.model_solver.material_usage_class import MaterialUsage
+from mppsteel.model_solver.plant_open_close_flow import (
+    close_real_plants,
+    update_plant_age_queue,
+)
+from mppsteel.model_solver.plant_open_close_helpers import current_plant_year
+from mppsteel.plant_classes.capacity_constraint_class import PlantCapacityConstraint
+from mppsteel.plant_classes.capacity_container_class import CapacityContainerClass
+from mppsteel.plant_classes.plant_age_queue_class import PlantAgeQueue
+from mppsteel.plant_classes.plant_choices_class import PlantChoices
+from mppsteel.plant_classes.plant_investment_cycle_class import PlantInvestmentCycle
+from mppsteel.plant_classes.plant_registry_class import PlantRegistry
+from mppsteel.plant_classes.regional_utilization_class import UtilizationContainerClass
+
+YEAR_RANGE = range(2020, 2051)
+YEAR = 2035
+PLANT_NAMES = [f"plant_{idx}" for idx in range(6)]
+PLANT_START_YEARS = [1990, 1995, 2000, 2005, 2010, 2015]
+PLANT_DF = pd.DataFrame(
+    {
+        "plant_name": PLANT_NAMES,
+        "rmi_region": ["Europe"] * 6,
+        "status": ["operating"] * 6,
+        "start_of_operation": PLANT_START_YEARS,
+        "plant_capacity": [1000.0] * 6,
+        "end_of_operation": [""] * 6,
+        "active_check": [True] * 6,
+    }
+)
+BUSINESS_CASE_REF = {
+    (technology, material): 0.0
+    for technology in ["BF", "EAF", "Close plant"]
+    for material in ["Scrap", "Biomass", "Biomethane", "Captured CO2", "Used CO2"]
+}
+
+
+def run_close_real_plants(record_choices: bool) -> tuple:
+    investment_container = PlantInvestmentCycle()
+    investment_container.instantiate_plants(PLANT_NAMES, PLANT_START_YEARS, False)
+    tech_choices_container = PlantChoices(record_choices=record_choices)
+    tech_choices_container.initiate_container(YEAR_RANGE)
+    for year in range(2020, YEAR + 1):
+        for plant_name in PLANT_NAMES:
+            tech_choices_container.update_choice(year, plant_name, "BF")
+    for plant_name in PLANT_NAMES[1::2]:
+        # the transitional switches that the solver makes in the off-cycle years
+        trans_year = [
+            year
+            for year_range in investment_container.return_investment_dict()[plant_name]
+            if isinstance(year_range, range)
+            for year in year_range
+            if year <= YEAR
+        ][-1]
+        investment_container.adjust_cycle_for_transitional_switch(
+            plant_name, trans_year
+        )
+        tech_choices_container.update_records(
+            "choice",
+            {
+                "year": trans_year,
+                "plant_name": plant_name,
+                "current_tech": "BF",
+                "switch_tech": "EAF",
+                "switch_type": "Transitional switch in off-cycle investment year",
+            },
+        )
+        for year in range(trans_year, YEAR + 1):
+            tech_choices_container.update_choice(year, plant_name, "EAF")
+
+    material_container = MaterialUsage()
+    material_container.initiate_years_and_regions(
+        YEAR_RANGE, ["biomass", "scrap", "co2", "ccs"], ["Europe"]
+    )
+    material_container.constraint = {
+        resource: {YEAR: {"Europe": 0.0} if resource == "scrap" else 0.0}
+        for resource in ["biomass", "scrap", "co2", "ccs"]
+    }
+    for resource in material_container.constraint:
+        material_container.set_year_balance(YEAR, resource, ["Europe"])
+    capacity_container = CapacityContainerClass()
+    capacity_container.instantiate_container(YEAR_RANGE)
+    capacity_container.start_year(YEAR)
+    capacity_container.sync_capacities(PLANT_DF, YEAR)
+    capacity_constraint_container = PlantCapacityConstraint()
+    capacity_constraint_container.instantiate_container(YEAR_RANGE)
+    utilization_container = UtilizationContainerClass()
+    utilization_container.initiate_container(YEAR_RANGE, ["Europe"])
+    plant_registry = PlantRegistry.from_dataframe(PLANT_DF)
+
+    random.seed(3)
+    closed_plants = close_real_plants(
+        production_demand_gap_analysis={
+            "Europe": {
+                "plants_to_close": 3,
+                "capacity": 6.0,
+                "new_total_capacity": 3.5,
+                "new_capacity_required": -2.5,
+                "new_utilized_capacity": 3.0,
+                "new_utilization": 0.5,
+            }
+        },
+        utilization_container=utilization_container,
+        investment_container=investment_container,
+        plant_age_queue=PlantAgeQueue(),
+        material_container=material_container,
+        capacity_container=capacity_container,
+        capacity_constraint_container=capacity_constraint_container,
+        tech_choices_container=tech_choices_container,
+        plant_registry=plant_registry,
+        plant_rows=plant_registry.order,
+        business_case_ref=BUSINESS_CASE_REF,
+        year=YEAR,
+        util_max=1.2,
+        util_min=0.5,
+        regional_scrap=True,
+    )
+    return closed_plants, tech_choices_container
+
+
+def test_closures_do_not_depend_on_the_recorded_choices():
+    closed_plants, tech_choices_container = run_close_real_plants(True)
+    assert not tech_choices_container.output_records_to_df("choice").empty
+    unrecorded_closed_plants, unrecorded_choices_container = run_close_real_plants(
+        False
+    )
+    assert unrecorded_choices_container.output_records_to_df("choice").empty
+    assert len(closed_plants) == 3
+    assert unrecorded_closed_plants == closed_plants
+    assert (
+        unrecorded_choices_container.output_choices_to_dict()
+        == tech_choices_container.output_choices_to_dict()
+    )
+
+
+def test_plant_age_queue_matches_the_plant_ages_in_every_year():
+    investment_container = PlantInvestmentCycle()
+    investment_container.instantiate_plants(PLANT_NAMES, PLANT_START_YEARS, False)
+    plant_registry = PlantRegistry.from_dataframe(PLANT_DF)
+    plant_age_queue = PlantAgeQueue()
+    for year in YEAR_RANGE:
+        if year == 2024:
+            investment_container.adjust_cycle_for_deferred_investment("plant_2", year)
+            investment_container.adjust_cycle_for_transitional_switch("plant_3", year)
+            investment_container.update_plant_cycle("plant_4", [2027, 2047])
+        if year == 2030:
+            investment_container.add_new_plants(["plant_6"], [year], False)
+            plant_registry.append_plants(
+                [dict(PLANT_DF.iloc[0], plant_name="plant_6", start_of_operation=year)]
+            )
+        update_plant_age_queue(
+            plant_age_queue,
+            investment_container,
+            plant_registry.return_plants_from_region(plant_registry.order, "Europe"),
+            "Europe",
+            year,
+        )
+        for plant_name in plant_registry.return_column("plant_name"):
+            assert plant_age_queue.plant_locations[plant_name][1] == (
+                year
+                - current_plant_year(
+                    investment_container.return_investment_dict(),
+                    investment_container.return_transitional_switch_years(),
+                    investment_container.plant_start_years,
+                    investment_container.return_cycle_lengths(),
+                    plant_name,
+                    year,
+                )
+            )
@@ -2,29 +2,29 @@
 
 from copy import deepcopy
 import math
-from typing import Dict, Sequence, Union
+from typing import Dict, Sequence, Tuple, Union
 
 import pandas as pd
 
-import random
 from mppsteel.config.mypy_config_settings import MYPY_DICT_STR_LIST
 
 from mppsteel.config.reference_lists import TECH_REFERENCE_LIST
 from mppsteel.model_solver.solver_flow_helpers import tech_availability_check
 
 from mppsteel.utility.location_utility import pick_random_country_from_region_subset
+from mppsteel.utility.random_utility import RandomStreams
 from mppsteel.utility.utils import (
     replace_dict_items,
-    get_dict_keys_by_value,
     get_closest_number_in_list,
 )
 from mppsteel.plant_classes.plant_container_class import PlantIdContainer
-from mppsteel.data_load_and_format.reg_steel_demand_formatter import steel_demand_getter
+from mppsteel.data_load_and_format.reg_steel_demand_formatter import SteelDemandIndex
 
 from mppsteel.config.model_config import (
     MAIN_REGIONAL_SCHEMA,
     CAPACITY_UTILIZATION_CUTOFF_FOR_CLOSING_PLANT_DECISION,
     CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION,
+    MODEL_YEAR_END,
     TRADE_ROUNDING_NUMBER,
     UTILIZATION_ROUNDING_NUMBER,
 )
@@ -33,8 +33,10 @@ from mppsteel.plant_classes.capacity_container_class import CapacityContainerCla
 from mppsteel.plant_classes.regional_utilization_class import UtilizationContainerClass
 from mppsteel.model_solver.material_usage_class import (
     MaterialUsage,
-    create_material_usage_dict,
+    create_material_check_entries,
+    create_material_check_matrix,
 )
+from mppsteel.model_solver.min_cost_tech_table_class import MinCostTechTable
 from mppsteel.trade_module.trade_helpers import (
     utilization_boundary,
     get_initial_utilization,
@@ -84,7 +86,7 @@ def least_consuming_tech(
 
 
 def get_min_cost_tech_for_region(
-    lcost_df: pd.DataFrame,
+    min_cost_tech_table: MinCostTechTable,
     business_case_ref: dict,
     plant_capacities_dict: dict,
     tech_availability: pd.DataFrame,
@@ -100,7 +102,7 @@ def get_min_cost_tech_for_region(
     """Gets the minimum cost technology for plants in a specified `year` and `region` based on a Levelised Cost Reference.
 
     Args:
-        lcost_df (pd.DataFrame): Levelized Cost Reference DataFrame.
+        min_cost_tech_table (MinCostTechTable): The technologies of each year and region sorted by levelized cost.
         business_case_ref (dict): Business Case Reference dictionary
         plant_capacities_dict (dict): A Dictionary with plants as keys and capacity values as values.
         tech_availability (pd.DataFrame): DataFrame of technology availability metadata
@@ -115,9 +117,7 @@ def get_min_cost_tech_for_region(
     Returns:
         str: The name of the lowest cost technology archetype.
     """
-    lcost_df_c = lcost_df.loc[year, region].groupby("technology").mean().copy()
-    assert lcost_df_c.isnull().values.any() == False, f"DF entry has nans: {lcost_df_c}"
-    lowest_cost_tech = lcost_df_c["levelized_cost"].idxmin()
+    lowest_cost_tech = min_cost_tech_table.return_min_cost_tech(year, region)
 
     if enforce_constraints:
         potential_technologies = apply_constraints_for_min_cost_tech(
@@ -153,41 +153,26 @@ def get_min_cost_tech_for_region(
                 potential_technologies.append(lowest_scrap_resource)
             # if scrap, append least cost technology regardless of other non-scrap constraints
             else:
-                lowest_cost_tech = lcost_df_c["levelized_cost"].idxmin()
                 potential_technologies.append(lowest_cost_tech)
-        lcost_df_c = lcost_df_c[lcost_df_c.index.isin(potential_technologies)]
-        lowest_cost_tech = lcost_df_c["levelized_cost"].idxmin()
-        # print(f"lowest cost technologies: {lowest_cost_tech}")
+        # walk the technologies from the lowest cost upwards and stop at the first feasible one
+        lowest_cost_tech = min_cost_tech_table.return_min_cost_tech(
+            year, region, potential_technologies
+        )
 
     return lowest_cost_tech
 
 
-def get_min_cost_region(lcost_df: pd.DataFrame, year: int) -> str:
+def get_min_cost_region(min_cost_tech_table: MinCostTechTable, year: int) -> str:
     """Gets the minimum cost region based on a Levelized cost reference.
 
     Args:
-        lcost_df (pd.DataFrame): The levelized cost DataFrame.
+        min_cost_tech_table (MinCostTechTable): The levelized cost table of each year and region.
         year (int): The current model year.
 
     Returns:
         str: The name of the lowest cost region for a particular year.
     """
-    lcost_df_c = lcost_df.loc[year].groupby("region").mean().copy()
-    return lcost_df_c["levelized_cost"].idxmin()
-
-
-def check_year_range_for_switch_type(
-    tech_choices_dict: pd.DataFrame,
-    plant_name: str,
-    list_with_years: list,
-    switch_type: str,
-) -> Union[None, range]:
-    df_c = tech_choices_dict[tech_choices_dict["plant_name"] == plant_name].copy()
-    if list_with_years:
-        check_df = df_c[df_c["year"].isin(list_with_years)].copy()
-        if switch_type in check_df.switch_type.unique():
-            return check_df[check_df["switch_type"] == switch_type]["year"]
-    return None
+    return min_cost_tech_table.return_min_cost_region(year)
 
 
 def get_trans_switch_range(list_of_ranges: list, number_to_check: int) -> list:
@@ -208,20 +193,19 @@ def get_closest_year_main_switch(
 
 
 def get_closest_year_trans_switch(
-    list_of_ranges, tech_choices_dict, year_to_check, plant_name
-) -> Union[None, range]:
+    list_of_ranges: list, trans_switch_years: list, year_to_check: int
+) -> Union[int, None]:
     list_with_years = get_trans_switch_range(list_of_ranges, year_to_check)
-    return check_year_range_for_switch_type(
-        tech_choices_dict,
-        plant_name,
-        list_with_years,
-        "Transitional switch in off-cycle investment year",
-    )
+    my_list = [year for year in trans_switch_years if year in list_with_years]
+    if my_list:
+        return get_closest_number_in_list(my_list, year_to_check)
+    else:
+        return None
 
 
 def current_plant_year(
     investment_dict: pd.DataFrame,
-    tech_choices_dict: pd.DataFrame,
+    trans_switch_years: dict,
     plant_start_years: dict,
     plant_cycle_lengths: dict,
     plant_name: str,
@@ -231,6 +215,9 @@ def current_plant_year(
 
     Args:
         investment_dict (pd.DataFrame): Dictionary with plant names as keys and main investment cycles as values.
+        trans_switch_years (dict): Dictionary with plant names as keys and the years of their transitional switches as values (see `PlantInvestmentCycle.return_transitional_switch_years`).
+        plant_start_years (dict): Dictionary with plant names as keys and start years as values.
+        plant_cycle_lengths (dict): Dictionary with plant names as keys and investment cycle lengths as values.
         plant_name (str): The name of the plant.
         current_year (int): The current model cycle year.
 
@@ -244,7 +231,7 @@ def current_plant_year(
     trans_years = [yr for yr in investment_dict[plant_name] if isinstance(yr, range)]
     main_switch_year = get_closest_year_main_switch(main_cycle_years, current_year)
     trans_switch_year = get_closest_year_trans_switch(
-        trans_years, tech_choices_dict, current_year, plant_name
+        trans_years, trans_switch_years.get(plant_name, []), current_year
     )
     potential_investment_years = [
         num for num in [main_switch_year, trans_switch_year] if isinstance(num, int)
@@ -261,27 +248,82 @@ def current_plant_year(
     )
 
 
+def return_plant_age_year(
+    investment_dict: dict,
+    trans_switch_years: dict,
+    plant_start_years: dict,
+    plant_cycle_lengths: dict,
+    plant_name: str,
+    current_year: int,
+) -> Tuple[int, int]:
+    """Returns the year that the age of a plant is counted from (see `current_plant_year`) and the next year in which it can change.
+    The year can only change in a main investment cycle year, in a transitional switch year, at the start or end of the transitional switch windows of a plant that has switched, or when the age wraps around the plant's cycle length before the first main investment cycle year.
+
+    Args:
+        investment_dict (dict): Dictionary with plant names as keys and main investment cycles as values.
+        trans_switch_years (dict): Dictionary with plant names as keys and the years of their transitional switches as values.
+        plant_start_years (dict): Dictionary with plant names as keys and start years as values.
+        plant_cycle_lengths (dict): Dictionary with plant names as keys and investment cycle lengths as values.
+        plant_name (str): The name of the plant.
+        current_year (int): The current model cycle year.
+
+    Returns:
+        Tuple[int, int]: The year that the plant's age is counted from and the next year in which it has to be checked again.
+    """
+    age_year = current_year - current_plant_year(
+        investment_dict,
+        trans_switch_years,
+        plant_start_years,
+        plant_cycle_lengths,
+        plant_name,
+        current_year,
+    )
+    plant_start_year = plant_start_years[plant_name]
+    if current_year <= plant_start_year:
+        return age_year, current_year + 1
+    main_cycle_years = [yr for yr in investment_dict[plant_name] if isinstance(yr, int)]
+    plant_trans_switch_years = trans_switch_years.get(plant_name, [])
+    event_years = main_cycle_years + plant_trans_switch_years
+    if plant_trans_switch_years:
+        for year_range in investment_dict[plant_name]:
+            if isinstance(year_range, range):
+                event_years.extend([year_range.start, year_range.stop])
+    if not [year for year in main_cycle_years if year <= current_year]:
+        # the age wraps around the cycle length until the first main investment year
+        cycle_length = plant_cycle_lengths[plant_name]
+        event_years.append(
+            plant_start_year
+            + cycle_length * ((current_year - plant_start_year) // cycle_length + 1)
+        )
+    next_years = [year for year in event_years if year > current_year]
+    return age_year, min(next_years) if next_years else MODEL_YEAR_END + 1
+
+
 def new_plant_metadata(
     plant_container: PlantIdContainer,
     production_demand_dict: dict,
-    levelized_cost_df: pd.DataFrame,
+    min_cost_tech_table: MinCostTechTable,
     plant_df: pd.DataFrame,
     ng_mapper: dict,
     year: int,
     region: str = None,
     low_cost_region: bool = False,
+    random_streams: Union[RandomStreams, None] = None,
+    stream_key: tuple = (),
 ) -> dict:
     """Creates the essential metadata fields for a new plant.
 
     Args:
         plant_container (PlantIdContainer): Plant Container class containing a track of plants and their unique IDs.
         production_demand_dict (dict): Dictionary with the results of the utilization and open/close and trade optimization process.
-        levelized_cost_df (pd.DataFrame): Levelized Cost Reference DataFrame.
+        min_cost_tech_table (MinCostTechTable): The levelized cost table of each year and region.
         plant_df (pd.DataFrame): The steel plant DataFrame.
         ng_mapper (dict): Mapper that includes country codes as keys and natural gas boolean flag as values.
         year (int): The current model year.
         region (str, optional): The region for the new plant. Defaults to None.
         low_cost_region (bool, optional): The low cost region for the. Defaults to False.
+        random_streams (Union[RandomStreams, None], optional): The random streams for the plant id and country of the new plant. The global `random` module is used if None. Defaults to None.
+        stream_key (tuple, optional): The keys of the stream of the new plant within `random_streams`. Defaults to ().
 
     Raises:
         AttributeError: When values are entered for both `region` and `low_cost_region`.
@@ -294,15 +336,21 @@ def new_plant_metadata(
         raise AttributeError(
             "You entered a value for `region` and set `low_cost_region` to true. Select ONE or the other, NOT both."
         )
-    new_id = plant_container.generate_plant_id(add_to_container=True)
+    new_id = plant_container.generate_plant_id(
+        add_to_container=True,
+        random_streams=random_streams,
+        stream_key=stream_key + ("plant_id",),
+    )
     if low_cost_region:
-        region = get_min_cost_region(levelized_cost_df, year=year)
+        region = get_min_cost_region(min_cost_tech_table, year=year)
     capacity_value = production_demand_dict[region]["avg_plant_capacity"]
     country_specific_mapper = {"China": "CHN", "India": "IND"}
     if region in country_specific_mapper:
         assigned_country = country_specific_mapper[region]
     else:
-        assigned_country = pick_random_country_from_region_subset(plant_df, str(region))
+        assigned_country = pick_random_country_from_region_subset(
+            plant_df, str(region), random_streams, stream_key + ("country",)
+        )
     return {
         "plant_id": new_id,
         "plant_name": f"{new_id} - {assigned_country}",
@@ -317,45 +365,6 @@ def new_plant_metadata(
     }
 
 
-def return_oldest_plant(
-    investment_dict: dict,
-    tech_choices_dict: pd.DataFrame,
-    plant_start_years: dict,
-    plant_cycle_lengths: dict,
-    current_year: int,
-    plant_list: Sequence,
-) -> str:
-    """Gets the oldest plant from `plant_list` based on their respective investment cycles in `investment dict` and the `current_year`.
-    If multiple plants have the same oldest age, then a plant is chosen at random.
-
-    Args:
-        investment_dict (pd.DataFrame): Dictionary with plant names as keys and main investment cycles as values.
-        plant_start_years (pd.DataFrame):
-        plant_start_years (dict):
-        plant_cycle_lengths (dict):
-        current_year (int): The current model year.
-        plant_list (Sequence): A list of plant names. Defaults to None.
-
-    Returns:
-        str: The name of the oldest plant.
-    """
-    if not plant_list:
-        plant_list = list(investment_dict.keys())
-    plant_age_dict = {
-        plant_name: current_plant_year(
-            investment_dict,
-            tech_choices_dict,
-            plant_start_years,
-            plant_cycle_lengths,
-            plant_name,
-            current_year,
-        )
-        for plant_name in plant_list
-    }
-    max_value = max(plant_age_dict.values())
-    return random.choice(get_dict_keys_by_value(plant_age_dict, max_value))
-
-
 def return_plants_from_region(plant_df: pd.DataFrame, region: str) -> list:
     """Gets plants from the same region.
 
@@ -415,7 +424,7 @@ def ng_flag_mapper(plant_df: pd.DataFrame, country_ref: pd.DataFrame) -> dict:
 
 
 def production_demand_gap(
-    steel_demand_df: pd.DataFrame,
+    steel_demand_index: SteelDemandIndex,
     capacity_container: CapacityContainerClass,
     utilization_container: UtilizationContainerClass,
     year: int,
@@ -428,7 +437,7 @@ def production_demand_gap(
     3) If not possible, open OR close plants as required to meet the regional demand.
 
     Args:
-        steel_demand_df (pd.DataFrame): The Steel Demand DataFrame.
+        steel_demand_index (SteelDemandIndex): The SteelDemandIndex Instance containing the steel demand data.
         capacity_container (CapacityContainerClass): The CapacityContainerClass Instance containing the capacity state.
         utilization_container (UtilizationContainerClass): The UtilizationContainerClass Instance containing the utilization state.
         year (int): The current model cycle year.
@@ -438,7 +447,7 @@ def production_demand_gap(
     Returns:
         dict: A dictionary of open close metadata for each region.
     """
-    logger.info(f"Defining the production demand gap for {year}")
+    logger.info("Defining the production demand gap for %s", year)
     # SUBSETTING & VALIDATION
     avg_plant_global_capacity = capacity_container.return_avg_capacity_value()
 
@@ -448,8 +457,8 @@ def production_demand_gap(
 
     for region in region_list:
 
-        demand = steel_demand_getter(
-            steel_demand_df, year=year, metric="crude", region=region
+        demand = steel_demand_index.get_steel_demand(
+            year=year, metric="crude", region=region
         )
         capacity = capacity_container.return_regional_capacity(year, region)
         initial_utilization = get_initial_utilization(
@@ -567,7 +576,13 @@ def market_balance_test(
     plants_required = production_supply_df["plants_required"].sum()
     plants_to_close = production_supply_df["plants_to_close"].sum()
     logger.info(
-        f"Market Balance Results for {year}: Capacity: {capacity_sum :0.2f} | Production: {production_sum :0.2f} | Demand: {demand_sum :0.2f} | New Plants: {plants_required} | Closed Plants {plants_to_close}"
+        "Market Balance Results for %s: Capacity: %0.2f | Production: %0.2f | Demand: %0.2f | New Plants: %s | Closed Plants %s",
+        year,
+        capacity_sum,
+        production_sum,
+        demand_sum,
+        plants_required,
+        plants_to_close,
     )
     assert capacity_sum > demand_sum
     assert capacity_sum > production_sum
@@ -628,7 +643,6 @@ def apply_constraints_for_min_cost_tech(
     Returns:
         list: The subsetted list.
     """
-    new_availability_list = []
     # Constraints checks
     combined_available_list = [
         tech
@@ -637,43 +651,38 @@ def apply_constraints_for_min_cost_tech(
             tech_availability, tech, year, tech_moratorium=tech_moratorium
         )
     ]
-    for technology in combined_available_list:
-        material_check_container = create_material_usage_dict(
-            material_usage_dict_container,
-            plant_capacities_dict,
-            business_case_ref,
-            plant_name,
-            region,
-            year,
-            technology,
-            regional_scrap,
-            plant_capacity,
-            override_constraint=False,
-            apply_transaction=False,
+    material_check_matrix = create_material_check_matrix(
+        material_usage_dict_container,
+        plant_capacities_dict,
+        business_case_ref,
+        plant_name,
+        region,
+        year,
+        combined_available_list,
+        regional_scrap,
+        plant_capacity,
+        override_constraint=False,
+    )
+    new_availability_list = [
+        technology
+        for technology, passed in zip(
+            combined_available_list, material_check_matrix.all(axis=1)
+        )
+        if passed
+    ]
+    if material_usage_dict_container.recording:
+        material_usage_dict_container.record_result_entries(
+            create_material_check_entries(
+                material_check_matrix,
+                combined_available_list,
+                {
+                    "plant": plant_name,
+                    "region": region,
+                    "start_technology": "none",
+                    "year": year,
+                    "assign_case": "new plant",
+                },
+                list_failed_resources=False,
+            )
         )
-
-        if all(material_check_container.values()):
-            new_availability_list.append(technology)
-
-        failure_resources = [
-            resource
-            for resource in material_check_container
-            if material_check_container[resource]
-        ]
-
-        result = "PASS" if all(material_check_container.values()) else "FAIL"
-
-        entry = {
-            "plant": plant_name,
-            "region": region,
-            "start_technology": "none",
-            "switch_technology": technology,
-            "year": year,
-            "assign_case": "new plant",
-            "result": result,
-            "failure_resources": failure_resources,
-            "pass_boolean_check": material_check_container,
-        }
-
-        material_usage_dict_container.record_results(entry)
     return new_availability_list
@@ -0,0 +1,121 @@
+"""Class to reuse the ranked technology tables of plants with the same decision context"""
+
+from collections import OrderedDict
+from typing import Hashable, Tuple, Union
+
+import pandas as pd
+
+from mppsteel.config.model_config import RANKING_CACHE_MAX_ENTRIES
+from mppsteel.model_solver.tco_adjustment_overlay_class import TcoAdjustmentOverlay
+from mppsteel.utility.log_utility import get_logger
+
+logger = get_logger(__name__)
+
+
+def create_ranking_cache_key(
+    year: int,
+    country_code: str,
+    start_tech: str,
+    transitional_switch_mode: bool,
+    technology_list: list,
+    solver_logic: str,
+    weighting_dict: dict,
+    tco_overlay: Union[TcoAdjustmentOverlay, None] = None,
+) -> tuple:
+    """Creates the key that identifies a plant's decision context in the RankingCache.
+
+    Args:
+        year (int): The current model year.
+        country_code (str): The country code of the plant.
+        start_tech (str): The starting technology of the plant.
+        transitional_switch_mode (bool): Boolean flag that determines if transitional switch logic is active.
+        technology_list (list): The technologies available to the plant (in order, as the order decides ties).
+        solver_logic (str): Determines the algorithm used to pick the best technology.
+        weighting_dict (dict): Weighting for tco and abatement data.
+        tco_overlay (Union[TcoAdjustmentOverlay, None], optional): The plant's TCO adjustments. Defaults to None.
+
+    Returns:
+        tuple: The cache key.
+    """
+    overlay_key = (
+        None
+        if tco_overlay is None
+        else (tco_overlay.discount, tco_overlay.cycle_length)
+    )
+    return (
+        year,
+        country_code,
+        start_tech,
+        transitional_switch_mode,
+        tuple(technology_list),
+        solver_logic,
+        tuple(sorted(weighting_dict.items())),
+        overlay_key,
+    )
+
+
+class RankingCache:
+    """Description
+    Class to store the ranked technology table of each decision context in a model year, so that plants with the same context reuse it.
+
+    Important Points
+    1) The cache only holds the entries of the current year and is cleared when `start_year` is called.
+    2) The cache is bounded to `max_entries`. The least recently used entry is removed when the cache is full.
+    3) Entries must not be modified by the caller. The per-plant constraint filtering and random tie-break are applied to new objects.
+
+    Main Class Attributes
+        cache: An OrderedDict of cache key: (ranked table, tco reference technology) pairs.
+        hits / misses: The number of cache hits and misses in the current year.
+        total_hits / total_misses: The number of cache hits and misses across all years.
+    """
+
+    def __init__(self, max_entries: int = RANKING_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.cache: OrderedDict = OrderedDict()
+        self.year = None
+        self.hits = 0
+        self.misses = 0
+        self.total_hits = 0
+        self.total_misses = 0
+
+    def start_year(self, year: int):
+        self.cache.clear()
+        self.year = year
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Union[Tuple[pd.DataFrame, str], None]:
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            self.total_hits += 1
+            return self.cache[key]
+        self.misses += 1
+        self.total_misses += 1
+        return None
+
+    def set(self, key: Hashable, value: Tuple[pd.DataFrame, str]):
+        self.cache[key] = value
+        self.cache.move_to_end(key)
+        if len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
+
+    def hit_rate(self, total: bool = False) -> float:
+        hits, misses = (
+            (self.total_hits, self.total_misses) if total else (self.hits, self.misses)
+        )
+        return hits / (hits + misses) if (hits + misses) else 0
+
+    def print_summary(self, total: bool = False):
+        hits, misses = (
+            (self.total_hits, self.total_misses) if total else (self.hits, self.misses)
+        )
+        period = "All years" if total else self.year
+        logger.info(
+            "Ranking cache | %s | Hits: %s | Misses: %s | Hit rate: % 0.2f%% | Entries: %s",
+            period,
+            hits,
+            misses,
+            self.hit_rate(total) * 100,
+            len(self.cache),
+        )
@@ -0,0 +1,233 @@
+"""Checkpoints of the solver state at year boundaries"""
+
+import gzip
+import os
+import pickle
+import random
+import re
+from pathlib import Path
+from typing import Dict, List, Union
+
+import numpy as np
+
+from mppsteel.config.mypy_config_settings import MYPY_SCENARIO_TYPE
+from mppsteel.utility.log_utility import get_logger
+
+logger = get_logger(__name__)
+
+SOLVER_CHECKPOINT_VERSION = 2
+SOLVER_CHECKPOINT_FOLDER_NAME = "solver_checkpoints"
+SOLVER_CHECKPOINT_FILENAME_PREFIX = "solver_checkpoint_"
+SOLVER_CHECKPOINT_FILENAME_REGEX = r"^solver_checkpoint_(\d{4})\.pickle\.gz$"
+SOLVER_CHECKPOINT_COMPRESSION_LEVEL = 1
+# scenario settings that do not change the results of the solver
+SOLVER_CHECKPOINT_IGNORED_SETTINGS = ["checkpoint_interval"]
+
+SOLVER_CHECKPOINT_CONTAINERS = [
+    "plant_id_container",
+    "plant_registry",
+    "market_container",
+    "utilization_container",
+    "capacity_container",
+    "material_usage_container",
+    "plant_choice_container",
+    "capacity_constraint_container",
+    "investment_container",
+]
+
+
+class SolverCheckpoint:
+    """Description
+    Snapshot of the solver state at the end of a model year, so that a run can be continued from the following year.
+
+    Important Points
+    1) The containers are pickled together, so that objects shared between them (e.g. the SolverIds of the plant choice and capacity containers) are still shared when they are loaded.
+    2) The random states of the `random` and `numpy.random` modules are stored with the containers and restored when the run is continued.
+    3) Containers that only cache values derived from the inputs (e.g. the RankingCache) are not stored and are rebuilt when the run is continued.
+    4) Checkpoints with a different `SOLVER_CHECKPOINT_VERSION` can not be loaded.
+
+    Main Class Attributes
+        year: The last model year that the checkpoint contains.
+        scenario_dict: The scenario settings of the run that created the checkpoint.
+        containers: A dictionary of the solver containers, keyed by the names in `SOLVER_CHECKPOINT_CONTAINERS`.
+        rng_state: A dictionary of the random states of the `random` and `numpy.random` modules.
+        version: The checkpoint format version.
+    """
+
+    def __init__(
+        self,
+        year: int,
+        scenario_dict: MYPY_SCENARIO_TYPE,
+        containers: Dict[str, object],
+        rng_state: Union[dict, None] = None,
+    ):
+        missing_containers = set(SOLVER_CHECKPOINT_CONTAINERS).difference(containers)
+        if missing_containers:
+            raise ValueError(
+                f"The solver checkpoint is missing containers: {sorted(missing_containers)}"
+            )
+        self.year = year
+        self.scenario_dict = dict(scenario_dict)
+        self.containers = containers
+        self.rng_state = rng_state if rng_state else capture_rng_state()
+        self.version = SOLVER_CHECKPOINT_VERSION
+
+    def __repr__(self):
+        return "Solver Checkpoint"
+
+    def __str__(self):
+        return f"Solver Checkpoint: {self.scenario_dict.get('scenario_name')} | Year {self.year} | Version {self.version}"
+
+    def matches_scenario(self, scenario_dict: MYPY_SCENARIO_TYPE) -> bool:
+        return {
+            key: value
+            for key, value in self.scenario_dict.items()
+            if key not in SOLVER_CHECKPOINT_IGNORED_SETTINGS
+        } == {
+            key: value
+            for key, value in scenario_dict.items()
+            if key not in SOLVER_CHECKPOINT_IGNORED_SETTINGS
+        }
+
+    def restore_rng_state(self) -> None:
+        random.setstate(self.rng_state["random"])
+        np.random.set_state(self.rng_state["numpy"])
+
+
+def capture_rng_state() -> dict:
+    """Returns the current random states of the `random` and `numpy.random` modules.
+
+    Returns:
+        dict: The random states, keyed by module.
+    """
+    return {"random": random.getstate(), "numpy": np.random.get_state()}
+
+
+def return_checkpoint_years(year_range: range, checkpoint_interval: int) -> List[int]:
+    """Returns the years at the end of which the solver creates a checkpoint. No checkpoint is created for the last year of the run.
+
+    Args:
+        year_range (range): The model years of the run.
+        checkpoint_interval (int): The number of years between checkpoints. No checkpoints are created if this is 0.
+
+    Returns:
+        List[int]: The checkpoint years.
+    """
+    if checkpoint_interval <= 0:
+        return []
+    return [
+        year
+        for year in year_range[:-1]
+        if (year - year_range[0] + 1) % checkpoint_interval == 0
+    ]
+
+
+def return_checkpoint_path(checkpoint_folder: Union[str, Path], year: int) -> Path:
+    return Path(checkpoint_folder) / f"{SOLVER_CHECKPOINT_FILENAME_PREFIX}{year}.pickle.gz"
+
+
+def save_solver_checkpoint(
+    checkpoint: SolverCheckpoint, checkpoint_folder: Union[str, Path]
+) -> Path:
+    """Serializes a solver checkpoint to a compressed pickle file. The file is written under a temporary name first, so that a run that stops while writing does not leave a partial checkpoint.
+
+    Args:
+        checkpoint (SolverCheckpoint): The checkpoint to serialize.
+        checkpoint_folder (Union[str, Path]): The folder where the checkpoints of the run are stored.
+
+    Returns:
+        Path: The path of the checkpoint file.
+    """
+    Path(checkpoint_folder).mkdir(parents=True, exist_ok=True)
+    checkpoint_path = return_checkpoint_path(checkpoint_folder, checkpoint.year)
+    temporary_path = checkpoint_path.with_name(f"{checkpoint_path.name}.tmp")
+    with gzip.open(
+        temporary_path, "wb", compresslevel=SOLVER_CHECKPOINT_COMPRESSION_LEVEL
+    ) as f:
+        pickle.dump(checkpoint, f, pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, checkpoint_path)
+    logger.info(
+        "* Saving solver checkpoint for %s to %s", checkpoint.year, checkpoint_path
+    )
+    return checkpoint_path
+
+
+def load_solver_checkpoint(checkpoint_path: Union[str, Path]) -> SolverCheckpoint:
+    """Loads a solver checkpoint from a compressed pickle file.
+
+    Args:
+        checkpoint_path (Union[str, Path]): The path of the checkpoint file.
+
+    Raises:
+        ValueError: If the checkpoint was created with a different checkpoint version.
+
+    Returns:
+        SolverCheckpoint: The loaded checkpoint.
+    """
+    with gzip.open(checkpoint_path, "rb") as f:
+        checkpoint: SolverCheckpoint = pickle.load(f)
+    if getattr(checkpoint, "version", None) != SOLVER_CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Solver checkpoint {checkpoint_path} has version {getattr(checkpoint, 'version', None)}, expected {SOLVER_CHECKPOINT_VERSION}"
+        )
+    logger.info("||| Loading solver checkpoint %s", checkpoint_path)
+    return checkpoint
+
+
+def return_latest_checkpoint_path(
+    checkpoint_folder: Union[str, Path], before_year: Union[int, None] = None
+) -> Union[Path, None]:
+    """Returns the path of the checkpoint with the latest year in a checkpoint folder.
+
+    Args:
+        checkpoint_folder (Union[str, Path]): The folder where the checkpoints of the run are stored.
+        before_year (Union[int, None], optional): If given, only checkpoints of earlier years are considered. Defaults to None.
+
+    Returns:
+        Union[Path, None]: The path of the latest checkpoint, or None if the folder does not contain any checkpoints.
+    """
+    if not os.path.isdir(checkpoint_folder):
+        return None
+    checkpoint_years = [
+        int(match.group(1))
+        for match in (
+            re.match(SOLVER_CHECKPOINT_FILENAME_REGEX, filename)
+            for filename in os.listdir(checkpoint_folder)
+        )
+        if match and ((before_year is None) or (int(match.group(1)) < before_year))
+    ]
+    if not checkpoint_years:
+        return None
+    return return_checkpoint_path(checkpoint_folder, max(checkpoint_years))
+
+
+def load_latest_solver_checkpoint(
+    checkpoint_folder: Union[str, Path], before_year: Union[int, None] = None
+) -> Union[SolverCheckpoint, None]:
+    """Loads the checkpoint with the latest year in a checkpoint folder.
+
+    Args:
+        checkpoint_folder (Union[str, Path]): The folder where the checkpoints of the run are stored.
+        before_year (Union[int, None], optional): If given, only checkpoints of earlier years are considered. Defaults to None.
+
+    Returns:
+        Union[SolverCheckpoint, None]: The latest checkpoint, or None if the folder does not contain any checkpoints.
+    """
+    checkpoint_path = return_latest_checkpoint_path(checkpoint_folder, before_year)
+    if checkpoint_path is None:
+        logger.info("No solver checkpoints found in %s", checkpoint_folder)
+        return None
+    return load_solver_checkpoint(checkpoint_path)
+
+
+def clear_solver_checkpoints(checkpoint_folder: Union[str, Path]) -> None:
+    """Removes the checkpoints of a previous run from a checkpoint folder.
+
+    Args:
+        checkpoint_folder (Union[str, Path]): The folder where the checkpoints of the run are stored.
+    """
+    if not os.path.isdir(checkpoint_folder):
+        return
+    for filename in os.listdir(checkpoint_folder):
+        if re.match(SOLVER_CHECKPOINT_FILENAME_REGEX, filename):
+            os.remove(Path(checkpoint_folder) / filename)
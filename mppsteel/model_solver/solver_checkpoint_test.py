@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from mppsteel.model_solver.solver_checkpoint import (
+    SOLVER_CHECKPOINT_CONTAINERS,
+    SolverCheckpoint,
+    load_latest_solver_checkpoint,
+    load_solver_checkpoint,
+    return_checkpoint_years,
+    save_solver_checkpoint,
+)
+
+
+def create_checkpoint(year: int) -> SolverCheckpoint:
+    shared_state = {"plant_a": 1.0}
+    containers = {
+        name: {"shared": shared_state} for name in SOLVER_CHECKPOINT_CONTAINERS
+    }
+    return SolverCheckpoint(year, {"scenario_name": "default"}, containers)
+
+
+def test_checkpoint_years():
+    assert return_checkpoint_years(range(2020, 2051), 5) == [
+        2024,
+        2029,
+        2034,
+        2039,
+        2044,
+        2049,
+    ]
+    assert return_checkpoint_years(range(2020, 2051), 0) == []
+
+
+def test_checkpoint_round_trip(tmp_path):
+    random.seed(1)
+    save_solver_checkpoint(create_checkpoint(2024), tmp_path)
+    expected_draw = random.random()
+    save_solver_checkpoint(create_checkpoint(2029), tmp_path)
+    checkpoint = load_latest_solver_checkpoint(tmp_path)
+    assert checkpoint.year == 2029
+    assert (
+        checkpoint.containers["capacity_container"]["shared"]
+        is checkpoint.containers["plant_choice_container"]["shared"]
+    )
+    assert checkpoint.matches_scenario(
+        {"scenario_name": "default", "checkpoint_interval": 1}
+    )
+    checkpoint = load_solver_checkpoint(tmp_path / "solver_checkpoint_2024.pickle.gz")
+    checkpoint.restore_rng_state()
+    assert random.random() == expected_draw
+
+
+def test_checkpoint_version_mismatch(tmp_path):
+    checkpoint = create_checkpoint(2024)
+    checkpoint.version = 0
+    checkpoint_path = save_solver_checkpoint(checkpoint, tmp_path)
+    with pytest.raises(ValueError):
+        load_solver_checkpoint(checkpoint_path)
+    assert load_latest_solver_checkpoint(tmp_path / "missing") is None
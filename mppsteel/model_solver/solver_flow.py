@@ -1,21 +1,26 @@
 """Main solving script for deciding investment decisions."""
 
+import logging
+
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+from pathlib import Path
 from typing import Iterable, Union
 from mppsteel.config.mypy_config_settings import MYPY_SCENARIO_TYPE
+from mppsteel.config.model_scenarios import TRADE_ENGINES
 from mppsteel.utility.dataframe_utility import extend_df_years
 
 from mppsteel.model_solver.solver_summary import (
     tech_capacity_splits,
     utilization_mapper,
 )
-from mppsteel.utility.function_timer_utility import timer_func
+from mppsteel.utility.function_timer_utility import SPAN_PROFILER, timer_func
 from mppsteel.plant_classes.plant_container_class import PlantIdContainer
 from mppsteel.plant_classes.plant_investment_cycle_class import PlantInvestmentCycle
 from mppsteel.plant_classes.capacity_constraint_class import PlantCapacityConstraint
-from mppsteel.data_load_and_format.reg_steel_demand_formatter import steel_demand_getter
+from mppsteel.data_load_and_format.reg_steel_demand_formatter import SteelDemandIndex
 from mppsteel.utility.file_handling_utility import (
     read_pickle_folder,
     return_pkl_paths,
@@ -33,17 +38,30 @@ from mppsteel.config.model_config import (
     PKL_DATA_IMPORTS,
     MAIN_REGIONAL_SCHEMA,
     PROJECT_PATH,
-    IMPORT_DATA_PATH
+    IMPORT_DATA_PATH,
+    SOLVER_CHECKPOINT_INTERVAL_YEARS,
+    VALIDATE_CAPACITY_RUNNING_TOTALS,
 )
 
-from mppsteel.config.reference_lists import (
-    RESOURCE_CONTAINER_REF,
-)
 from mppsteel.model_solver.solver_flow_helpers import read_and_format_tech_availability
 from mppsteel.model_solver.material_usage_class import return_current_usage
-from mppsteel.data_load_and_format.steel_plant_formatter import create_active_check_col
 from mppsteel.model_solver.tco_and_abatement_optimizer import subset_presolver_df
+from mppsteel.model_solver.tco_abatement_tensor_class import TcoAbatementTensor
+from mppsteel.model_solver.ranking_cache_class import RankingCache
+from mppsteel.model_solver.min_cost_tech_table_class import MinCostTechTable
+from mppsteel.model_solver.solver_checkpoint import (
+    SOLVER_CHECKPOINT_FOLDER_NAME,
+    SolverCheckpoint,
+    clear_solver_checkpoints,
+    load_latest_solver_checkpoint,
+    return_checkpoint_years,
+    save_solver_checkpoint,
+)
+from mppsteel.model_solver.solver_warm_start import return_divergence_year
 from mppsteel.plant_classes.plant_choices_class import PlantChoices
+from mppsteel.plant_classes.id_interner_class import SolverIds
+from mppsteel.plant_classes.plant_age_queue_class import PlantAgeQueue
+from mppsteel.plant_classes.plant_registry_class import PlantRegistry
 from mppsteel.plant_classes.capacity_container_class import CapacityContainerClass
 from mppsteel.model_solver.market_container_class import MarketContainerClass
 
@@ -53,21 +71,31 @@ from mppsteel.plant_classes.regional_utilization_class import (
 )
 from mppsteel.model_solver.material_usage_class import (
     MaterialUsage,
-    create_material_usage_dict,
+    apply_material_usage_transactions,
 )
 from mppsteel.model_solver.plant_open_close_flow import open_close_plants
 from mppsteel.model_solver.solver_flow_helpers import (
     active_check_results,
     create_solver_entry_dict,
+    create_technology_rank_batch,
     get_current_technology,
+    partition_switchers,
     resort_primary_switchers,
     return_best_tech,
+    return_best_tech_from_batch,
     return_initial_tech,
+    return_partition_indices,
+    return_recording_settings,
+    return_unrecorded_files,
     split_primary_plant_switchers,
 )
 from mppsteel.data_load_and_format.country_reference import country_df_formatter
 from mppsteel.data_preprocessing.levelized_cost import generate_levelized_cost_results
-from mppsteel.utility.log_utility import get_logger
+from mppsteel.utility.log_utility import get_logger, set_log_run_name
+from mppsteel.utility.random_utility import (
+    RandomStreams,
+    return_scenario_random_streams,
+)
 
 
 logger = get_logger(__name__)
@@ -149,9 +177,11 @@ class ChooseTechnologyInput:
         levelized_cost: pd.DataFrame = pd.DataFrame(),
         steel_plant_abatement_switches: pd.DataFrame = pd.DataFrame(),
         abatement_slim: pd.DataFrame = pd.DataFrame(),
+        decision_tensor: Union[TcoAbatementTensor, None] = None,
         scenario_dict: MYPY_SCENARIO_TYPE = {},
         wsa_dict: dict[str, float] = {},
         model_year_range: range = range(2020, 2021),
+        random_streams: RandomStreams = RandomStreams(),
     ):
         self.original_plant_df = original_plant_df
         self.year_range = year_range
@@ -182,12 +212,16 @@ class ChooseTechnologyInput:
         self.levelized_cost = levelized_cost
         self.steel_plant_abatement_switches = steel_plant_abatement_switches
         self.abatement_slim = abatement_slim
+        self.decision_tensor = decision_tensor
         self.scenario_dict = scenario_dict
         self.wsa_dict = wsa_dict
         self.model_year_range = model_year_range
+        self.random_streams = random_streams
 
     @classmethod
-    def from_filesystem(cls, scenario_dict, pkl_paths, year_range=MODEL_YEAR_RANGE):
+    def from_filesystem(
+        cls, scenario_dict, pkl_paths, year_range=MODEL_YEAR_RANGE, model_run=""
+    ):
         tech_moratorium = scenario_dict["tech_moratorium"]
         trade_active = scenario_dict["trade_active"]
         enforce_constraints = scenario_dict["enforce_constraints"]
@@ -260,8 +294,12 @@ class ChooseTechnologyInput:
         abatement_slim = subset_presolver_df(
             steel_plant_abatement_switches, subset_type="abatement"
         )
+        decision_tensor = TcoAbatementTensor.from_dataframes(tco_slim, abatement_slim)
         wsa_dict = create_wsa_2020_utilization_dict(utilization_cap=1)
         model_year_range = MODEL_YEAR_RANGE
+        random_streams = return_scenario_random_streams(scenario_dict)
+        if model_run:
+            random_streams = random_streams.child("model_run", model_run)
         return cls(
             original_plant_df=original_plant_df,
             year_range=year_range,
@@ -289,23 +327,36 @@ class ChooseTechnologyInput:
             levelized_cost=levelized_cost,
             steel_plant_abatement_switches=steel_plant_abatement_switches,
             abatement_slim=abatement_slim,
+            decision_tensor=decision_tensor,
             scenario_dict=scenario_dict,
             wsa_dict=wsa_dict,
             model_year_range=model_year_range,
+            random_streams=random_streams,
         )
 
 
-def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
+def choose_technology_core(
+    cti: ChooseTechnologyInput,
+    checkpoint_folder: Union[str, Path, None] = None,
+    checkpoint_interval: int = SOLVER_CHECKPOINT_INTERVAL_YEARS,
+    resume_checkpoint: Union[SolverCheckpoint, None] = None,
+) -> dict:
     """Function containing the entire solver decision logic flow.
     1) In each year, the solver splits the plants non-switchers and switchers (secondary EAF plants and primary plants).
     2) The solver extracts the prior year technology of the non-switchers and assumes this is the current technology of the switchers.
     3) The material usage of the non-switching and secondary EAF plants is subtracted from the constraints and the remainder is then left over for the remaining switching plants.
     4) Plants are opened or closed according to the Demand for that year, the open and closing logic (potentially including trade). Which changes the capacity constraints.
-    5) All switching plants are then sent through the `return_best_tech` function that decides the best technology depending on the switch type (main cycle or transitional switch).
+    5) All switching plants are then sent through the `return_best_tech` function that decides the best technology depending on the switch type (main cycle or transitional switch). When a `decision_tensor` is available and the solver logic is `ranked`, the technologies of all main cycle (and transitional switch) plants are ranked together in a `TechnologyRankBatch` before each plant picks its technology.
     6) All results are saved to a dictionary which is outputted at the end of the year loop.
+    7) The random choices of the solver (shuffling the switchers, breaking ties between technologies, opening and closing plants) are drawn from the RandomStreams of `cti`, keyed by year and by plant or purpose, so that they do not depend on the order the plants are processed in.
+    8) If the SPAN_PROFILER is enabled, each year and its phases (activity check, non-switcher usage, open/close, main cycle decisions, transitional decisions, capacity constraint) are recorded as spans.
+    9) If a `checkpoint_folder` is given, the state of the solver containers is saved to a SolverCheckpoint every `checkpoint_interval` years. If a `resume_checkpoint` is given, the solver continues from the year after the checkpoint with the checkpoint's containers (which are modified in place) and the references of `cti`.
 
     Args:
-        scenario_dict (int): Model Scenario settings.
+        cti (ChooseTechnologyInput): The inputs of the solver.
+        checkpoint_folder (Union[str, Path, None], optional): The folder where the solver checkpoints are saved. No checkpoints are saved if None. Defaults to None.
+        checkpoint_interval (int, optional): The number of years between solver checkpoints. Defaults to SOLVER_CHECKPOINT_INTERVAL_YEARS.
+        resume_checkpoint (Union[SolverCheckpoint, None], optional): A checkpoint to continue the run from. Defaults to None.
     Returns:
         dict: A dictionary containing the best technology resuls. Organised as [year][plant][best tech].
     """
@@ -314,6 +365,7 @@ def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
     scenario_dict = cti.scenario_dict
     tech_moratorium = cti.tech_moratorium
     trade_scenario = cti.trade_active
+    trade_engine = TRADE_ENGINES[str(scenario_dict.get("trade_engine", "cascade"))]
     enforce_constraints = cti.enforce_constraints
     regional_scrap = cti.regional_scrap_constraint
     investment_cycle_randomness = cti.investment_cycle_randomness
@@ -337,17 +389,20 @@ def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
     levelized_cost = cti.levelized_cost
     steel_plant_abatement_switches = cti.steel_plant_abatement_switches
     abatement_slim = cti.abatement_slim
+    decision_tensor = cti.decision_tensor
     wsa_dict = cti.wsa_dict
     model_year_range: range = cti.model_year_range
+    random_streams = cti.random_streams
+    recording_settings = return_recording_settings(scenario_dict)
 
     # Initialize plant container
     PlantIDC = PlantIdContainer()
     PlantIDC.add_steel_plant_ids(original_plant_df)
-    year_start_df = original_plant_df.copy()
+    PlantRegistryContainer = PlantRegistry.from_dataframe(original_plant_df)
 
     # Instantiate Trade Container
     market_container = MarketContainerClass()
-    region_list = year_start_df[MAIN_REGIONAL_SCHEMA].unique()
+    region_list = original_plant_df[MAIN_REGIONAL_SCHEMA].unique()
     market_container.full_instantiation(model_year_range, region_list)
 
     # Utilization & Capacity Containers
@@ -356,7 +411,9 @@ def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
     UtilizationContainer.initiate_container(
         year_range=model_year_range, region_list=region_list
     )
-    CapacityContainer = CapacityContainerClass()
+    # Plant and technology ids shared by the containers
+    SolverIdContainer = SolverIds(original_plant_df["plant_name"])
+    CapacityContainer = CapacityContainerClass(solver_ids=SolverIdContainer)
     CapacityContainer.instantiate_container(model_year_range)
     CapacityContainer.set_average_plant_capacity(original_plant_df)
 
@@ -367,7 +424,9 @@ def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
         "co2": co2_constraint,
         "ccs": ccs_constraint,
     }
-    MaterialUsageContainer = MaterialUsage()
+    MaterialUsageContainer = MaterialUsage(
+        recording=recording_settings["material_records"]
+    )
     MaterialUsageContainer.initiate_years_and_regions(
         model_year_range,
         resource_list=list(resource_models.keys()),
@@ -378,341 +437,372 @@ def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
         MaterialUsageContainer.load_constraint(resource_models[resource], resource)
 
     # Plant Choices
-    PlantChoiceContainer = PlantChoices()
+    PlantChoiceContainer = PlantChoices(
+        record_choices=recording_settings["choice_records"],
+        record_ranks=recording_settings["rank_records"],
+        solver_ids=SolverIdContainer,
+    )
     PlantChoiceContainer.initiate_container(model_year_range)
     # Plant Constraint
     PlantCapacityConstraintContainer = PlantCapacityConstraint()
     PlantCapacityConstraintContainer.instantiate_container(model_year_range)
-    # Investment Cycles
-    for year in tqdm(model_year_range, total=len(model_year_range), desc="Years"):
-        year_start_df["active_check"] = year_start_df.apply(
-            create_active_check_col, year=year, axis=1
-        )
-        active_plant_df = year_start_df[year_start_df["active_check"] == True].copy()
-        inactive_year_start_df = year_start_df[
-            year_start_df["active_check"] == False
-        ].copy()
-        CapacityContainer.map_capacities(active_plant_df, year)
-        world_capacity = CapacityContainer.get_world_capacity_sum(year)
-        PlantCapacityConstraintContainer.update_capacity_turnover_limit(
-            year, world_capacity
-        )
-        PlantCapacityConstraintContainer.update_capacity_balance(year)
-        logger.info(
-            f"Number of active (inactive) plants in {year}: {len(active_plant_df)} ({len(inactive_year_start_df)})"
-        )
+    # Plant ages for closures (derived from the investment cycles, so it is rebuilt rather than checkpointed)
+    PlantAgeQueueContainer = PlantAgeQueue()
+    # Ranking Cache
+    RankingCacheContainer = RankingCache()
+    # Levelized cost ranking of technologies for new plants
+    MinCostTechContainer = MinCostTechTable(levelized_cost)
+    # Steel demand lookups
+    SteelDemandContainer = SteelDemandIndex(steel_demand_df)
 
+    # Solver Checkpoints
+    solver_year_range = model_year_range
+    if resume_checkpoint is not None:
+        logger.info("Resuming the solver from the end of %s", resume_checkpoint.year)
+        checkpoint_containers = resume_checkpoint.containers
+        PlantIDC = checkpoint_containers["plant_id_container"]
+        PlantRegistryContainer = checkpoint_containers["plant_registry"]
+        market_container = checkpoint_containers["market_container"]
+        UtilizationContainer = checkpoint_containers["utilization_container"]
+        CapacityContainer = checkpoint_containers["capacity_container"]
+        MaterialUsageContainer = checkpoint_containers["material_usage_container"]
+        PlantChoiceContainer = checkpoint_containers["plant_choice_container"]
+        PlantCapacityConstraintContainer = checkpoint_containers[
+            "capacity_constraint_container"
+        ]
+        PlantInvestmentCycleContainer = checkpoint_containers["investment_container"]
+        # the constraints of a warm-started run can differ from the checkpoint's run
         for resource in resource_models:
-            MaterialUsageContainer.set_year_balance(year, resource, region_list)
-
-        # Assign initial technologies for plants in the first year
-        logger.info(f"Running investment decisions for {year}")
-        if year == MODEL_YEAR_START:
-            logger.info(f"Loading initial technology choices for {year}")
-            for row in active_plant_df.itertuples():
-                PlantChoiceContainer.update_choice(
-                    year, row.plant_name, row.initial_technology
-                )
-            UtilizationContainer.assign_year_utilization(MODEL_YEAR_START, wsa_dict)
+            MaterialUsageContainer.load_constraint(resource_models[resource], resource)
+        resume_checkpoint.restore_rng_state()
+        solver_year_range = range(resume_checkpoint.year + 1, model_year_range.stop)
+    solver_containers = {
+        "plant_id_container": PlantIDC,
+        "plant_registry": PlantRegistryContainer,
+        "market_container": market_container,
+        "utilization_container": UtilizationContainer,
+        "capacity_container": CapacityContainer,
+        "material_usage_container": MaterialUsageContainer,
+        "plant_choice_container": PlantChoiceContainer,
+        "capacity_constraint_container": PlantCapacityConstraintContainer,
+        "investment_container": PlantInvestmentCycleContainer,
+    }
+    checkpoint_years = (
+        return_checkpoint_years(model_year_range, checkpoint_interval)
+        if checkpoint_folder
+        else []
+    )
 
-        # Exceptions for plants in plants database that are scheduled to open later, to have their prior technology as their previous choice
-        for row in inactive_year_start_df.itertuples():
-            if row.start_of_operation == year + 1:
-                PlantChoiceContainer.update_choice(
-                    year, row.plant_name, row.initial_technology
+    # Investment Cycles
+    for year in tqdm(solver_year_range, total=len(solver_year_range), desc="Years"):
+        with SPAN_PROFILER.span("year", year=year):
+            year_streams = random_streams.child(year)
+            with SPAN_PROFILER.span("activity_check"):
+                RankingCacheContainer.start_year(year)
+                year_start_rows = PlantRegistryContainer.order
+                active_idx, inactive_idx = return_partition_indices(
+                    PlantRegistryContainer.create_active_check_mask(
+                        year, year_start_rows
+                    )
+                )
+                active_plant_rows = year_start_rows[active_idx]
+                inactive_plant_rows = year_start_rows[inactive_idx]
+                active_plant_df = PlantRegistryContainer.to_dataframe(active_plant_rows)
+                CapacityContainer.start_year(year)
+                CapacityContainer.sync_capacities(active_plant_df, year)
+                if VALIDATE_CAPACITY_RUNNING_TOTALS:
+                    CapacityContainer.check_capacities(active_plant_df, year)
+                world_capacity = CapacityContainer.get_world_capacity_sum(year)
+                PlantCapacityConstraintContainer.update_capacity_turnover_limit(
+                    year, world_capacity
+                )
+                PlantCapacityConstraintContainer.update_capacity_balance(year)
+                logger.info(
+                    "Number of active (inactive) plants in %s: %s (%s)",
+                    year,
+                    len(active_plant_df),
+                    len(inactive_plant_rows),
                 )
 
-        all_active_plant_names = active_plant_df["plant_name"].copy()
-        plant_capacities_dict = CapacityContainer.return_plant_capacity(year=year)
-        switchers = PlantInvestmentCycleContainer.return_plant_switchers(
-            all_active_plant_names, year, "combined"
-        )
-        non_switchers = list(set(all_active_plant_names).difference(switchers))
-        switchers_df = (
-            active_plant_df.set_index(["plant_name"]).drop(non_switchers).reset_index()
-        ).copy()
-        switchers_df.rename({"index": "plant_name"}, axis=1, inplace=True)
-        non_switchers_df = (
-            active_plant_df.set_index(["plant_name"]).drop(switchers).reset_index()
-        ).copy()
-        non_switchers_df.rename({"index": "plant_name"}, axis=1, inplace=True)
-        logger.info(f"-- Assigning usage for exisiting plants")
-
-        # skip first year
-        if year in YEARS_TO_SKIP_FOR_SOLVER:
-            pass
-        else:
-            # check resource allocation for non-switchers
-            for row in non_switchers_df.itertuples():
-                plant_name = row.plant_name
-                plant_region = row.rmi_region
-                plant_capacity = row.plant_capacity / MEGATON_TO_KILOTON_FACTOR
-                current_tech = ""
-                year_founded = PlantInvestmentCycleContainer.plant_start_years[
-                    plant_name
+                for resource in resource_models:
+                    MaterialUsageContainer.set_year_balance(year, resource, region_list)
+
+                # Assign initial technologies for plants in the first year
+                logger.info("Running investment decisions for %s", year)
+                if year == MODEL_YEAR_START:
+                    logger.info("Loading initial technology choices for %s", year)
+                    for row in active_plant_df.itertuples():
+                        PlantChoiceContainer.update_choice(
+                            year, row.plant_name, row.initial_technology
+                        )
+                    UtilizationContainer.assign_year_utilization(
+                        MODEL_YEAR_START, wsa_dict
+                    )
+
+                # Exceptions for plants in plants database that are scheduled to open later, to have their prior technology as their previous choice
+                opening_plant_rows = inactive_plant_rows[
+                    PlantRegistryContainer.return_column(
+                        "start_of_operation", inactive_plant_rows
+                    )
+                    == year + 1
                 ]
+                for row in PlantRegistryContainer.to_dataframe(
+                    opening_plant_rows
+                ).itertuples():
+                    PlantChoiceContainer.update_choice(
+                        year, row.plant_name, row.initial_technology
+                    )
 
-                if (year == MODEL_YEAR_START) or (year == year_founded):
-                    current_tech = row.initial_technology
-                else:
-                    current_tech = PlantChoiceContainer.get_choice(year - 1, plant_name)
-                create_solver_entry_dict(
-                    PlantChoiceContainer,
-                    year,
-                    plant_name,
-                    current_tech,
-                    current_tech,
-                    "not a switch year",
-                    update_record=True,
-                    update_choice=True,
+                all_active_plant_names = active_plant_df["plant_name"].copy()
+                plant_capacities_dict = CapacityContainer.return_plant_capacity(
+                    year=year
+                )
+                switchers = PlantInvestmentCycleContainer.return_plant_switchers(
+                    all_active_plant_names, year, "combined"
+                )
+                switchers_df, non_switchers_df, non_switchers = partition_switchers(
+                    active_plant_df, switchers
                 )
+            with SPAN_PROFILER.span("non_switcher_usage"):
+                logger.info("-- Assigning usage for exisiting plants")
+
+                # skip first year
+                if year in YEARS_TO_SKIP_FOR_SOLVER:
+                    pass
+                else:
+                    # check resource allocation for non-switchers
+                    non_switcher_techs = []
+                    for row in non_switchers_df.itertuples():
+                        plant_name = row.plant_name
+                        current_tech = ""
+                        year_founded = PlantInvestmentCycleContainer.plant_start_years[
+                            plant_name
+                        ]
+
+                        if (year == MODEL_YEAR_START) or (year == year_founded):
+                            current_tech = row.initial_technology
+                        else:
+                            current_tech = PlantChoiceContainer.get_choice(
+                                year - 1, plant_name
+                            )
+                        create_solver_entry_dict(
+                            PlantChoiceContainer,
+                            year,
+                            plant_name,
+                            current_tech,
+                            current_tech,
+                            "not a switch year",
+                            update_record=True,
+                            update_choice=True,
+                        )
+                        non_switcher_techs.append(current_tech)
+
+                    apply_material_usage_transactions(
+                        material_usage_dict_container=MaterialUsageContainer,
+                        plant_capacities=plant_capacities_dict,
+                        business_case_ref=business_case_ref,
+                        plant_names=non_switchers_df["plant_name"],
+                        regions=non_switchers_df["rmi_region"],
+                        year=year,
+                        technologies=non_switcher_techs,
+                        capacity_values=non_switchers_df["plant_capacity"]
+                        / MEGATON_TO_KILOTON_FACTOR,
+                    )
+
+                # the scrap usage is only calculated to be logged
+                log_scrap_usage = logger.isEnabledFor(logging.INFO)
+                if log_scrap_usage:
+                    intensity_matrix = MaterialUsageContainer.return_intensity_matrix(
+                        business_case_ref
+                    )
+                    scrap_usage = return_current_usage(
+                        non_switchers,
+                        PlantChoiceContainer.return_choices(year),
+                        plant_capacities_dict,
+                        intensity_matrix,
+                        "scrap",
+                    )
+                    logger.info(
+                        "Scrap usage | Non-Switchers: % 0.2f | Count: %s",
+                        scrap_usage,
+                        len(non_switchers),
+                    )
 
-                create_material_usage_dict(
+                # check resource allocation for EAF secondary capacity
+                secondary_eaf_switchers = switchers_df[
+                    switchers_df["primary_capacity"] == "N"
+                ].copy()
+
+                for row in secondary_eaf_switchers.itertuples():
+                    create_solver_entry_dict(
+                        PlantChoiceContainer,
+                        year,
+                        row.plant_name,
+                        "EAF",
+                        "EAF",
+                        "Secondary capacity is always EAF",
+                        update_record=True,
+                        update_choice=True,
+                    )
+
+                apply_material_usage_transactions(
                     material_usage_dict_container=MaterialUsageContainer,
                     plant_capacities=plant_capacities_dict,
                     business_case_ref=business_case_ref,
-                    plant_name=plant_name,
-                    region=plant_region,
+                    plant_names=secondary_eaf_switchers["plant_name"],
+                    regions=secondary_eaf_switchers["rmi_region"],
                     year=year,
-                    switch_technology=current_tech,
-                    regional_scrap=regional_scrap,
-                    capacity_value=plant_capacity,
-                    override_constraint=True,
-                    apply_transaction=True,
+                    technologies=["EAF"] * len(secondary_eaf_switchers),
+                    capacity_values=secondary_eaf_switchers["plant_capacity"]
+                    / MEGATON_TO_KILOTON_FACTOR,
                 )
 
-        scrap_usage = return_current_usage(
-            non_switchers,
-            PlantChoiceContainer.return_choices(year),
-            plant_capacities_dict,
-            business_case_ref,
-            RESOURCE_CONTAINER_REF["scrap"],
-        )
-        logger.info(
-            f"Scrap usage | Non-Switchers: {scrap_usage: 0.2f} | Count: {len(non_switchers)}"
-        )
-
-        # check resource allocation for EAF secondary capacity
-        secondary_eaf_switchers = switchers_df[
-            switchers_df["primary_capacity"] == "N"
-        ].copy()
-        secondary_eaf_switchers_plants = secondary_eaf_switchers["plant_name"].unique()
-
-        for row in secondary_eaf_switchers.itertuples():
-            plant_name = row.plant_name
-            plant_capacity = row.plant_capacity / MEGATON_TO_KILOTON_FACTOR
-            plant_region = row.rmi_region
-            create_solver_entry_dict(
-                PlantChoiceContainer,
-                year,
-                plant_name,
-                "EAF",
-                "EAF",
-                "Secondary capacity is always EAF",
-                update_record=True,
-                update_choice=True,
-            )
-
-            create_material_usage_dict(
-                material_usage_dict_container=MaterialUsageContainer,
-                plant_capacities=plant_capacities_dict,
-                business_case_ref=business_case_ref,
-                plant_name=plant_name,
-                region=plant_region,
-                year=year,
-                switch_technology="EAF",
-                regional_scrap=regional_scrap,
-                capacity_value=plant_capacity,
-                override_constraint=True,
-                apply_transaction=True,
-            )
-
-        scrap_usage = return_current_usage(
-            secondary_eaf_switchers_plants,
-            PlantChoiceContainer.return_choices(year),
-            plant_capacities_dict,
-            business_case_ref,
-            RESOURCE_CONTAINER_REF["scrap"],
-        )
-        logger.info(
-            f"Scrap usage | Switchers - Secondary EAF: {scrap_usage: 0.2f} | Count: {len(secondary_eaf_switchers_plants)}"
-        )
-        logger.info(
-            f"Scrap usage | Amount remaining for switchers/new plants: {MaterialUsageContainer.get_current_balance(year, 'scrap'): 0.2f}"
-        )
-        # skip first year
-        if year in YEARS_TO_SKIP_FOR_SOLVER:
-            capacity_adjusted_df = active_plant_df.copy()
-            regional_capacities = CapacityContainer.return_regional_capacity(year)
-            global_demand = steel_demand_getter(
-                steel_demand_df, year=year, metric="crude", region="World"
-            )
-            UtilizationContainer.calculate_world_utilization(
-                year, regional_capacities, global_demand
-            )
-        else:
-            # Run open/close capacity
-            capacity_adjusted_df = open_close_plants(
-                steel_demand_df=steel_demand_df,
-                steel_plant_df=active_plant_df,
-                country_df=country_ref_f,
-                lev_cost_df=levelized_cost,
-                business_case_ref=business_case_ref,
-                tech_availability=tech_availability,
-                variable_costs_df=variable_costs_regional,
-                capex_dict=capex_dict,
-                capacity_container=CapacityContainer,
-                capacity_constraint_container=PlantCapacityConstraintContainer,
-                utilization_container=UtilizationContainer,
-                material_container=MaterialUsageContainer,
-                tech_choices_container=PlantChoiceContainer,
-                plant_id_container=PlantIDC,
-                market_container=market_container,
-                investment_container=PlantInvestmentCycleContainer,
-                year=year,
-                trade_scenario=trade_scenario,
-                tech_moratorium=tech_moratorium,
-                regional_scrap=regional_scrap,
-                enforce_constraints=enforce_constraints,
-                investment_cycle_randomness=investment_cycle_randomness,
-            )
-            capacity_adjusted_active_plants = capacity_adjusted_df[
-                capacity_adjusted_df["active_check"] == True
-            ].copy()
-            all_active_plant_names = capacity_adjusted_active_plants[
-                "plant_name"
-            ].copy()
-            plant_capacities_dict = CapacityContainer.return_plant_capacity(year=year)
-            switchers = PlantInvestmentCycleContainer.return_plant_switchers(
-                all_active_plant_names, year, "combined"
-            )
-            non_switchers = list(set(all_active_plant_names).difference(switchers))
-            switchers_df = (
-                capacity_adjusted_active_plants.set_index(["plant_name"])
-                .drop(non_switchers)
-                .reset_index()
-            ).copy()
-            switchers_df.rename({"index": "plant_name"}, axis=1, inplace=True)
-            switchers_df = switchers_df.sample(frac=1)
-            logger.info(f"-- Running investment decisions for Non Switching Plants")
-
-            primary_switchers_df = switchers_df[
-                switchers_df["primary_capacity"] == "Y"
-            ].copy()
-
-            # Shuffle rows
-            primary_switchers_df = primary_switchers_df.sample(frac=1)
-            waiting_list_dict = (
-                PlantCapacityConstraintContainer.potential_plant_switchers[year]
-            )
-            if len(waiting_list_dict) > 0:
-                primary_switchers_df = resort_primary_switchers(
-                    primary_switchers_df, waiting_list_dict
+                if log_scrap_usage:
+                    secondary_eaf_switchers_plants = secondary_eaf_switchers[
+                        "plant_name"
+                    ].unique()
+                    scrap_usage = return_current_usage(
+                        secondary_eaf_switchers_plants,
+                        PlantChoiceContainer.return_choices(year),
+                        plant_capacities_dict,
+                        intensity_matrix,
+                        "scrap",
+                    )
+                    logger.info(
+                        "Scrap usage | Switchers - Secondary EAF: % 0.2f | Count: %s",
+                        scrap_usage,
+                        len(secondary_eaf_switchers_plants),
+                    )
+                    logger.info(
+                        "Scrap usage | Amount remaining for switchers/new plants: % 0.2f",
+                        MaterialUsageContainer.get_current_balance(year, "scrap"),
+                    )
+            # skip first year
+            if year in YEARS_TO_SKIP_FOR_SOLVER:
+                capacity_adjusted_rows = active_plant_rows
+                regional_capacities = CapacityContainer.return_regional_capacity(year)
+                global_demand = SteelDemandContainer.get_steel_demand(
+                    year=year, metric="crude", region="World"
                 )
-
-            # Split up primary switchers into groups
-            (
-                closed_plants_current_techs,
-                new_open_plants,
-                main_cycle_plants,
-                trans_switch_plants,
-            ) = split_primary_plant_switchers(
-                primary_switchers_df,
-                PlantInvestmentCycleContainer,
-                PlantChoiceContainer,
-                year,
-            )
-
-            # CASE 1: CLOSED PLANTS
-            for plant_name in tqdm(
-                closed_plants_current_techs,
-                total=len(closed_plants_current_techs),
-                desc="Closed Plants",
-            ):
-                current_tech = closed_plants_current_techs[plant_name]
-                create_solver_entry_dict(
-                    PlantChoiceContainer,
-                    year,
-                    plant_name,
-                    closed_plants_current_techs[plant_name],
-                    "Close plant",
-                    "Plant was already closed",
-                    update_record=True,
-                    update_choice=True,
+                UtilizationContainer.calculate_world_utilization(
+                    year, regional_capacities, global_demand
                 )
-
-            # CASE 2: NEW PLANTS
-            for plant_name in tqdm(
-                new_open_plants, total=len(new_open_plants), desc="New Open Plants"
-            ):
-                current_tech = new_open_plants[plant_name]
-                create_solver_entry_dict(
-                    PlantChoiceContainer,
-                    year,
-                    plant_name,
-                    current_tech,
-                    current_tech,
-                    "New plant founding year",
-                    update_record=True,
-                    update_choice=True,
+            else:
+                # Run open/close capacity
+                with SPAN_PROFILER.span("open_close"):
+                    capacity_adjusted_rows = open_close_plants(
+                        steel_demand_index=SteelDemandContainer,
+                        plant_registry=PlantRegistryContainer,
+                        plant_rows=active_plant_rows,
+                        country_df=country_ref_f,
+                        min_cost_tech_table=MinCostTechContainer,
+                        business_case_ref=business_case_ref,
+                        tech_availability=tech_availability,
+                        variable_costs_df=variable_costs_regional,
+                        capex_dict=capex_dict,
+                        capacity_container=CapacityContainer,
+                        capacity_constraint_container=PlantCapacityConstraintContainer,
+                        utilization_container=UtilizationContainer,
+                        material_container=MaterialUsageContainer,
+                        tech_choices_container=PlantChoiceContainer,
+                        plant_id_container=PlantIDC,
+                        market_container=market_container,
+                        investment_container=PlantInvestmentCycleContainer,
+                        plant_age_queue=PlantAgeQueueContainer,
+                        year=year,
+                        trade_scenario=trade_scenario,
+                        trade_engine=trade_engine,
+                        tech_moratorium=tech_moratorium,
+                        regional_scrap=regional_scrap,
+                        enforce_constraints=enforce_constraints,
+                        investment_cycle_randomness=investment_cycle_randomness,
+                        random_streams=year_streams,
+                    )
+                capacity_adjusted_active_plants = PlantRegistryContainer.to_dataframe(
+                    PlantRegistryContainer.return_active_rows(capacity_adjusted_rows)
+                )
+                all_active_plant_names = capacity_adjusted_active_plants[
+                    "plant_name"
+                ].copy()
+                plant_capacities_dict = CapacityContainer.return_plant_capacity(
+                    year=year
+                )
+                switchers = PlantInvestmentCycleContainer.return_plant_switchers(
+                    all_active_plant_names, year, "combined"
                 )
+                switchers_df, _, non_switchers = partition_switchers(
+                    capacity_adjusted_active_plants, switchers
+                )
+                switchers_df = year_streams.shuffle_df(switchers_df, "switchers")
+                logger.info("-- Running investment decisions for Non Switching Plants")
 
-            # CASE 3: MAIN CYCLE PLANTS
-            for plant_name in tqdm(
-                main_cycle_plants,
-                total=len(main_cycle_plants),
-                desc="Main Cycle Plants",
-            ):
-                current_tech = main_cycle_plants[plant_name]["current_tech"]
-                best_choice_tech = return_best_tech(
-                    tco_reference_data=tco_slim,
-                    abatement_reference_data=abatement_slim,
-                    business_case_ref=business_case_ref,
-                    variable_costs_df=variable_costs_regional,
-                    green_premium_timeseries=green_premium_timeseries,
-                    tech_availability=tech_availability,
-                    tech_avail_from_dict=ta_dict,
-                    plant_capacities=plant_capacities_dict,
-                    scenario_dict=scenario_dict,
-                    investment_container=PlantInvestmentCycleContainer,
-                    plant_choice_container=PlantChoiceContainer,
-                    capacity_constraint_container=PlantCapacityConstraintContainer,
-                    year=year,
-                    plant_name=plant_name,
-                    region=main_cycle_plants[plant_name]["region"],
-                    country_code=main_cycle_plants[plant_name]["country_code"],
-                    base_tech=current_tech,
-                    transitional_switch_mode=False,
-                    material_usage_dict_container=MaterialUsageContainer,
+                primary_switchers_df = switchers_df[
+                    switchers_df["primary_capacity"] == "Y"
+                ].copy()
+
+                # Shuffle rows
+                primary_switchers_df = year_streams.shuffle_df(
+                    primary_switchers_df, "primary_switchers"
                 )
-                switch_type_entry = (
-                    "No change in main investment cycle year"
-                    if best_choice_tech == current_tech
-                    else "Regular change in investment cycle year"
+                waiting_list_dict = (
+                    PlantCapacityConstraintContainer.potential_plant_switchers[year]
                 )
+                if len(waiting_list_dict) > 0:
+                    primary_switchers_df = resort_primary_switchers(
+                        primary_switchers_df, waiting_list_dict
+                    )
 
-                create_solver_entry_dict(
+                # Split up primary switchers into groups
+                (
+                    closed_plants_current_techs,
+                    new_open_plants,
+                    main_cycle_plants,
+                    trans_switch_plants,
+                ) = split_primary_plant_switchers(
+                    primary_switchers_df,
+                    PlantInvestmentCycleContainer,
                     PlantChoiceContainer,
                     year,
-                    plant_name,
-                    current_tech,
-                    best_choice_tech,
-                    switch_type_entry,
-                    update_record=True,
-                    update_choice=True,
                 )
 
-            # CASE 4: TRANSITIONARY SWITCH PLANTS
-            if scenario_dict["transitional_switch"]:
+                # CASE 1: CLOSED PLANTS
                 for plant_name in tqdm(
-                    trans_switch_plants,
-                    total=len(trans_switch_plants),
-                    desc="Trans Switch Plants",
+                    closed_plants_current_techs,
+                    total=len(closed_plants_current_techs),
+                    desc="Closed Plants",
+                ):
+                    current_tech = closed_plants_current_techs[plant_name]
+                    create_solver_entry_dict(
+                        PlantChoiceContainer,
+                        year,
+                        plant_name,
+                        closed_plants_current_techs[plant_name],
+                        "Close plant",
+                        "Plant was already closed",
+                        update_record=True,
+                        update_choice=True,
+                    )
+
+                # CASE 2: NEW PLANTS
+                for plant_name in tqdm(
+                    new_open_plants, total=len(new_open_plants), desc="New Open Plants"
                 ):
-                    current_tech = trans_switch_plants[plant_name]["current_tech"]
-                    best_choice_tech = return_best_tech(
-                        tco_reference_data=tco_slim,
-                        abatement_reference_data=abatement_slim,
+                    current_tech = new_open_plants[plant_name]
+                    create_solver_entry_dict(
+                        PlantChoiceContainer,
+                        year,
+                        plant_name,
+                        current_tech,
+                        current_tech,
+                        "New plant founding year",
+                        update_record=True,
+                        update_choice=True,
+                    )
+
+                # CASE 3: MAIN CYCLE PLANTS
+                with SPAN_PROFILER.span("main_cycle_decisions"):
+                    rank_batch = create_technology_rank_batch(
+                        switching_plants=main_cycle_plants,
                         business_case_ref=business_case_ref,
                         variable_costs_df=variable_costs_regional,
                         green_premium_timeseries=green_premium_timeseries,
@@ -721,85 +811,217 @@ def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
                         plant_capacities=plant_capacities_dict,
                         scenario_dict=scenario_dict,
                         investment_container=PlantInvestmentCycleContainer,
-                        plant_choice_container=PlantChoiceContainer,
-                        capacity_constraint_container=PlantCapacityConstraintContainer,
                         year=year,
-                        plant_name=plant_name,
-                        region=trans_switch_plants[plant_name]["region"],
-                        country_code=trans_switch_plants[plant_name]["country_code"],
-                        base_tech=current_tech,
-                        transitional_switch_mode=True,
-                        material_usage_dict_container=MaterialUsageContainer,
+                        transitional_switch_mode=False,
+                        decision_tensor=decision_tensor,
+                        ranking_cache=RankingCacheContainer,
                     )
-                    if best_choice_tech != current_tech:
-                        PlantInvestmentCycleContainer.adjust_cycle_for_transitional_switch(
-                            plant_name, year
+                    for plant_name in tqdm(
+                        main_cycle_plants,
+                        total=len(main_cycle_plants),
+                        desc="Main Cycle Plants",
+                    ):
+                        current_tech = main_cycle_plants[plant_name]["current_tech"]
+                        if rank_batch is not None:
+                            best_choice_tech = return_best_tech_from_batch(
+                                rank_batch=rank_batch,
+                                business_case_ref=business_case_ref,
+                                plant_capacities=plant_capacities_dict,
+                                scenario_dict=scenario_dict,
+                                plant_choice_container=PlantChoiceContainer,
+                                capacity_constraint_container=PlantCapacityConstraintContainer,
+                                material_usage_dict_container=MaterialUsageContainer,
+                                plant_name=plant_name,
+                                region=main_cycle_plants[plant_name]["region"],
+                                random_streams=year_streams,
+                            )
+                        else:
+                            best_choice_tech = return_best_tech(
+                                tco_reference_data=tco_slim,
+                                abatement_reference_data=abatement_slim,
+                                business_case_ref=business_case_ref,
+                                variable_costs_df=variable_costs_regional,
+                                green_premium_timeseries=green_premium_timeseries,
+                                tech_availability=tech_availability,
+                                tech_avail_from_dict=ta_dict,
+                                plant_capacities=plant_capacities_dict,
+                                scenario_dict=scenario_dict,
+                                investment_container=PlantInvestmentCycleContainer,
+                                plant_choice_container=PlantChoiceContainer,
+                                capacity_constraint_container=PlantCapacityConstraintContainer,
+                                year=year,
+                                plant_name=plant_name,
+                                region=main_cycle_plants[plant_name]["region"],
+                                country_code=main_cycle_plants[plant_name]["country_code"],
+                                base_tech=current_tech,
+                                transitional_switch_mode=False,
+                                material_usage_dict_container=MaterialUsageContainer,
+                                decision_tensor=decision_tensor,
+                                ranking_cache=RankingCacheContainer,
+                                random_streams=year_streams,
+                            )
+                        switch_type_entry = (
+                            "No change in main investment cycle year"
+                            if best_choice_tech == current_tech
+                            else "Regular change in investment cycle year"
                         )
-                    switch_type_entry = (
-                        "Transitional switch in off-cycle investment year"
-                        if best_choice_tech != current_tech
-                        else "No change during off-cycle investment year"
+
+                        create_solver_entry_dict(
+                            PlantChoiceContainer,
+                            year,
+                            plant_name,
+                            current_tech,
+                            best_choice_tech,
+                            switch_type_entry,
+                            update_record=True,
+                            update_choice=True,
+                        )
+
+                # CASE 4: TRANSITIONARY SWITCH PLANTS
+                with SPAN_PROFILER.span("transitional_decisions"):
+                    if scenario_dict["transitional_switch"]:
+                        rank_batch = create_technology_rank_batch(
+                            switching_plants=trans_switch_plants,
+                            business_case_ref=business_case_ref,
+                            variable_costs_df=variable_costs_regional,
+                            green_premium_timeseries=green_premium_timeseries,
+                            tech_availability=tech_availability,
+                            tech_avail_from_dict=ta_dict,
+                            plant_capacities=plant_capacities_dict,
+                            scenario_dict=scenario_dict,
+                            investment_container=PlantInvestmentCycleContainer,
+                            year=year,
+                            transitional_switch_mode=True,
+                            decision_tensor=decision_tensor,
+                            ranking_cache=RankingCacheContainer,
+                        )
+                        for plant_name in tqdm(
+                            trans_switch_plants,
+                            total=len(trans_switch_plants),
+                            desc="Trans Switch Plants",
+                        ):
+                            current_tech = trans_switch_plants[plant_name]["current_tech"]
+                            if rank_batch is not None:
+                                best_choice_tech = return_best_tech_from_batch(
+                                    rank_batch=rank_batch,
+                                    business_case_ref=business_case_ref,
+                                    plant_capacities=plant_capacities_dict,
+                                    scenario_dict=scenario_dict,
+                                    plant_choice_container=PlantChoiceContainer,
+                                    capacity_constraint_container=PlantCapacityConstraintContainer,
+                                    material_usage_dict_container=MaterialUsageContainer,
+                                    plant_name=plant_name,
+                                    region=trans_switch_plants[plant_name]["region"],
+                                    random_streams=year_streams,
+                                )
+                            else:
+                                best_choice_tech = return_best_tech(
+                                    tco_reference_data=tco_slim,
+                                    abatement_reference_data=abatement_slim,
+                                    business_case_ref=business_case_ref,
+                                    variable_costs_df=variable_costs_regional,
+                                    green_premium_timeseries=green_premium_timeseries,
+                                    tech_availability=tech_availability,
+                                    tech_avail_from_dict=ta_dict,
+                                    plant_capacities=plant_capacities_dict,
+                                    scenario_dict=scenario_dict,
+                                    investment_container=PlantInvestmentCycleContainer,
+                                    plant_choice_container=PlantChoiceContainer,
+                                    capacity_constraint_container=PlantCapacityConstraintContainer,
+                                    year=year,
+                                    plant_name=plant_name,
+                                    region=trans_switch_plants[plant_name]["region"],
+                                    country_code=trans_switch_plants[plant_name]["country_code"],
+                                    base_tech=current_tech,
+                                    transitional_switch_mode=True,
+                                    material_usage_dict_container=MaterialUsageContainer,
+                                    decision_tensor=decision_tensor,
+                                    ranking_cache=RankingCacheContainer,
+                                    random_streams=year_streams,
+                                )
+                            if best_choice_tech != current_tech:
+                                PlantInvestmentCycleContainer.adjust_cycle_for_transitional_switch(
+                                    plant_name, year
+                                )
+                            switch_type_entry = (
+                                "Transitional switch in off-cycle investment year"
+                                if best_choice_tech != current_tech
+                                else "No change during off-cycle investment year"
+                            )
+                            create_solver_entry_dict(
+                                PlantChoiceContainer,
+                                year,
+                                plant_name,
+                                current_tech,
+                                best_choice_tech,
+                                switch_type_entry,
+                                update_record=True,
+                                update_choice=True,
+                            )
+
+                # CASE 5: CAPACITY CONSTRAINED PLANTS
+                with SPAN_PROFILER.span("capacity_constraint"):
+                    capacity_constrained_plants = (
+                        PlantCapacityConstraintContainer.return_waiting_list(year)
                     )
-                    create_solver_entry_dict(
-                        PlantChoiceContainer,
-                        year,
-                        plant_name,
-                        current_tech,
-                        best_choice_tech,
-                        switch_type_entry,
-                        update_record=True,
-                        update_choice=True,
+                    PlantCapacityConstraintContainer.move_waiting_list_plants_to_next_year(
+                        PlantInvestmentCycleContainer, year
+                    )
+                    PlantCapacityConstraintContainer.test_capacity_constraint(year)
+                    assert set(capacity_constrained_plants).issubset(
+                        primary_switchers_df["plant_name"].to_list()
+                    ), "Not all plants in the waiting list are in the current year's active plants"
+                    initial_tech_ref = (
+                        primary_switchers_df[["plant_name", "initial_technology"]]
+                        .set_index("plant_name")
+                        .to_dict()
                     )
+                    for plant_name in capacity_constrained_plants:
+                        year_founded = PlantInvestmentCycleContainer.plant_start_years[
+                            plant_name
+                        ]
+                        initial_tech = return_initial_tech(
+                            initial_tech_ref["initial_technology"], plant_name
+                        )
+                        current_tech = get_current_technology(
+                            PlantChoiceContainer,
+                            year,
+                            plant_name,
+                            year_founded,
+                            initial_tech,
+                        )
+                        create_solver_entry_dict(
+                            PlantChoiceContainer,
+                            year,
+                            plant_name,
+                            current_tech,
+                            current_tech,
+                            "Investment year deferred due to Capacity Constraint",
+                            update_record=True,
+                            update_choice=False,
+                        )
+                    PlantCapacityConstraintContainer.print_capacity_summary(year)
+                RankingCacheContainer.print_summary()
 
-            # CASE 5: CAPACITY CONSTRAINED PLANTS
-            capacity_constrained_plants = (
-                PlantCapacityConstraintContainer.return_waiting_list(year)
+            PlantRegistryContainer.set_order(
+                np.concatenate([capacity_adjusted_rows, inactive_plant_rows])
             )
-            PlantCapacityConstraintContainer.move_waiting_list_plants_to_next_year(
-                PlantInvestmentCycleContainer, year
+            MaterialUsageContainer.print_year_summary(
+                year, regional_scrap=regional_scrap
             )
-            PlantCapacityConstraintContainer.test_capacity_constraint(year)
-            assert set(capacity_constrained_plants).issubset(
-                primary_switchers_df["plant_name"].to_list()
-            ), "Not all plants in the waiting list are in the current year's active plants"
-            initial_tech_ref = (
-                primary_switchers_df[["plant_name", "initial_technology"]]
-                .set_index("plant_name")
-                .to_dict()
-            )
-            for plant_name in capacity_constrained_plants:
-                year_founded = PlantInvestmentCycleContainer.plant_start_years[
-                    plant_name
-                ]
-                initial_tech = return_initial_tech(
-                    initial_tech_ref["initial_technology"], plant_name
-                )
-                current_tech = get_current_technology(
-                    PlantChoiceContainer, year, plant_name, year_founded, initial_tech
+            if year in checkpoint_years:
+                save_solver_checkpoint(
+                    SolverCheckpoint(year, scenario_dict, solver_containers),
+                    checkpoint_folder,
                 )
-                create_solver_entry_dict(
-                    PlantChoiceContainer,
-                    year,
-                    plant_name,
-                    current_tech,
-                    current_tech,
-                    "Investment year deferred due to Capacity Constraint",
-                    update_record=True,
-                    update_choice=False,
-                )
-            PlantCapacityConstraintContainer.print_capacity_summary(year)
 
-        year_start_df = pd.concat(
-            [capacity_adjusted_df, inactive_year_start_df]
-        ).reset_index(drop=True)
-        MaterialUsageContainer.print_year_summary(year, regional_scrap=regional_scrap)
-
-    final_steel_plant_df = year_start_df.copy()
+    final_steel_plant_df = PlantRegistryContainer.to_dataframe()
     active_check_results_dict = active_check_results(
         final_steel_plant_df, model_year_range
     )
 
     PlantCapacityConstraintContainer.waiting_list_limit_checker()
+    RankingCacheContainer.print_summary(total=True)
     production_demand_analysis = market_container.output_trade_calculations_to_df(
         "market_results"
     )
@@ -810,7 +1032,7 @@ def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
     investment_dict = PlantInvestmentCycleContainer.return_investment_dict()
     plant_cycle_length_mapper = PlantInvestmentCycleContainer.return_cycle_lengths()
     investment_df = PlantInvestmentCycleContainer.create_investment_df()
-    tech_choice_dict = PlantChoiceContainer.return_choices()
+    tech_choice_dict = PlantChoiceContainer.output_choices_to_dict()
     tech_choice_records = PlantChoiceContainer.output_records_to_df("choice")
     tech_rank_records = PlantChoiceContainer.output_records_to_df("rank")
     regional_capacity_results = CapacityContainer.return_regional_capacity()
@@ -839,25 +1061,116 @@ def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
     }
 
 
-def choose_technology(scenario_dict: dict, pkl_paths: Union[dict, None] = None) -> dict:
+def choose_technology(
+    scenario_dict: dict,
+    pkl_paths: Union[dict, None] = None,
+    checkpoint_folder: Union[str, Path, None] = None,
+    resume: bool = False,
+    model_run: str = "",
+) -> dict:
     """Function containing the entire solver decision logic flow.
     1) In each year, the solver splits the plants non-switchers and switchers (secondary EAF plants and primary plants).
     2) The solver extracts the prior year technology of the non-switchers and assumes this is the current technology of the switchers.
     3) The material usage of the non-switching and secondary EAF plants is subtracted from the constraints and the remainder is then left over for the remaining switching plants.
     4) Plants are opened or closed according to the Demand for that year, the open and closing logic (potentially including trade). Which changes the capacity constraints.
-    5) All switching plants are then sent through the `return_best_tech` function that decides the best technology depending on the switch type (main cycle or transitional switch).
+    5) All switching plants are then sent through the `return_best_tech` function that decides the best technology depending on the switch type (main cycle or transitional switch). When a `decision_tensor` is available and the solver logic is `ranked`, the technologies of all main cycle (and transitional switch) plants are ranked together in a `TechnologyRankBatch` before each plant picks its technology.
     6) All results are saved to a dictionary which is outputted at the end of the year loop.
 
     Args:
         scenario_dict (int): Model Scenario settings.
         pkl_paths (dict): A dict from runtime containing any custom pkl_paths.
+        checkpoint_folder (Union[str, Path, None], optional): The folder where the solver checkpoints are saved. No checkpoints are saved if None. Defaults to None.
+        resume (bool, optional): Flag to continue the run from the latest checkpoint in `checkpoint_folder` (the run starts from the first year if there is none). Defaults to False.
+        model_run (str, optional): The run of the model. Each run of a scenario draws from its own random streams. Defaults to "".
+
+    Raises:
+        ValueError: If the checkpoint to resume from was created with different scenario settings.
+
     Returns:
         dict: A dictionary containing the best technology resuls. Organised as [year][plant][best tech].
     """
+    checkpoint_interval = int(
+        scenario_dict.get("checkpoint_interval", SOLVER_CHECKPOINT_INTERVAL_YEARS)
+    )
+    resume_checkpoint = None
+    if checkpoint_folder and resume:
+        resume_checkpoint = load_latest_solver_checkpoint(checkpoint_folder)
+        if resume_checkpoint and not resume_checkpoint.matches_scenario(scenario_dict):
+            raise ValueError(
+                f"The solver checkpoint for {resume_checkpoint.year} was created with different scenario settings"
+            )
+    elif checkpoint_folder:
+        clear_solver_checkpoints(checkpoint_folder)
     return choose_technology_core(
         ChooseTechnologyInput.from_filesystem(
-            scenario_dict=scenario_dict, pkl_paths=pkl_paths
+            scenario_dict=scenario_dict, pkl_paths=pkl_paths, model_run=model_run
+        ),
+        checkpoint_folder=checkpoint_folder,
+        checkpoint_interval=checkpoint_interval,
+        resume_checkpoint=resume_checkpoint,
+    )
+
+
+def warm_start_choose_technology(
+    scenario_dict: dict,
+    base_scenario_dict: dict,
+    base_checkpoint_folder: Union[str, Path],
+    pkl_paths: Union[dict, None] = None,
+    base_pkl_paths: Union[dict, None] = None,
+    checkpoint_folder: Union[str, Path, None] = None,
+    model_run: str = "",
+) -> dict:
+    """Runs the solver for a scenario variant from the checkpoint of a base scenario run, skipping the years before the variant can diverge from the base scenario.
+    1) The divergence year is the earliest year that the changed scenario settings or the preprocessed references of the variant can influence the solver (see `return_divergence_year`).
+    2) The solver continues from the latest checkpoint of the base run before the divergence year, with the settings and references of the variant. The solver runs from the first year if there is no such checkpoint.
+
+    Args:
+        scenario_dict (dict): The settings of the scenario variant.
+        base_scenario_dict (dict): The settings of the base scenario.
+        base_checkpoint_folder (Union[str, Path]): The folder where the checkpoints of the base scenario run are stored.
+        pkl_paths (Union[dict, None], optional): Custom pkl_paths of the scenario variant. Defaults to None.
+        base_pkl_paths (Union[dict, None], optional): Custom pkl_paths of the base scenario. Defaults to None.
+        checkpoint_folder (Union[str, Path, None], optional): The folder where the checkpoints of the scenario variant are saved. No checkpoints are saved if None. Defaults to None.
+        model_run (str, optional): The run of the model (the same run of the base scenario and the variant draw from the same random streams). Defaults to "".
+
+    Raises:
+        ValueError: If the checkpoint of the base run was created with different settings than `base_scenario_dict`.
+
+    Returns:
+        dict: A dictionary containing the best technology resuls. Organised as [year][plant][best tech].
+    """
+    cti = ChooseTechnologyInput.from_filesystem(
+        scenario_dict=scenario_dict, pkl_paths=pkl_paths, model_run=model_run
+    )
+    base_cti = ChooseTechnologyInput.from_filesystem(
+        scenario_dict=base_scenario_dict, pkl_paths=base_pkl_paths, model_run=model_run
+    )
+    divergence_year = return_divergence_year(base_cti, cti)
+    logger.info(
+        "%s diverges from %s in %s",
+        scenario_dict["scenario_name"],
+        base_scenario_dict["scenario_name"],
+        divergence_year,
+    )
+    resume_checkpoint = load_latest_solver_checkpoint(
+        base_checkpoint_folder,
+        before_year=divergence_year if divergence_year else MODEL_YEAR_END,
+    )
+    if resume_checkpoint and not resume_checkpoint.matches_scenario(
+        base_scenario_dict
+    ):
+        raise ValueError(
+            f"The solver checkpoint for {resume_checkpoint.year} was not created with the settings of {base_scenario_dict['scenario_name']}"
         )
+    if checkpoint_folder:
+        clear_solver_checkpoints(checkpoint_folder)
+    return choose_technology_core(
+        cti,
+        checkpoint_folder=checkpoint_folder,
+        checkpoint_interval=int(
+            scenario_dict.get("checkpoint_interval", SOLVER_CHECKPOINT_INTERVAL_YEARS)
+        ),
+        resume_checkpoint=resume_checkpoint,
     )
 
 
@@ -896,6 +1209,8 @@ def main_solver_flow(
     pkl_paths: Union[dict, None] = None,
     serialize: bool = False,
     model_run: str = "",
+    resume: bool = False,
+    warm_start_scenario: Union[dict, None] = None,
 ) -> dict:
     """Initiates the complete solver flow and serializes the outputs. Tracks all technology choices and plant changes.
 
@@ -904,15 +1219,39 @@ def main_solver_flow(
         pkl_paths (Union[dict, None], optional): A dictionary containing custom pickle paths. Defaults to {}.
         serialize (bool, optional): Flag to only serialize the DataFrame to a pickle file and not return a DataFrame. Defaults to False.
         model_run (str, optional): The run of the model to customize pkl folder paths. Defaults to "".
+        resume (bool, optional): Flag to continue the solver from its latest checkpoint in the intermediate folder. Defaults to False.
+        warm_start_scenario (Union[dict, None], optional): The settings of a base scenario to warm-start the solver from (see `warm_start_choose_technology`). The base scenario's solver must have been run with checkpoints. Defaults to None.
 
     Returns:
         dict: A dictionary containing the best technology results and the resultant steel plants. tech_choice_dict is organised as year: plant: best tech.
     """
+    set_log_run_name(str(scenario_dict["scenario_name"]), model_run)
     _, intermediate_path, final_path = return_pkl_paths(
         scenario_dict["scenario_name"], pkl_paths, model_run
     )
 
-    results_dict = choose_technology(scenario_dict=scenario_dict, pkl_paths=pkl_paths)
+    checkpoint_folder = f"{intermediate_path}/{SOLVER_CHECKPOINT_FOLDER_NAME}"
+    if warm_start_scenario:
+        _, base_intermediate_path, _ = return_pkl_paths(
+            warm_start_scenario["scenario_name"], None, model_run
+        )
+        results_dict = warm_start_choose_technology(
+            scenario_dict=scenario_dict,
+            base_scenario_dict=warm_start_scenario,
+            base_checkpoint_folder=f"{base_intermediate_path}/{SOLVER_CHECKPOINT_FOLDER_NAME}",
+            pkl_paths=pkl_paths,
+            checkpoint_folder=checkpoint_folder,
+            model_run=model_run,
+        )
+    else:
+        results_dict = choose_technology(
+            scenario_dict=scenario_dict,
+            pkl_paths=pkl_paths,
+            checkpoint_folder=checkpoint_folder,
+            resume=resume,
+            model_run=model_run,
+        )
+    unrecorded_files = return_unrecorded_files(scenario_dict)
 
     levelized_cost_results = create_levelized_cost_actuals(
         results_dict=results_dict, scenario_dict=scenario_dict, pkl_paths=pkl_paths,
@@ -923,16 +1262,18 @@ def main_solver_flow(
         serialize_file(
             results_dict["tech_choice_dict"], intermediate_path, "tech_choice_dict"
         )
-        serialize_file(
-            results_dict["tech_choice_records"],
-            intermediate_path,
-            "tech_choice_records",
-        )
-        serialize_file(
-            results_dict["tech_rank_records"],
-            intermediate_path,
-            "tech_rank_records",
-        )
+        if "tech_choice_records" not in unrecorded_files:
+            serialize_file(
+                results_dict["tech_choice_records"],
+                intermediate_path,
+                "tech_choice_records",
+            )
+        if "tech_rank_records" not in unrecorded_files:
+            serialize_file(
+                results_dict["tech_rank_records"],
+                intermediate_path,
+                "tech_rank_records",
+            )
         serialize_file(
             results_dict["plant_result_df"], intermediate_path, "plant_result_df"
         )
@@ -981,11 +1322,12 @@ def main_solver_flow(
             intermediate_path,
             "full_trade_summary",
         )
-        serialize_file(
-            results_dict["material_usage_results"],
-            intermediate_path,
-            "material_usage_results",
-        )
+        if "material_usage_results" not in unrecorded_files:
+            serialize_file(
+                results_dict["material_usage_results"],
+                intermediate_path,
+                "material_usage_results",
+            )
         serialize_file(
             results_dict["constraints_summary"],
             intermediate_path,
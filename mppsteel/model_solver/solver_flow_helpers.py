@@ -1,5 +1,6 @@
 """Helper functions for the main Solver Flow"""
 
+import numpy as np
 import pandas as pd
 
 from typing import Dict, List, Tuple, Union
@@ -10,22 +11,32 @@ from mppsteel.plant_classes.capacity_constraint_class import PlantCapacityConstr
 from mppsteel.utility.dataframe_utility import return_furnace_group
 from mppsteel.config.model_config import (
     MODEL_YEAR_START,
-    INVESTMENT_OFFCYCLE_BUFFER_TOP,
-    INVESTMENT_OFFCYCLE_BUFFER_TAIL,
     TECH_MORATORIUM_DATE,
 )
-from mppsteel.config.model_scenarios import TECH_SWITCH_SCENARIOS, SOLVER_LOGICS
+from mppsteel.config.model_scenarios import (
+    RECORDING_MODES,
+    TECH_SWITCH_SCENARIOS,
+    SOLVER_LOGICS,
+)
 from mppsteel.config.reference_lists import (
+    SOLVER_RECORD_PKL_FILES,
     SWITCH_DICT,
-    TECH_REFERENCE_LIST,
     TECHNOLOGY_PHASES,
     FURNACE_GROUP_DICT,
 )
 from mppsteel.data_preprocessing.tco_calculation_functions import (
     calculate_green_premium,
 )
-from mppsteel.model_solver.tco_and_abatement_optimizer import get_best_choice
+from mppsteel.model_solver.tco_and_abatement_optimizer import (
+    TechnologyRankBatch,
+    get_best_choice,
+    get_best_choice_from_batch,
+)
+from mppsteel.model_solver.tco_abatement_tensor_class import TcoAbatementTensor
+from mppsteel.model_solver.tco_adjustment_overlay_class import TcoAdjustmentOverlay
+from mppsteel.model_solver.ranking_cache_class import RankingCache
 from mppsteel.plant_classes.plant_choices_class import PlantChoices
+from mppsteel.utility.random_utility import RandomStreams
 from mppsteel.model_solver.material_usage_class import (
     MaterialUsage,
     create_material_usage_dict,
@@ -36,6 +47,35 @@ from mppsteel.utility.log_utility import get_logger
 logger = get_logger(__name__)
 
 
+def return_recording_settings(scenario_dict: MYPY_SCENARIO_TYPE) -> Dict[str, bool]:
+    """Returns the solver records to collect for a scenario's recording mode. Scenarios without a recording mode record everything.
+
+    Args:
+        scenario_dict (dict): Scenario dictionary containing the model run's scenario settings.
+
+    Returns:
+        Dict[str, bool]: A dictionary of record type: boolean flag.
+    """
+    return RECORDING_MODES[str(scenario_dict.get("recording_mode", "full"))]
+
+
+def return_unrecorded_files(scenario_dict: MYPY_SCENARIO_TYPE) -> List[str]:
+    """Returns the solver output files that are not created in a scenario's recording mode.
+
+    Args:
+        scenario_dict (dict): Scenario dictionary containing the model run's scenario settings.
+
+    Returns:
+        List[str]: The names of the files that are not serialized.
+    """
+    recording_settings = return_recording_settings(scenario_dict)
+    return [
+        SOLVER_RECORD_PKL_FILES[record_type]
+        for record_type in SOLVER_RECORD_PKL_FILES
+        if not recording_settings[record_type]
+    ]
+
+
 def return_best_tech(
     tco_reference_data: pd.DataFrame,
     abatement_reference_data: pd.DataFrame,
@@ -56,6 +96,9 @@ def return_best_tech(
     country_code: str,
     base_tech: str = None,
     transitional_switch_mode: bool = False,
+    decision_tensor: Union[TcoAbatementTensor, None] = None,
+    ranking_cache: Union[RankingCache, None] = None,
+    random_streams: Union[RandomStreams, None] = None,
 ) -> str:
     """Function generates the best technology choice from a number of key data and scenario inputs.
 
@@ -78,6 +121,9 @@ def return_best_tech(
         country_code (str): The country code related to the plant.
         base_tech (str, optional): The current base technology. Defaults to None.
         transitional_switch_mode (bool, optional): Boolean flag that determines if transitional switch logic is active. Defaults to False.
+        decision_tensor (Union[TcoAbatementTensor, None], optional): The dense TCO and abatement reference. If provided, it is used instead of `tco_reference_data` and `abatement_reference_data`. Defaults to None.
+        ranking_cache (Union[RankingCache, None], optional): The cache of ranked technology tables shared by plants with the same decision context. Defaults to None.
+        random_streams (Union[RandomStreams, None], optional): The year's random streams, used to break ties between the best technologies. Defaults to None.
 
     Raises:
         ValueError: If there is no base technology selected, a ValueError is raised because this provides the foundation for choosing a switch technology.
@@ -89,11 +135,119 @@ def return_best_tech(
     solver_logic = SOLVER_LOGICS[str(scenario_dict["solver_logic"])]
     tech_moratorium = bool(scenario_dict["tech_moratorium"])
     enforce_constraints = bool(scenario_dict["enforce_constraints"])
-    green_premium_scenario = str(scenario_dict["green_premium_scenario"])
     scenario_name = str(scenario_dict["scenario_name"])
     regional_scrap = bool(scenario_dict["regional_scrap_constraint"])
 
-    tco_ref_data = tco_reference_data.copy()
+    if not base_tech:
+        raise ValueError(
+            f"Issue with base_tech not existing: {plant_name} | {year} | {base_tech}"
+        )
+
+    if not isinstance(base_tech, str):
+        raise ValueError(
+            f"Issue with base_tech not being a string: {plant_name} | {year} | {base_tech}"
+        )
+
+    combined_available_list = return_available_technologies(
+        tech_availability,
+        tech_avail_from_dict,
+        year,
+        base_tech,
+        transitional_switch_mode,
+        tech_moratorium,
+    )
+
+    tco_overlay = create_tco_overlay(
+        variable_costs_df,
+        green_premium_timeseries,
+        plant_capacities,
+        scenario_dict,
+        investment_container,
+        year,
+        plant_name,
+        country_code,
+        base_tech,
+        transitional_switch_mode,
+    )
+
+    best_choice = get_best_choice(
+        tco_reference_data,
+        abatement_reference_data,
+        country_code,
+        year,
+        base_tech,
+        solver_logic,
+        scenario_name,
+        proportions_dict,
+        combined_available_list,
+        transitional_switch_mode,
+        regional_scrap,
+        plant_choice_container,
+        enforce_constraints,
+        business_case_ref,
+        plant_capacities,
+        material_usage_dict_container,
+        plant_name,
+        region,
+        decision_tensor=decision_tensor,
+        tco_overlay=tco_overlay,
+        ranking_cache=ranking_cache,
+        random_streams=random_streams,
+    )
+
+    if not isinstance(best_choice, str):
+        raise ValueError(
+            f"Issue with get_best_choice function returning a nan: {plant_name} | {year} | {base_tech} | {combined_available_list}"
+        )
+
+    return commit_best_tech(
+        business_case_ref,
+        plant_capacities,
+        capacity_constraint_container,
+        material_usage_dict_container,
+        year,
+        plant_name,
+        region,
+        base_tech,
+        best_choice,
+        transitional_switch_mode,
+        enforce_constraints,
+        regional_scrap,
+    )
+
+
+def create_tco_overlay(
+    variable_costs_df: pd.DataFrame,
+    green_premium_timeseries: pd.DataFrame,
+    plant_capacities: dict,
+    scenario_dict: MYPY_SCENARIO_TYPE,
+    investment_container: PlantInvestmentCycle,
+    year: int,
+    plant_name: str,
+    country_code: str,
+    base_tech: str,
+    transitional_switch_mode: bool,
+) -> Union[TcoAdjustmentOverlay, None]:
+    """Creates the overlay holding a plant's green premium discount and transitional switch scaling.
+
+    Args:
+        variable_costs_df (pd.DataFrame): Variable Costs DataFrame.
+        green_premium_timeseries (pd.DataFrame): The timeseries containing the green premium values.
+        plant_capacities (dict): A dictionary containing plant: capacity/inital tech key:value pairs.
+        scenario_dict (dict): Scenario dictionary containing the model run's scenario settings.
+        investment_container (PlantInvestmentCycle): The PlantInvestmentCycle Instance containing each plant's investment cycle.
+        year (int): The current model year.
+        plant_name (str): The plant name.
+        country_code (str): The country code related to the plant.
+        base_tech (str): The current base technology.
+        transitional_switch_mode (bool): Boolean flag that determines if transitional switch logic is active.
+
+    Returns:
+        Union[TcoAdjustmentOverlay, None]: The plant's overlay. None if the plant's TCO values do not need adjusting.
+    """
+    green_premium_scenario = str(scenario_dict["green_premium_scenario"])
+    discount: float = 0
+    cycle_length = None
 
     ## ## RECCOMMENDED TO RUN MODEL WITH green_premium_scenario SWITCHED OFF AS THIS FEATURE IS NOT FULLY TESTED.
     if green_premium_scenario != "off":
@@ -108,25 +262,39 @@ def return_best_tech(
             year,
             usd_to_eur_rate,
         )
-        for technology in TECH_REFERENCE_LIST:
-            for tco_col in ["tco_regular_capex", "tco_gf_capex"]:
-                current_tco_value = tco_ref_data.loc[
-                    (year, country_code, technology), tco_col
-                ]
-                tco_ref_data.loc[(year, country_code, technology), tco_col] = (
-                    current_tco_value - discounted_green_premium_values[technology]
-                )
+        # the green premium is subtracted from the rows of the plant's base tech
+        discount = discounted_green_premium_values[base_tech]
 
-    if not base_tech:
-        raise ValueError(
-            f"Issue with base_tech not existing: {plant_name} | {year} | {base_tech}"
-        )
+    if transitional_switch_mode:
+        # Adjust tco values based on transistional switch years
+        cycle_length = investment_container.return_cycle_lengths(plant_name)
 
-    if not isinstance(base_tech, str):
-        raise ValueError(
-            f"Issue with base_tech not being a string: {plant_name} | {year} | {base_tech}"
-        )
+    if (not discount) and (cycle_length is None):
+        return None
+    return TcoAdjustmentOverlay(discount, cycle_length)
+
+
+def return_available_technologies(
+    tech_availability: pd.DataFrame,
+    tech_avail_from_dict: dict,
+    year: int,
+    base_tech: str,
+    transitional_switch_mode: bool,
+    tech_moratorium: bool,
+) -> List[str]:
+    """Returns the technologies a plant can switch to from its base technology in a given year.
 
+    Args:
+        tech_availability (pd.DataFrame): Technology Availability DataFrame
+        tech_avail_from_dict (dict): A condensed version of the technology availability DataFrame as a dictionary of technology as key, availability year as value.
+        year (int): The current model year.
+        base_tech (str): The current base technology.
+        transitional_switch_mode (bool): Boolean flag that determines if transitional switch logic is active.
+        tech_moratorium (bool): The scenario boolean value that determines whether there is a technology moratorium.
+
+    Returns:
+        List[str]: The list of valid switch technologies.
+    """
     # Valid Switches
     combined_available_list: List[str] = [
         tech for tech in SWITCH_DICT if tech in SWITCH_DICT[base_tech]
@@ -158,44 +326,42 @@ def return_best_tech(
     ):
         combined_available_list.append(base_tech)
 
-    if transitional_switch_mode:
-        cycle_length = investment_container.return_cycle_lengths(plant_name)
-        # Adjust tco values based on transistional switch years
-        tco_ref_data["tco_gf_capex"] = (
-            tco_ref_data["tco_gf_capex"]
-            * cycle_length
-            / (
-                cycle_length
-                - (INVESTMENT_OFFCYCLE_BUFFER_TOP + INVESTMENT_OFFCYCLE_BUFFER_TAIL)
-            )
-        )
+    return combined_available_list
 
-    best_choice = get_best_choice(
-        tco_ref_data,
-        abatement_reference_data,
-        country_code,
-        year,
-        base_tech,
-        solver_logic,
-        scenario_name,
-        proportions_dict,
-        combined_available_list,
-        transitional_switch_mode,
-        regional_scrap,
-        plant_choice_container,
-        enforce_constraints,
-        business_case_ref,
-        plant_capacities,
-        material_usage_dict_container,
-        plant_name,
-        region,
-    )
 
-    if not isinstance(best_choice, str):
-        raise ValueError(
-            f"Issue with get_best_choice function returning a nan: {plant_name} | {year} | {base_tech} | {combined_available_list}"
-        )
+def commit_best_tech(
+    business_case_ref: dict,
+    plant_capacities: dict,
+    capacity_constraint_container: PlantCapacityConstraint,
+    material_usage_dict_container: MaterialUsage,
+    year: int,
+    plant_name: str,
+    region: str,
+    base_tech: str,
+    best_choice: str,
+    transitional_switch_mode: bool,
+    enforce_constraints: bool,
+    regional_scrap: bool,
+) -> str:
+    """Applies the capacity constraint to a plant's best technology choice and adds the resulting material usage to the material usage container.
 
+    Args:
+        business_case_ref (dict): Standardised Business Cases.
+        plant_capacities (dict): A dictionary containing plant: capacity/inital tech key:value pairs.
+        capacity_constraint_container (PlantCapacityConstraint): The PlantCapacityConstraint Instance containing the capacity constraint balances.
+        material_usage_dict_container (MaterialUsage): Container class object that is used to track the material usage within the application.
+        year (int): The current model year.
+        plant_name (str): The plant name.
+        region (str): The plant's region.
+        base_tech (str): The current base technology.
+        best_choice (str): The best technology choice of the plant.
+        transitional_switch_mode (bool): Boolean flag that determines if transitional switch logic is active.
+        enforce_constraints (bool): Boolen flag to determine if constraints should affect technology availability.
+        regional_scrap (bool): The scenario boolean value that determines whether there is a regional or global scrap constraints.
+
+    Returns:
+        str: The technology the plant uses after the capacity constraint is applied.
+    """
     switch_type = "Trans Switch" if transitional_switch_mode else "Main Switch"
 
     capacity_constraint_container.update_potential_plant_switcher(
@@ -231,6 +397,165 @@ def return_best_tech(
     return best_choice
 
 
+def create_technology_rank_batch(
+    switching_plants: dict,
+    business_case_ref: dict,
+    variable_costs_df: pd.DataFrame,
+    green_premium_timeseries: pd.DataFrame,
+    tech_availability: pd.DataFrame,
+    tech_avail_from_dict: dict,
+    plant_capacities: dict,
+    scenario_dict: MYPY_SCENARIO_TYPE,
+    investment_container: PlantInvestmentCycle,
+    year: int,
+    transitional_switch_mode: bool,
+    decision_tensor: Union[TcoAbatementTensor, None],
+    ranking_cache: Union[RankingCache, None] = None,
+) -> Union[TechnologyRankBatch, None]:
+    """Ranks the switch technologies of all of a year's main cycle (or transitional switch) plants in one vectorized pass.
+
+    Args:
+        switching_plants (dict): A dictionary of plant_name as key and a dictionary of `current_tech`, `region` and `country_code` as value.
+        business_case_ref (dict): Standardised Business Cases.
+        variable_costs_df (pd.DataFrame): Variable Costs DataFrame.
+        green_premium_timeseries (pd.DataFrame): The timeseries containing the green premium values.
+        tech_availability (pd.DataFrame): Technology Availability DataFrame
+        tech_avail_from_dict (dict): A condensed version of the technology availability DataFrame as a dictionary of technology as key, availability year as value.
+        plant_capacities (dict): A dictionary containing plant: capacity/inital tech key:value pairs.
+        scenario_dict (dict): Scenario dictionary containing the model run's scenario settings.
+        investment_container (PlantInvestmentCycle): The PlantInvestmentCycle Instance containing each plant's investment cycle.
+        year (int): The current model year.
+        transitional_switch_mode (bool): Boolean flag that determines if transitional switch logic is active.
+        decision_tensor (Union[TcoAbatementTensor, None]): The dense TCO and abatement reference.
+        ranking_cache (Union[RankingCache, None], optional): The cache of ranked technology tables shared by plants with the same decision context. Defaults to None.
+
+    Returns:
+        Union[TechnologyRankBatch, None]: The ranked plants. None if there is no `decision_tensor`, no switching plants or if the solver logic is not `ranked`.
+    """
+    solver_logic = SOLVER_LOGICS[str(scenario_dict["solver_logic"])]
+    if (decision_tensor is None) or (solver_logic != "ranked") or not switching_plants:
+        return None
+    tech_moratorium = bool(scenario_dict["tech_moratorium"])
+
+    plant_names = list(switching_plants)
+    country_codes = []
+    start_techs = []
+    technology_lists = []
+    tco_overlays = []
+    for plant_name in plant_names:
+        base_tech = switching_plants[plant_name]["current_tech"]
+        country_code = switching_plants[plant_name]["country_code"]
+        if not base_tech:
+            raise ValueError(
+                f"Issue with base_tech not existing: {plant_name} | {year} | {base_tech}"
+            )
+        if not isinstance(base_tech, str):
+            raise ValueError(
+                f"Issue with base_tech not being a string: {plant_name} | {year} | {base_tech}"
+            )
+        country_codes.append(country_code)
+        start_techs.append(base_tech)
+        technology_lists.append(
+            return_available_technologies(
+                tech_availability,
+                tech_avail_from_dict,
+                year,
+                base_tech,
+                transitional_switch_mode,
+                tech_moratorium,
+            )
+        )
+        tco_overlays.append(
+            create_tco_overlay(
+                variable_costs_df,
+                green_premium_timeseries,
+                plant_capacities,
+                scenario_dict,
+                investment_container,
+                year,
+                plant_name,
+                country_code,
+                base_tech,
+                transitional_switch_mode,
+            )
+        )
+
+    return TechnologyRankBatch(
+        decision_tensor,
+        year,
+        plant_names,
+        country_codes,
+        start_techs,
+        technology_lists,
+        transitional_switch_mode,
+        tco_overlays,
+        ranking_cache=ranking_cache,
+    )
+
+
+def return_best_tech_from_batch(
+    rank_batch: TechnologyRankBatch,
+    business_case_ref: dict,
+    plant_capacities: dict,
+    scenario_dict: MYPY_SCENARIO_TYPE,
+    plant_choice_container: PlantChoices,
+    capacity_constraint_container: PlantCapacityConstraint,
+    material_usage_dict_container: MaterialUsage,
+    plant_name: str,
+    region: str,
+    random_streams: Union[RandomStreams, None] = None,
+) -> str:
+    """Equivalent of `return_best_tech` for a plant whose technologies have already been ranked in a TechnologyRankBatch.
+
+    Args:
+        rank_batch (TechnologyRankBatch): The precalculated ranks of the year's switching plants.
+        business_case_ref (dict): Standardised Business Cases.
+        plant_capacities (dict): A dictionary containing plant: capacity/inital tech key:value pairs.
+        scenario_dict (dict): Scenario dictionary containing the model run's scenario settings.
+        plant_choice_container (PlantChoices): The PlantChoices Instance containing each plant's choices.
+        capacity_constraint_container (PlantCapacityConstraint): The PlantCapacityConstraint Instance containing the capacity constraint balances.
+        material_usage_dict_container (MaterialUsage): Container class object that is used to track the material usage within the application.
+        plant_name (str): The plant name.
+        region (str): The plant's region.
+        random_streams (Union[RandomStreams, None], optional): The year's random streams, used to break ties between the best technologies. Defaults to None.
+
+    Returns:
+        str: Returns the best technology as a string.
+    """
+    enforce_constraints = bool(scenario_dict["enforce_constraints"])
+    regional_scrap = bool(scenario_dict["regional_scrap_constraint"])
+    base_tech = rank_batch.start_techs[rank_batch.plant_index[plant_name]]
+    best_choice = get_best_choice_from_batch(
+        rank_batch,
+        plant_name,
+        region,
+        SOLVER_LOGICS[str(scenario_dict["solver_logic"])],
+        str(scenario_dict["scenario_name"]),
+        TECH_SWITCH_SCENARIOS[str(scenario_dict["tech_switch_scenario"])],
+        regional_scrap,
+        plant_choice_container,
+        enforce_constraints,
+        business_case_ref,
+        plant_capacities,
+        material_usage_dict_container,
+        random_streams=random_streams,
+    )
+    return commit_best_tech(
+        business_case_ref,
+        plant_capacities,
+        capacity_constraint_container,
+        material_usage_dict_container,
+        rank_batch.year,
+        plant_name,
+        region,
+        base_tech,
+        best_choice,
+        rank_batch.transitional_switch_mode,
+        enforce_constraints,
+        regional_scrap,
+    )
+
+
 def active_check_results(
     steel_plant_df: pd.DataFrame, year_range: range, inverse: bool = False
 ) -> dict:
@@ -267,6 +592,41 @@ def active_check_results(
         return active_check
 
 
+def return_partition_indices(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Splits the row positions of a boolean mask into the positions where the mask is True and where it is False.
+
+    Args:
+        mask (np.ndarray): A boolean array.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The positions where the mask is True and the positions where it is False (both in ascending order).
+    """
+    return np.flatnonzero(mask), np.flatnonzero(~mask)
+
+
+def partition_switchers(
+    active_plant_df: pd.DataFrame, switchers: list
+) -> Tuple[pd.DataFrame, pd.DataFrame, list]:
+    """Splits the active plants into the plants that are and are not in their switch year.
+
+    Args:
+        active_plant_df (pd.DataFrame): The active steel plants.
+        switchers (list): The names of the plants in their switch year.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame, list]: The switching plants, the non switching plants and the names of the non switching plants.
+    """
+    plant_names = active_plant_df["plant_name"].to_numpy()
+    switcher_idx, non_switcher_idx = return_partition_indices(
+        active_plant_df["plant_name"].isin(switchers).to_numpy()
+    )
+    return (
+        active_plant_df.iloc[switcher_idx].reset_index(drop=True),
+        active_plant_df.iloc[non_switcher_idx].reset_index(drop=True),
+        list(plant_names[non_switcher_idx]),
+    )
+
+
 def resort_primary_switchers(
     primary_switchers_df: pd.DataFrame, waiting_list_dict: dict
 ) -> pd.DataFrame:
@@ -0,0 +1,199 @@
+"""Divergence years of scenario variants for warm-started solver runs"""
+
+from typing import Dict, List, Union
+
+import pandas as pd
+
+from mppsteel.config.model_config import MODEL_YEAR_START, TECH_MORATORIUM_DATE
+from mppsteel.config.mypy_config_settings import MYPY_SCENARIO_TYPE
+from mppsteel.model_solver.solver_checkpoint import SOLVER_CHECKPOINT_IGNORED_SETTINGS
+from mppsteel.utility.log_utility import get_logger
+
+logger = get_logger(__name__)
+
+# scenario settings that only change the solver from a fixed year
+SCENARIO_SETTING_DIVERGENCE_YEARS: Dict[str, int] = {
+    "tech_moratorium": TECH_MORATORIUM_DATE,
+}
+# scenario settings that only reach the solver through the preprocessed references
+SCENARIO_SETTINGS_APPLIED_THROUGH_REFERENCES = [
+    "carbon_tax_scenario",
+    "green_premium_scenario",
+    "electricity_cost_scenario",
+    "grid_scenario",
+    "hydrogen_cost_scenario",
+    "biomass_cost_scenario",
+    "ccs_cost_scenario",
+    "ccs_capacity_scenario",
+    "fossil_fuel_scenario",
+    "steel_demand_scenario",
+    "eur_to_usd",
+    "usd_to_eur",
+]
+SCENARIO_SETTINGS_WITHOUT_SOLVER_EFFECT = [
+    "scenario_name"
+] + SOLVER_CHECKPOINT_IGNORED_SETTINGS
+# preprocessed references of the ChooseTechnologyInput that are indexed by year
+YEARLY_SOLVER_REFERENCES = [
+    "variable_costs_regional",
+    "bio_constraint_model",
+    "co2_constraint",
+    "ccs_constraint",
+    "steel_demand_df",
+    "capex_dict",
+    "green_premium_timeseries",
+    "tco_slim",
+    "abatement_slim",
+    "levelized_cost",
+]
+STATIC_SOLVER_REFERENCES = [
+    "tech_availability",
+    "ta_dict",
+    "business_case_ref",
+    "wsa_dict",
+]
+YEAR_KEY_NAMES = ["year", "Year"]
+# label columns that name the scenario of a reference rather than its values
+REFERENCE_LABEL_COLUMNS = ["scenario"]
+
+
+def return_setting_divergence_year(
+    base_scenario_dict: MYPY_SCENARIO_TYPE,
+    scenario_dict: MYPY_SCENARIO_TYPE,
+    references_compared: bool = False,
+) -> Union[int, None]:
+    """Returns the earliest year that the changed settings of a scenario variant can influence the solver.
+
+    Args:
+        base_scenario_dict (MYPY_SCENARIO_TYPE): The settings of the base scenario.
+        scenario_dict (MYPY_SCENARIO_TYPE): The settings of the scenario variant.
+        references_compared (bool, optional): Flag for whether the preprocessed references of the scenarios are compared separately (with `return_reference_divergence_year`). If False, the settings in `SCENARIO_SETTINGS_APPLIED_THROUGH_REFERENCES` are assumed to change the solver from the first model year. Defaults to False.
+
+    Returns:
+        Union[int, None]: The divergence year, or None if the settings do not change the solver.
+    """
+    divergence_years = []
+    for setting in set(base_scenario_dict).union(scenario_dict):
+        if (setting in SCENARIO_SETTINGS_WITHOUT_SOLVER_EFFECT) or (
+            base_scenario_dict.get(setting) == scenario_dict.get(setting)
+        ):
+            continue
+        if references_compared and (
+            setting in SCENARIO_SETTINGS_APPLIED_THROUGH_REFERENCES
+        ):
+            continue
+        divergence_years.append(
+            SCENARIO_SETTING_DIVERGENCE_YEARS.get(setting, MODEL_YEAR_START)
+        )
+    return min(divergence_years, default=None)
+
+
+def format_reference_for_comparison(reference: pd.DataFrame) -> pd.DataFrame:
+    reference = reference.reset_index()
+    reference = reference.drop(
+        columns=[
+            column
+            for column in reference.columns
+            if (column in REFERENCE_LABEL_COLUMNS) or (column == "index")
+        ]
+    )
+    object_columns = reference.select_dtypes(include="object").columns
+    reference[object_columns] = reference[object_columns].astype(str)
+    return reference
+
+
+def return_dataframe_divergence_year(
+    base_reference: pd.DataFrame, reference: pd.DataFrame
+) -> Union[int, None]:
+    """Returns the earliest year that has different rows in two versions of a reference DataFrame.
+
+    Args:
+        base_reference (pd.DataFrame): The reference of the base scenario.
+        reference (pd.DataFrame): The reference of the scenario variant.
+
+    Returns:
+        Union[int, None]: The divergence year, or None if the references are the same. The first model year if the references are not indexed by year or have different columns.
+    """
+    base_reference = format_reference_for_comparison(base_reference)
+    reference = format_reference_for_comparison(reference)
+    year_keys = [key for key in YEAR_KEY_NAMES if key in reference.columns]
+    if (not year_keys) or (list(base_reference.columns) != list(reference.columns)):
+        return None if base_reference.equals(reference) else MODEL_YEAR_START
+    different_rows = pd.concat([base_reference, reference]).drop_duplicates(
+        keep=False
+    )
+    if different_rows.empty:
+        return None
+    return int(different_rows[year_keys[0]].min())
+
+
+def return_reference_divergence_year(
+    base_reference: object, reference: object
+) -> Union[int, None]:
+    """Returns the earliest year that differs between two versions of a preprocessed reference (a DataFrame, a dictionary of DataFrames or any other value).
+
+    Args:
+        base_reference (object): The reference of the base scenario.
+        reference (object): The reference of the scenario variant.
+
+    Returns:
+        Union[int, None]: The divergence year, or None if the references are the same.
+    """
+    if isinstance(base_reference, pd.DataFrame) and isinstance(
+        reference, pd.DataFrame
+    ):
+        return return_dataframe_divergence_year(base_reference, reference)
+    if (
+        isinstance(base_reference, dict)
+        and isinstance(reference, dict)
+        and all(
+            isinstance(value, pd.DataFrame)
+            for value in list(base_reference.values()) + list(reference.values())
+        )
+    ):
+        if set(base_reference) != set(reference):
+            return MODEL_YEAR_START
+        return min(
+            (
+                divergence_year
+                for divergence_year in (
+                    return_dataframe_divergence_year(
+                        base_reference[key], reference[key]
+                    )
+                    for key in reference
+                )
+                if divergence_year is not None
+            ),
+            default=None,
+        )
+    return None if base_reference == reference else MODEL_YEAR_START
+
+
+def return_divergence_year(base_cti, cti) -> Union[int, None]:
+    """Returns the earliest year that the solver run of a scenario variant can differ from the run of its base scenario, from their settings and their preprocessed references.
+
+    Args:
+        base_cti (ChooseTechnologyInput): The solver inputs of the base scenario.
+        cti (ChooseTechnologyInput): The solver inputs of the scenario variant.
+
+    Returns:
+        Union[int, None]: The divergence year, or None if the runs are the same.
+    """
+    divergence_years: List[int] = []
+    setting_divergence_year = return_setting_divergence_year(
+        base_cti.scenario_dict, cti.scenario_dict, references_compared=True
+    )
+    if setting_divergence_year is not None:
+        divergence_years.append(setting_divergence_year)
+    for reference_name in YEARLY_SOLVER_REFERENCES + STATIC_SOLVER_REFERENCES:
+        reference_divergence_year = return_reference_divergence_year(
+            getattr(base_cti, reference_name), getattr(cti, reference_name)
+        )
+        if reference_divergence_year is not None:
+            logger.info(
+                "%s differs from the base scenario from %s",
+                reference_name,
+                reference_divergence_year,
+            )
+            divergence_years.append(reference_divergence_year)
+    return min(divergence_years, default=None)
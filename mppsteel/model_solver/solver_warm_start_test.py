@@ -0,0 +1,58 @@
+import pandas as pd
+
+from mppsteel.config.model_config import MODEL_YEAR_START, TECH_MORATORIUM_DATE
+from mppsteel.model_solver.solver_warm_start import (
+    return_reference_divergence_year,
+    return_setting_divergence_year,
+)
+
+
+def test_setting_divergence_year():
+    base_scenario_dict = {
+        "scenario_name": "default",
+        "tech_moratorium": True,
+        "carbon_tax_scenario": "off",
+        "trade_active": True,
+    }
+    assert return_setting_divergence_year(base_scenario_dict, base_scenario_dict) is None
+    moratorium_scenario_dict = dict(
+        base_scenario_dict, scenario_name="variant", tech_moratorium=False
+    )
+    assert (
+        return_setting_divergence_year(base_scenario_dict, moratorium_scenario_dict)
+        == TECH_MORATORIUM_DATE
+    )
+    carbon_tax_scenario_dict = dict(base_scenario_dict, carbon_tax_scenario="high")
+    assert (
+        return_setting_divergence_year(base_scenario_dict, carbon_tax_scenario_dict)
+        == MODEL_YEAR_START
+    )
+    assert (
+        return_setting_divergence_year(
+            base_scenario_dict, carbon_tax_scenario_dict, references_compared=True
+        )
+        is None
+    )
+
+
+def test_reference_divergence_year():
+    base_reference = pd.DataFrame(
+        {
+            "year": [2020, 2021, 2022, 2023],
+            "scenario": "Low",
+            "value": [1.0, 2.0, 3.0, 4.0],
+        }
+    ).set_index("year")
+    reference = base_reference.assign(scenario="High", value=[1.0, 2.0, 3.5, 4.5])
+    assert return_reference_divergence_year(base_reference, base_reference) is None
+    assert return_reference_divergence_year(base_reference, reference) == 2022
+    assert (
+        return_reference_divergence_year(
+            {"a": base_reference, "b": base_reference},
+            {"a": base_reference, "b": reference},
+        )
+        == 2022
+    )
+    assert return_reference_divergence_year({"EAF": 2020}, {"EAF": 2025}) == (
+        MODEL_YEAR_START
+    )
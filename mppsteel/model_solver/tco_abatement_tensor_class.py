@@ -0,0 +1,173 @@
+"""Class to manage the dense TCO and emissions abatement reference used by the solver"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from mppsteel.config.reference_lists import TECH_REFERENCE_LIST
+from mppsteel.utility.log_utility import get_logger
+
+logger = get_logger(__name__)
+
+TENSOR_VALUE_COLS = [
+    "tco_regular_capex",
+    "tco_gf_capex",
+    "abated_combined_emissivity",
+]
+
+
+class TcoAbatementTensor:
+    """Description
+    Class to hold the TCO and emissions abatement reference tables as a dense NumPy array so that the solver can read
+    each plant's switching options with integer indexing rather than slicing the multi-indexed DataFrames.
+
+    Important Points
+    1) The tensor is built once per scenario from the `tco_slim` and `abatement_slim` DataFrames.
+    2) Entries that do not exist in the source DataFrames are marked as missing in the `present` masks, so lookups return the same set of switch technologies as a DataFrame slice would.
+
+    Main Class Attributes
+        values: A float array in the form [year][country_code][base_tech][switch_tech][value_col].
+        tco_present: A boolean array in the form [year][country_code][base_tech][switch_tech] that marks the rows present in the TCO DataFrame.
+        abatement_present: A boolean array in the form [year][country_code][base_tech][switch_tech] that marks the rows present in the abatement DataFrame.
+        year_index / country_index / tech_index / value_col_index: Dictionaries mapping each label to its integer position.
+        technologies: The technology labels in tensor order.
+    """
+
+    def __init__(
+        self,
+        years: Sequence[int],
+        country_codes: Sequence[str],
+        technologies: Sequence[str],
+    ):
+        self.years = list(years)
+        self.country_codes = list(country_codes)
+        self.technologies = list(technologies)
+        self.year_index = {year: idx for idx, year in enumerate(self.years)}
+        self.country_index = {
+            country_code: idx for idx, country_code in enumerate(self.country_codes)
+        }
+        self.tech_index = {tech: idx for idx, tech in enumerate(self.technologies)}
+        self.value_col_index = {
+            value_col: idx for idx, value_col in enumerate(TENSOR_VALUE_COLS)
+        }
+        shape = (
+            len(self.years),
+            len(self.country_codes),
+            len(self.technologies),
+            len(self.technologies),
+        )
+        self.values = np.full(shape + (len(TENSOR_VALUE_COLS),), np.nan)
+        self.tco_present = np.zeros(shape, dtype=bool)
+        self.abatement_present = np.zeros(shape, dtype=bool)
+
+    @classmethod
+    def from_dataframes(
+        cls, tco_slim: pd.DataFrame, abatement_slim: pd.DataFrame
+    ) -> "TcoAbatementTensor":
+        """Builds the tensor from the subsetted TCO and emissions abatement DataFrames created by `subset_presolver_df`.
+
+        Args:
+            tco_slim (pd.DataFrame): The TCO DataFrame indexed by year, country_code and base_tech.
+            abatement_slim (pd.DataFrame): The abatement DataFrame indexed by year, country_code and base_tech.
+
+        Returns:
+            TcoAbatementTensor: The populated tensor.
+        """
+        tco_df = tco_slim.reset_index()
+        abatement_df = abatement_slim.reset_index()
+        years = sorted(set(tco_df["year"]).union(abatement_df["year"]))
+        country_codes = sorted(
+            set(tco_df["country_code"]).union(abatement_df["country_code"])
+        )
+        data_techs = (
+            set(tco_df["base_tech"])
+            .union(tco_df["switch_tech"])
+            .union(abatement_df["base_tech"])
+            .union(abatement_df["switch_tech"])
+        )
+        technologies = [tech for tech in TECH_REFERENCE_LIST if tech in data_techs]
+        technologies.extend(sorted(data_techs.difference(technologies)))
+        tensor = cls(years, country_codes, technologies)
+        tensor.load_values(tco_df, ["tco_regular_capex", "tco_gf_capex"], "tco")
+        tensor.load_values(abatement_df, ["abated_combined_emissivity"], "abatement")
+        logger.info(
+            "Created TCO/abatement tensor with shape %s (% 0.1f MB)",
+            tensor.values.shape,
+            tensor.values.nbytes / 1e6,
+        )
+        return tensor
+
+    def return_positions(self, df: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+        return (
+            pd.Index(self.years).get_indexer(df["year"]),
+            pd.Index(self.country_codes).get_indexer(df["country_code"]),
+            pd.Index(self.technologies).get_indexer(df["base_tech"]),
+            pd.Index(self.technologies).get_indexer(df["switch_tech"]),
+        )
+
+    def load_values(self, df: pd.DataFrame, value_cols: List[str], table: str):
+        positions = self.return_positions(df)
+        for value_col in value_cols:
+            self.values[positions + (self.value_col_index[value_col],)] = df[
+                value_col
+            ].astype(float)
+        if table == "tco":
+            self.tco_present[positions] = True
+        elif table == "abatement":
+            self.abatement_present[positions] = True
+
+    def has_entry(self, year: int, country_code: str, base_tech: str) -> bool:
+        return (
+            (year in self.year_index)
+            and (country_code in self.country_index)
+            and (base_tech in self.tech_index)
+        )
+
+    def return_values(
+        self,
+        year: int,
+        country_code: str,
+        base_tech: str,
+        value_col: str,
+        technology_list: Sequence[str],
+    ) -> pd.DataFrame:
+        """Returns the values of a single column for each available switch technology of a plant.
+
+        Args:
+            year (int): The year to return values for.
+            country_code (str): The country code of the plant.
+            base_tech (str): The base technology of the plant.
+            value_col (str): The column to return. One of `TENSOR_VALUE_COLS`.
+            technology_list (Sequence[str]): The switch technologies to return values for.
+
+        Raises:
+            KeyError: If the year, country_code or base_tech are not in the tensor (matches the DataFrame `.loc` behaviour).
+
+        Returns:
+            pd.DataFrame: A DataFrame indexed by `switch_tech` with `value_col` as its only column.
+        """
+        if not self.has_entry(year, country_code, base_tech):
+            raise KeyError((year, country_code, base_tech))
+        year_idx = self.year_index[year]
+        country_idx = self.country_index[country_code]
+        base_idx = self.tech_index[base_tech]
+        present = (
+            self.abatement_present
+            if value_col == "abated_combined_emissivity"
+            else self.tco_present
+        )[year_idx, country_idx, base_idx]
+        switch_techs = [
+            tech
+            for tech in technology_list
+            if (tech in self.tech_index) and present[self.tech_index[tech]]
+        ]
+        switch_idx = np.array(
+            [self.tech_index[tech] for tech in switch_techs], dtype=int
+        )
+        values = self.values[
+            year_idx, country_idx, base_idx, switch_idx, self.value_col_index[value_col]
+        ]
+        return pd.DataFrame(
+            {value_col: values}, index=pd.Index(switch_techs, name="switch_tech")
+        )
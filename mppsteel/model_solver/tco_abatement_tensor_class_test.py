@@ -0,0 +1,220 @@
+import pandas as pd
+
+from mppsteel.config.model_config import (
+    INVESTMENT_OFFCYCLE_BUFFER_TOP,
+    INVESTMENT_OFFCYCLE_BUFFER_TAIL,
+)
+from mppsteel.model_solver.ranking_cache_class import RankingCache
+from mppsteel.model_solver.tco_abatement_tensor_class import TcoAbatementTensor
+from mppsteel.model_solver.tco_and_abatement_optimizer import (
+    TechnologyRankBatch,
+    get_best_choice,
+    get_best_choice_from_batch,
+    min_ranker,
+    tensor_min_ranker,
+)
+from mppsteel.model_solver.tco_adjustment_overlay_class import TcoAdjustmentOverlay
+from mppsteel.plant_classes.plant_choices_class import PlantChoices
+
+INDEX_COLS = ["year", "country_code", "base_tech"]
+
+TCO_SLIM = pd.DataFrame(
+    [
+        [2030, "DEU", "Avg BF-BOF", "Avg BF-BOF", 100.0, 120.0],
+        [2030, "DEU", "Avg BF-BOF", "BAT BF-BOF", 105.0, 130.0],
+        [2030, "DEU", "Avg BF-BOF", "EAF", 90.0, 95.0],
+        [2030, "DEU", "Avg BF-BOF", "DRI-EAF", 150.0, 160.0],
+    ],
+    columns=INDEX_COLS + ["switch_tech", "tco_regular_capex", "tco_gf_capex"],
+).set_index(INDEX_COLS)
+
+ABATEMENT_SLIM = pd.DataFrame(
+    [
+        [2030, "DEU", "Avg BF-BOF", "Avg BF-BOF", 0.0],
+        [2030, "DEU", "Avg BF-BOF", "BAT BF-BOF", 0.5],
+        [2030, "DEU", "Avg BF-BOF", "EAF", 3.0],
+        [2030, "DEU", "Avg BF-BOF", "DRI-EAF", 1.0],
+    ],
+    columns=INDEX_COLS + ["switch_tech", "abated_combined_emissivity"],
+).set_index(INDEX_COLS)
+
+
+def test_tensor_min_ranker_matches_min_ranker():
+    tensor = TcoAbatementTensor.from_dataframes(TCO_SLIM, ABATEMENT_SLIM)
+    technology_list = ["Avg BF-BOF", "BAT BF-BOF", "EAF"]
+    for df, value_col, data_type in [
+        (TCO_SLIM, "tco_regular_capex", "tco"),
+        (ABATEMENT_SLIM, "abated_combined_emissivity", "abatement"),
+    ]:
+        expected, expected_ref = min_ranker(
+            df, value_col, data_type, 2030, "DEU", "Avg BF-BOF", technology_list, True
+        )
+        result, result_ref = tensor_min_ranker(
+            tensor, value_col, data_type, 2030, "DEU", "Avg BF-BOF", technology_list, True
+        )
+        assert result_ref == expected_ref
+        pd.testing.assert_frame_equal(result, expected[result.columns])
+
+
+def test_technology_rank_batch_matches_get_best_choice():
+    tensor = TcoAbatementTensor.from_dataframes(TCO_SLIM, ABATEMENT_SLIM)
+    weighting_dict = {"tco": 1, "emissions": 1}
+    for transitional_switch_mode in [False, True]:
+        expected_choices = PlantChoices()
+        expected = get_best_choice(
+            TCO_SLIM,
+            ABATEMENT_SLIM,
+            "DEU",
+            2030,
+            "Avg BF-BOF",
+            "ranked",
+            "test",
+            weighting_dict,
+            ["BAT BF-BOF", "EAF", "DRI-EAF"],
+            transitional_switch_mode,
+            False,
+            expected_choices,
+            False,
+            {},
+            {},
+            None,
+            "plant_a",
+            "Europe",
+        )
+        batch_choices = PlantChoices()
+        rank_batch = TechnologyRankBatch(
+            tensor,
+            2030,
+            ["plant_a"],
+            ["DEU"],
+            ["Avg BF-BOF"],
+            [["BAT BF-BOF", "EAF", "DRI-EAF"]],
+            transitional_switch_mode,
+            [None],
+        )
+        result = get_best_choice_from_batch(
+            rank_batch,
+            "plant_a",
+            "Europe",
+            "ranked",
+            "test",
+            weighting_dict,
+            False,
+            batch_choices,
+            False,
+            {},
+            {},
+            None,
+        )
+        assert result == expected
+        pd.testing.assert_frame_equal(
+            batch_choices.output_records_to_df("rank"),
+            expected_choices.output_records_to_df("rank"),
+        )
+
+
+def test_tco_overlay_matches_adjusted_table():
+    tco_overlay = TcoAdjustmentOverlay(discount=10.0, cycle_length=20)
+    adjusted_tco = TCO_SLIM.copy()
+    adjusted_tco[["tco_regular_capex", "tco_gf_capex"]] -= 10.0
+    adjusted_tco["tco_gf_capex"] = adjusted_tco["tco_gf_capex"] * 20 / (
+        20 - (INVESTMENT_OFFCYCLE_BUFFER_TOP + INVESTMENT_OFFCYCLE_BUFFER_TAIL)
+    )
+    tensor = TcoAbatementTensor.from_dataframes(TCO_SLIM, ABATEMENT_SLIM)
+    technology_list = ["BAT BF-BOF", "EAF", "DRI-EAF"]
+    expected, expected_ref = min_ranker(
+        adjusted_tco,
+        "tco_gf_capex",
+        "tco",
+        2030,
+        "DEU",
+        "Avg BF-BOF",
+        list(technology_list),
+        True,
+        True,
+    )
+    for df in [TCO_SLIM, tensor]:
+        ranker = min_ranker if df is TCO_SLIM else tensor_min_ranker
+        result, result_ref = ranker(
+            df,
+            "tco_gf_capex",
+            "tco",
+            2030,
+            "DEU",
+            "Avg BF-BOF",
+            list(technology_list),
+            True,
+            True,
+            tco_overlay=tco_overlay,
+        )
+        assert result_ref == expected_ref
+        pd.testing.assert_series_equal(result["tco_gf_capex"], expected["tco_gf_capex"])
+
+
+def test_ranking_cache_reuses_ranks_for_same_context():
+    ranking_cache = RankingCache(max_entries=2)
+    ranking_cache.start_year(2030)
+    weighting_dict = {"tco": 1, "emissions": 1}
+    choices = []
+    for plant_name in ["plant_a", "plant_b"]:
+        choices.append(
+            get_best_choice(
+                TCO_SLIM,
+                ABATEMENT_SLIM,
+                "DEU",
+                2030,
+                "Avg BF-BOF",
+                "ranked",
+                "test",
+                weighting_dict,
+                ["BAT BF-BOF", "EAF", "DRI-EAF"],
+                False,
+                False,
+                PlantChoices(),
+                False,
+                {},
+                {},
+                None,
+                plant_name,
+                "Europe",
+                ranking_cache=ranking_cache,
+            )
+        )
+    assert choices[0] == choices[1]
+    assert (ranking_cache.hits, ranking_cache.misses) == (1, 1)
+    ranking_cache.start_year(2031)
+    assert (ranking_cache.hits, ranking_cache.misses) == (0, 0)
+    assert (ranking_cache.total_hits, ranking_cache.total_misses) == (1, 1)
+
+
+def test_rank_records_skipped_when_not_recording():
+    recording_choices = PlantChoices()
+    silent_choices = PlantChoices(record_choices=False, record_ranks=False)
+    best_choices = [
+        get_best_choice(
+            TCO_SLIM,
+            ABATEMENT_SLIM,
+            "DEU",
+            2030,
+            "Avg BF-BOF",
+            "ranked",
+            "test",
+            {"tco": 1, "emissions": 1},
+            ["BAT BF-BOF", "EAF", "DRI-EAF"],
+            False,
+            False,
+            plant_choice_container,
+            False,
+            {},
+            {},
+            None,
+            "plant_a",
+            "Europe",
+        )
+        for plant_choice_container in [recording_choices, silent_choices]
+    ]
+    assert best_choices[0] == best_choices[1]
+    assert len(recording_choices.rank_records) == 3
+    assert len(silent_choices.rank_records) == 0
+    silent_choices.update_records("choice", {"year": 2030})
+    assert not silent_choices.choice_records
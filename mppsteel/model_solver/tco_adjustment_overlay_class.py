@@ -0,0 +1,126 @@
+"""Class to apply the plant specific TCO adjustments to the values scored by the solver"""
+
+from typing import Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from mppsteel.config.model_config import (
+    INVESTMENT_OFFCYCLE_BUFFER_TOP,
+    INVESTMENT_OFFCYCLE_BUFFER_TAIL,
+)
+
+TCO_VALUE_COLS = ["tco_regular_capex", "tco_gf_capex"]
+TRANSITIONAL_TCO_VALUE_COL = "tco_gf_capex"
+
+
+class TcoAdjustmentOverlay:
+    """Description
+    Class to hold the adjustments made to a plant's TCO values before they are ranked (the green premium discount and the transitional switch cycle length scaling).
+    The adjustments are applied to the slice of values being scored, so the full TCO reference table never has to be copied or rewritten.
+
+    Important Points
+    1) The discount is subtracted from both TCO columns of the plant's base technology rows.
+    2) The transitional switch scaling is only applied to `tco_gf_capex`, after the discount.
+
+    Main Class Attributes
+        discount: The discounted green premium value subtracted from the TCO values.
+        cycle_length: The plant's investment cycle length used to scale `tco_gf_capex`. None if the plant is not making a transitional switch.
+    """
+
+    def __init__(self, discount: float = 0, cycle_length: Union[float, None] = None):
+        self.discount = discount
+        self.cycle_length = cycle_length
+
+    def __repr__(self):
+        return f"TcoAdjustmentOverlay(discount={self.discount}, cycle_length={self.cycle_length})"
+
+    def is_active(self, value_col: str) -> bool:
+        return bool(self.discount) or (
+            (self.cycle_length is not None)
+            and (value_col == TRANSITIONAL_TCO_VALUE_COL)
+        )
+
+    def adjust_values(
+        self, values: Union[pd.Series, np.ndarray], value_col: str
+    ) -> Union[pd.Series, np.ndarray]:
+        """Returns the adjusted values of a single TCO column.
+
+        Args:
+            values (Union[pd.Series, np.ndarray]): The unadjusted TCO values.
+            value_col (str): The TCO column that `values` belongs to.
+
+        Returns:
+            Union[pd.Series, np.ndarray]: The adjusted TCO values.
+        """
+        if self.discount:
+            values = values - self.discount
+        if (self.cycle_length is not None) and (
+            value_col == TRANSITIONAL_TCO_VALUE_COL
+        ):
+            values = (
+                values
+                * self.cycle_length
+                / (
+                    self.cycle_length
+                    - (INVESTMENT_OFFCYCLE_BUFFER_TOP + INVESTMENT_OFFCYCLE_BUFFER_TAIL)
+                )
+            )
+        return values
+
+    def adjust_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Adjusts the TCO columns of a (plant level) DataFrame slice in place.
+
+        Args:
+            df (pd.DataFrame): A DataFrame containing one or more of the TCO columns.
+
+        Returns:
+            pd.DataFrame: The adjusted DataFrame.
+        """
+        for value_col in TCO_VALUE_COLS:
+            if (value_col in df.columns) and self.is_active(value_col):
+                df[value_col] = self.adjust_values(df[value_col], value_col)
+        return df
+
+
+def adjust_value_matrix(
+    values: np.ndarray,
+    overlays: Sequence[Union[TcoAdjustmentOverlay, None]],
+    value_col: str,
+) -> np.ndarray:
+    """Applies a list of overlays to a matrix of TCO values with one row per overlay.
+
+    Args:
+        values (np.ndarray): The unadjusted TCO values in the form [plant][switch_tech].
+        overlays (Sequence[Union[TcoAdjustmentOverlay, None]]): The overlay of each row. None for rows without adjustments.
+        value_col (str): The TCO column that `values` belongs to.
+
+    Returns:
+        np.ndarray: The adjusted TCO values.
+    """
+    discounts = np.array(
+        [overlay.discount if overlay else 0 for overlay in overlays], dtype=float
+    )[:, np.newaxis]
+    cycle_lengths = np.array(
+        [
+            np.nan if (overlay is None) or (overlay.cycle_length is None) else overlay.cycle_length
+            for overlay in overlays
+        ],
+        dtype=float,
+    )[:, np.newaxis]
+    if (discounts != 0).any():
+        values = np.where(discounts != 0, values - discounts, values)
+    scaled_rows = ~np.isnan(cycle_lengths)
+    if (value_col == TRANSITIONAL_TCO_VALUE_COL) and scaled_rows.any():
+        with np.errstate(invalid="ignore"):
+            values = np.where(
+                scaled_rows,
+                values
+                * cycle_lengths
+                / (
+                    cycle_lengths
+                    - (INVESTMENT_OFFCYCLE_BUFFER_TOP + INVESTMENT_OFFCYCLE_BUFFER_TAIL)
+                ),
+                values,
+            )
+    return values
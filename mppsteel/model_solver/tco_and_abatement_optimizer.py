@@ -1,16 +1,27 @@
 """Script for the tco and abatament optimisation functions."""
 from copy import deepcopy
 from functools import lru_cache
-import random
-from typing import Tuple
+from typing import Sequence, Tuple, Union
+import warnings
 
 import pandas as pd
 import numpy as np
 from mppsteel.plant_classes.plant_choices_class import PlantChoices
 from mppsteel.model_solver.material_usage_class import (
     MaterialUsage,
+    create_material_check_entries,
+    create_material_check_matrix,
     create_material_usage_dict,
 )
+from mppsteel.model_solver.tco_abatement_tensor_class import TcoAbatementTensor
+from mppsteel.model_solver.ranking_cache_class import (
+    RankingCache,
+    create_ranking_cache_key,
+)
+from mppsteel.model_solver.tco_adjustment_overlay_class import (
+    TcoAdjustmentOverlay,
+    adjust_value_matrix,
+)
 
 from mppsteel.utility.log_utility import get_logger
 from mppsteel.utility.utils import (
@@ -19,6 +30,7 @@ from mppsteel.utility.utils import (
     return_bin_rank,
 )
 from mppsteel.utility.dataframe_utility import change_cols_to_numeric
+from mppsteel.utility.random_utility import RandomStreams, random_choice
 
 from mppsteel.config.model_config import (
     TCO_RANK_1_SCALER,
@@ -26,6 +38,7 @@ from mppsteel.config.model_config import (
     ABATEMENT_RANK_2,
     ABATEMENT_RANK_3,
 )
+from mppsteel.config.reference_lists import RESOURCE_CONTAINER_REF
 
 
 logger = get_logger(__name__)
@@ -97,41 +110,27 @@ def abatement_ranker_logic(x: float) -> int:
         return 1
 
 
-def min_ranker(
-    df: pd.DataFrame,
+def rank_technology_values(
+    df_subset: pd.DataFrame,
     value_col: str,
     data_type: str,
-    year: int,
-    country_code: str,
     start_tech: str,
-    technology_list: list,
     rank: bool = False,
     transitional_switch_mode: bool = False,
 ) -> Tuple[pd.DataFrame, str]:
-    """Sorts (and optionally ranks) each technology from a given list for the purpose of choosing a best technology.
+    """Sorts (and optionally ranks) the switch technology values of a single plant.
 
     Args:
-        df (pd.DataFrame): A DataFrame containing either tco values or emission abatement values.
-        value_col (str): The column name containing the values of the DataFrame provided in `df`.
-        data_type (str): The type of data contained in `df`.
-        year (int): The year you want to rank the technologies for.
-        country_code (str): The country code of the plant you want to rank technologies for.
+        df_subset (pd.DataFrame): A DataFrame indexed by `switch_tech` containing either tco values or emission abatement values.
+        value_col (str): The column name containing the values of the DataFrame provided in `df_subset`.
+        data_type (str): The type of data contained in `df_subset`.
         start_tech (str): The starting technology for the plant.
-        technology_list (list): A list of technologies that represent valid technology switches.
         rank (bool, optional): Decide whether to assign custom ranking logic to the technologies. Defaults to False.
         transitional_switch_mode (bool, optional): Boolean flag that determines if transitional switch logic is active. Defaults to False.
 
     Returns:
         Tuple[pd.DataFrame, str]: A DataFrame containing the sorted list of each technology for a given plant and technology.
     """
-    # subsetting the dataframe
-    df_c = df.loc[year, country_code, start_tech].copy()
-    # subset switch_technology based on technology_list
-    if transitional_switch_mode and start_tech not in technology_list:
-        technology_list.append(start_tech)
-    df_subset = df_c[df_c["switch_tech"].isin(technology_list)].copy()
-    # set index as switch_tech
-    df_subset = df_subset.reset_index().set_index("switch_tech")
     # sort the dataframe according to the value column
     df_subset.sort_values(value_col, ascending=True, inplace=True)
     # default ref: empty string
@@ -173,6 +172,101 @@ def min_ranker(
     return df_subset, tco_reference_tech
 
 
+def min_ranker(
+    df: pd.DataFrame,
+    value_col: str,
+    data_type: str,
+    year: int,
+    country_code: str,
+    start_tech: str,
+    technology_list: list,
+    rank: bool = False,
+    transitional_switch_mode: bool = False,
+    tco_overlay: Union[TcoAdjustmentOverlay, None] = None,
+) -> Tuple[pd.DataFrame, str]:
+    """Sorts (and optionally ranks) each technology from a given list for the purpose of choosing a best technology.
+
+    Args:
+        df (pd.DataFrame): A DataFrame containing either tco values or emission abatement values.
+        value_col (str): The column name containing the values of the DataFrame provided in `df`.
+        data_type (str): The type of data contained in `df`.
+        year (int): The year you want to rank the technologies for.
+        country_code (str): The country code of the plant you want to rank technologies for.
+        start_tech (str): The starting technology for the plant.
+        technology_list (list): A list of technologies that represent valid technology switches.
+        rank (bool, optional): Decide whether to assign custom ranking logic to the technologies. Defaults to False.
+        transitional_switch_mode (bool, optional): Boolean flag that determines if transitional switch logic is active. Defaults to False.
+        tco_overlay (Union[TcoAdjustmentOverlay, None], optional): The plant's TCO adjustments, applied to the subsetted values. Defaults to None.
+
+    Returns:
+        Tuple[pd.DataFrame, str]: A DataFrame containing the sorted list of each technology for a given plant and technology.
+    """
+    # subsetting the dataframe
+    df_c = df.loc[year, country_code, start_tech].copy()
+    # subset switch_technology based on technology_list
+    if transitional_switch_mode and start_tech not in technology_list:
+        technology_list.append(start_tech)
+    df_subset = df_c[df_c["switch_tech"].isin(technology_list)].copy()
+    # set index as switch_tech
+    df_subset = df_subset.reset_index().set_index("switch_tech")
+    if tco_overlay is not None:
+        df_subset = tco_overlay.adjust_dataframe(df_subset)
+    return rank_technology_values(
+        df_subset,
+        value_col,
+        data_type,
+        start_tech,
+        rank=rank,
+        transitional_switch_mode=transitional_switch_mode,
+    )
+
+
+def tensor_min_ranker(
+    decision_tensor: TcoAbatementTensor,
+    value_col: str,
+    data_type: str,
+    year: int,
+    country_code: str,
+    start_tech: str,
+    technology_list: list,
+    rank: bool = False,
+    transitional_switch_mode: bool = False,
+    tco_overlay: Union[TcoAdjustmentOverlay, None] = None,
+) -> Tuple[pd.DataFrame, str]:
+    """Equivalent of `min_ranker` that reads the values from a TcoAbatementTensor rather than a multi-indexed DataFrame.
+
+    Args:
+        decision_tensor (TcoAbatementTensor): The dense TCO and abatement reference.
+        value_col (str): The value column to read from the tensor.
+        data_type (str): The type of data contained in `value_col`.
+        year (int): The year you want to rank the technologies for.
+        country_code (str): The country code of the plant you want to rank technologies for.
+        start_tech (str): The starting technology for the plant.
+        technology_list (list): A list of technologies that represent valid technology switches.
+        rank (bool, optional): Decide whether to assign custom ranking logic to the technologies. Defaults to False.
+        transitional_switch_mode (bool, optional): Boolean flag that determines if transitional switch logic is active. Defaults to False.
+        tco_overlay (Union[TcoAdjustmentOverlay, None], optional): The plant's TCO adjustments, applied to the values read from the tensor. Defaults to None.
+
+    Returns:
+        Tuple[pd.DataFrame, str]: A DataFrame containing the sorted list of each technology for a given plant and technology.
+    """
+    if transitional_switch_mode and start_tech not in technology_list:
+        technology_list.append(start_tech)
+    df_subset = decision_tensor.return_values(
+        year, country_code, start_tech, value_col, technology_list
+    )
+    if tco_overlay is not None:
+        df_subset = tco_overlay.adjust_dataframe(df_subset)
+    return rank_technology_values(
+        df_subset,
+        value_col,
+        data_type,
+        start_tech,
+        rank=rank,
+        transitional_switch_mode=transitional_switch_mode,
+    )
+
+
 def get_tco_and_abatement_values(
     tco_df: pd.DataFrame,
     emissions_df: pd.DataFrame,
@@ -183,6 +277,8 @@ def get_tco_and_abatement_values(
     technology_list: list,
     rank: bool,
     transitional_switch_mode: bool,
+    decision_tensor: Union[TcoAbatementTensor, None] = None,
+    tco_overlay: Union[TcoAdjustmentOverlay, None] = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame, str]:
     """Sends both the TCO DataFrame and the Emissions Abatement DataFrame through a minimum ranking function and filters the list based on the `technology_list`.
 
@@ -196,10 +292,38 @@ def get_tco_and_abatement_values(
         technology_list (list): The technology list that you want to filter the values for.
         rank (bool): A scenario boolean for the ranking logic switch.
         transitional_switch_mode (bool, optional): Boolean flag that determines if transitional switch logic is active.
+        decision_tensor (Union[TcoAbatementTensor, None], optional): The dense TCO and abatement reference. If provided, the values are read from the tensor rather than from `tco_df` and `emissions_df`. Defaults to None.
+        tco_overlay (Union[TcoAdjustmentOverlay, None], optional): The plant's TCO adjustments (green premium and transitional switch scaling). Defaults to None.
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame, str]: Two DataFrames in a tuple, TCO Values and Abatement Values and a ref point
     """
+    if decision_tensor is not None:
+        tco_values, tco_reference_tech = tensor_min_ranker(
+            decision_tensor=decision_tensor,
+            data_type="tco",
+            value_col=cost_value_col,
+            year=year,
+            country_code=country_code,
+            start_tech=start_tech,
+            technology_list=technology_list,
+            rank=rank,
+            transitional_switch_mode=transitional_switch_mode,
+            tco_overlay=tco_overlay,
+        )
+        abatement_values, _ = tensor_min_ranker(
+            decision_tensor=decision_tensor,
+            data_type="abatement",
+            value_col="abated_combined_emissivity",
+            year=year,
+            country_code=country_code,
+            start_tech=start_tech,
+            technology_list=technology_list,
+            rank=rank,
+            transitional_switch_mode=transitional_switch_mode,
+        )
+        return tco_values, abatement_values, tco_reference_tech
+
     # Remove unavailable techs
     tco_values, tco_reference_tech = min_ranker(
         df=tco_df,
@@ -211,6 +335,7 @@ def get_tco_and_abatement_values(
         technology_list=technology_list,
         rank=rank,
         transitional_switch_mode=transitional_switch_mode,
+        tco_overlay=tco_overlay,
     )
     abatement_values, _ = min_ranker(
         df=emissions_df,
@@ -241,7 +366,7 @@ def record_ranking(
     scenario_name: str,
     transitional_switch_mode: bool,
 ) -> None:
-    """Formats the combined rank dataframe and adds it to a plant choice container class instance.
+    """Formats the combined rank dataframe as columns and adds them to the rank records of a plant choice container class instance.
 
     Args:
         combined_ranks (pd.DataFrame): A DataFrame showing the ranking.
@@ -257,91 +382,95 @@ def record_ranking(
         scenario_name (str): The current scenario of the model_run.
         transitional_switch_mode (bool): Boolean flag that determines if transitional switch logic is active.
     """
-
-    def boolean_check(row) -> bool:
-        return not row.excluded_due_to_availability and row.excluded_due_to_constraints
-
-    if not combined_ranks.empty:
-        records = combined_ranks.reset_index().copy()
-        records["year"] = year
-        records["region"] = region
-        records["plant_name"] = plant_name
-        records["start_tech"] = start_tech
-        records["tco_reference_tech"] = tco_reference_tech
-        records["solver_logic"] = solver_logic
-        records["weighting"] = str(weighting_dict)
-        records["scenario_name"] = scenario_name
-        records["switch_type"] = (
-            "transitional switch" if transitional_switch_mode else "main cycle switch"
-        )
-        records["excluded_due_to_availability"] = records["switch_tech"].apply(
-            lambda switch_tech: switch_tech not in availability_included_techs
+    if (not combined_ranks.empty) and plant_choice_container.record_ranks:
+        switch_techs = combined_ranks.index.to_list()
+        excluded_due_to_availability = np.array(
+            [
+                switch_tech not in availability_included_techs
+                for switch_tech in switch_techs
+            ],
+            dtype=bool,
         )
-        records["excluded_due_to_constraints"] = records["switch_tech"].apply(
-            lambda switch_tech: switch_tech not in constraint_included_techs
+        excluded_due_to_constraints = np.array(
+            [
+                switch_tech not in constraint_included_techs
+                for switch_tech in switch_techs
+            ],
+            dtype=bool,
         )
-        records["excluded_for_any_reason"] = records.apply(boolean_check, axis=1)
+        records = {
+            "switch_tech": switch_techs,
+            **{col: combined_ranks[col].values for col in combined_ranks.columns},
+            "year": year,
+            "region": region,
+            "plant_name": plant_name,
+            "start_tech": start_tech,
+            "tco_reference_tech": tco_reference_tech,
+            "solver_logic": solver_logic,
+            "weighting": str(weighting_dict),
+            "scenario_name": scenario_name,
+            "switch_type": (
+                "transitional switch"
+                if transitional_switch_mode
+                else "main cycle switch"
+            ),
+            "excluded_due_to_availability": excluded_due_to_availability,
+            "excluded_due_to_constraints": excluded_due_to_constraints,
+            "excluded_for_any_reason": ~excluded_due_to_availability
+            & excluded_due_to_constraints,
+        }
 
+        record_cols = None
         if solver_logic == "rank":
-            records = records[
-                [
-                    "year",
-                    "region",
-                    "plant_name",
-                    "start_tech",
-                    "tco_reference_tech",
-                    "solver_logic",
-                    "weighting",
-                    "switch_type",
-                    "scenario_name",
-                    "switch_tech",
-                    "tco_rank_score",
-                    "abatement_rank_score",
-                    "overall_rank",
-                    "excluded_due_to_constraints",
-                ]
+            record_cols = [
+                "year",
+                "region",
+                "plant_name",
+                "start_tech",
+                "tco_reference_tech",
+                "solver_logic",
+                "weighting",
+                "switch_type",
+                "scenario_name",
+                "switch_tech",
+                "tco_rank_score",
+                "abatement_rank_score",
+                "overall_rank",
+                "excluded_due_to_constraints",
             ]
         elif solver_logic in {"scaled", "scaled_bins"}:
-            records = records[
-                [
-                    "year",
-                    "region",
-                    "plant_name",
-                    "start_tech",
-                    "tco_reference_tech",
-                    "solver_logic",
-                    "weighting",
-                    "switch_type",
-                    "scenario_name",
-                    "switch_tech",
-                    "tco_scaled",
-                    "abatement_scaled",
-                    "overall_score",
-                    "excluded_due_to_constraints",
-                ]
-            ]
-        records = records.set_index(
-            [
+            record_cols = [
                 "year",
                 "region",
                 "plant_name",
+                "start_tech",
+                "tco_reference_tech",
                 "solver_logic",
                 "weighting",
                 "switch_type",
                 "scenario_name",
-                "start_tech",
+                "switch_tech",
+                "tco_scaled",
+                "abatement_scaled",
+                "overall_score",
+                "excluded_due_to_constraints",
             ]
-        ).sort_index(ascending=True)
+        if record_cols:
+            records = {col: records[col] for col in record_cols}
         plant_choice_container.update_records("rank", records)
 
 
 def return_best_choice(
-    best_values: pd.DataFrame, start_tech: str, potential_techs: list
+    best_values: pd.DataFrame,
+    start_tech: str,
+    potential_techs: list,
+    random_streams: Union[RandomStreams, None] = None,
+    stream_key: tuple = (),
 ):
     # pick random choice if there is more than one option
     if len(best_values) > 1:
         potential_techs = best_values.index.to_list()
-        return random.choice(potential_techs)
+        return random_choice(potential_techs, random_streams, stream_key)
     # pick the only option if there is one option
     elif len(best_values) == 1:
         return best_values.index.values[0]
@@ -352,6 +481,28 @@ def return_best_choice(
         return start_tech
 
 
+def combine_ranks(
+    tco_values: pd.DataFrame, abatement_values: pd.DataFrame, weighting_dict: dict
+) -> pd.DataFrame:
+    """Joins the TCO ranks and the abatement ranks of a plant and calculates the weighted overall rank.
+
+    Args:
+        tco_values (pd.DataFrame): The ranked TCO values.
+        abatement_values (pd.DataFrame): The ranked abatement values.
+        weighting_dict (dict): Weighting for tco and abatement data.
+
+    Returns:
+        pd.DataFrame: A DataFrame indexed by switch_tech containing the tco, abatement and overall ranks.
+    """
+    combined_ranks = tco_values[["tco_rank_score"]].join(
+        abatement_values[["abatement_rank_score"]]
+    )
+    combined_ranks["overall_rank"] = (
+        combined_ranks["tco_rank_score"] * weighting_dict["tco"]
+    ) + (combined_ranks["abatement_rank_score"] * weighting_dict["emissions"])
+    return combined_ranks
+
+
 def get_best_choice(
     tco_df: pd.DataFrame,
     emissions_df: pd.DataFrame,
@@ -371,6 +522,10 @@ def get_best_choice(
     material_usage_dict_container: MaterialUsage,
     plant_name: str,
     region: str,
+    decision_tensor: Union[TcoAbatementTensor, None] = None,
+    tco_overlay: Union[TcoAdjustmentOverlay, None] = None,
+    ranking_cache: Union[RankingCache, None] = None,
+    random_streams: Union[RandomStreams, None] = None,
 ) -> str:
     """Returns the best technology choice from a list of potential logic according to the parameter settings provided in the function.
 
@@ -393,6 +548,10 @@ def get_best_choice(
         material_usage_dict_container (MaterialUsage): Container class object that is used to track the material usage within the application. Defaults to None.
         plant_name (str): The plant name.
         region (str): The plant's region.
+        decision_tensor (Union[TcoAbatementTensor, None], optional): The dense TCO and abatement reference. If provided, it is used instead of `tco_df` and `emissions_df`. Defaults to None.
+        tco_overlay (Union[TcoAdjustmentOverlay, None], optional): The plant's TCO adjustments (green premium and transitional switch scaling). Defaults to None.
+        ranking_cache (Union[RankingCache, None], optional): The cache of ranked technology tables shared by plants with the same decision context. Only used by the `ranked` logic. Defaults to None.
+        random_streams (Union[RandomStreams, None], optional): The year's random streams, used to break ties between the best technologies. Ties are broken with the global `random` module if None. Defaults to None.
 
     Returns:
         str: The best technology choice for a given year.
@@ -413,6 +572,8 @@ def get_best_choice(
             technology_list,
             rank=False,
             transitional_switch_mode=transitional_switch_mode,
+            decision_tensor=decision_tensor,
+            tco_overlay=tco_overlay,
         )
         if enforce_constraints:
             constraint_included_techs = apply_constraints(
@@ -530,23 +691,57 @@ def get_best_choice(
                 ]
 
                 return_tech = return_best_choice(
-                    best_values, start_tech, updated_tech_availability
+                    best_values,
+                    start_tech,
+                    updated_tech_availability,
+                    random_streams,
+                    ("best_tech", plant_name),
                 )
 
     # Ranking algorithm
     elif solver_logic == "ranked":
+        if transitional_switch_mode and start_tech not in technology_list:
+            technology_list.append(start_tech)
+        cache_key = None
+        cached_ranks = None
+        if ranking_cache is not None:
+            cache_key = create_ranking_cache_key(
+                year,
+                country_code,
+                start_tech,
+                transitional_switch_mode,
+                technology_list,
+                solver_logic,
+                weighting_dict,
+                tco_overlay,
+            )
+            cached_ranks = ranking_cache.get(cache_key)
 
-        tco_values, abatement_values, tco_reference_tech = get_tco_and_abatement_values(
-            tco_df,
-            emissions_df,
-            cost_value_col,
-            year,
-            country_code,
-            start_tech,
-            technology_list,
-            rank=True,
-            transitional_switch_mode=transitional_switch_mode,
-        )
+        if cached_ranks is None:
+            (
+                tco_values,
+                abatement_values,
+                tco_reference_tech,
+            ) = get_tco_and_abatement_values(
+                tco_df,
+                emissions_df,
+                cost_value_col,
+                year,
+                country_code,
+                start_tech,
+                technology_list,
+                rank=True,
+                transitional_switch_mode=transitional_switch_mode,
+                decision_tensor=decision_tensor,
+                tco_overlay=tco_overlay,
+            )
+            combined_ranks = combine_ranks(
+                tco_values, abatement_values, weighting_dict
+            )
+            if ranking_cache is not None:
+                ranking_cache.set(cache_key, (combined_ranks, tco_reference_tech))
+        else:
+            combined_ranks, tco_reference_tech = cached_ranks
 
         if enforce_constraints:
             constraint_included_techs = apply_constraints(
@@ -569,26 +764,12 @@ def get_best_choice(
             if (
                 not transitional_switch_mode
                 and 1
-                not in tco_values.loc[updated_tech_availability][
+                not in combined_ranks.loc[updated_tech_availability][
                     "tco_rank_score"
                 ].values
             ):
                 updated_tech_availability.append(start_tech)
 
-        tco_values.drop(
-            columns=tco_values.columns.difference(["tco_rank_score"]),
-            axis=1,
-            inplace=True,
-        )
-        abatement_values.drop(
-            columns=abatement_values.columns.difference(["abatement_rank_score"]),
-            axis=1,
-            inplace=True,
-        )
-        combined_ranks = tco_values.join(abatement_values)
-        combined_ranks["overall_rank"] = (
-            combined_ranks["tco_rank_score"] * weighting_dict["tco"]
-        ) + (combined_ranks["abatement_rank_score"] * weighting_dict["emissions"])
         record_ranking(
             combined_ranks,
             technology_list,
@@ -604,20 +785,347 @@ def get_best_choice(
             scenario_name,
             transitional_switch_mode,
         )
-        combined_ranks.drop(
-            labels=combined_ranks.index.difference(updated_tech_availability),
-            inplace=True,
-        )
-        combined_ranks.sort_values("overall_rank", axis=0, inplace=True)
-        min_value = combined_ranks["overall_rank"].min()
-        best_values = combined_ranks[combined_ranks["overall_rank"] == min_value]
+        available_ranks = combined_ranks.drop(
+            labels=combined_ranks.index.difference(updated_tech_availability)
+        ).sort_values("overall_rank", axis=0)
+        min_value = available_ranks["overall_rank"].min()
+        best_values = available_ranks[available_ranks["overall_rank"] == min_value]
         return_tech = return_best_choice(
-            best_values, start_tech, updated_tech_availability
+            best_values,
+            start_tech,
+            updated_tech_availability,
+            random_streams,
+            ("best_tech", plant_name),
         )
 
     return return_tech
 
 
+def nan_last_argsort(values: np.ndarray) -> np.ndarray:
+    """Returns the indices that sort `values` in ascending order with NaN values placed last.
+    Uses the same algorithm as `DataFrame.sort_values` so that ties are ordered in the same way.
+
+    Args:
+        values (np.ndarray): The values to sort.
+
+    Returns:
+        np.ndarray: The sorting indices.
+    """
+    nan_mask = np.isnan(values)
+    positions = np.arange(len(values))
+    sorted_positions = positions[~nan_mask][
+        values[~nan_mask].argsort(kind="quicksort")
+    ]
+    return np.concatenate([sorted_positions, positions[nan_mask]])
+
+
+class TechnologyRankBatch:
+    """Description
+    Class to rank the switch technologies of every switching plant in a year in a single vectorized pass over a TcoAbatementTensor.
+    Produces the same TCO ranks, abatement ranks and weighted overall ranks as the `ranked` logic in `get_best_choice`.
+
+    Important Points
+    1) The ranks only depend on the reference data, so they can be calculated for all plants before any decision is made.
+    2) The resource constraint checks and the capacity constraint commit depend on the decisions of the plants before, so they still run one plant at a time (see `get_best_choice_from_batch`).
+
+    Main Class Attributes
+        plant_index: A dictionary mapping each plant name to its row in the rank arrays.
+        technology_lists: The technology list of each plant (including the start technology in transitional switch mode).
+        tco_values / abatement_values: Arrays in the form [plant][switch_tech] with the (adjusted) TCO values and the abatement values.
+        tco_present / abatement_present: Boolean arrays in the form [plant][switch_tech] that mark the options available to each plant.
+        tco_ranks / abatement_ranks: Arrays in the form [plant][switch_tech] with the rank of each option.
+        ranking_cache: An optional RankingCache used to share each plant's ranked table with plants in the same decision context.
+    """
+
+    def __init__(
+        self,
+        decision_tensor: TcoAbatementTensor,
+        year: int,
+        plant_names: list,
+        country_codes: list,
+        start_techs: list,
+        technology_lists: list,
+        transitional_switch_mode: bool,
+        tco_overlays: Sequence[Union[TcoAdjustmentOverlay, None]],
+        ranking_cache: Union[RankingCache, None] = None,
+    ):
+        self.decision_tensor = decision_tensor
+        self.year = year
+        self.country_codes = list(country_codes)
+        self.tco_overlays = list(tco_overlays)
+        self.ranking_cache = ranking_cache
+        self.transitional_switch_mode = transitional_switch_mode
+        self.plant_index = {plant_name: idx for idx, plant_name in enumerate(plant_names)}
+        self.start_techs = list(start_techs)
+        self.technology_lists = technology_lists
+        self.cost_value_col = (
+            "tco_gf_capex" if transitional_switch_mode else "tco_regular_capex"
+        )
+        for start_tech, technology_list in zip(start_techs, technology_lists):
+            if transitional_switch_mode and start_tech not in technology_list:
+                technology_list.append(start_tech)
+        self.calculate_ranks(self.country_codes, self.tco_overlays)
+
+    def calculate_ranks(
+        self,
+        country_codes: list,
+        tco_overlays: Sequence[Union[TcoAdjustmentOverlay, None]],
+    ) -> None:
+        tensor = self.decision_tensor
+        number_of_plants = len(self.start_techs)
+        number_of_techs = len(tensor.technologies)
+        for country_code, start_tech in zip(country_codes, self.start_techs):
+            if not tensor.has_entry(self.year, country_code, start_tech):
+                raise KeyError((self.year, country_code, start_tech))
+        year_idx = tensor.year_index[self.year]
+        country_idx = np.array(
+            [tensor.country_index[country_code] for country_code in country_codes],
+            dtype=int,
+        )
+        base_idx = np.array(
+            [tensor.tech_index[start_tech] for start_tech in self.start_techs],
+            dtype=int,
+        )
+        in_list = np.zeros((number_of_plants, number_of_techs), dtype=bool)
+        for plant_idx, technology_list in enumerate(self.technology_lists):
+            in_list[
+                plant_idx,
+                [tensor.tech_index[tech] for tech in technology_list if tech in tensor.tech_index],
+            ] = True
+
+        self.tco_present = tensor.tco_present[year_idx, country_idx, base_idx] & in_list
+        self.abatement_present = (
+            tensor.abatement_present[year_idx, country_idx, base_idx] & in_list
+        )
+        tco_values = tensor.values[
+            year_idx, country_idx, base_idx, :, tensor.value_col_index[self.cost_value_col]
+        ]
+        self.tco_values = adjust_value_matrix(
+            tco_values, tco_overlays, self.cost_value_col
+        )
+        self.abatement_values = tensor.values[
+            year_idx,
+            country_idx,
+            base_idx,
+            :,
+            tensor.value_col_index["abated_combined_emissivity"],
+        ]
+
+        # TCO reference values
+        masked_tco = np.where(self.tco_present, self.tco_values, np.nan)
+        eaf_idx = tensor.tech_index.get("EAF")
+        with np.errstate(invalid="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            ref_values = np.nanmin(masked_tco, axis=1)
+            if eaf_idx is not None:
+                masked_tco_no_eaf = masked_tco.copy()
+                masked_tco_no_eaf[:, eaf_idx] = np.nan
+                eaf_ref_values = np.nanmin(masked_tco_no_eaf, axis=1)
+                ref_values = np.where(
+                    self.tco_present[:, eaf_idx], eaf_ref_values, ref_values
+                )
+        if self.transitional_switch_mode:
+            ref_values = self.tco_values[np.arange(number_of_plants), base_idx]
+        ref_values = ref_values[:, np.newaxis]
+        self.tco_ranks = np.where(
+            self.tco_values > ref_values * TCO_RANK_2_SCALER,
+            3,
+            np.where(self.tco_values > ref_values * TCO_RANK_1_SCALER, 2, 1),
+        )
+        self.abatement_ranks = np.where(
+            self.abatement_values < ABATEMENT_RANK_3,
+            3,
+            np.where(self.abatement_values < ABATEMENT_RANK_2, 2, 1),
+        )
+        # a single option is always ranked first
+        self.tco_ranks[self.tco_present.sum(axis=1) == 1] = 1
+        self.abatement_ranks[self.abatement_present.sum(axis=1) == 1] = 1
+
+    def return_plant_ranks(
+        self, plant_name: str, weighting_dict: dict
+    ) -> Tuple[pd.DataFrame, str]:
+        """Returns the combined ranks of a single plant in the same format as the `ranked` logic in `get_best_choice`.
+
+        Args:
+            plant_name (str): The name of the plant.
+            weighting_dict (dict): Weighting for tco and abatement data.
+
+        Returns:
+            Tuple[pd.DataFrame, str]: A DataFrame indexed by switch_tech containing the tco, abatement and overall ranks sorted by TCO value, and the TCO reference technology.
+        """
+        tensor = self.decision_tensor
+        plant_idx = self.plant_index[plant_name]
+        start_tech = self.start_techs[plant_idx]
+        cache_key = None
+        if self.ranking_cache is not None:
+            cache_key = create_ranking_cache_key(
+                self.year,
+                self.country_codes[plant_idx],
+                start_tech,
+                self.transitional_switch_mode,
+                self.technology_lists[plant_idx],
+                "ranked",
+                weighting_dict,
+                self.tco_overlays[plant_idx],
+            )
+            cached_ranks = self.ranking_cache.get(cache_key)
+            if cached_ranks is not None:
+                return cached_ranks
+        tech_positions = np.array(
+            [
+                tensor.tech_index[tech]
+                for tech in self.technology_lists[plant_idx]
+                if (tech in tensor.tech_index)
+                and self.tco_present[plant_idx, tensor.tech_index[tech]]
+            ],
+            dtype=int,
+        )
+        tco_values = self.tco_values[plant_idx, tech_positions]
+        tech_positions = tech_positions[nan_last_argsort(tco_values)]
+        tco_values = self.tco_values[plant_idx, tech_positions]
+        switch_techs = [tensor.technologies[position] for position in tech_positions]
+
+        tco_reference_tech = ""
+        if self.transitional_switch_mode and len(switch_techs) > 1:
+            tco_reference_tech = start_tech
+        else:
+            reference_mask = ~np.isnan(tco_values)
+            if (len(switch_techs) > 1) and ("EAF" in switch_techs):
+                reference_mask &= np.array([tech != "EAF" for tech in switch_techs])
+            if reference_mask.any():
+                reference_values = np.where(reference_mask, tco_values, np.nan)
+                tco_reference_tech = switch_techs[int(np.nanargmin(reference_values))]
+
+        tco_rank_score = self.tco_ranks[plant_idx, tech_positions]
+        abatement_present = self.abatement_present[plant_idx, tech_positions]
+        if abatement_present.all():
+            abatement_rank_score = self.abatement_ranks[plant_idx, tech_positions]
+        else:
+            abatement_rank_score = np.where(
+                abatement_present,
+                self.abatement_ranks[plant_idx, tech_positions],
+                np.nan,
+            )
+        overall_rank = (tco_rank_score * weighting_dict["tco"]) + (
+            abatement_rank_score * weighting_dict["emissions"]
+        )
+        combined_ranks = pd.DataFrame(
+            {
+                "tco_rank_score": tco_rank_score,
+                "abatement_rank_score": abatement_rank_score,
+                "overall_rank": overall_rank,
+            },
+            index=pd.Index(switch_techs, name="switch_tech"),
+        )
+        if self.ranking_cache is not None:
+            self.ranking_cache.set(cache_key, (combined_ranks, tco_reference_tech))
+        return combined_ranks, tco_reference_tech
+
+
+def get_best_choice_from_batch(
+    rank_batch: TechnologyRankBatch,
+    plant_name: str,
+    region: str,
+    solver_logic: str,
+    scenario_name: str,
+    weighting_dict: dict,
+    regional_scrap: bool,
+    plant_choice_container: PlantChoices,
+    enforce_constraints: bool,
+    business_case_ref: dict,
+    plant_capacities: dict,
+    material_usage_dict_container: MaterialUsage,
+    random_streams: Union[RandomStreams, None] = None,
+) -> str:
+    """Returns the best technology choice of a plant using the ranks precalculated in a TechnologyRankBatch.
+    Equivalent to the `ranked` logic in `get_best_choice`, applying the resource constraints against the current material balances.
+
+    Args:
+        rank_batch (TechnologyRankBatch): The precalculated ranks of the year's switching plants.
+        plant_name (str): The plant name.
+        region (str): The plant's region.
+        solver_logic (str): Determines the algorithm used to pick the best technology.
+        scenario_name (str): The current scenario of the model_run.
+        weighting_dict (dict): A dictionary containing the weighting scenario of lowest cost vs. emission abatement.
+        regional_scrap (bool): The scenario boolean value that determines whether there is a regional or global scrap constraints.
+        plant_choice_container (PlantChoices): The PlantChoices Instance containing each plant's choices.
+        enforce_constraints (bool): Boolen flag to determine if constraints should affect technology availability.
+        business_case_ref (dict): Standardised Business Cases.
+        plant_capacities (dict): A dictionary containing plant: capacity/inital tech key:value pairs.
+        material_usage_dict_container (MaterialUsage): Container class object that is used to track the material usage within the application.
+        random_streams (Union[RandomStreams, None], optional): The year's random streams, used to break ties between the best technologies. Ties are broken with the global `random` module if None. Defaults to None.
+
+    Returns:
+        str: The best technology choice for a given year.
+    """
+    plant_idx = rank_batch.plant_index[plant_name]
+    start_tech = rank_batch.start_techs[plant_idx]
+    technology_list = rank_batch.technology_lists[plant_idx]
+    transitional_switch_mode = rank_batch.transitional_switch_mode
+    year = rank_batch.year
+    combined_ranks, tco_reference_tech = rank_batch.return_plant_ranks(
+        plant_name, weighting_dict
+    )
+    updated_tech_availability = technology_list
+
+    if enforce_constraints:
+        constraint_included_techs = apply_constraints(
+            business_case_ref,
+            plant_capacities,
+            material_usage_dict_container,
+            technology_list,
+            year,
+            plant_name,
+            region,
+            start_tech,
+            regional_scrap=regional_scrap,
+            override_constraint=False,
+            apply_transaction=False,
+        )
+        updated_tech_availability = deepcopy(constraint_included_techs)
+        if transitional_switch_mode and start_tech not in updated_tech_availability:
+            updated_tech_availability.append(start_tech)
+
+        if (
+            not transitional_switch_mode
+            and 1
+            not in combined_ranks["tco_rank_score"]
+            .reindex(updated_tech_availability)
+            .values
+        ):
+            updated_tech_availability.append(start_tech)
+
+    record_ranking(
+        combined_ranks,
+        technology_list,
+        updated_tech_availability,
+        plant_choice_container,
+        year,
+        region,
+        plant_name,
+        start_tech,
+        tco_reference_tech,
+        solver_logic,
+        weighting_dict,
+        scenario_name,
+        transitional_switch_mode,
+    )
+    available_mask = combined_ranks.index.isin(updated_tech_availability)
+    available_techs = combined_ranks.index.values[available_mask]
+    overall_ranks = combined_ranks["overall_rank"].values[available_mask]
+    sort_order = nan_last_argsort(overall_ranks)
+    available_techs = available_techs[sort_order]
+    overall_ranks = overall_ranks[sort_order]
+    best_values = []
+    if (~np.isnan(overall_ranks)).any():
+        best_values = list(available_techs[overall_ranks == np.nanmin(overall_ranks)])
+    if len(best_values) > 1:
+        return random_choice(best_values, random_streams, ("best_tech", plant_name))
+    elif len(best_values) == 1:
+        return best_values[0]
+    return start_tech
+
+
 def subset_presolver_df(df: pd.DataFrame, subset_type: str) -> pd.DataFrame:
     """Subsets and formats the TCO or Emissions Abatement DataFrame prior to being used in the solver flow.
 
@@ -677,40 +1185,59 @@ def apply_constraints(
     apply_transaction: bool,
 ):
     # Constraints checks
-    new_availability_list = []
-    for switch_technology in combined_available_list:
-        material_check_container = create_material_usage_dict(
+    if apply_transaction:
+        # transactions change the balances, so each technology is checked in turn
+        material_check_matrix = np.array(
+            [
+                list(
+                    create_material_usage_dict(
+                        material_usage_dict_container,
+                        plant_capacities,
+                        business_case_ref,
+                        plant_name,
+                        region,
+                        year,
+                        switch_technology,
+                        regional_scrap,
+                        override_constraint=override_constraint,
+                        apply_transaction=apply_transaction,
+                    ).values()
+                )
+                for switch_technology in combined_available_list
+            ],
+            dtype=bool,
+        ).reshape(len(combined_available_list), len(RESOURCE_CONTAINER_REF))
+    else:
+        material_check_matrix = create_material_check_matrix(
             material_usage_dict_container,
             plant_capacities,
             business_case_ref,
             plant_name,
             region,
             year,
-            switch_technology,
+            combined_available_list,
             regional_scrap,
             override_constraint=override_constraint,
-            apply_transaction=apply_transaction,
         )
-        if all(material_check_container.values()):
-            new_availability_list.append(switch_technology)
-        failure_resources = [
-            resource
-            for resource in material_check_container
-            if not material_check_container[resource]
-        ]
-
-        result = "PASS" if all(material_check_container.values()) else "FAIL"
-
-        entry = {
-            "plant": plant_name,
-            "region": region,
-            "start_technology": base_tech,
-            "switch_technology": switch_technology,
-            "year": year,
-            "assign_case": "pre-existing plant",
-            "result": result,
-            "failure_resources": failure_resources,
-            "pass_boolean_check": material_check_container,
-        }
-        material_usage_dict_container.record_results(entry)
+    new_availability_list = [
+        switch_technology
+        for switch_technology, passed in zip(
+            combined_available_list, material_check_matrix.all(axis=1)
+        )
+        if passed
+    ]
+    if material_usage_dict_container.recording:
+        material_usage_dict_container.record_result_entries(
+            create_material_check_entries(
+                material_check_matrix,
+                combined_available_list,
+                {
+                    "plant": plant_name,
+                    "region": region,
+                    "start_technology": base_tech,
+                    "year": year,
+                    "assign_case": "pre-existing plant",
+                },
+            )
+        )
     return new_availability_list
@@ -2,15 +2,36 @@
 
 import multiprocessing as mp
 
-from typing import Any, Callable, MutableMapping, Sized, Sequence
+from typing import Any, Callable, MutableMapping, Sized, Sequence, Union
 from mppsteel.config.mypy_config_settings import MYPY_SCENARIO_TYPE_DICT
-from mppsteel.utility.log_utility import get_logger
+from mppsteel.utility.function_timer_utility import SPAN_PROFILER
+from mppsteel.utility.log_utility import (
+    LOG_PIPELINE,
+    configure_worker_logging,
+    get_logger,
+)
 
 logger = get_logger(__name__)
 
 
+def initialize_worker(
+    log_level: Union[str, int], span_folder: Union[str, None] = None
+) -> None:
+    """Initializer of the worker processes of multiprocessing pools.
+
+    Args:
+        log_level (Union[str, int]): The logging level of the worker.
+        span_folder (Union[str, None], optional): The folder that the worker writes its timing spans to when it exits. Spans are not recorded if None. Defaults to None.
+    """
+    configure_worker_logging(log_level)
+    if span_folder:
+        SPAN_PROFILER.start_worker(span_folder)
+
+
 def create_pool(processes_to_run: Sized):
     """Creates a Multiprocessing pool with the number of processess based on the length of processes_to_run.
+    Each worker process writes its own log file at the batch run log level of the LOG_PIPELINE.
+    If the SPAN_PROFILER is enabled, each worker also writes its own span files to the worker folder of the profiler.
 
     Args:
         processes_to_run (Sized): The number of processes to run.
@@ -20,8 +41,15 @@ def create_pool(processes_to_run: Sized):
     """
     n_cores = mp.cpu_count()
     virtual_cores = len(processes_to_run)
-    logger.info(f"{n_cores} cores detected, creating {virtual_cores} virtual cores")
-    return mp.Pool(processes=virtual_cores)
+    logger.info("%s cores detected, creating %s virtual cores", n_cores, virtual_cores)
+    return mp.Pool(
+        processes=virtual_cores,
+        initializer=initialize_worker,
+        initargs=(
+            LOG_PIPELINE.batch_level,
+            SPAN_PROFILER.worker_folder if SPAN_PROFILER.enabled else None,
+        ),
+    )
 
 
 def multiprocessing_scenarios_single_run(
@@ -83,9 +111,8 @@ def multiprocessing_scenarios_preprocessing(
 
 
 def async_error_handler(e):
-    print("error")
-    logger.info(dir(e), "\n")
-    logger.info(f"-->{e.__cause__}<--")
+    logger.error("Error in worker process: %r", e)
+    logger.error("-->%s<--", e.__cause__)
 
 
 def multi_run_function(
@@ -1,9 +1,14 @@
 from . import (
     plant_container_class,
+    investment_cycle_bitset_class,
     plant_investment_cycle_class,
     plant_investment_cycle_helpers,
     capacity_constraint_class,
     capacity_container_class,
+    id_interner_class,
+    plant_age_queue_class,
     plant_choices_class,
+    plant_registry_class,
+    record_buffer_class,
     regional_utilization_class,
 )
@@ -152,7 +152,9 @@ class PlantCapacityConstraint:
         }
         if burst_limit_dict:
             logger.info(
-                f"Some plants burst the waiting list limit of {MAX_WAITING_LIST_YEARS} years -> {burst_limit_dict}"
+                "Some plants burst the waiting list limit of %s years -> %s",
+                MAX_WAITING_LIST_YEARS,
+                burst_limit_dict,
             )
         else:
             max_waiting_time = (
@@ -160,7 +162,9 @@ class PlantCapacityConstraint:
             )
             if waiting_list_dict.values():
                 logger.info(
-                    f"No plants burst the limit of {MAX_WAITING_LIST_YEARS} years. Max waiting list time is {max_waiting_time} years."
+                    "No plants burst the limit of %s years. Max waiting list time is %s years.",
+                    MAX_WAITING_LIST_YEARS,
+                    max_waiting_time,
                 )
 
     def print_capacity_summary(self, year: int) -> None:
@@ -168,5 +172,9 @@ class PlantCapacityConstraint:
         waiting_list = self.return_waiting_list(year)
         switched_plants = self.return_capcity_switch_plants(year)
         logger.info(
-            f"Capacity Balance for {year} is {capacity_balance: .2f}. {len(switched_plants)} Plants switched their capacity to a different technology. There are {len(waiting_list)} plants in the waiting_list."
+            "Capacity Balance for %s is % .2f. %s Plants switched their capacity to a different technology. There are %s plants in the waiting_list.",
+            year,
+            capacity_balance,
+            len(switched_plants),
+            len(waiting_list),
         )
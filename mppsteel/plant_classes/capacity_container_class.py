@@ -1,9 +1,18 @@
 """Classes to manage plant capacity"""
 
-from typing import Tuple, Union
+from fractions import Fraction
+import math
+from typing import Dict, List, Sequence, Set, Tuple, Union
+
+import numpy as np
 import pandas as pd
 
 from mppsteel.config.model_config import MEGATON_TO_KILOTON_FACTOR, MAIN_REGIONAL_SCHEMA
+from mppsteel.plant_classes.id_interner_class import (
+    InternedMappingView,
+    SolverIds,
+    grow_id_array,
+)
 from mppsteel.utility.log_utility import get_logger
 
 logger = get_logger(__name__)
@@ -13,29 +22,245 @@ class CapacityContainerClass:
     """Description
     Class for maintaining the state of each plant's capacity.
 
+    Important Points
+    1) The capacities are kept as running totals that are updated when plants are added (opened) or removed (closed), instead of being remapped from the plant DataFrame.
+    2) Regional totals are kept as exact fractions, so they do not depend on the order of the updates and always equal the (correctly rounded) sum of the regional plant capacities.
+    3) Each year's snapshots are shared with the previous year and only copied when the year is first updated (copy-on-write). Adding or removing a plant only updates the regional snapshot entry of its region, and regions are ordered by the time they gained their first plant.
+    4) `sync_capacities` rebuilds the state from the plant DataFrame with `map_capacities` only if the region or capacity of a plant has drifted from the running totals. `check_capacities` compares the running totals to a vectorized groupby of a plant DataFrame, and is only run by the solver if `VALIDATE_CAPACITY_RUNNING_TOTALS` is set.
+    5) The plant level snapshots are arrays indexed by the plant ids of the shared SolverIds instance. `return_plant_capacity` returns read-only dictionary views of them.
+
     Main Class Attributes
-        At the plant level: `plant_capacities` in the form [year][plant_name] -> total capacity value
+        At the plant level:
+            `plant_capacity_arrays` in the form [year][plant_id] -> total capacity value (NaN if the plant is not active)
+            `plant_orders` in the form [year] -> the plant ids in the order that they were added
         At the region level:
             `regional_capacities_agg` in the form [year][region] -> total regional capacity value
             `regional_capacities_avg` in the form [year][region] -> average regional capacity value
+        Running totals: `plant_regions`, `plant_capacity_values` and `regional_totals` (in kilotons) for the current state of the plants.
     """
 
-    def __init__(self):
-        self.plant_capacities = {}
+    def __init__(self, solver_ids: SolverIds = None):
+        self.solver_ids = solver_ids if solver_ids else SolverIds()
+        self.plant_capacity_arrays: Dict[int, np.ndarray] = {}
+        self.plant_orders: Dict[int, List[int]] = {}
         self.regional_capacities_agg = {}
+        self.plant_regions: Dict[str, str] = {}
+        self.plant_capacity_values: Dict[str, float] = {}
+        self.regional_totals: Dict[str, Fraction] = {}
+        self.regional_plant_counts: Dict[str, int] = {}
+        self.copied_years: Set[int] = set()
 
     def instantiate_container(self, year_range: range) -> None:
-        self.plant_capacities = {year: 0 for year in year_range}
+        self.plant_capacity_arrays = {year: None for year in year_range}
+        self.plant_orders = {year: None for year in year_range}
         self.regional_capacities_agg = {year: 0 for year in year_range}
         self.regional_capacities_avg = {year: 0 for year in year_range}
 
+    def start_year(self, year: int) -> None:
+        # share the previous year's snapshots until the year is updated
+        previous_plant_capacities = self.plant_capacity_arrays.get(year - 1)
+        if previous_plant_capacities is not None:
+            self.plant_capacity_arrays[year] = previous_plant_capacities
+            self.plant_orders[year] = self.plant_orders[year - 1]
+            self.regional_capacities_agg[year] = self.regional_capacities_agg[year - 1]
+        else:
+            self.plant_capacity_arrays[year] = np.zeros(0)
+            self.plant_orders[year] = []
+            self.regional_capacities_agg[year] = {}
+        self.copied_years.discard(year)
+
+    def return_writable_plant_capacities(self, year: int) -> np.ndarray:
+        if year not in self.copied_years:
+            plant_capacities = self.plant_capacity_arrays.get(year)
+            plant_order = self.plant_orders.get(year)
+            self.plant_capacity_arrays[year] = (
+                plant_capacities.copy() if plant_capacities is not None else np.zeros(0)
+            )
+            self.plant_orders[year] = list(plant_order) if plant_order else []
+            regional_capacities = self.regional_capacities_agg.get(year)
+            self.regional_capacities_agg[year] = (
+                dict(regional_capacities)
+                if isinstance(regional_capacities, dict)
+                else {}
+            )
+            self.copied_years.add(year)
+        return self.plant_capacity_arrays[year]
+
+    def update_regional_snapshot(self, year: int, regions: Sequence[str]) -> None:
+        # regions are ordered by the time they gained their first plant, so only the entries of the updated regions change
+        regional_capacities = self.regional_capacities_agg[year]
+        for region in regions:
+            if region in self.regional_totals:
+                regional_capacities[region] = (
+                    float(self.regional_totals[region]) / MEGATON_TO_KILOTON_FACTOR
+                )
+            else:
+                regional_capacities.pop(region, None)
+
+    def subtract_plant_total(self, plant_name: str) -> None:
+        region = self.plant_regions[plant_name]
+        self.regional_totals[region] -= Fraction(self.plant_capacity_values[plant_name])
+        self.regional_plant_counts[region] -= 1
+        if self.regional_plant_counts[region] == 0:
+            del self.regional_totals[region]
+            del self.regional_plant_counts[region]
+
+    def add_plants(
+        self,
+        year: int,
+        plant_names: Sequence[str],
+        regions: Sequence[str],
+        capacities: Sequence[float],
+    ) -> None:
+        """Adds plants (e.g. newly opened plants) to the running totals and the year's snapshots.
+
+        Args:
+            year (int): The year to update.
+            plant_names (Sequence[str]): The names of the plants.
+            regions (Sequence[str]): The region of each plant.
+            capacities (Sequence[float]): The capacity of each plant (in kilotons).
+        """
+        plant_ids = self.solver_ids.plants.intern_many(plant_names)
+        plant_capacities = grow_id_array(
+            self.return_writable_plant_capacities(year),
+            max(plant_ids, default=-1) + 1,
+            np.nan,
+        )
+        self.plant_capacity_arrays[year] = plant_capacities
+        plant_order = self.plant_orders[year]
+        updated_regions = {}
+        for plant_name, plant_id, region, capacity in zip(
+            plant_names, plant_ids, regions, capacities
+        ):
+            if plant_name in self.plant_regions:
+                updated_regions[self.plant_regions[plant_name]] = None
+                self.subtract_plant_total(plant_name)
+            updated_regions[region] = None
+            self.plant_regions[plant_name] = region
+            self.plant_capacity_values[plant_name] = capacity
+            self.regional_totals[region] = self.regional_totals.get(
+                region, Fraction(0)
+            ) + Fraction(capacity)
+            self.regional_plant_counts[region] = (
+                self.regional_plant_counts.get(region, 0) + 1
+            )
+            if np.isnan(plant_capacities[plant_id]):
+                plant_order.append(plant_id)
+            plant_capacities[plant_id] = capacity / MEGATON_TO_KILOTON_FACTOR
+        self.update_regional_snapshot(year, updated_regions)
+
+    def remove_plants(self, year: int, plant_names: Sequence[str]) -> None:
+        """Removes plants (e.g. closed plants) from the running totals and the year's snapshots.
+
+        Args:
+            year (int): The year to update.
+            plant_names (Sequence[str]): The names of the plants.
+        """
+        plant_capacities = self.return_writable_plant_capacities(year)
+        removed_plant_ids = set()
+        updated_regions = {}
+        for plant_name in plant_names:
+            updated_regions[self.plant_regions[plant_name]] = None
+            self.subtract_plant_total(plant_name)
+            del self.plant_regions[plant_name]
+            del self.plant_capacity_values[plant_name]
+            plant_id = self.solver_ids.plants.get_id(plant_name)
+            plant_capacities[plant_id] = np.nan
+            removed_plant_ids.add(plant_id)
+        if removed_plant_ids:
+            self.plant_orders[year] = [
+                plant_id
+                for plant_id in self.plant_orders[year]
+                if plant_id not in removed_plant_ids
+            ]
+        self.update_regional_snapshot(year, updated_regions)
+
+    def sync_capacities(self, plant_df: pd.DataFrame, year: int) -> bool:
+        """Adds and removes plants so that the running totals match the plants in `plant_df`. The running totals are rebuilt if the region or capacity of a plant that is already in the running totals has changed.
+
+        Args:
+            plant_df (pd.DataFrame): The active plants.
+            year (int): The year to update.
+
+        Returns:
+            bool: True if the running totals had not drifted from the plant DataFrame.
+        """
+        plant_names = set(plant_df["plant_name"])
+        self.remove_plants(
+            year,
+            [
+                plant_name
+                for plant_name in self.plant_regions
+                if plant_name not in plant_names
+            ],
+        )
+        existing_plants = plant_df["plant_name"].isin(self.plant_regions)
+        existing_plants_df = plant_df[existing_plants]
+        if not (
+            existing_plants_df["plant_name"]
+            .map(self.plant_regions)
+            .eq(existing_plants_df[MAIN_REGIONAL_SCHEMA])
+            .all()
+            and existing_plants_df["plant_name"]
+            .map(self.plant_capacity_values)
+            .eq(existing_plants_df["plant_capacity"])
+            .all()
+        ):
+            logger.warning(
+                "Capacity running totals for %s do not match the active plants. Rebuilding the capacities.",
+                year,
+            )
+            self.map_capacities(plant_df, year)
+            return False
+        new_plants_df = plant_df[~existing_plants]
+        self.add_plants(
+            year,
+            new_plants_df["plant_name"],
+            new_plants_df[MAIN_REGIONAL_SCHEMA],
+            new_plants_df["plant_capacity"],
+        )
+        return True
+
     def map_capacities(self, plant_df: pd.DataFrame, year: int) -> None:
-        # Map capacities of plants that are still active for aggregates, else use averages
+        # Rebuild the running totals from the plants that are active
+        self.plant_regions = {}
+        self.plant_capacity_values = {}
+        self.regional_totals = {}
+        self.regional_plant_counts = {}
+        self.plant_capacity_arrays[year] = np.zeros(0)
+        self.plant_orders[year] = []
+        self.regional_capacities_agg[year] = {}
+        self.copied_years.add(year)
+        self.add_plants(
+            year,
+            plant_df["plant_name"],
+            plant_df[MAIN_REGIONAL_SCHEMA],
+            plant_df["plant_capacity"],
+        )
+
+    def check_capacities(self, plant_df: pd.DataFrame, year: int) -> bool:
+        """Checks the running totals of a year against the capacities of the plants in `plant_df`. The running totals are rebuilt if they do not match.
+
+        Args:
+            plant_df (pd.DataFrame): The active plants.
+            year (int): The year to check.
+
+        Returns:
+            bool: True if the running totals matched the plant DataFrame.
+        """
         plant_capacity_dict, regional_capacity_dict = create_annual_capacity_dict(
             plant_df, as_mt=True
         )
-        self.plant_capacities[year] = plant_capacity_dict
-        self.regional_capacities_agg[year] = regional_capacity_dict
+        if (plant_capacity_dict == dict(self.return_plant_capacity(year))) and (
+            regional_capacity_dict == self.regional_capacities_agg[year]
+        ):
+            return True
+        logger.warning(
+            "Capacity running totals for %s do not match the active plants. Rebuilding the capacities.",
+            year,
+        )
+        self.map_capacities(plant_df, year)
+        return False
 
     def set_average_plant_capacity(self, original_plant_df: pd.DataFrame) -> None:
         self.average_plant_capacity = create_average_plant_capacity(
@@ -67,32 +292,57 @@ class CapacityContainerClass:
     def get_world_capacity_sum(self, year: int) -> float:
         return sum(list(self.regional_capacities_agg[year].values()))
 
+    def return_plant_capacity_value(self, year: int, plant_id: int) -> float:
+        plant_capacities = self.plant_capacity_arrays[year]
+        if plant_capacities is None or plant_id >= len(plant_capacities):
+            return np.nan
+        return float(plant_capacities[plant_id])
+
+    def return_plant_capacity_view(self, year: int) -> InternedMappingView:
+        plant_capacities = self.plant_capacity_arrays[year]
+
+        def getter(plant_id: int) -> float:
+            if plant_id >= len(plant_capacities) or np.isnan(
+                plant_capacities[plant_id]
+            ):
+                raise KeyError(self.solver_ids.plants.get_name(plant_id))
+            return float(plant_capacities[plant_id])
+
+        return InternedMappingView(
+            self.solver_ids.plants, self.plant_orders[year], getter
+        )
+
     def return_plant_capacity(self, year: int = None, plant: str = None):
         if plant and not year:
             # return a year valye time series for a region
             return {
-                year_val: (
-                    self.plant_capacities[year_val][plant]
-                    if plant in self.plant_capacities[year_val]
-                    else 0
-                )
-                for year_val in self.plant_capacities
+                year_val: self.return_plant_capacity(year_val, plant)
+                for year_val in self.plant_capacity_arrays
             }
 
         if year and not plant:
             # return all plants for single year
-            return self.plant_capacities[year]
+            return self.return_plant_capacity_view(year)
 
         if year and plant:
             # return single value
-            return (
-                self.plant_capacities[year][plant]
-                if plant in self.plant_capacities[year]
-                else 0
+            plant_id = self.solver_ids.plants.ids.get(plant)
+            value = (
+                np.nan
+                if plant_id is None
+                else self.return_plant_capacity_value(year, plant_id)
             )
+            return 0 if np.isnan(value) else value
 
         # return all years and regions
-        return self.plant_capacities
+        return {
+            year_val: (
+                dict(self.return_plant_capacity_view(year_val))
+                if self.plant_capacity_arrays[year_val] is not None
+                else 0
+            )
+            for year_val in self.plant_capacity_arrays
+        }
 
 
 def create_regional_capacity_dict(
@@ -159,25 +409,13 @@ def create_annual_capacity_dict(
     Returns:
         Tuple[dict, dict]: A tuple of the two capacity dictionary references.
     """
-    regions = plant_df[MAIN_REGIONAL_SCHEMA].unique()
     plant_capacity_dict = dict(zip(plant_df["plant_name"], plant_df["plant_capacity"]))
-    regional_capacity_dict_list = {
-        region: [
-            plant_capacity_dict[plant_name]
-            for plant_name in set(plant_capacity_dict.keys()).intersection(
-                set(
-                    plant_df[plant_df[MAIN_REGIONAL_SCHEMA] == region][
-                        "plant_name"
-                    ].unique()
-                )
-            )
-        ]
-        for region in regions
-    }
-    regional_capacity_dict = {
-        region: sum(value_list)
-        for region, value_list in regional_capacity_dict_list.items()
-    }
+    unique_plant_df = plant_df.drop_duplicates(subset="plant_name", keep="last")
+    regional_capacity_dict = (
+        unique_plant_df.groupby(MAIN_REGIONAL_SCHEMA, sort=False)["plant_capacity"]
+        .agg(math.fsum)
+        .to_dict()
+    )
     if as_mt:
         plant_capacity_dict = {
             plant_name: value / MEGATON_TO_KILOTON_FACTOR
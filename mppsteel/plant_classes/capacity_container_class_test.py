@@ -0,0 +1,71 @@
+import pandas as pd
+
+from mppsteel.plant_classes.capacity_container_class import (
+    CapacityContainerClass,
+    create_annual_capacity_dict,
+)
+
+PLANT_DF = pd.DataFrame(
+    {
+        "plant_name": ["plant_a", "plant_b", "plant_c", "plant_d"],
+        "rmi_region": ["Europe", "India", "Europe", "India"],
+        "plant_capacity": [1000.1, 2000.2, 1500.3, 700.7],
+    }
+)
+
+
+def test_running_totals_match_rebuild():
+    capacity_container = CapacityContainerClass()
+    capacity_container.instantiate_container(range(2020, 2022))
+    capacity_container.start_year(2020)
+    capacity_container.sync_capacities(PLANT_DF.iloc[:3], 2020)
+    capacity_container.start_year(2021)
+    assert (
+        capacity_container.plant_capacity_arrays[2021]
+        is capacity_container.plant_capacity_arrays[2020]
+    )
+    capacity_container.add_plants(2021, ["plant_d"], ["India"], [700.7])
+    capacity_container.remove_plants(2021, ["plant_b"])
+
+    plant_df_2021 = PLANT_DF.iloc[[0, 2, 3]]
+    assert capacity_container.check_capacities(plant_df_2021, 2021)
+    assert (
+        capacity_container.return_plant_capacity(2020),
+        capacity_container.return_regional_capacity(2020),
+    ) == create_annual_capacity_dict(PLANT_DF.iloc[:3], as_mt=True)
+    # exact totals: removing plant_b leaves exactly the capacity of plant_d
+    assert capacity_container.return_regional_capacity(2021, "India") == 700.7 / 1000
+
+
+def test_sync_capacities_rebuilds_drifted_totals():
+    capacity_container = CapacityContainerClass()
+    capacity_container.instantiate_container(range(2020, 2022))
+    capacity_container.start_year(2020)
+    assert capacity_container.sync_capacities(PLANT_DF.iloc[:3], 2020)
+    capacity_container.start_year(2021)
+    plant_df_2021 = PLANT_DF.copy()
+    plant_df_2021.loc[0, "plant_capacity"] = 1200.1
+    assert not capacity_container.sync_capacities(plant_df_2021, 2021)
+    assert capacity_container.check_capacities(plant_df_2021, 2021)
+    assert capacity_container.return_regional_capacity(2021, "Europe") == (
+        1200.1 + 1500.3
+    ) / 1000
+
+
+def test_regional_snapshot_updates_only_the_changed_regions():
+    capacity_container = CapacityContainerClass()
+    capacity_container.instantiate_container(range(2020, 2022))
+    capacity_container.start_year(2020)
+    capacity_container.sync_capacities(PLANT_DF.iloc[:2], 2020)
+    capacity_container.start_year(2021)
+    capacity_container.remove_plants(2021, ["plant_a"])
+    capacity_container.add_plants(2021, ["plant_c"], ["Europe"], [1500.3])
+    assert list(capacity_container.return_regional_capacity(2021)) == [
+        "India",
+        "Europe",
+    ]
+    assert capacity_container.return_regional_capacity(2021, "Europe") == 1.5003
+    assert capacity_container.return_regional_capacity(2020) == {
+        "Europe": 1.0001,
+        "India": 2.0002,
+    }
@@ -0,0 +1,145 @@
+"""Classes to map plant and technology names to dense integer ids"""
+
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Sequence
+
+import numpy as np
+
+from mppsteel.config.reference_lists import TECH_REFERENCE_LIST
+from mppsteel.utility.log_utility import get_logger
+
+logger = get_logger(__name__)
+
+NO_ID = -1
+
+
+class IdInterner:
+    """Description
+    Class that maps names (e.g. plant names or technologies) to dense integer ids, so that state can be stored in NumPy arrays indexed by those ids.
+
+    Important Points
+    1) Ids are assigned in the order the names are first interned and never change.
+    2) Names are only translated back from ids at output time.
+
+    Main Class Attributes
+        ids: A dictionary of name: id.
+        names: A list of the names, where the position of each name is its id.
+    """
+
+    def __init__(self, names: Iterable[Hashable] = ()):
+        self.ids: Dict[Hashable, int] = {}
+        self.names: List[Hashable] = []
+        for name in names:
+            self.intern(name)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name: Hashable) -> bool:
+        return name in self.ids
+
+    def intern(self, name: Hashable) -> int:
+        name_id = self.ids.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            self.ids[name] = name_id
+            self.names.append(name)
+        return name_id
+
+    def intern_many(self, names: Iterable[Hashable]) -> np.ndarray:
+        return np.array([self.intern(name) for name in names], dtype=np.int64)
+
+    def get_id(self, name: Hashable) -> int:
+        return self.ids[name]
+
+    def get_ids(self, names: Iterable[Hashable]) -> np.ndarray:
+        return np.array([self.ids[name] for name in names], dtype=np.int64)
+
+    def get_name(self, name_id: int) -> Hashable:
+        return self.names[name_id]
+
+    def get_names(self, name_ids: Sequence[int]) -> list:
+        return [self.names[name_id] for name_id in name_ids]
+
+
+class SolverIds:
+    """Description
+    The interning layer shared by the solver containers.
+
+    Important Points
+    1) The technology ids start with the technologies of `TECH_REFERENCE_LIST`, in the same order. Other values (e.g. `Close plant`) are added as they are first used.
+    2) Containers that are created without a SolverIds instance create their own.
+
+    Main Class Attributes
+        plants: The IdInterner of the plant names.
+        technologies: The IdInterner of the technologies.
+    """
+
+    def __init__(
+        self,
+        plant_names: Iterable[str] = (),
+        technologies: Iterable[str] = TECH_REFERENCE_LIST,
+    ):
+        self.plants = IdInterner(plant_names)
+        self.technologies = IdInterner(technologies)
+
+    def __repr__(self):
+        return "Solver Ids"
+
+    def __str__(self):
+        return f"Solver Ids: {len(self.plants)} plants | {len(self.technologies)} technologies"
+
+
+class InternedMappingView(Mapping):
+    """Description
+    Read-only dictionary view of values stored by id, so that containers can keep the dictionary getters of their previous versions.
+
+    Important Points
+    1) The keys are the names of the ids in `order`, in that order.
+    2) `getter` returns the value of an id and raises a KeyError if the id has no value.
+    """
+
+    def __init__(
+        self, interner: IdInterner, order: List[int], getter: Callable[[int], Any]
+    ):
+        self.interner = interner
+        self.order = order
+        self.getter = getter
+
+    def __getitem__(self, name: Hashable):
+        return self.getter(self.interner.ids[name])
+
+    def __iter__(self):
+        return iter(self.interner.get_names(self.order))
+
+    def __len__(self):
+        return len(self.order)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def grow_id_array(
+    id_array: np.ndarray, required_length: int, fill_value: Any
+) -> np.ndarray:
+    """Grows the last axis of an array indexed by ids by doubling its size until it holds `required_length` ids.
+
+    Args:
+        id_array (np.ndarray): The array indexed by ids on its last axis.
+        required_length (int): The number of ids that the array needs to hold.
+        fill_value (Any): The value of the new entries.
+
+    Returns:
+        np.ndarray: The grown array (or `id_array` if it is already large enough).
+    """
+    current_length = id_array.shape[-1]
+    if required_length <= current_length:
+        return id_array
+    new_length = max(current_length, 1)
+    while new_length < required_length:
+        new_length *= 2
+    new_array = np.full(
+        id_array.shape[:-1] + (new_length,), fill_value, dtype=id_array.dtype
+    )
+    new_array[..., :current_length] = id_array
+    return new_array
@@ -0,0 +1,19 @@
+from mppsteel.plant_classes.id_interner_class import NO_ID, SolverIds
+from mppsteel.plant_classes.plant_choices_class import PlantChoices
+
+
+def test_plant_choices_are_stored_by_id():
+    solver_ids = SolverIds(["plant_a", "plant_b"])
+    plant_choices = PlantChoices(solver_ids=solver_ids)
+    plant_choices.initiate_container(range(2020, 2022))
+    plant_choices.update_choice(2020, "plant_b", "EAF")
+    plant_choices.update_choice(2020, "plant_c", "Close plant")
+    plant_choices.update_choice(2021, "plant_a", "DRI-EAF")
+    assert solver_ids.plants.get_id("plant_c") == 2
+    assert plant_choices.get_choice(2020, "plant_b") == "EAF"
+    assert plant_choices.choice_array[0, solver_ids.plants.get_id("plant_a")] == NO_ID
+    assert list(plant_choices.return_choices(2020)) == ["plant_b", "plant_c"]
+    assert plant_choices.output_choices_to_dict() == {
+        2020: {"plant_b": "EAF", "plant_c": "Close plant"},
+        2021: {"plant_a": "DRI-EAF"},
+    }
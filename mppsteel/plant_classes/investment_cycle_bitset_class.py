@@ -0,0 +1,222 @@
+"""Class to store the investment cycles of plants as bitmasks over the model years"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from mppsteel.config.model_config import MODEL_YEAR_RANGE
+from mppsteel.config.mypy_config_settings import MYPY_NUMERICAL_AND_RANGE
+from mppsteel.utility.log_utility import get_logger
+
+logger = get_logger(__name__)
+
+SWITCH_TYPES = ["no switch", "main cycle", "trans switch"]
+NO_SWITCH, MAIN_CYCLE, TRANS_SWITCH = range(len(SWITCH_TYPES))
+
+
+class InvestmentCycleBitsets:
+    """Description
+    Class to store each plant's investment cycle as three uint64 bitmasks, where bit `n` represents the year `year_range[n]`.
+    Queries such as "all plants switching in a year" or "the switch type of every plant in every year" are vectorized bit operations over the plants.
+
+    Important Points
+    1) The main cycle mask has a bit for every main investment year.
+    2) The off-cycle mask has a bit for every year inside a transitional switch window.
+    3) The window mask has a bit for the start year of every transitional switch window (including empty windows), so that adjacent and empty windows can be converted back to the list format.
+    4) The year range can be at most 64 years long. Years outside the range are not stored.
+    5) Main cycle years take precedence over transitional switch windows in the switch type queries, as in `return_switch_type`.
+
+    Main Class Attributes
+        plant_positions: A dictionary of plant_name: position in the mask arrays.
+        main_masks / off_cycle_masks / window_masks: uint64 arrays with one mask per plant.
+    """
+
+    def __init__(
+        self, year_range: range = MODEL_YEAR_RANGE, initial_capacity: int = 1024
+    ):
+        if len(year_range) > 64:
+            raise ValueError(
+                f"The year range {year_range} is longer than 64 years and can not be stored in a uint64 bitmask."
+            )
+        self.year_range = year_range
+        self.capacity = initial_capacity
+        self.plant_names: List[str] = []
+        self.plant_positions: Dict[str, int] = {}
+        self.main_masks = np.zeros(initial_capacity, dtype=np.uint64)
+        self.off_cycle_masks = np.zeros(initial_capacity, dtype=np.uint64)
+        self.window_masks = np.zeros(initial_capacity, dtype=np.uint64)
+
+    def __len__(self):
+        return len(self.plant_names)
+
+    def grow(self, required_length: int):
+        new_capacity = self.capacity
+        while new_capacity < required_length:
+            new_capacity *= 2
+        for attribute in ["main_masks", "off_cycle_masks", "window_masks"]:
+            new_masks = np.zeros(new_capacity, dtype=np.uint64)
+            new_masks[: len(self)] = getattr(self, attribute)[: len(self)]
+            setattr(self, attribute, new_masks)
+        self.capacity = new_capacity
+
+    def year_bit(self, year: int) -> int:
+        return 1 << (year - self.year_range[0]) if year in self.year_range else 0
+
+    def encode_cycle(
+        self, investment_cycle: MYPY_NUMERICAL_AND_RANGE
+    ) -> Tuple[int, int, int]:
+        """Encodes an investment cycle list of main cycle years (int) and transitional switch windows (range) as bitmasks.
+
+        Args:
+            investment_cycle (MYPY_NUMERICAL_AND_RANGE): The investment cycle of a plant.
+
+        Returns:
+            Tuple[int, int, int]: The main cycle, off-cycle and window masks.
+        """
+        main_mask, off_cycle_mask, window_mask = 0, 0, 0
+        for cycle_obj in investment_cycle:
+            if isinstance(cycle_obj, int):
+                main_mask |= self.year_bit(cycle_obj)
+            elif isinstance(cycle_obj, range):
+                window_mask |= self.year_bit(cycle_obj.start)
+                for year in cycle_obj:
+                    off_cycle_mask |= self.year_bit(year)
+        return main_mask, off_cycle_mask, window_mask
+
+    def set_cycle(self, plant_name: str, investment_cycle: MYPY_NUMERICAL_AND_RANGE):
+        if plant_name not in self.plant_positions:
+            if len(self) == self.capacity:
+                self.grow(len(self) + 1)
+            self.plant_positions[plant_name] = len(self)
+            self.plant_names.append(plant_name)
+        position = self.plant_positions[plant_name]
+        (
+            self.main_masks[position],
+            self.off_cycle_masks[position],
+            self.window_masks[position],
+        ) = self.encode_cycle(investment_cycle)
+
+    def return_switch_type_codes(
+        self, plant_names: Sequence[str], year: int
+    ) -> np.ndarray:
+        """Returns the switch type code (NO_SWITCH, MAIN_CYCLE or TRANS_SWITCH) of a list of plants in a year.
+
+        Args:
+            plant_names (Sequence[str]): The plants to return the switch types for.
+            year (int): The year to return the switch types for.
+
+        Returns:
+            np.ndarray: An array of switch type codes, one per plant in `plant_names`.
+        """
+        if year not in self.year_range:
+            return np.full(len(plant_names), NO_SWITCH)
+        positions = np.array(
+            [self.plant_positions[plant_name] for plant_name in plant_names],
+            dtype=np.int64,
+        )
+        shift = np.uint64(year - self.year_range[0])
+        main_cycle = (self.main_masks[positions] >> shift) & np.uint64(1)
+        off_cycle = (self.off_cycle_masks[positions] >> shift) & np.uint64(1)
+        return np.where(
+            main_cycle == 1,
+            MAIN_CYCLE,
+            np.where(off_cycle == 1, TRANS_SWITCH, NO_SWITCH),
+        )
+
+    def return_switch_type(self, plant_name: str, year: int) -> str:
+        return SWITCH_TYPES[self.return_switch_type_codes([plant_name], year)[0]]
+
+    def return_plant_switchers(
+        self, plant_names: Sequence[str], year: int, value_type: str
+    ) -> list:
+        """Returns the plants of `plant_names` with a given switch type in a year, in the order of `plant_names`.
+
+        Args:
+            plant_names (Sequence[str]): The plants to check.
+            year (int): The year to check.
+            value_type (str): `main cycle`, `trans switch`, `no switch` or `combined` (main cycle switchers followed by transitional switchers).
+
+        Returns:
+            list: The names of the plants with the switch type.
+        """
+        plant_names = np.asarray(plant_names, dtype=object)
+        switch_types = self.return_switch_type_codes(plant_names, year)
+        if value_type == "combined":
+            return list(plant_names[switch_types == MAIN_CYCLE]) + list(
+                plant_names[switch_types == TRANS_SWITCH]
+            )
+        return list(plant_names[switch_types == SWITCH_TYPES.index(value_type)])
+
+    def return_switch_type_matrix(self) -> np.ndarray:
+        """Returns the switch type code of every plant in every year in the form [plant][year]."""
+        shifts = np.arange(len(self.year_range), dtype=np.uint64)
+        main_masks = self.main_masks[: len(self), np.newaxis]
+        off_cycle_masks = self.off_cycle_masks[: len(self), np.newaxis]
+        main_cycle = (main_masks >> shifts) & np.uint64(1)
+        off_cycle = (off_cycle_masks >> shifts) & np.uint64(1)
+        return np.where(
+            main_cycle == 1,
+            MAIN_CYCLE,
+            np.where(off_cycle == 1, TRANS_SWITCH, NO_SWITCH),
+        )
+
+    def create_investment_df(self) -> pd.DataFrame:
+        """Vectorized version of `create_investment_cycle_reference`.
+
+        Returns:
+            pd.DataFrame: A DataFrame with the switch type of every plant in every year, indexed by year and plant_name.
+        """
+        if not self.plant_names:
+            return pd.DataFrame(columns=["year", "plant_name"]).set_index(
+                ["year", "plant_name"]
+            )
+        number_of_years = len(self.year_range)
+        switch_type_names = np.array(SWITCH_TYPES, dtype=object)
+        return pd.DataFrame(
+            {
+                "plant_name": np.repeat(
+                    np.array(self.plant_names, dtype=object), number_of_years
+                ),
+                "year": np.tile(np.array(self.year_range, dtype=np.int64), len(self)),
+                "switch_type": switch_type_names[
+                    self.return_switch_type_matrix().ravel()
+                ],
+            }
+        ).set_index(["year", "plant_name"])
+
+    def decode_cycle(self, plant_name: str) -> MYPY_NUMERICAL_AND_RANGE:
+        """Converts a plant's bitmasks back to the investment cycle list format (main cycle years as integers, transitional switch windows as ranges).
+
+        Args:
+            plant_name (str): The name of the plant.
+
+        Returns:
+            MYPY_NUMERICAL_AND_RANGE: The investment cycle.
+        """
+        position = self.plant_positions[plant_name]
+        main_mask = int(self.main_masks[position])
+        off_cycle_mask = int(self.off_cycle_masks[position])
+        window_mask = int(self.window_masks[position])
+        investment_cycle: MYPY_NUMERICAL_AND_RANGE = []
+        for offset, year in enumerate(self.year_range):
+            if (window_mask >> offset) & 1:
+                end_offset = offset
+                if (off_cycle_mask >> offset) & 1:
+                    end_offset += 1
+                    while (
+                        (end_offset < len(self.year_range))
+                        and ((off_cycle_mask >> end_offset) & 1)
+                        and not ((window_mask >> end_offset) & 1)
+                    ):
+                        end_offset += 1
+                investment_cycle.append(range(year, year + end_offset - offset))
+            if (main_mask >> offset) & 1:
+                investment_cycle.append(year)
+        return investment_cycle
+
+    def to_investment_cycles(self) -> Dict[str, MYPY_NUMERICAL_AND_RANGE]:
+        return {
+            plant_name: self.decode_cycle(plant_name)
+            for plant_name in self.plant_names
+        }
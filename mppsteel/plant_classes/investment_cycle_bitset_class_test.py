@@ -0,0 +1,20 @@
+from mppsteel.plant_classes.investment_cycle_bitset_class import (
+    InvestmentCycleBitsets,
+)
+
+INVESTMENT_CYCLES = {
+    "plant_a": [range(2020, 2022), 2027, range(2030, 2035), range(2035, 2039), 2047],
+    "plant_b": [range(2021, 2021), 2024, range(2036, 2035), 2044],
+    "plant_c": [range(2041, 2051)],
+}
+
+
+def test_bitsets_convert_back_to_investment_cycles():
+    cycle_bitsets = InvestmentCycleBitsets(initial_capacity=1)
+    for plant_name, investment_cycle in INVESTMENT_CYCLES.items():
+        cycle_bitsets.set_cycle(plant_name, investment_cycle)
+    assert cycle_bitsets.to_investment_cycles() == INVESTMENT_CYCLES
+    assert cycle_bitsets.return_plant_switchers(
+        ["plant_c", "plant_b", "plant_a"], 2047, "combined"
+    ) == ["plant_a", "plant_c"]
+    assert cycle_bitsets.return_switch_type("plant_b", 2035) == "no switch"
@@ -0,0 +1,176 @@
+"""Class to select the oldest plants of a region for closure"""
+
+import bisect
+import heapq
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from mppsteel.utility.log_utility import get_logger
+from mppsteel.utility.random_utility import RandomStreams, random_choice
+
+logger = get_logger(__name__)
+
+
+class PlantAgeQueue:
+    """Description
+    Class that keeps a min-heap of plant age years for each region, so that the oldest plant of a region can be popped in O(log n) when plants are closed.
+    A plant's age year is the year that its age is counted from (the current year minus its age), so the queue is kept on the solver state across the model years.
+
+    Important Points
+    1) Plants with the same age year are kept in an age bucket in the order that they were first added to the queue. The heap holds each age year once.
+    2) If several plants share the oldest age year, one of them is chosen at random over the bucket, which gives the same choice as a random choice over the oldest plants of the region (in the order they were added) for the same random stream (or the same state of the global `random` module if no random streams are passed).
+    3) Empty buckets are removed from the heap lazily when the heap is popped.
+    4) `pop_plants_to_close` stops when the region runs out of plants, even if the capacity to close has not been reached.
+    5) The age year of a plant only changes when it has an investment or switch event. `schedule_refresh` stores the next year that a plant's age year has to be checked in, and `update_plant` moves the plant if its age year has changed.
+
+    Main Class Attributes
+        age_heaps: A dictionary of region: heap of plant age years.
+        age_buckets: A dictionary of region: age year: (sequence number, plant name) tuples.
+        plant_locations: A dictionary of plant_name: (region, age year, sequence number).
+        region_sizes: A dictionary of region: number of plants in the queue.
+        next_sequence: The sequence number of the next plant that is added to the queue.
+        refresh_years: A dictionary of year: plant names whose age years have to be checked in the year.
+        refresh_heap: A heap of the years in `refresh_years`.
+        cycle_updates_seen: The number of investment cycle updates (see `PlantInvestmentCycle.return_cycle_updates`) that the age years are up to date with.
+    """
+
+    def __init__(self):
+        self.age_heaps: Dict[str, List[int]] = {}
+        self.age_buckets: Dict[str, Dict[int, List[Tuple[int, str]]]] = {}
+        self.plant_locations: Dict[str, tuple] = {}
+        self.region_sizes: Dict[str, int] = {}
+        self.next_sequence = 0
+        self.refresh_years: Dict[int, List[str]] = {}
+        self.refresh_heap: List[int] = []
+        self.cycle_updates_seen = 0
+
+    def __len__(self):
+        return len(self.plant_locations)
+
+    def __contains__(self, plant_name: str):
+        return plant_name in self.plant_locations
+
+    def add_to_bucket(self, region: str, age_year: int, entry: Tuple[int, str]) -> None:
+        buckets = self.age_buckets.setdefault(region, {})
+        if age_year not in buckets:
+            buckets[age_year] = []
+            heapq.heappush(self.age_heaps.setdefault(region, []), age_year)
+        bisect.insort(buckets[age_year], entry)
+
+    def add_plants(
+        self, region: str, plant_names: Sequence[str], age_years: Sequence[int]
+    ) -> None:
+        for plant_name, age_year in zip(plant_names, age_years):
+            self.add_to_bucket(region, age_year, (self.next_sequence, plant_name))
+            self.plant_locations[plant_name] = (region, age_year, self.next_sequence)
+            self.region_sizes[region] = self.region_sizes.get(region, 0) + 1
+            self.next_sequence += 1
+
+    def update_plant(self, plant_name: str, age_year: int) -> None:
+        region, previous_age_year, sequence = self.plant_locations[plant_name]
+        if age_year == previous_age_year:
+            return
+        self.age_buckets[region][previous_age_year].remove((sequence, plant_name))
+        self.add_to_bucket(region, age_year, (sequence, plant_name))
+        self.plant_locations[plant_name] = (region, age_year, sequence)
+
+    def remove_plant(self, plant_name: str) -> None:
+        region, age_year, sequence = self.plant_locations.pop(plant_name)
+        self.age_buckets[region][age_year].remove((sequence, plant_name))
+        self.region_sizes[region] -= 1
+
+    def schedule_refresh(self, plant_name: str, year: int) -> None:
+        if year not in self.refresh_years:
+            self.refresh_years[year] = []
+            heapq.heappush(self.refresh_heap, year)
+        self.refresh_years[year].append(plant_name)
+
+    def pop_plants_to_refresh(self, year: int) -> List[str]:
+        """Removes and returns the plants in the queue that have been scheduled to be refreshed in or before `year`.
+
+        Args:
+            year (int): The current model year.
+
+        Returns:
+            List[str]: The names of the plants to refresh.
+        """
+        plants_to_refresh = []
+        while self.refresh_heap and self.refresh_heap[0] <= year:
+            plants_to_refresh.extend(
+                self.refresh_years.pop(heapq.heappop(self.refresh_heap))
+            )
+        return [
+            plant_name
+            for plant_name in dict.fromkeys(plants_to_refresh)
+            if plant_name in self
+        ]
+
+    def return_region_size(self, region: str) -> int:
+        return self.region_sizes.get(region, 0)
+
+    def pop_oldest_plant(
+        self,
+        region: str,
+        random_streams: Union[RandomStreams, None] = None,
+        stream_key: tuple = (),
+    ) -> str:
+        """Removes and returns the oldest plant of a region. Ties are broken at random.
+
+        Args:
+            region (str): The region to pop a plant from.
+            random_streams (Union[RandomStreams, None], optional): The random streams to break ties with. The global `random` module is used if None. Defaults to None.
+            stream_key (tuple, optional): The keys of the stream within `random_streams`. Defaults to ().
+
+        Raises:
+            IndexError: If there are no plants left in the region.
+
+        Returns:
+            str: The name of the oldest plant.
+        """
+        heap = self.age_heaps.get(region, [])
+        buckets = self.age_buckets.get(region, {})
+        while heap and not buckets[heap[0]]:
+            del buckets[heapq.heappop(heap)]
+        if not heap:
+            raise IndexError(f"There are no plants left to close in {region}")
+        _, plant_name = random_choice(buckets[heap[0]], random_streams, stream_key)
+        self.remove_plant(plant_name)
+        return plant_name
+
+    def pop_plants_to_close(
+        self,
+        region: str,
+        min_capacity_to_close: float,
+        capacity_getter: Callable[[str], float],
+        random_streams: Union[RandomStreams, None] = None,
+        stream_key: tuple = (),
+    ) -> Tuple[List[str], float]:
+        """Pops the oldest plants of a region until more than `min_capacity_to_close` has been removed, or until there are no plants left in the region.
+
+        Args:
+            region (str): The region to pop plants from.
+            min_capacity_to_close (float): The capacity that has to be exceeded by the plants that are popped.
+            capacity_getter (Callable[[str], float]): Returns the capacity of a plant.
+            random_streams (Union[RandomStreams, None], optional): The random streams to break ties with. The global `random` module is used if None. Defaults to None.
+            stream_key (tuple, optional): The keys of the stream within `random_streams`. The number of plants already popped is added to the keys for each plant. Defaults to ().
+
+        Returns:
+            Tuple[List[str], float]: The names of the popped plants and their total capacity.
+        """
+        plants_to_close = []
+        capacity_removed = 0
+        while (capacity_removed <= min_capacity_to_close) and self.return_region_size(
+            region
+        ):
+            plant_name = self.pop_oldest_plant(
+                region, random_streams, stream_key + (len(plants_to_close),)
+            )
+            capacity_removed += capacity_getter(plant_name)
+            plants_to_close.append(plant_name)
+        if capacity_removed <= min_capacity_to_close:
+            logger.warning(
+                "All plants in %s have been closed. Capacity closed: %0.2f | Capacity to close: %0.2f",
+                region,
+                capacity_removed,
+                min_capacity_to_close,
+            )
+        return plants_to_close, capacity_removed
@@ -0,0 +1,104 @@
+import random
+
+from mppsteel.model_solver.plant_open_close_helpers import current_plant_year
+from mppsteel.plant_classes.plant_age_queue_class import PlantAgeQueue
+from mppsteel.utility.utils import get_dict_keys_by_value
+
+PLANT_NAMES = [f"plant_{idx}" for idx in range(12)]
+INVESTMENT_DICT = {
+    plant_name: [2020 + (idx % 4), range(2030, 2033)]
+    for idx, plant_name in enumerate(PLANT_NAMES)
+}
+PLANT_START_YEARS = {plant_name: 2000 for plant_name in PLANT_NAMES}
+PLANT_CYCLE_LENGTHS = {plant_name: 20 for plant_name in PLANT_NAMES}
+
+
+def return_oldest_plant(plant_list: list, current_year: int) -> str:
+    # the selection that the queue replaced: a random choice over the oldest plants
+    plant_age_dict = {
+        plant_name: current_plant_year(
+            INVESTMENT_DICT,
+            {},
+            PLANT_START_YEARS,
+            PLANT_CYCLE_LENGTHS,
+            plant_name,
+            current_year,
+        )
+        for plant_name in plant_list
+    }
+    return random.choice(
+        get_dict_keys_by_value(plant_age_dict, max(plant_age_dict.values()))
+    )
+
+
+def test_queue_pops_plants_in_the_same_order_as_return_oldest_plant():
+    random.seed(7)
+    plant_list = list(PLANT_NAMES)
+    expected = []
+    while plant_list:
+        plant_name = return_oldest_plant(plant_list, 2025)
+        plant_list.remove(plant_name)
+        expected.append(plant_name)
+
+    random.seed(7)
+    plant_age_queue = PlantAgeQueue()
+    plant_age_queue.add_plants(
+        "Europe",
+        PLANT_NAMES,
+        [INVESTMENT_DICT[plant_name][0] for plant_name in PLANT_NAMES],
+    )
+    assert [
+        plant_age_queue.pop_oldest_plant("Europe") for _ in PLANT_NAMES
+    ] == expected
+    assert plant_age_queue.return_region_size("Europe") == 0
+
+
+def test_pop_plants_to_close_stops_when_the_region_is_drained():
+    plant_age_queue = PlantAgeQueue()
+    plant_age_queue.add_plants("Europe", PLANT_NAMES[:3], [1990, 2010, 2000])
+    plant_age_queue.add_plants("India", PLANT_NAMES[3:5], [2015, 2015])
+    plants_to_close, capacity_removed = plant_age_queue.pop_plants_to_close(
+        "Europe", 1.5, lambda plant_name: 1.0
+    )
+    assert plants_to_close == ["plant_0", "plant_2"]
+    assert capacity_removed == 2.0
+    plants_to_close, capacity_removed = plant_age_queue.pop_plants_to_close(
+        "Europe", 5.0, lambda plant_name: 1.0
+    )
+    assert plants_to_close == ["plant_1"]
+    assert capacity_removed == 1.0
+    assert plant_age_queue.return_region_size("Europe") == 0
+    assert plant_age_queue.pop_plants_to_close(
+        "Europe", 1.0, lambda plant_name: 1.0
+    ) == ([], 0)
+    assert plant_age_queue.return_region_size("India") == 2
+
+
+def test_updated_plants_keep_their_order_within_an_age_year():
+    plant_age_queue = PlantAgeQueue()
+    plant_age_queue.add_plants("Europe", PLANT_NAMES[:4], [2000, 2010, 2000, 2010])
+    plant_age_queue.update_plant("plant_0", 2010)
+    plant_age_queue.update_plant("plant_3", 2000)
+    plant_age_queue.update_plant("plant_1", 2020)
+    plant_age_queue.update_plant("plant_1", 2010)
+    assert plant_age_queue.age_buckets["Europe"] == {
+        2000: [(2, "plant_2"), (3, "plant_3")],
+        2010: [(0, "plant_0"), (1, "plant_1")],
+        2020: [],
+    }
+    assert plant_age_queue.pop_oldest_plant("Europe") in ["plant_2", "plant_3"]
+    assert plant_age_queue.return_region_size("Europe") == 3
+
+
+def test_refreshes_are_returned_once_for_the_plants_in_the_queue():
+    plant_age_queue = PlantAgeQueue()
+    plant_age_queue.add_plants("Europe", PLANT_NAMES[:3], [2000, 2000, 2000])
+    plant_age_queue.schedule_refresh("plant_0", 2025)
+    plant_age_queue.schedule_refresh("plant_1", 2023)
+    plant_age_queue.schedule_refresh("plant_0", 2024)
+    plant_age_queue.schedule_refresh("plant_2", 2030)
+    plant_age_queue.remove_plant("plant_1")
+    assert plant_age_queue.pop_plants_to_refresh(2022) == []
+    assert plant_age_queue.pop_plants_to_refresh(2025) == ["plant_0"]
+    assert plant_age_queue.pop_plants_to_refresh(2029) == []
+    assert plant_age_queue.pop_plants_to_refresh(2030) == ["plant_2"]
@@ -1,83 +1,182 @@
 """Class to manage plant choices"""
 
+from typing import Dict, List, Union
 
+import numpy as np
 import pandas as pd
 
+from mppsteel.plant_classes.id_interner_class import (
+    NO_ID,
+    InternedMappingView,
+    SolverIds,
+    grow_id_array,
+)
+from mppsteel.plant_classes.record_buffer_class import ColumnarRecordBuffer
 from mppsteel.utility.log_utility import get_logger
 
 logger = get_logger(__name__)
 
+CHOICE_RECORD_COLS = ["year", "plant_name", "current_tech", "switch_tech", "switch_type"]
+
+RANK_RECORD_INDEX_COLS = [
+    "year",
+    "region",
+    "plant_name",
+    "solver_logic",
+    "weighting",
+    "switch_type",
+    "scenario_name",
+    "start_tech",
+]
+
 
 class PlantChoices:
     """Description
     Class to manage the state of each plant's technology choices.
 
+    Important Points
+    1) Plants and technologies are stored as ids of the shared SolverIds instance. The names are only translated back in the getters and at output time.
+    2) `return_choices` returns read-only dictionary views of the choices, so the choices are never copied in the year loop.
+
     Main Class attributes
-        choices: Keeps track of each plants choice in every year. A dictionary in the form [year][plant_name] -> technology
+        choice_array: Keeps track of each plants choice in every year. An array of technology ids in the form [year, plant_id] -> technology id (NO_ID if the plant has no choice in the year).
+        year_orders: The plant ids of each year in the order that their choices were first made.
         choice_records: A list of DataFrames that record why certain technologies were chosen or not chosen. The list can be outputted to a combined DataFrame.
-        rank_records: A list of DataFrames that record the rankings of technologies prior to the selection. The list can be outputted to a combined DataFrame.
-        active_check: A dictionary that keeps track of whether a plant is active or not. A dictionary in the form [year][plant_name] -> boolean check
+        rank_records: A ColumnarRecordBuffer that records the rankings of technologies prior to the selection. The buffer can be outputted to a combined DataFrame.
+        record_choices / record_ranks: Flags that determine whether choice_records and rank_records are collected (set by the scenario's recording mode).
     """
 
-    def __init__(self):
-        self.choices = {}
+    def __init__(
+        self,
+        record_choices: bool = True,
+        record_ranks: bool = True,
+        solver_ids: SolverIds = None,
+    ):
+        self.record_choices = record_choices
+        self.record_ranks = record_ranks
+        self.solver_ids = solver_ids if solver_ids else SolverIds()
+        self.year_index: Dict[int, int] = {}
+        self.year_orders: Dict[int, List[int]] = {}
+        self.choice_array = np.full((0, 0), NO_ID, dtype=np.int32)
         self.choice_records = []
-        self.rank_records = []
-        self.active_check = {}
+        self.rank_records = ColumnarRecordBuffer()
 
     def initiate_container(self, year_range: range):
-        for year in year_range:
-            self.choices[year] = {}
-            self.active_check[year] = {}
+        self.year_index = {year: idx for idx, year in enumerate(year_range)}
+        self.year_orders = {year: [] for year in year_range}
+        self.choice_array = np.full(
+            (len(self.year_index), max(len(self.solver_ids.plants), 1)),
+            NO_ID,
+            dtype=np.int32,
+        )
 
     def update_choice(self, year: int, plant: str, tech: str):
-        self.choices[year][plant] = tech
-        if tech != "Close plant":
-            self.active_check[year][plant] = True
-        if tech == "Close plant":
-            self.active_check[year][plant] = False
+        year_idx = self.year_index[year]
+        plant_id = self.solver_ids.plants.intern(plant)
+        self.choice_array = grow_id_array(self.choice_array, plant_id + 1, NO_ID)
+        if self.choice_array[year_idx, plant_id] == NO_ID:
+            self.year_orders[year].append(plant_id)
+        self.choice_array[year_idx, plant_id] = self.solver_ids.technologies.intern(
+            tech
+        )
 
     def remove_choice(self, year: int, plant: str):
-        del self.choices[year][plant]
+        plant_id = self.return_plant_choice_id(year, plant)
+        self.choice_array[self.year_index[year], plant_id] = NO_ID
+        self.year_orders[year].remove(plant_id)
+
+    def return_plant_choice_id(self, year: int, plant: str) -> int:
+        plant_id = self.solver_ids.plants.get_id(plant)
+        if (plant_id >= self.choice_array.shape[1]) or (
+            self.choice_array[self.year_index[year], plant_id] == NO_ID
+        ):
+            raise KeyError(plant)
+        return plant_id
+
+    def return_choice_by_id(self, year: int, plant_id: int) -> str:
+        tech_id = (
+            self.choice_array[self.year_index[year], plant_id]
+            if plant_id < self.choice_array.shape[1]
+            else NO_ID
+        )
+        if tech_id == NO_ID:
+            raise KeyError(self.solver_ids.plants.get_name(plant_id))
+        return self.solver_ids.technologies.get_name(tech_id)
 
     def get_choice(self, year: int, plant: str):
-        return self.choices[year][plant]
+        return self.return_choice_by_id(year, self.solver_ids.plants.get_id(plant))
+
+    def return_year_view(self, year: int) -> InternedMappingView:
+        return InternedMappingView(
+            self.solver_ids.plants,
+            self.year_orders[year],
+            lambda plant_id: self.return_choice_by_id(year, plant_id),
+        )
 
     def return_choices(self, year: int = None):
-        return self.choices[year] if year else self.choices
+        if year:
+            return self.return_year_view(year)
+        return {year: self.return_year_view(year) for year in self.year_orders}
+
+    def return_active_check(self, year: int) -> dict:
+        return {
+            plant: tech != "Close plant"
+            for plant, tech in self.return_year_view(year).items()
+        }
+
+    def output_choices_to_dict(self) -> dict:
+        choices = {}
+        for year, plant_ids in self.year_orders.items():
+            tech_ids = self.choice_array[self.year_index[year], plant_ids]
+            choices[year] = dict(
+                zip(
+                    self.solver_ids.plants.get_names(plant_ids),
+                    self.solver_ids.technologies.get_names(tech_ids),
+                )
+            )
+        return choices
 
     def return_nans(self, year: int):
         return [
-            plant for plant in self.choices[year] if pd.isna(self.choices[year][plant])
+            plant
+            for plant, tech in self.return_year_view(year).items()
+            if pd.isna(tech)
         ]
 
-    def update_records(self, record_type: str, df_entry: pd.DataFrame):
+    def update_records(self, record_type: str, entry: Union[pd.DataFrame, dict]):
         if record_type == "choice":
-            self.choice_records.append(df_entry)
-        elif record_type == "rank":
-            self.rank_records.append(df_entry)
+            if self.record_choices:
+                self.choice_records.append(entry)
+        elif (record_type == "rank") and self.record_ranks:
+            # a dictionary of columns: one value (or sequence of values) per column
+            self.rank_records.append(entry)
 
     def output_records_to_df(self, record_type: str):
         if record_type == "choice":
+            if not self.choice_records:
+                return pd.DataFrame(columns=CHOICE_RECORD_COLS)
             df = pd.DataFrame(self.choice_records).reset_index(drop=True)
             return df.drop_duplicates(keep="last")
         elif record_type == "rank":
-            df = pd.DataFrame(self.rank_records).reset_index(drop=True)
-            df = df[~df.index.duplicated(keep="first")]
-            return combine_tech_ranks(df)
+            return combine_tech_ranks(self.rank_records.to_dataframe())
 
 
 def combine_tech_ranks(tr_df: pd.DataFrame) -> pd.DataFrame:
     """Formats a combined the tech ranks dataframe.
 
     Args:
-        tr_df (pd.DataFrame): The unformatted Technology Ranks DataFrame.
+        tr_df (pd.DataFrame): The unformatted Technology Ranks DataFrame (one row per ranked technology).
 
     Returns:
         pd.DataFrame: A combined DataFrame of Technology Ranks.
     """
-    container = [pd.concat(tr_df.values[count]) for count in range(len(tr_df.values))]
-    if len(container) == 0:
+    if tr_df.empty:
         return pd.DataFrame(columns=["year", "start_tech"])
-    df = pd.concat(container)
-    return df.sort_values(by=["year", "start_tech"], ascending=True).reset_index()
+    column_order = RANK_RECORD_INDEX_COLS + [
+        col for col in tr_df.columns if col not in RANK_RECORD_INDEX_COLS
+    ]
+    return (
+        tr_df[column_order]
+        .sort_values(by=["year", "start_tech"], ascending=True)
+        .reset_index(drop=True)
+    )
@@ -1,6 +1,9 @@
 """Class for the Plant ID container."""
 
+from typing import Union
+
 import pandas as pd
+from mppsteel.utility.random_utility import RandomStreams
 from mppsteel.utility.utils import generate_random_string_with_prefix
 
 
@@ -30,10 +33,19 @@ class PlantIdContainer:
             self.id_container.remove(plant_id)
             print(f"Plant ID removed {plant_id}")
 
-    def generate_plant_id(self, add_to_container: bool = False) -> str:
+    def generate_plant_id(
+        self,
+        add_to_container: bool = False,
+        random_streams: Union[RandomStreams, None] = None,
+        stream_key: tuple = (),
+    ) -> str:
         unmatched = True
+        attempt = 0
         while unmatched:
-            new_id = generate_random_string_with_prefix()
+            new_id = generate_random_string_with_prefix(
+                random_streams=random_streams, stream_key=stream_key + (attempt,)
+            )
+            attempt += 1
             if new_id not in self.id_container:
                 if add_to_container:
                     self.add_id(new_id)
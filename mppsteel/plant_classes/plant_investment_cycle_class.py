@@ -1,6 +1,6 @@
 """Script for the PlantInvestmentCycle class."""
 
-from typing import Dict, List
+from typing import Dict, List, Union
 import pandas as pd
 
 from mppsteel.config.model_config import (
@@ -10,16 +10,17 @@ from mppsteel.config.model_config import (
 from mppsteel.config.mypy_config_settings import MYPY_NUMERICAL_AND_RANGE
 
 from mppsteel.utility.log_utility import get_logger
+from mppsteel.utility.random_utility import RandomStreams
+from mppsteel.plant_classes.investment_cycle_bitset_class import (
+    InvestmentCycleBitsets,
+)
 from mppsteel.plant_classes.plant_investment_cycle_helpers import (
     add_off_cycle_investment_years,
     adjust_cycles_for_first_year,
     adjust_transitional_switch_in_investment_cycle,
     calculate_investment_years,
-    create_investment_cycle_reference,
-    extract_tech_plant_switchers,
     increment_investment_cycle_year,
     return_cycle_length,
-    return_switch_type,
 )
 
 
@@ -35,6 +36,10 @@ class PlantInvestmentCycle:
     - plant_investment_cycle_length: The length of the investment cycles of each plant.
     - plant_cycles: The investment cycles of each plant, including main investment years only.
     - plant_cycles_with_off_cycle: The investment cycles of each plant, including both main investment years and transitional switch years.
+    - transitional_switch_years: The years in which each plant made a transitional switch away from its technology (only plants that switched are keys).
+    - cycle_updates: The names of the plants in the order that their cycles were updated in the model years (a plant is listed once per update). Used to refresh state that is derived from the cycles, such as the plant age queue.
+    - cycle_bitsets: `plant_cycles_with_off_cycle` stored as main cycle / off-cycle bitmasks over the model years (see InvestmentCycleBitsets). Used for the switcher queries.
+      The bitsets are updated whenever a plant's cycle changes and are rebuilt (rather than serialized) when the class is unpickled.
     """
 
     def __init__(self) -> None:
@@ -43,19 +48,52 @@ class PlantInvestmentCycle:
         self.plant_investment_cycle_length: Dict[str, int] = {}
         self.plant_cycles: Dict[str, MYPY_NUMERICAL_AND_RANGE] = {}
         self.plant_cycles_with_off_cycle: Dict[str, MYPY_NUMERICAL_AND_RANGE] = {}
+        self.transitional_switch_years: Dict[str, List[int]] = {}
+        self.cycle_updates: List[str] = []
+        self.cycle_bitsets = InvestmentCycleBitsets()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop("cycle_bitsets", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        # the preprocessed investment cycles are pickled before any transitional switches
+        state.setdefault("transitional_switch_years", {})
+        state.setdefault("cycle_updates", [])
+        self.__dict__.update(state)
+        self.create_cycle_bitsets()
+
+    def create_cycle_bitsets(self) -> None:
+        self.cycle_bitsets = InvestmentCycleBitsets(
+            initial_capacity=max(2 * len(self.plant_cycles_with_off_cycle), 1)
+        )
+        for plant_name, plant_cycle in self.plant_cycles_with_off_cycle.items():
+            self.cycle_bitsets.set_cycle(plant_name, plant_cycle)
+
+    def update_plant_cycle(
+        self, plant_name: str, new_cycle: MYPY_NUMERICAL_AND_RANGE
+    ) -> None:
+        self.plant_cycles_with_off_cycle[plant_name] = new_cycle
+        self.cycle_bitsets.set_cycle(plant_name, new_cycle)
+        self.cycle_updates.append(plant_name)
 
     def instantiate_plants(
         self,
         plant_names: list,
         plant_start_years: list,
         investment_cycle_randomness: bool,
+        random_streams: Union[RandomStreams, None] = None,
     ) -> None:
         self.plant_names = plant_names
         start_year_dict = dict(zip(plant_names, plant_start_years))
         for plant_name in self.plant_names:
             self.plant_start_years[plant_name] = start_year_dict[plant_name]
             self.plant_investment_cycle_length[plant_name] = return_cycle_length(
-                INVESTMENT_CYCLE_DURATION_YEARS, investment_cycle_randomness
+                INVESTMENT_CYCLE_DURATION_YEARS,
+                investment_cycle_randomness,
+                random_streams,
+                ("cycle_length", plant_name),
             )
             self.plant_cycles[plant_name] = calculate_investment_years(
                 self.plant_start_years[plant_name],
@@ -67,27 +105,32 @@ class PlantInvestmentCycle:
         self.plant_cycles_with_off_cycle = adjust_cycles_for_first_year(
             self.plant_cycles_with_off_cycle
         )
+        self.create_cycle_bitsets()
 
     def add_new_plants(
         self,
         plant_names: list,
         plant_start_years: list,
         investment_cycle_randomness: bool,
+        random_streams: Union[RandomStreams, None] = None,
     ) -> None:
         new_dict = dict(zip(plant_names, plant_start_years))
         for plant_name in plant_names:
             self.plant_names.append(plant_name)
             self.plant_start_years[plant_name] = new_dict[plant_name]
             self.plant_investment_cycle_length[plant_name] = return_cycle_length(
-                INVESTMENT_CYCLE_DURATION_YEARS, investment_cycle_randomness
+                INVESTMENT_CYCLE_DURATION_YEARS,
+                investment_cycle_randomness,
+                random_streams,
+                ("cycle_length", plant_name),
             )
             self.plant_cycles[plant_name] = calculate_investment_years(
                 self.plant_start_years[plant_name],
                 self.plant_investment_cycle_length[plant_name],
             )
-            self.plant_cycles_with_off_cycle[
-                plant_name
-            ] = add_off_cycle_investment_years(self.plant_cycles[plant_name])
+            self.update_plant_cycle(
+                plant_name, add_off_cycle_investment_years(self.plant_cycles[plant_name])
+            )
 
     def adjust_cycle_for_transitional_switch(
         self, plant_name: str, rebase_year: int
@@ -95,7 +138,8 @@ class PlantInvestmentCycle:
         new_cycle = adjust_transitional_switch_in_investment_cycle(
             self.plant_cycles_with_off_cycle[plant_name], rebase_year
         )
-        self.plant_cycles_with_off_cycle[plant_name] = new_cycle
+        self.update_plant_cycle(plant_name, new_cycle)
+        self.transitional_switch_years.setdefault(plant_name, []).append(rebase_year)
 
     def adjust_cycle_for_deferred_investment(
         self, plant_name: str, rebase_year: int
@@ -103,17 +147,23 @@ class PlantInvestmentCycle:
         new_cycle = increment_investment_cycle_year(
             self.plant_cycles_with_off_cycle[plant_name], rebase_year
         )
-        self.plant_cycles_with_off_cycle[plant_name] = new_cycle
+        self.update_plant_cycle(plant_name, new_cycle)
 
     def create_investment_df(self) -> pd.DataFrame:
-        return create_investment_cycle_reference(self.plant_cycles_with_off_cycle)
+        return self.cycle_bitsets.create_investment_df()
 
     def return_plant_switch_type(self, plant_name: str, year: int) -> str:
-        return return_switch_type(self.plant_cycles_with_off_cycle[plant_name], year)
+        return self.cycle_bitsets.return_switch_type(plant_name, year)
 
     def return_investment_dict(self) -> dict:
         return self.plant_cycles_with_off_cycle
 
+    def return_transitional_switch_years(self) -> dict:
+        return self.transitional_switch_years
+
+    def return_cycle_updates(self, start: int = 0) -> list:
+        return self.cycle_updates[start:]
+
     def return_cycle_lengths(self, plant_name: str = ""):
         return (
             self.plant_investment_cycle_length[plant_name]
@@ -139,18 +189,7 @@ class PlantInvestmentCycle:
     def return_plant_switchers(
         self, active_plants: list, year: int, value_type: str
     ) -> list:
-        (
-            main_cycle_switchers,
-            trans_cycle_switchers,
-            non_switchers,
-            combined_switchers,
-        ) = extract_tech_plant_switchers(
-            self.plant_cycles_with_off_cycle, active_plants, year
+        # plants are returned in the order of `active_plants`
+        return self.cycle_bitsets.return_plant_switchers(
+            active_plants, year, value_type
         )
-        if value_type == "main cycle":
-            return main_cycle_switchers
-        elif value_type == "trans switch":
-            return trans_cycle_switchers
-        elif value_type == "no switch":
-            return non_switchers
-        return combined_switchers  # value_type == "combined"
@@ -0,0 +1,48 @@
+import pickle
+
+import pandas as pd
+
+from mppsteel.config.model_config import MODEL_YEAR_RANGE
+from mppsteel.plant_classes.plant_investment_cycle_class import PlantInvestmentCycle
+from mppsteel.plant_classes.plant_investment_cycle_helpers import (
+    create_investment_cycle_reference,
+    extract_tech_plant_switchers,
+    return_switch_type,
+)
+
+
+def test_cycle_bitsets_match_investment_cycles():
+    investment_cycles = PlantInvestmentCycle()
+    investment_cycles.instantiate_plants(
+        ["plant_a", "plant_b", "plant_c"], [1990, 2005, 2012], False
+    )
+    investment_cycles.add_new_plants(["plant_d"], [2030], False)
+    investment_cycles.adjust_cycle_for_transitional_switch("plant_a", 2023)
+    investment_cycles.adjust_cycle_for_deferred_investment("plant_b", 2025)
+    investment_cycles = pickle.loads(pickle.dumps(investment_cycles))
+    assert investment_cycles.return_transitional_switch_years() == {"plant_a": [2023]}
+
+    plant_names = ["plant_d", "plant_c", "plant_b", "plant_a"]
+    for year in MODEL_YEAR_RANGE:
+        expected = extract_tech_plant_switchers(
+            investment_cycles.plant_cycles_with_off_cycle, plant_names, year
+        )
+        for value_type, expected_plants in zip(
+            ["main cycle", "trans switch", "no switch", "combined"], expected
+        ):
+            assert (
+                investment_cycles.return_plant_switchers(plant_names, year, value_type)
+                == expected_plants
+            )
+        for plant_name in plant_names:
+            assert investment_cycles.return_plant_switch_type(
+                plant_name, year
+            ) == return_switch_type(
+                investment_cycles.plant_cycles_with_off_cycle[plant_name], year
+            )
+    pd.testing.assert_frame_equal(
+        investment_cycles.create_investment_df(),
+        create_investment_cycle_reference(
+            investment_cycles.plant_cycles_with_off_cycle
+        ),
+    )
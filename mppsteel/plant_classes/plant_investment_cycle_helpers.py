@@ -1,6 +1,5 @@
 """Script with function to manipulate the PlantInvestmentCycle Class."""
 
-import random
 from typing import Dict, List, Sequence, Tuple, Union
 
 import pandas as pd
@@ -19,6 +18,7 @@ from mppsteel.config.model_config import (
 from mppsteel.config.mypy_config_settings import MYPY_NUMERICAL_AND_RANGE
 
 from mppsteel.utility.log_utility import get_logger
+from mppsteel.utility.random_utility import RandomStreams, random_range
 from mppsteel.utility.utils import combine_and_order_list_and_range
 
 
@@ -53,21 +53,29 @@ def calculate_investment_years(
 
 
 def return_cycle_length(
-    inv_intervals, investment_cycle_randomness: bool = False
+    inv_intervals,
+    investment_cycle_randomness: bool = False,
+    random_streams: Union[RandomStreams, None] = None,
+    stream_key: tuple = (),
 ) -> int:
     """Returns a new cycle length based on a fixed value and a random value within a predefined inveral.
 
     Args:
         inv_intervals (int): A fixed interval value aroud which the final interval will fluctuate.
         investment_cycle_randomness (bool): Switch to turn on randomness in range.
+        random_streams (Union[RandomStreams, None], optional): The random streams to draw the random value from. The global `random` module is used if None. Defaults to None.
+        stream_key (tuple, optional): The keys of the stream within `random_streams`. Defaults to ().
 
     Returns:
         int: A final interval value.
     """
     cycle_length = inv_intervals
     if investment_cycle_randomness:
-        cycle_length = inv_intervals + random.randrange(
-            -INVESTMENT_CYCLE_VARIANCE_YEARS, INVESTMENT_CYCLE_VARIANCE_YEARS, 1
+        cycle_length = inv_intervals + random_range(
+            -INVESTMENT_CYCLE_VARIANCE_YEARS,
+            INVESTMENT_CYCLE_VARIANCE_YEARS,
+            random_streams,
+            stream_key,
         )
     return cycle_length
 
@@ -0,0 +1,182 @@
+"""Class to store the steel plant metadata in a persistent array-backed registry"""
+
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from mppsteel.config.model_config import MAIN_REGIONAL_SCHEMA
+from mppsteel.data_load_and_format.steel_plant_formatter import ACTIVE_PLANT_STATUSES
+from mppsteel.utility.log_utility import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED_PLANT_STATUS = "decomissioned"
+
+
+def return_common_dtype(storage_dtype: np.dtype, values_dtype: np.dtype) -> np.dtype:
+    """Returns the dtype that a column needs when new values are added to it, following the dtype rules of `pd.concat`.
+
+    Args:
+        storage_dtype (np.dtype): The current dtype of the column.
+        values_dtype (np.dtype): The dtype of the new values.
+
+    Returns:
+        np.dtype: The dtype of the combined column.
+    """
+    if storage_dtype == values_dtype:
+        return storage_dtype
+    if (
+        (storage_dtype.kind not in "biuf")
+        or (values_dtype.kind not in "biuf")
+        or ((storage_dtype.kind == "b") != (values_dtype.kind == "b"))
+    ):
+        return np.dtype(object)
+    return np.result_type(storage_dtype, values_dtype)
+
+
+class PlantRegistry:
+    """Description
+    Class to hold the metadata of every steel plant (existing and newly opened) in one NumPy array per column.
+    Plants are opened by appending rows and closed by updating their row in place, so the plant data never has to be copied or concatenated in the year loop.
+
+    Important Points
+    1) A plant's row number never changes. Rows are only ever appended.
+    2) `order` holds the row numbers in the order that the plants are iterated by the solver. The solver sets it at the end of each year.
+    3) DataFrames are only created as views of a set of rows (e.g. for the trade module or the outputs) with `to_dataframe`.
+    4) Column dtypes are widened when appended values do not fit them, in the same way as `pd.concat`.
+
+    Main Class Attributes
+        columns: A dictionary of column name: storage array. The arrays are grown by doubling their size.
+        length: The number of plants in the registry.
+        order: The row numbers of the plants in solver order.
+        plant_rows: A dictionary of plant_name: row number.
+    """
+
+    def __init__(self, initial_capacity: int = 1024):
+        self.capacity = initial_capacity
+        self.length = 0
+        self.columns: Dict[str, np.ndarray] = {}
+        self.order = np.array([], dtype=np.int64)
+        self.plant_rows: Dict[str, int] = {}
+
+    def __len__(self):
+        return self.length
+
+    @classmethod
+    def from_dataframe(cls, plant_df: pd.DataFrame):
+        plant_registry = cls(initial_capacity=max(2 * len(plant_df), 1))
+        for column in plant_df.columns:
+            values = plant_df[column].to_numpy()
+            storage = np.empty(plant_registry.capacity, dtype=values.dtype)
+            storage[: len(values)] = values
+            plant_registry.columns[column] = storage
+        plant_registry.length = len(plant_df)
+        plant_registry.order = np.arange(len(plant_df), dtype=np.int64)
+        for row, plant_name in enumerate(plant_df["plant_name"]):
+            plant_registry.plant_rows.setdefault(plant_name, row)
+        return plant_registry
+
+    def grow(self, required_length: int):
+        new_capacity = self.capacity
+        while new_capacity < required_length:
+            new_capacity *= 2
+        for column, storage in self.columns.items():
+            new_storage = np.empty(new_capacity, dtype=storage.dtype)
+            new_storage[: self.length] = storage[: self.length]
+            self.columns[column] = new_storage
+        self.capacity = new_capacity
+
+    def set_column_values(
+        self, column: str, rows: Union[np.ndarray, slice], values: Sequence
+    ):
+        storage = self.columns[column]
+        values = pd.Series(values, dtype=object if storage.dtype == object else None)
+        common_dtype = return_common_dtype(storage.dtype, values.dtype)
+        if common_dtype != storage.dtype:
+            storage = storage.astype(common_dtype)
+            self.columns[column] = storage
+        storage[rows] = values.to_numpy(dtype=common_dtype)
+
+    def append_plants(self, entries: List[dict]) -> np.ndarray:
+        """Adds new plants to the end of the registry and to the end of `order`.
+
+        Args:
+            entries (List[dict]): A list of plant metadata dictionaries. Every dictionary must have a value for every column.
+
+        Returns:
+            np.ndarray: The row numbers of the new plants.
+        """
+        new_rows = np.arange(self.length, self.length + len(entries), dtype=np.int64)
+        if not entries:
+            return new_rows
+        if self.length + len(entries) > self.capacity:
+            self.grow(self.length + len(entries))
+        row_slice = slice(self.length, self.length + len(entries))
+        for column in self.columns:
+            self.set_column_values(
+                column, row_slice, [entry[column] for entry in entries]
+            )
+        for row, entry in zip(new_rows, entries):
+            self.plant_rows.setdefault(entry["plant_name"], int(row))
+        self.length += len(entries)
+        self.order = np.concatenate([self.order, new_rows])
+        return new_rows
+
+    def set_order(self, rows: np.ndarray):
+        self.order = np.asarray(rows, dtype=np.int64)
+
+    def return_column(self, column: str, rows: np.ndarray = None) -> np.ndarray:
+        storage = self.columns[column][: self.length]
+        return storage[self.order] if rows is None else storage[rows]
+
+    def return_plant_row(self, plant_name: str) -> int:
+        return self.plant_rows[plant_name]
+
+    def create_active_check_mask(self, year: int, rows: np.ndarray) -> np.ndarray:
+        """Vectorized active check of a set of plants. Also updates the plants' `active_check` column.
+
+        Args:
+            year (int): The current year to check against the start_of_operation column.
+            rows (np.ndarray): The row numbers of the plants to check.
+
+        Returns:
+            np.ndarray: A boolean array with one value per row in `rows`.
+        """
+        active_mask = np.isin(
+            self.return_column("status", rows), ACTIVE_PLANT_STATUSES
+        ) & (self.return_column("start_of_operation", rows) <= year)
+        self.set_column_values("active_check", rows, active_mask)
+        return active_mask
+
+    def return_active_rows(self, rows: np.ndarray) -> np.ndarray:
+        return rows[self.return_column("active_check", rows).astype(bool)]
+
+    def return_plants_from_region(self, rows: np.ndarray, region: str) -> list:
+        return list(
+            self.return_column("plant_name", rows)[
+                self.return_column(MAIN_REGIONAL_SCHEMA, rows) == region
+            ]
+        )
+
+    def return_value_count(self, rows: np.ndarray, column: str, value) -> int:
+        return int((self.return_column(column, rows) == value).sum())
+
+    def close_plant(self, plant_name: str, year: int):
+        row = np.array([self.return_plant_row(plant_name)])
+        self.set_column_values("status", row, [CLOSED_PLANT_STATUS])
+        self.set_column_values("end_of_operation", row, [year])
+        self.set_column_values("active_check", row, [False])
+
+    def to_dataframe(self, rows: np.ndarray = None) -> pd.DataFrame:
+        """Creates a DataFrame view of a set of plants.
+
+        Args:
+            rows (np.ndarray, optional): The row numbers of the plants (in the order they should appear). Defaults to None (every plant in `order`).
+
+        Returns:
+            pd.DataFrame: A DataFrame with one row per plant and a RangeIndex.
+        """
+        return pd.DataFrame(
+            {column: self.return_column(column, rows) for column in self.columns}
+        )
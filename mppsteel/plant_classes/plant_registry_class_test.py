@@ -0,0 +1,44 @@
+import pandas as pd
+
+from mppsteel.plant_classes.plant_registry_class import PlantRegistry
+
+PLANT_DF = pd.DataFrame(
+    {
+        "plant_name": ["plant_a", "plant_b", "plant_c"],
+        "rmi_region": ["Europe", "Europe", "India"],
+        "status": ["operating", "operating", "announced"],
+        "start_of_operation": [1990, 2005, 2030],
+        "plant_capacity": [1000.0, 2000.0, 1500.0],
+        "end_of_operation": ["", "", ""],
+        "active_check": [True, True, False],
+    }
+)
+
+
+def test_plant_registry_matches_dataframe_updates():
+    plant_registry = PlantRegistry.from_dataframe(PLANT_DF)
+    active_mask = plant_registry.create_active_check_mask(2020, plant_registry.order)
+    new_plant = {
+        "plant_name": "plant_d",
+        "rmi_region": "India",
+        "status": "new model plant",
+        "start_of_operation": 2020,
+        "plant_capacity": 2500.0,
+        "end_of_operation": "",
+        "active_check": True,
+    }
+    new_rows = plant_registry.append_plants([new_plant])
+    plant_registry.close_plant("plant_a", 2020)
+
+    expected = pd.concat([PLANT_DF, pd.DataFrame([new_plant])]).reset_index(drop=True)
+    expected.loc[0, ["status", "end_of_operation", "active_check"]] = [
+        "decomissioned",
+        2020,
+        False,
+    ]
+    assert list(active_mask) == [True, True, False]
+    assert list(new_rows) == [3]
+    assert plant_registry.return_plants_from_region(
+        plant_registry.return_active_rows(plant_registry.order), "India"
+    ) == ["plant_d"]
+    pd.testing.assert_frame_equal(plant_registry.to_dataframe(), expected)
@@ -0,0 +1,168 @@
+"""Class to store solver records in an append-only columnar buffer"""
+
+from typing import Dict, Hashable, List
+
+import numpy as np
+import pandas as pd
+
+from mppsteel.utility.log_utility import get_logger
+
+logger = get_logger(__name__)
+
+CATEGORY_COLUMN = "category"
+NUMERIC_COLUMN = "numeric"
+BOOL_COLUMN = "bool"
+MISSING_CODE = -1
+
+
+def return_column_kind(values: np.ndarray) -> str:
+    if values.dtype.kind == "b":
+        return BOOL_COLUMN
+    elif values.dtype.kind in {"i", "u", "f"}:
+        return NUMERIC_COLUMN
+    return CATEGORY_COLUMN
+
+
+class ColumnarRecordBuffer:
+    """Description
+    Class to collect records (e.g. the technology rankings of each plant decision) in typed NumPy arrays instead of in a list of small DataFrames.
+    The records are only materialized to a DataFrame when `to_dataframe` is called.
+
+    Important Points
+    1) Each call to `append` adds one or more rows. Scalar values are repeated for every row of the entry.
+    2) Text columns are stored as integer codes with a categories list per column (a categorical dictionary).
+    3) Numeric columns are stored as floats and converted back to integers if every entry was an integer and no rows are missing, so the output dtypes match a concatenation of the original DataFrames.
+    4) Columns missing from an entry are NaN for that entry's rows.
+
+    Main Class Attributes
+        length: The number of rows in the buffer.
+        columns: A dictionary of column name: storage array. The arrays are grown by doubling their size.
+        column_kinds: A dictionary of column name: column kind (category, numeric or bool).
+        categories / category_codes: The categorical dictionary of each text column.
+    """
+
+    def __init__(self, initial_capacity: int = 1024):
+        self.capacity = initial_capacity
+        self.length = 0
+        self.columns: Dict[str, np.ndarray] = {}
+        self.column_kinds: Dict[str, str] = {}
+        self.integer_columns: Dict[str, bool] = {}
+        self.missing_columns: Dict[str, bool] = {}
+        self.categories: Dict[str, List[Hashable]] = {}
+        self.category_codes: Dict[str, Dict[Hashable, int]] = {}
+
+    def __len__(self):
+        return self.length
+
+    def create_column(self, column: str, kind: str):
+        if kind == CATEGORY_COLUMN:
+            storage = np.full(self.capacity, MISSING_CODE, dtype=np.int32)
+            self.categories[column] = []
+            self.category_codes[column] = {}
+        elif kind == BOOL_COLUMN:
+            storage = np.full(self.capacity, MISSING_CODE, dtype=np.int8)
+        else:
+            storage = np.full(self.capacity, np.nan, dtype=float)
+        self.columns[column] = storage
+        self.column_kinds[column] = kind
+        self.integer_columns[column] = True
+        self.missing_columns[column] = self.length > 0
+
+    def grow(self, required_length: int):
+        new_capacity = self.capacity
+        while new_capacity < required_length:
+            new_capacity *= 2
+        for column, storage in self.columns.items():
+            fill_value = np.nan if self.column_kinds[column] == NUMERIC_COLUMN else MISSING_CODE
+            new_storage = np.full(new_capacity, fill_value, dtype=storage.dtype)
+            new_storage[: self.length] = storage[: self.length]
+            self.columns[column] = new_storage
+        self.capacity = new_capacity
+
+    def return_codes(self, column: str, values: np.ndarray) -> np.ndarray:
+        category_codes = self.category_codes[column]
+        categories = self.categories[column]
+        codes = np.empty(len(values), dtype=np.int32)
+        for idx, value in enumerate(values):
+            if pd.isna(value):
+                codes[idx] = MISSING_CODE
+                continue
+            code = category_codes.get(value)
+            if code is None:
+                code = len(categories)
+                category_codes[value] = code
+                categories.append(value)
+            codes[idx] = code
+        return codes
+
+    def append(self, entry: dict):
+        """Adds an entry of one or more rows to the buffer.
+
+        Args:
+            entry (dict): A dictionary of column name: values. Values are either scalars or sequences with one value per row.
+        """
+        number_of_rows = max(
+            [
+                len(values)
+                for values in entry.values()
+                if isinstance(values, (list, tuple, np.ndarray, pd.Series, pd.Index))
+            ],
+            default=1,
+        )
+        if number_of_rows == 0:
+            return
+        if self.length + number_of_rows > self.capacity:
+            self.grow(self.length + number_of_rows)
+        row_slice = slice(self.length, self.length + number_of_rows)
+        for column, values in entry.items():
+            if isinstance(values, (list, tuple, np.ndarray, pd.Series, pd.Index)):
+                values = np.asarray(values)
+            else:
+                values = np.full(
+                    number_of_rows,
+                    values,
+                    dtype=object if isinstance(values, str) else None,
+                )
+            if column not in self.columns:
+                self.create_column(column, return_column_kind(values))
+            kind = self.column_kinds[column]
+            if kind == CATEGORY_COLUMN:
+                self.columns[column][row_slice] = self.return_codes(column, values)
+            elif kind == BOOL_COLUMN:
+                self.columns[column][row_slice] = values.astype(np.int8)
+            else:
+                if values.dtype.kind not in {"i", "u", "b"}:
+                    self.integer_columns[column] = False
+                self.columns[column][row_slice] = values
+        for column in self.columns:
+            if column not in entry:
+                self.missing_columns[column] = True
+        self.length += number_of_rows
+
+    def materialize_column(self, column: str) -> np.ndarray:
+        storage = self.columns[column][: self.length]
+        kind = self.column_kinds[column]
+        if kind == CATEGORY_COLUMN:
+            categories = np.empty(len(self.categories[column]) + 1, dtype=object)
+            categories[:-1] = self.categories[column]
+            categories[-1] = np.nan
+            return categories[storage]
+        elif kind == BOOL_COLUMN:
+            if (storage == MISSING_CODE).any():
+                values = storage.astype(bool).astype(object)
+                values[storage == MISSING_CODE] = np.nan
+                return values
+            return storage.astype(bool)
+        if self.integer_columns[column] and not self.missing_columns[column]:
+            return storage.astype(np.int64)
+        return storage.copy()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Materializes the buffer to a DataFrame.
+
+        Returns:
+            pd.DataFrame: A DataFrame with a column for each column in the buffer (in the order they were first added).
+        """
+        return pd.DataFrame(
+            {column: self.materialize_column(column) for column in self.columns}
+        )
@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+
+from mppsteel.plant_classes.record_buffer_class import ColumnarRecordBuffer
+
+
+def test_record_buffer_matches_concatenated_dataframes():
+    entries = [
+        {"switch_tech": ["EAF", "DRI-EAF"], "rank": np.array([1, 2]), "year": 2030},
+        {"switch_tech": ["BAT BF-BOF"], "rank": np.array([np.nan]), "year": 2031},
+        {"switch_tech": ["EAF"], "rank": np.array([3]), "year": 2031, "flag": True},
+    ]
+    record_buffer = ColumnarRecordBuffer(initial_capacity=2)
+    for entry in entries:
+        record_buffer.append(entry)
+    expected = pd.concat(
+        [pd.DataFrame(entry, index=range(len(entry["switch_tech"]))) for entry in entries]
+    ).reset_index(drop=True)
+    assert len(record_buffer) == 4
+    pd.testing.assert_frame_equal(record_buffer.to_dataframe(), expected)
@@ -24,53 +24,97 @@ class UtilizationContainerClass:
     """Description
     Class for managing each region's utilization rates.
 
+    Important Points
+    1) Regions that are not part of the initial region list (e.g. World) are added to the container the first time they are assigned.
+    2) A region only appears in a year's utilization values once it has been assigned in that year.
+
     Main Class Attirbutes
-        It maintains a dictionary called utilization_container structured as [year][region] -> value
+        It maintains an array called utilization_array structured as [year, region] -> value, with a boolean array `assigned_mask` of the same shape recording the assigned values.
         World Utilization rates are treated as a weighted average of all the region's utilizatoin rates
     """
 
     def __init__(self):
-        self.utilization_container = {}
+        self.year_index = {}
+        self.region_index = {}
+        self.utilization_array = np.zeros((0, 0))
+        self.assigned_mask = np.zeros((0, 0), dtype=bool)
 
     def initiate_container(self, year_range: range, region_list: list):
-        for year in year_range:
-            self.utilization_container[year] = {region: 0 for region in region_list}
+        self.year_index = {year: idx for idx, year in enumerate(year_range)}
+        self.region_index = {region: idx for idx, region in enumerate(region_list)}
+        self.utilization_array = np.zeros((len(self.year_index), len(region_list)))
+        self.assigned_mask = np.ones(self.utilization_array.shape, dtype=bool)
+
+    def add_region(self, region: str):
+        if region not in self.region_index:
+            self.region_index[region] = len(self.region_index)
+            self.utilization_array = np.hstack(
+                [self.utilization_array, np.zeros((len(self.year_index), 1))]
+            )
+            self.assigned_mask = np.hstack(
+                [self.assigned_mask, np.zeros((len(self.year_index), 1), dtype=bool)]
+            )
 
     def assign_year_utilization(self, year: int, entry: dict):
-        self.utilization_container[year] = entry
+        self.assigned_mask[self.year_index[year]] = False
+        for region, value in entry.items():
+            self.update_region(year, region, value)
 
     def update_region(self, year: int, region: str, value: float):
-        self.utilization_container[year][region] = value
+        self.add_region(region)
+        year_idx = self.year_index[year]
+        region_idx = self.region_index[region]
+        self.utilization_array[year_idx, region_idx] = value
+        self.assigned_mask[year_idx, region_idx] = True
 
     def get_average_utilization(self, year: int):
-        return np.mean(self.utilization_container[year].values())
+        year_idx = self.year_index[year]
+        return np.mean(self.utilization_array[year_idx, self.assigned_mask[year_idx]])
 
     def calculate_world_utilization(
         self, year: int, capacity_dict: dict, demand_value: float
     ):
-        self.utilization_container[year]["World"] = demand_value / sum(
-            capacity_dict.values()
-        )
+        self.update_region(year, "World", demand_value / sum(capacity_dict.values()))
+
+    def return_year_values(self, year: int) -> dict:
+        year_idx = self.year_index[year]
+        return {
+            region: value
+            for region, value, assigned in zip(
+                self.region_index,
+                self.utilization_array[year_idx].tolist(),
+                self.assigned_mask[year_idx],
+            )
+            if assigned
+        }
 
     def get_utilization_values(self, year: int = None, region: str = None):
         year = year + 1 if year == MODEL_YEAR_START - 1 else year
         if region and not year:
             # return a year valye time series for a region
+            region_idx = self.region_index[region]
             return {
-                year_val: self.utilization_container[year_val][region]
-                for year_val in self.utilization_container
+                year_val: self.utilization_array[year_idx, region_idx].item()
+                for year_val, year_idx in self.year_index.items()
+                if self.assigned_mask[year_idx, region_idx]
             }
 
         if year and not region:
             # return all regions for single year
-            return self.utilization_container[year]
+            return self.return_year_values(year)
 
         if year and region:
             # return single value
-            return self.utilization_container[year][region]
+            year_idx = self.year_index[year]
+            region_idx = self.region_index[region]
+            if not self.assigned_mask[year_idx, region_idx]:
+                raise KeyError(f"No utilization value for {region} in {year}")
+            return self.utilization_array[year_idx, region_idx].item()
 
         # return all years and regions
-        return self.utilization_container
+        return {
+            year_val: self.return_year_values(year_val) for year_val in self.year_index
+        }
 
 
 def format_wsa_production_data(df: pd.DataFrame, as_dict: bool = False) -> pd.DataFrame:
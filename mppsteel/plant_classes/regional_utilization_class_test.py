@@ -0,0 +1,31 @@
+import pytest
+
+from mppsteel.plant_classes.regional_utilization_class import (
+    UtilizationContainerClass,
+)
+
+
+def test_utilization_container_assigned_regions():
+    utilization_container = UtilizationContainerClass()
+    utilization_container.initiate_container(range(2020, 2022), ["Europe", "India"])
+    utilization_container.assign_year_utilization(2020, {"Europe": 0.8, "India": 0.5})
+    utilization_container.calculate_world_utilization(
+        2020, {"Europe": 100, "India": 100}, 130
+    )
+    utilization_container.update_region(2021, "India", 0.6)
+    assert utilization_container.get_utilization_values(2020) == {
+        "Europe": 0.8,
+        "India": 0.5,
+        "World": 0.65,
+    }
+    # World is only part of the years in which it has been calculated
+    assert utilization_container.get_utilization_values(2021) == {
+        "Europe": 0,
+        "India": 0.6,
+    }
+    assert utilization_container.get_utilization_values(2019, "Europe") == 0.8
+    assert utilization_container.get_utilization_values(region="World") == {
+        2020: 0.65
+    }
+    with pytest.raises(KeyError):
+        utilization_container.get_utilization_values(2021, "World")
@@ -5,4 +5,7 @@ from . import (
     trade_logic_test,
     trade_logic,
     trade_helpers,
+    trade_lp_engine,
+    trade_lp_engine_test,
+    trade_engine_benchmark,
 )
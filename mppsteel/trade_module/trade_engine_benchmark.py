@@ -0,0 +1,274 @@
+"""Benchmark of the cascade and linear programming trade engines"""
+
+from copy import deepcopy
+import logging
+import time
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from mppsteel.config.model_config import (
+    CAPACITY_UTILIZATION_CUTOFF_FOR_CLOSING_PLANT_DECISION,
+    CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION,
+    MEGATON_TO_KILOTON_FACTOR,
+)
+from mppsteel.config.reference_lists import REGION_LIST
+from mppsteel.data_load_and_format.reg_steel_demand_formatter import SteelDemandIndex
+from mppsteel.plant_classes.capacity_container_class import CapacityContainerClass
+from mppsteel.model_solver.market_container_class import MarketContainerClass
+from mppsteel.plant_classes.regional_utilization_class import UtilizationContainerClass
+from mppsteel.trade_module.trade_flow import trade_flow
+from mppsteel.trade_module.trade_lp_engine import trade_flow_lp
+from mppsteel.utility.log_utility import get_logger
+
+logger = get_logger(__name__)
+
+TRADE_ENGINE_FUNCTIONS: Dict[str, Callable] = {
+    "cascade": trade_flow,
+    "lp": trade_flow_lp,
+}
+BENCHMARK_TECHNOLOGIES = ["Avg BF-BOF", "DRI-EAF", "EAF"]
+
+
+def create_synthetic_trade_inputs(
+    region_list: Sequence[str],
+    plants_per_region: int = 20,
+    year: int = 2021,
+    seed: int = 0,
+) -> dict:
+    """Creates the inputs of a trade engine for a synthetic market with one country per region, so that the engines can be compared on regional schemas of any size.
+
+    Args:
+        region_list (Sequence[str]): The regions of the market.
+        plants_per_region (int, optional): The number of plants in each region. Defaults to 20.
+        year (int, optional): The year to balance. The previous year is used for the utilization and technology choices. Defaults to 2021.
+        seed (int, optional): The seed of the random capacities, costs and demands. Defaults to 0.
+
+    Returns:
+        dict: The keyword arguments of `trade_flow` / `trade_flow_lp`.
+    """
+    rng = np.random.default_rng(seed)
+    year_range = range(year - 1, year + 1)
+    country_codes = [f"C{idx:04d}" for idx in range(len(region_list))]
+    plant_df = pd.DataFrame(
+        [
+            {
+                "plant_name": f"{country_code} - plant {plant_number}",
+                "country_code": country_code,
+                "rmi_region": region,
+                "plant_capacity": rng.uniform(1000, 4000),
+                "active_check": True,
+            }
+            for region, country_code in zip(region_list, country_codes)
+            for plant_number in range(plants_per_region)
+        ]
+    )
+    capacity_container = CapacityContainerClass()
+    capacity_container.instantiate_container(year_range)
+    for capacity_year in year_range:
+        capacity_container.start_year(capacity_year)
+        capacity_container.sync_capacities(plant_df, capacity_year)
+    capacity_container.set_average_plant_capacity(plant_df)
+
+    utilization_dict = {
+        region: rng.uniform(0.65, 0.9) for region in region_list
+    }
+    utilization_container = UtilizationContainerClass()
+    utilization_container.initiate_container(year_range, list(region_list))
+    utilization_container.assign_year_utilization(year - 1, utilization_dict)
+
+    regional_capacity_dict = capacity_container.return_regional_capacity(year)
+    steel_demand_df = pd.DataFrame(
+        [
+            [
+                year,
+                region,
+                regional_capacity_dict[region]
+                * utilization_dict[region]
+                * rng.uniform(0.85, 1.15),
+                country_code,
+                "Crude steel demand",
+            ]
+            for region, country_code in zip(region_list, country_codes)
+        ],
+        columns=["year", "region", "value", "country_code", "metric"],
+    ).set_index(["year", "metric"])
+
+    regional_costs = dict(zip(country_codes, rng.uniform(250, 450, len(region_list))))
+    variable_cost_df = pd.DataFrame(
+        [
+            [country_code, cost_year, technology, regional_costs[country_code] + idx * 20]
+            for country_code in country_codes
+            for cost_year in year_range
+            for idx, technology in enumerate(BENCHMARK_TECHNOLOGIES)
+        ],
+        columns=["country_code", "year", "technology", "cost"],
+    ).set_index(["country_code", "year", "technology"])
+    capex_dict = {
+        "other_opex": pd.DataFrame(
+            [
+                [technology, cost_year, 40.0]
+                for technology in BENCHMARK_TECHNOLOGIES
+                for cost_year in year_range
+            ],
+            columns=["technology", "year", "value"],
+        ).set_index(["technology", "year"])
+    }
+    tech_choices_ref = {
+        year
+        - 1: dict(
+            zip(
+                plant_df["plant_name"],
+                rng.choice(BENCHMARK_TECHNOLOGIES, len(plant_df)),
+            )
+        )
+    }
+    market_container = MarketContainerClass()
+    market_container.full_instantiation(year_range, list(region_list))
+    return {
+        "market_container": market_container,
+        "utilization_container": utilization_container,
+        "capacity_container": capacity_container,
+        "steel_demand_index": SteelDemandIndex(steel_demand_df),
+        "variable_cost_df": variable_cost_df,
+        "plant_df": plant_df,
+        "capex_dict": capex_dict,
+        "tech_choices_ref": tech_choices_ref,
+        "year": year,
+        "util_min": CAPACITY_UTILIZATION_CUTOFF_FOR_CLOSING_PLANT_DECISION,
+        "util_max": CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION,
+        "region_list": list(region_list),
+        "pct_boundary_dict": {region: 0.05 for region in region_list},
+    }
+
+
+def run_trade_engine(trade_engine: str, trade_inputs: dict) -> dict:
+    """Runs a trade engine on a copy of the trade inputs and summarises the results.
+
+    Args:
+        trade_engine (str): The trade engine to run: `cascade` or `lp`.
+        trade_inputs (dict): The inputs created by `create_synthetic_trade_inputs`.
+
+    Returns:
+        dict: The runtime, the error (if the engine failed) and a DataFrame of the regional production, trade and plant changes.
+    """
+    trade_inputs = deepcopy(trade_inputs)
+    market_container = trade_inputs["market_container"]
+    year = trade_inputs["year"]
+    start_time = time.perf_counter()
+    try:
+        results_container = TRADE_ENGINE_FUNCTIONS[trade_engine](**trade_inputs)
+    except (AssertionError, KeyError, ValueError) as error:
+        return {
+            "runtime": time.perf_counter() - start_time,
+            "error": f"{type(error).__name__}: {str(error)[:200]}",
+            "results": pd.DataFrame(),
+        }
+    runtime = time.perf_counter() - start_time
+    results = pd.DataFrame(
+        [
+            {
+                "region": region,
+                "production": results_container[region]["new_utilized_capacity"],
+                "imports": market_container.trade_container_getter(
+                    year, region, "imports"
+                ),
+                "exports": market_container.trade_container_getter(
+                    year, region, "exports"
+                ),
+                "utilization": results_container[region]["new_utilization"],
+                "plants_required": results_container[region]["plants_required"],
+                "plants_to_close": results_container[region]["plants_to_close"],
+            }
+            for region in trade_inputs["region_list"]
+        ]
+    ).set_index("region")
+    return {"runtime": runtime, "error": "", "results": results}
+
+
+def compare_trade_engines(trade_inputs: dict) -> pd.DataFrame:
+    """Runs both trade engines on the same trade inputs and compares their runtime and results.
+
+    Args:
+        trade_inputs (dict): The inputs created by `create_synthetic_trade_inputs`.
+
+    Returns:
+        pd.DataFrame: One row per engine with the runtime, the global trade and plant changes and the production cost.
+    """
+    regional_costs = (
+        trade_inputs["variable_cost_df"]
+        .xs(trade_inputs["year"] - 1, level="year")
+        .groupby("country_code")["cost"]
+        .mean()
+    )
+    region_costs = (
+        trade_inputs["plant_df"]
+        .drop_duplicates("rmi_region")
+        .set_index("rmi_region")["country_code"]
+        .map(regional_costs)
+    )
+    comparison: List[dict] = []
+    for trade_engine in TRADE_ENGINE_FUNCTIONS:
+        engine_run = run_trade_engine(trade_engine, trade_inputs)
+        results = engine_run["results"]
+        entry = {
+            "trade_engine": trade_engine,
+            "regions": len(trade_inputs["region_list"]),
+            "runtime": engine_run["runtime"],
+            "error": engine_run["error"],
+        }
+        if not results.empty:
+            entry.update(
+                {
+                    "production": results["production"].sum(),
+                    "trade": results["exports"].sum(),
+                    "plants_required": results["plants_required"].sum(),
+                    "plants_to_close": results["plants_to_close"].sum(),
+                    "production_cost": (
+                        results["production"]
+                        * region_costs.reindex(results.index)
+                        * MEGATON_TO_KILOTON_FACTOR
+                    ).sum(),
+                }
+            )
+        comparison.append(entry)
+    return pd.DataFrame(comparison)
+
+
+def benchmark_trade_engines(
+    region_counts: Sequence[int] = (50, 200),
+    plants_per_region: int = 20,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Compares the trade engines on the model's regional schema and on synthetic finer regional schemas (e.g. country-level).
+
+    Args:
+        region_counts (Sequence[int], optional): The number of synthetic regions of the finer schemas. Defaults to (50, 200).
+        plants_per_region (int, optional): The number of plants in each region. Defaults to 20.
+        seed (int, optional): The seed of the synthetic markets. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: The output of `compare_trade_engines` for every regional schema.
+    """
+    region_lists = [REGION_LIST] + [
+        [f"Region {idx:04d}" for idx in range(region_count)]
+        for region_count in region_counts
+    ]
+    benchmark = pd.concat(
+        [
+            compare_trade_engines(
+                create_synthetic_trade_inputs(
+                    region_list, plants_per_region=plants_per_region, seed=seed
+                )
+            )
+            for region_list in region_lists
+        ]
+    ).reset_index(drop=True)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Trade engine benchmark\n%s", benchmark.to_string())
+    return benchmark
+
+
+if __name__ == "__main__":
+    benchmark_trade_engines()
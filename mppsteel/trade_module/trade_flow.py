@@ -1,5 +1,6 @@
 """Module that contains the trade functions"""
 
+import logging
 from typing import List, Sequence
 import pandas as pd
 
@@ -14,7 +15,7 @@ from mppsteel.config.reference_lists import REGION_LIST
 from mppsteel.plant_classes.capacity_container_class import CapacityContainerClass
 from mppsteel.model_solver.market_container_class import MarketContainerClass
 from mppsteel.plant_classes.regional_utilization_class import UtilizationContainerClass
-from mppsteel.data_load_and_format.reg_steel_demand_formatter import steel_demand_getter
+from mppsteel.data_load_and_format.reg_steel_demand_formatter import SteelDemandIndex
 from mppsteel.trade_module.trade_helpers import (
     TradeStatus,
     calculate_cos,
@@ -53,7 +54,7 @@ def trade_flow(
     market_container: MarketContainerClass,
     utilization_container: UtilizationContainerClass,
     capacity_container: CapacityContainerClass,
-    steel_demand_df: pd.DataFrame,
+    steel_demand_index: SteelDemandIndex,
     variable_cost_df: pd.DataFrame,
     plant_df: pd.DataFrame,
     capex_dict: dict,
@@ -61,6 +62,8 @@ def trade_flow(
     year: int,
     util_min: float = CAPACITY_UTILIZATION_CUTOFF_FOR_CLOSING_PLANT_DECISION,
     util_max: float = CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION,
+    region_list: Sequence[str] = REGION_LIST,
+    pct_boundary_dict: dict = TRADE_PCT_BOUNDARY_FACTOR_DICT,
 ) -> dict:
     """Modifies an open close dictionary of metadata for each region. The following optimization steps are taken by the algorithm.
     1) Determine whether a plant can meet its current regional demand with its current utilization levels.
@@ -71,7 +74,7 @@ def trade_flow(
         market_container (MarketContainerClass): The MaterialUsage Instance containing the material usage state.
         utilization_container (UtilizationContainerClass): The UtilizationContainerClass Instance containing the utilization state.
         capacity_container (CapacityContainerClass): The CapacityContainerClass Instance containing the capacity state.
-        steel_demand_df (pd.DataFrame): The steel demand DataFrame.
+        steel_demand_index (SteelDemandIndex): The SteelDemandIndex Instance containing the steel demand data.
         variable_costs_df (pd.DataFrame): The variable costs reference DataFrame.
         plant_df (pd.DataFrame): The steel plant DataFrame.
         capex_dict (dict): The capex reference dictionary.
@@ -79,6 +82,8 @@ def trade_flow(
         year (int): The current model year.
         util_min (float, optional): The minimum capacity utilization that plants are allowed to reach before having to close existing plants. Defaults to CAPACITY_UTILIZATION_CUTOFF_FOR_CLOSING_PLANT_DECISION.
         util_max (float, optional): The maximum capacity utilization that plants are allowed to reach before having to open new plants. Defaults to CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION.
+        region_list (Sequence[str], optional): The regions to balance. Defaults to REGION_LIST.
+        pct_boundary_dict (dict, optional): The percentage boundary around the mean cost of steelmaking of each region. Defaults to TRADE_PCT_BOUNDARY_FACTOR_DICT.
 
     Returns:
         dict: A dictionary of open close metadata for each region.
@@ -93,17 +98,16 @@ def trade_flow(
         capacity_container,
     )
     relative_production_cost_df = check_relative_production_cost(
-        cos_df, "cost_of_steelmaking", TRADE_PCT_BOUNDARY_FACTOR_DICT, year
+        cos_df, "cost_of_steelmaking", pct_boundary_dict, year
     )
     trade_status_container = {}
     initial_overproduction_container = {}
     results_container = {}
-    region_list = REGION_LIST
     regional_capacity_dict = {region: 0 for region in region_list}
     cases: MYPY_DICT_STR_LIST = {region: [] for region in region_list}
     demand_dict = {
-        region: steel_demand_getter(
-            steel_demand_df, year=year, metric="crude", region=region
+        region: steel_demand_index.get_steel_demand(
+            year=year, metric="crude", region=region
         )
         for region in region_list
     }
@@ -253,18 +257,26 @@ def trade_flow(
         relative_production_cost_df["relative_cost_close_to_mean"] == True
     ]
 
-    logger.info(
-        f"TRADE BALANCING ROUND 1: Importing Regions: {join_list_as_string(importing_regions)} | Exporting Regions: {join_list_as_string(exporting_regions)} | Balanced Regions: {join_list_as_string(balanced_regions)}"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "TRADE BALANCING ROUND 1: Importing Regions: %s | Exporting Regions: %s | Balanced Regions: %s",
+            join_list_as_string(importing_regions),
+            join_list_as_string(exporting_regions),
+            join_list_as_string(balanced_regions),
+        )
 
     if round(global_trade_balance, TRADE_ROUNDING_NUMBER) == 0:
         logger.info(
-            f"TRADE BALANCING ROUND 2: Trade Balance is completely balanced at {global_trade_balance: .2f} Mt in year {year}"
+            "TRADE BALANCING ROUND 2: Trade Balance is completely balanced at % .2f Mt in year %s",
+            global_trade_balance,
+            year,
         )
 
     elif round(global_trade_balance, TRADE_ROUNDING_NUMBER) > 0:
         logger.info(
-            f"TRADE BALANCING ROUND 2-A: Trade Balance Surplus of {global_trade_balance: .2f} Mt in year {year}. Balancing to zero."
+            "TRADE BALANCING ROUND 2-A: Trade Balance Surplus of % .2f Mt in year %s. Balancing to zero.",
+            global_trade_balance,
+            year,
         )
         for region in exporting_regions:
             current_utilization = utilization_container.get_utilization_values(
@@ -297,7 +309,8 @@ def trade_flow(
                 )
 
         logger.info(
-            f"TRADE BALANCING ROUND 2-B: Reducing excess trade balance of {global_trade_balance :0.2f} via closing plants"
+            "TRADE BALANCING ROUND 2-B: Reducing excess trade balance of %0.2f via closing plants",
+            global_trade_balance,
         )
         exporting_regions = market_container.list_regional_types(year, "exports")
         regions_close_mean = regions_with_cost_close_to_mean.index.to_list()
@@ -341,7 +354,9 @@ def trade_flow(
 
     elif round(global_trade_balance, TRADE_ROUNDING_NUMBER) < 0:
         logger.info(
-            f"TRADE BALANCING ROUND 3: Trade Balance Deficit of {global_trade_balance: .2f} Mt in year {year}, balancing to zero via utilization optimization."
+            "TRADE BALANCING ROUND 3: Trade Balance Deficit of % .2f Mt in year %s, balancing to zero via utilization optimization.",
+            global_trade_balance,
+            year,
         )
         non_import_status_regions = [
             region
@@ -380,7 +395,8 @@ def trade_flow(
                 and round(global_trade_balance, TRADE_ROUNDING_NUMBER) < 0
             ):
                 logger.info(
-                    f"TRADE BALANCING ROUND 3-A: {region} can supply all of the import demand."
+                    "TRADE BALANCING ROUND 3-A: %s can supply all of the import demand.",
+                    region,
                 )
                 (
                     results_container,
@@ -403,7 +419,10 @@ def trade_flow(
                 global_trade_balance
             ):
                 logger.info(
-                    f"TRADE BALANCING ROUND 3-B: {region} can supply {potential_extra_production :0.2f} of the import demand of {global_trade_balance :0.2f}."
+                    "TRADE BALANCING ROUND 3-B: %s can supply %0.2f of the import demand of %0.2f.",
+                    region,
+                    potential_extra_production,
+                    global_trade_balance,
                 )
                 (
                     results_container,
@@ -430,7 +449,9 @@ def trade_flow(
                 "cost_of_steelmaking"
             ].idxmin()
             logger.info(
-                f"TRADE BALANCING ROUND 3-C: Assigning trade balance of {global_trade_balance: .2f} Mt to cheapest region: {cheapest_region}"
+                "TRADE BALANCING ROUND 3-C: Assigning trade balance of % .2f Mt to cheapest region: %s",
+                global_trade_balance,
+                cheapest_region,
             )
             (
                 results_container,
@@ -467,7 +488,9 @@ def trade_flow(
 
     if round(global_trade_balance, TRADE_ROUNDING_NUMBER) == 0:
         logger.info(
-            f"Trade Balance is completely balanced at {global_trade_balance: 4f} Mt in year {year}"
+            "Trade Balance is completely balanced at % 4f Mt in year %s",
+            global_trade_balance,
+            year,
         )
     else:
         raise AssertionError(
@@ -490,7 +513,9 @@ def trade_flow(
         utilization_container, results_container, year, util_min, util_max, cases
     )
 
-    logger.info(f"Final Trade Balance is {global_trade_balance: .2f} Mt in year {year}")
+    logger.info(
+        "Final Trade Balance is % .2f Mt in year %s", global_trade_balance, year
+    )
     return results_container
 
 
@@ -11,7 +11,10 @@ from mppsteel.data_load_and_format.data_interface import (
     create_business_case_reference,
     create_capex_opex_dict,
 )
-from mppsteel.data_load_and_format.reg_steel_demand_formatter import get_steel_demand
+from mppsteel.data_load_and_format.reg_steel_demand_formatter import (
+    SteelDemandIndex,
+    get_steel_demand,
+)
 from mppsteel.data_load_and_format.steel_plant_formatter import (
     create_active_check_col,
     steel_plant_processor,
@@ -161,7 +164,7 @@ def test_trade_flow():
         market_container,
         utilization_container,
         capacity_container,
-        steel_demand_df,
+        SteelDemandIndex(steel_demand_df),
         variable_cost_df,
         active_plant_df,
         capex_dict,
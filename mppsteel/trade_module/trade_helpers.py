@@ -2,8 +2,9 @@
 
 from copy import deepcopy
 from enum import Enum
-from typing import List
+from typing import List, Sequence
 
+import numpy as np
 import pandas as pd
 
 from mppsteel.config.model_config import (
@@ -61,68 +62,81 @@ def check_relative_production_cost(
         pd.DataFrame: The COS DataFrame with new columns `relative_cost_below_avg` and `relative_cost_close_to_mean`
     """
 
-    def apply_upper_boundary(
-        row: pd.DataFrame, mean_value: float, pct_boundary_dict: dict
-    ) -> float:
-        return mean_value * (1 + (pct_boundary_dict[row["rmi_region"]]))
-
-    def close_to_mean_test(row: pd.DataFrame) -> bool:
-        return row["cost_of_steelmaking"] < row["upper_boundary"]
-
     df_c = cos_df.copy()
     mean_val = df_c[value_col].mean()
     df_c.reset_index(inplace=True)
-    df_c["upper_boundary"] = df_c.apply(
-        apply_upper_boundary,
-        mean_value=mean_val,
-        pct_boundary_dict=pct_boundary_dict,
-        axis=1,
+    pct_boundaries = np.array(
+        [pct_boundary_dict[region] for region in df_c["rmi_region"]], dtype=float
+    )
+    df_c["upper_boundary"] = mean_val * (1 + pct_boundaries)
+    df_c["relative_cost_below_avg"] = df_c[value_col] <= mean_val
+    df_c["relative_cost_close_to_mean"] = (
+        df_c["cost_of_steelmaking"] < df_c["upper_boundary"]
     )
-    df_c["relative_cost_below_avg"] = df_c[value_col].apply(lambda x: x <= mean_val)
-    df_c["relative_cost_close_to_mean"] = df_c.apply(close_to_mean_test, axis=1)
     df_c["year"] = year
     return df_c.set_index("rmi_region")
 
 
 def single_year_cos(
-    plant_capacity: float,
-    utilization_rate: float,
-    variable_cost: float,
-    other_opex_cost: float,
-) -> float:
-    """Applies the Cost of Steelmaking function to a given row in a DataFrame.
+    plant_capacity: np.ndarray,
+    utilization_rate: np.ndarray,
+    variable_cost: np.ndarray,
+    other_opex_cost: np.ndarray,
+) -> np.ndarray:
+    """Applies the Cost of Steelmaking function to arrays of plant values.
 
     Args:
-        row (_type_): A vectorized DataFrame row from .apply function.
-        year (int): The current year.
-        v_costs (pd.DataFrame): A DataFrame containing the variable costs for each technology across each year and region.
-        capex_costs (dict): A dictionary containing the Capex values for Greenfield, Brownfield and Other Opex values.
-        production_df (pd.DataFrame): A DataFrame containing the production values.
-        steel_scenario (str): A string containing the scenario to be used in the steel.
+        plant_capacity (np.ndarray): The capacity of each plant.
+        utilization_rate (np.ndarray): The utilization rate of each plant's region.
+        variable_cost (np.ndarray): The variable cost of each plant's technology.
+        other_opex_cost (np.ndarray): The other opex cost of each plant's technology.
 
     Returns:
-        float: The cost of Steelmaking value to be applied.
+        np.ndarray: The cost of Steelmaking value of each plant.
     """
-    return (
-        0
-        if utilization_rate == 0
-        else (plant_capacity * utilization_rate * (variable_cost + other_opex_cost))
+    return np.where(
+        utilization_rate == 0,
+        0,
+        plant_capacity * utilization_rate * (variable_cost + other_opex_cost),
     )
 
 
-def cos_value_generator(
-    row: pd.Series,
+def return_indexed_values(
+    df: pd.DataFrame, value_col: str, index_arrays: List[Sequence]
+) -> np.ndarray:
+    """Looks up the values of `value_col` for every key in `index_arrays` using the DataFrame's index.
+
+    Args:
+        df (pd.DataFrame): A DataFrame with a unique (Multi)Index.
+        value_col (str): The column to return the values of.
+        index_arrays (List[Sequence]): One array per index level, with one entry per key.
+
+    Raises:
+        KeyError: If any of the keys are not in the DataFrame's index.
+
+    Returns:
+        np.ndarray: The values, one per key.
+    """
+    keys = pd.MultiIndex.from_arrays(index_arrays)
+    positions = df.index.get_indexer(keys)
+    if (positions == -1).any():
+        raise KeyError(f"Keys not found: {list(keys[positions == -1])}")
+    return df[value_col].to_numpy()[positions]
+
+
+def cos_values_generator(
+    plant_df: pd.DataFrame,
     year: int,
     utilization_container: UtilizationContainerClass,
     v_costs: pd.DataFrame,
     capacity_dict: dict,
     tech_choices: dict,
     capex_costs: dict,
-) -> float:
-    """Generates COS values per steel plant row.
+) -> np.ndarray:
+    """Generates COS values for every steel plant in a DataFrame.
 
     Args:
-        row (pd.Series): A series containing metadata on a steel plant.
+        plant_df (pd.DataFrame): The steel plant DataFrame.
         year (int): The current model cycle year.
         utilization_container (UtilizationContainerClass): The open close metadata dictionary.
         v_costs (pd.DataFrame): Variable costs DataFrame.
@@ -131,17 +145,27 @@ def cos_value_generator(
         capex_costs (dict): Capex costs dictionary.
 
     Returns:
-        float: The COS value for the plant
+        np.ndarray: The COS value of each plant.
     """
-    technology = tech_choices[year][row.plant_name]
-    plant_capacity = capacity_dict[row.plant_name]
-    utilization_rate = utilization_container.get_utilization_values(
-        year, row.rmi_region
+    plant_names = plant_df["plant_name"].to_list()
+    technologies = [tech_choices[year][plant_name] for plant_name in plant_names]
+    years = [year] * len(plant_names)
+    regional_utilization_dict = utilization_container.get_utilization_values(year)
+    utilization_rates = np.array(
+        [regional_utilization_dict[region] for region in plant_df[MAIN_REGIONAL_SCHEMA]],
+        dtype=float,
+    )
+    plant_capacities = np.array(
+        [capacity_dict[plant_name] for plant_name in plant_names], dtype=float
+    )
+    variable_costs = return_indexed_values(
+        v_costs, "cost", [plant_df["country_code"].to_list(), years, technologies]
+    )
+    other_opex_costs = return_indexed_values(
+        capex_costs["other_opex"], "value", [technologies, years]
     )
-    variable_cost = v_costs.loc[row.country_code, year, technology]["cost"]
-    other_opex_cost = capex_costs["other_opex"].loc[technology, year]["value"]
     return single_year_cos(
-        plant_capacity, utilization_rate, variable_cost, other_opex_cost
+        plant_capacities, utilization_rates, variable_costs, other_opex_costs
     )
 
 
@@ -154,7 +178,7 @@ def calculate_cos(
     capex_costs: dict,
     capacity_container: CapacityContainerClass,
 ) -> pd.DataFrame:
-    """Calculates the COS as a column in a steel plant DataFrame.
+    """Calculates the COS of every steel plant and sums it by region.
 
     Args:
         plant_df (pd.DataFrame): The steel plant DataFrame.
@@ -168,39 +192,42 @@ def calculate_cos(
     Returns:
         pd.DataFrame: A Dataframe grouped by region and sorted by the new cost_of_steelmaking function.
     """
-    plant_df_c = plant_df.copy()
     capacity_dict = capacity_container.return_plant_capacity(year)
     reference_year = year if year == MODEL_YEAR_START else year - 1
-    plant_df_c["cost_of_steelmaking"] = plant_df_c.apply(
-        cos_value_generator,
-        year=reference_year,
-        utilization_container=utilization_container,
-        v_costs=v_costs,
-        capacity_dict=capacity_dict,
-        tech_choices=tech_choices,
-        capex_costs=capex_costs,
-        axis=1,
+    plant_cos = pd.DataFrame(
+        {
+            MAIN_REGIONAL_SCHEMA: plant_df[MAIN_REGIONAL_SCHEMA].to_numpy(),
+            "cost_of_steelmaking": cos_values_generator(
+                plant_df,
+                reference_year,
+                utilization_container,
+                v_costs,
+                capacity_dict,
+                tech_choices,
+                capex_costs,
+            ),
+        }
     )
     regional_capacity_dict = capacity_container.return_regional_capacity(reference_year)
     regional_utilization_dict = utilization_container.get_utilization_values(
         reference_year
     )
     cos_df = (
-        plant_df_c[[MAIN_REGIONAL_SCHEMA, "cost_of_steelmaking"]]
-        .groupby([MAIN_REGIONAL_SCHEMA])
+        plant_cos.groupby([MAIN_REGIONAL_SCHEMA])
         .sum()
         .sort_values(by="cost_of_steelmaking", ascending=True)
         .reset_index()
-        .copy()
     )
-
-    def final_cos_adjustment(row):
-        return row.cost_of_steelmaking / (
-            regional_capacity_dict[row.rmi_region]
-            * regional_utilization_dict[row.rmi_region]
-        )
-
-    cos_df["cost_of_steelmaking"] = cos_df.apply(final_cos_adjustment, axis=1)
+    regional_utilized_capacity = np.array(
+        [
+            regional_capacity_dict[region] * regional_utilization_dict[region]
+            for region in cos_df[MAIN_REGIONAL_SCHEMA]
+        ],
+        dtype=float,
+    )
+    cos_df["cost_of_steelmaking"] = (
+        cos_df["cost_of_steelmaking"].to_numpy() / regional_utilized_capacity
+    )
     return cos_df.set_index(MAIN_REGIONAL_SCHEMA)
 
 
@@ -414,13 +441,13 @@ def test_utilization_values(
     cases = cases or {region: "" for region in util_container}
     if overutilized_regions:
         for region in overutilized_regions:
-            print(f"{region}: {util_container[region]} -> {cases[region]}")
+            logger.error("%s: %s -> %s", region, util_container[region], cases[region])
         raise AssertionError(
             f"Regions Overutilized in {year}: {util_container} {overutilized_regions}"
         )
     if underutilized_regions:
         for region in underutilized_regions:
-            print(f"{region}: {util_container[region]} -> {cases[region]}")
+            logger.error("%s: %s -> %s", region, util_container[region], cases[region])
         raise AssertionError(
             f"Regions Underutilized in {year}: {underutilized_regions}"
         )
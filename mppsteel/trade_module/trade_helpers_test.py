@@ -1,4 +1,13 @@
-from mppsteel.trade_module.trade_helpers import return_trade_status, TradeStatus
+import pandas as pd
+
+from mppsteel.plant_classes.capacity_container_class import CapacityContainerClass
+from mppsteel.plant_classes.regional_utilization_class import UtilizationContainerClass
+from mppsteel.trade_module.trade_helpers import (
+    calculate_cos,
+    check_relative_production_cost,
+    return_trade_status,
+    TradeStatus,
+)
 
 
 def test_return_trade_status():
@@ -6,3 +15,61 @@ def test_return_trade_status():
     assert return_trade_status(True, -2) == TradeStatus.DOMESTIC
     assert return_trade_status(False, 2) == TradeStatus.DOMESTIC
     assert return_trade_status(False, -2) == TradeStatus.IMPORTER
+
+
+def test_calculate_cos():
+    plant_df = pd.DataFrame(
+        {
+            "plant_name": ["plant_a", "plant_b", "plant_c"],
+            "country_code": ["DEU", "IND", "FRA"],
+            "rmi_region": ["Europe", "India", "Europe"],
+            "plant_capacity": [1000.0, 2000.0, 1500.0],
+        }
+    )
+    capacity_container = CapacityContainerClass()
+    capacity_container.instantiate_container(range(2020, 2022))
+    for year in [2020, 2021]:
+        capacity_container.start_year(year)
+        capacity_container.sync_capacities(plant_df, year)
+    utilization_container = UtilizationContainerClass()
+    utilization_container.initiate_container(range(2020, 2022), ["Europe", "India"])
+    utilization_container.assign_year_utilization(2020, {"Europe": 0.8, "India": 0.5})
+    tech_choices = {2020: {"plant_a": "EAF", "plant_b": "Avg BF-BOF", "plant_c": "EAF"}}
+    v_costs = pd.DataFrame(
+        [
+            ["DEU", 2020, "EAF", 300.0],
+            ["FRA", 2020, "EAF", 320.0],
+            ["IND", 2020, "Avg BF-BOF", 250.0],
+        ],
+        columns=["country_code", "year", "technology", "cost"],
+    ).set_index(["country_code", "year", "technology"])
+    capex_costs = {
+        "other_opex": pd.DataFrame(
+            [["EAF", 2020, 20.0], ["Avg BF-BOF", 2020, 40.0]],
+            columns=["technology", "year", "value"],
+        ).set_index(["technology", "year"])
+    }
+    cos_df = calculate_cos(
+        plant_df,
+        2021,
+        utilization_container,
+        v_costs,
+        tech_choices,
+        capex_costs,
+        capacity_container,
+    )
+    # regions are sorted by their summed plant COS, capacities are stored in Mt
+    assert list(cos_df.index) == ["India", "Europe"]
+    assert cos_df.loc["Europe", "cost_of_steelmaking"] == (
+        1 * 0.8 * (300.0 + 20.0) + 1.5 * 0.8 * (320.0 + 20.0)
+    ) / (2.5 * 0.8)
+    assert cos_df.loc["India", "cost_of_steelmaking"] == 290.0
+
+    relative_cost_df = check_relative_production_cost(
+        cos_df, "cost_of_steelmaking", {"Europe": 0.1, "India": 0.1}, 2021
+    )
+    assert relative_cost_df["relative_cost_below_avg"].to_dict() == {
+        "India": True,
+        "Europe": False,
+    }
+    assert relative_cost_df["relative_cost_close_to_mean"].all()
@@ -0,0 +1,349 @@
+"""Module that contains the linear programming trade engine"""
+
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import Bounds, LinearConstraint, milp
+from scipy.sparse import csr_matrix, hstack, identity
+
+from mppsteel.config.model_config import (
+    CAPACITY_UTILIZATION_CUTOFF_FOR_CLOSING_PLANT_DECISION,
+    CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION,
+    TRADE_LP_CLOSED_CAPACITY_COST_FACTOR,
+    TRADE_LP_EXPORT_COST_FACTOR,
+    TRADE_LP_NEW_CAPACITY_COST_FACTOR,
+    TRADE_PCT_BOUNDARY_FACTOR_DICT,
+    TRADE_ROUNDING_NUMBER,
+)
+from mppsteel.config.reference_lists import REGION_LIST
+from mppsteel.plant_classes.capacity_container_class import CapacityContainerClass
+from mppsteel.model_solver.market_container_class import MarketContainerClass
+from mppsteel.plant_classes.regional_utilization_class import UtilizationContainerClass
+from mppsteel.data_load_and_format.reg_steel_demand_formatter import SteelDemandIndex
+from mppsteel.trade_module.trade_helpers import (
+    TradeStatus,
+    calculate_cos,
+    check_relative_production_cost,
+    merge_trade_status_col_to_rpc_df,
+    return_trade_status,
+    test_capacity_values,
+    test_market_dict_output,
+    test_open_close_plants,
+    test_production_equals_demand,
+    test_production_values,
+    test_regional_production,
+    test_utilization_values,
+)
+from mppsteel.trade_module.trade_logic import create_plant_change_dict
+from mppsteel.utility.log_utility import get_logger
+
+logger = get_logger(__name__)
+
+# the variable blocks of the trade problem, each with one variable per region
+TRADE_LP_VARIABLES = [
+    "production",
+    "imports",
+    "exports",
+    "plants_required",
+    "plants_to_close",
+]
+
+
+def create_trade_lp_problem(
+    capacities: np.ndarray,
+    demands: np.ndarray,
+    costs: np.ndarray,
+    import_flags: np.ndarray,
+    export_flags: np.ndarray,
+    avg_plant_capacity: float,
+    util_min: float,
+    util_max: float,
+    new_capacity_cost: float,
+    closed_capacity_cost: float,
+    export_cost: float,
+) -> dict:
+    """Formulates the regional production, trade and plant changes of a year as one mixed integer linear program.
+    For every region, production = demand - imports + exports, and production has to be within the utilization boundaries of the region's capacity after plants are opened or closed.
+    Global exports have to equal global imports. The objective is the total cost of production plus the cost of new capacity, closed capacity and exports.
+
+    Args:
+        capacities (np.ndarray): The capacity of each region.
+        demands (np.ndarray): The demand of each region.
+        costs (np.ndarray): The cost of steelmaking of each region.
+        import_flags (np.ndarray): Boolean flags for the regions that are allowed to import.
+        export_flags (np.ndarray): Boolean flags for the regions that are allowed to export.
+        avg_plant_capacity (float): The capacity of a new or closed plant.
+        util_min (float): The minimum utilization of a region's capacity.
+        util_max (float): The maximum utilization of a region's capacity.
+        new_capacity_cost (float): The cost of a Mt of new capacity.
+        closed_capacity_cost (float): The cost of a Mt of closed capacity.
+        export_cost (float): The cost of a Mt of exports.
+
+    Returns:
+        dict: The keyword arguments for `scipy.optimize.milp`. The variables are ordered in the blocks of TRADE_LP_VARIABLES.
+    """
+    number_of_regions = len(capacities)
+    eye = identity(number_of_regions, format="csr")
+    zeros = csr_matrix((number_of_regions, number_of_regions))
+    ones = np.ones((1, number_of_regions))
+    no_regions = np.zeros((1, number_of_regions))
+    balance_matrix = hstack([eye, eye, -eye, zeros, zeros])
+    trade_matrix = csr_matrix(
+        np.hstack([no_regions, -ones, ones, no_regions, no_regions])
+    )
+    plant_block = avg_plant_capacity * eye
+    max_capacity_matrix = hstack(
+        [eye, zeros, zeros, -util_max * plant_block, util_max * plant_block]
+    )
+    min_capacity_matrix = hstack(
+        [eye, zeros, zeros, -util_min * plant_block, util_min * plant_block]
+    )
+    constraints = [
+        LinearConstraint(balance_matrix, demands, demands),
+        LinearConstraint(trade_matrix, 0, 0),
+        LinearConstraint(max_capacity_matrix, -np.inf, util_max * capacities),
+        LinearConstraint(min_capacity_matrix, util_min * capacities, np.inf),
+    ]
+    # as in the cascade, only the capacity in excess of the regional demand at the minimum utilization can be closed
+    max_plants_to_close = np.clip(
+        np.ceil((capacities - demands / util_min) / avg_plant_capacity),
+        0,
+        np.maximum(np.ceil(capacities / avg_plant_capacity) - 1, 0),
+    )
+    lower_bounds = np.zeros(len(TRADE_LP_VARIABLES) * number_of_regions)
+    upper_bounds = np.concatenate(
+        [
+            np.full(number_of_regions, np.inf),
+            np.where(import_flags, demands, 0),
+            np.where(export_flags, np.inf, 0),
+            np.full(number_of_regions, np.inf),
+            max_plants_to_close,
+        ]
+    )
+    objective = np.concatenate(
+        [
+            costs,
+            np.zeros(number_of_regions),
+            np.full(number_of_regions, export_cost),
+            np.full(number_of_regions, new_capacity_cost * avg_plant_capacity),
+            np.full(number_of_regions, closed_capacity_cost * avg_plant_capacity),
+        ]
+    )
+    integrality = np.concatenate(
+        [np.zeros(3 * number_of_regions), np.ones(2 * number_of_regions)]
+    )
+    return {
+        "c": objective,
+        "constraints": constraints,
+        "bounds": Bounds(lower_bounds, upper_bounds),
+        "integrality": integrality,
+    }
+
+
+def solve_trade_lp_problem(
+    problem: dict, number_of_regions: int
+) -> Dict[str, np.ndarray]:
+    """Solves a problem created by `create_trade_lp_problem` with the HiGHS solver.
+
+    Args:
+        problem (dict): The problem created by `create_trade_lp_problem`.
+        number_of_regions (int): The number of regions in the problem.
+
+    Raises:
+        ValueError: If the solver does not find an optimal solution.
+
+    Returns:
+        Dict[str, np.ndarray]: A dictionary of TRADE_LP_VARIABLES: the solution value of each region.
+    """
+    result = milp(**problem)
+    if not result.success:
+        raise ValueError(f"The trade LP could not be solved: {result.message}")
+    solution = result.x.reshape(len(TRADE_LP_VARIABLES), number_of_regions)
+    solution_dict = dict(zip(TRADE_LP_VARIABLES, solution))
+    for variable in ["plants_required", "plants_to_close"]:
+        solution_dict[variable] = np.round(solution_dict[variable]).astype(int)
+    solution_dict["imports"] = np.clip(solution_dict["imports"], 0, None)
+    solution_dict["exports"] = np.clip(solution_dict["exports"], 0, None)
+    return solution_dict
+
+
+def trade_flow_lp(
+    market_container: MarketContainerClass,
+    utilization_container: UtilizationContainerClass,
+    capacity_container: CapacityContainerClass,
+    steel_demand_index: SteelDemandIndex,
+    variable_cost_df: pd.DataFrame,
+    plant_df: pd.DataFrame,
+    capex_dict: dict,
+    tech_choices_ref: dict,
+    year: int,
+    util_min: float = CAPACITY_UTILIZATION_CUTOFF_FOR_CLOSING_PLANT_DECISION,
+    util_max: float = CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION,
+    region_list: Sequence[str] = REGION_LIST,
+    pct_boundary_dict: dict = TRADE_PCT_BOUNDARY_FACTOR_DICT,
+) -> dict:
+    """Alternative to `trade_flow` that balances all regions at once by solving a linear program (see `create_trade_lp_problem`) instead of the regional cascade.
+    The regions' trade statuses are determined as in `trade_flow`. Importers are the only regions that can import and cannot export.
+    Fills the market, utilization and results containers in the same format as `trade_flow`.
+
+    Args:
+        market_container (MarketContainerClass): The MaterialUsage Instance containing the material usage state.
+        utilization_container (UtilizationContainerClass): The UtilizationContainerClass Instance containing the utilization state.
+        capacity_container (CapacityContainerClass): The CapacityContainerClass Instance containing the capacity state.
+        steel_demand_index (SteelDemandIndex): The SteelDemandIndex Instance containing the steel demand data.
+        variable_costs_df (pd.DataFrame): The variable costs reference DataFrame.
+        plant_df (pd.DataFrame): The steel plant DataFrame.
+        capex_dict (dict): The capex reference dictionary.
+        tech_choices_container (PlantChoices): The PlantChoices Instance containing the Technology Choices state.
+        year (int): The current model year.
+        util_min (float, optional): The minimum capacity utilization that plants are allowed to reach before having to close existing plants. Defaults to CAPACITY_UTILIZATION_CUTOFF_FOR_CLOSING_PLANT_DECISION.
+        util_max (float, optional): The maximum capacity utilization that plants are allowed to reach before having to open new plants. Defaults to CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION.
+        region_list (Sequence[str], optional): The regions to balance. Defaults to REGION_LIST.
+        pct_boundary_dict (dict, optional): The percentage boundary around the mean cost of steelmaking of each region. Defaults to TRADE_PCT_BOUNDARY_FACTOR_DICT.
+
+    Returns:
+        dict: A dictionary of open close metadata for each region.
+    """
+    cos_df = calculate_cos(
+        plant_df,
+        year,
+        utilization_container,
+        variable_cost_df,
+        tech_choices_ref,
+        capex_dict,
+        capacity_container,
+    )
+    relative_production_cost_df = check_relative_production_cost(
+        cos_df, "cost_of_steelmaking", pct_boundary_dict, year
+    )
+    demand_dict = {
+        region: steel_demand_index.get_steel_demand(
+            year=year, metric="crude", region=region
+        )
+        for region in region_list
+    }
+    avg_plant_capacity_value = capacity_container.return_avg_capacity_value()
+    plant_change_dicts = {}
+    trade_status_container = {}
+    initial_overproduction_container = {}
+    for region in region_list:
+        plant_change_dict = create_plant_change_dict(
+            capacity_container,
+            utilization_container,
+            year,
+            region,
+            demand_dict,
+            util_min,
+            util_max,
+        )
+        initial_balance = plant_change_dict["initial_balance"]
+        initial_overproduction_container[region] = initial_balance > 0
+        trade_status_container[region] = return_trade_status(
+            relative_production_cost_df.loc[region]["relative_cost_close_to_mean"],
+            initial_balance,
+        ).value
+        plant_change_dicts[region] = plant_change_dict
+
+    capacities = np.array(
+        [plant_change_dicts[region]["capacity"] for region in region_list], dtype=float
+    )
+    demands = np.array(
+        [plant_change_dicts[region]["demand"] for region in region_list], dtype=float
+    )
+    costs = relative_production_cost_df["cost_of_steelmaking"]
+    mean_cost = costs.mean()
+    importers = np.array(
+        [
+            trade_status_container[region] == TradeStatus.IMPORTER.value
+            for region in region_list
+        ]
+    )
+    problem = create_trade_lp_problem(
+        capacities,
+        demands,
+        costs.reindex(region_list).fillna(mean_cost).to_numpy(dtype=float),
+        importers,
+        ~importers,
+        avg_plant_capacity_value,
+        util_min,
+        util_max,
+        TRADE_LP_NEW_CAPACITY_COST_FACTOR * mean_cost,
+        TRADE_LP_CLOSED_CAPACITY_COST_FACTOR * mean_cost,
+        TRADE_LP_EXPORT_COST_FACTOR * mean_cost,
+    )
+    solution = solve_trade_lp_problem(problem, len(region_list))
+
+    results_container = {}
+    regional_capacity_dict = {}
+    cases = {}
+    for idx, region in enumerate(region_list):
+        plant_change_dict = plant_change_dicts[region]
+        demand = demands[idx]
+        imports = min(solution["imports"][idx], demand)
+        exports = solution["exports"][idx]
+        plants_required = solution["plants_required"][idx]
+        plants_to_close = solution["plants_to_close"][idx]
+        new_capacity_required = (
+            plants_required - plants_to_close
+        ) * avg_plant_capacity_value
+        new_total_capacity = capacities[idx] + new_capacity_required
+        production = (demand - imports) + exports
+        market_container.assign_market_tuple(
+            year,
+            region,
+            market_container.return_market_entry(demand - imports, imports, exports),
+        )
+        cases[region] = [
+            case
+            for case, flag in [
+                ("LP: open plants", plants_required > 0),
+                ("LP: close plants", plants_to_close > 0),
+                ("LP: import", round(imports, TRADE_ROUNDING_NUMBER) > 0),
+                ("LP: export", round(exports, TRADE_ROUNDING_NUMBER) > 0),
+            ]
+            if flag
+        ] or ["LP: domestic supply"]
+        plant_change_dict["plants_required"] = plants_required
+        plant_change_dict["plants_to_close"] = plants_to_close
+        plant_change_dict["new_capacity_required"] = new_capacity_required
+        plant_change_dict["new_total_capacity"] = new_total_capacity
+        plant_change_dict["new_utilized_capacity"] = production
+        plant_change_dict["new_balance"] = production - demand
+        plant_change_dict["new_utilization"] = production / new_total_capacity
+        plant_change_dict["cases"] = cases[region]
+        test_market_dict_output(plant_change_dict, util_min, util_max)
+        utilization_container.update_region(
+            year, region, plant_change_dict["new_utilization"]
+        )
+        regional_capacity_dict[region] = new_total_capacity
+        results_container[region] = plant_change_dict
+
+    relative_production_cost_df = merge_trade_status_col_to_rpc_df(
+        relative_production_cost_df,
+        trade_status_container,
+        initial_overproduction_container,
+    )
+    market_container.store_results(
+        year, relative_production_cost_df.reset_index(), "competitiveness"
+    )
+
+    global_trade_balance = market_container.trade_container_aggregator(year, "trade")
+    assert (
+        round(global_trade_balance, TRADE_ROUNDING_NUMBER) == 0
+    ), f"Trade Balance is not equal to zero after the trade LP -> {global_trade_balance: .2f} ||| {market_container.trade_container_getter(year)}"
+    global_production = market_container.trade_container_aggregator(year, "production")
+    global_demand = sum(demand_dict.values())
+    test_regional_production(results_container, relative_production_cost_df, cases)
+    test_open_close_plants(results_container, cases)
+    test_production_values(results_container, market_container, cases, year)
+    test_capacity_values(results_container, regional_capacity_dict, cases)
+    test_production_equals_demand(global_demand, global_production)
+    test_utilization_values(
+        utilization_container, results_container, year, util_min, util_max, cases
+    )
+
+    logger.info(
+        "Final Trade Balance is % .2f Mt in year %s", global_trade_balance, year
+    )
+    return results_container
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from mppsteel.trade_module.trade_engine_benchmark import (
+    create_synthetic_trade_inputs,
+    run_trade_engine,
+)
+from mppsteel.trade_module.trade_lp_engine import (
+    create_trade_lp_problem,
+    solve_trade_lp_problem,
+)
+
+
+def test_trade_lp_imports_from_cheaper_region():
+    problem = create_trade_lp_problem(
+        capacities=np.array([100.0, 100.0]),
+        demands=np.array([70.0, 70.0]),
+        costs=np.array([300.0, 500.0]),
+        import_flags=np.array([False, True]),
+        export_flags=np.array([True, False]),
+        avg_plant_capacity=2.5,
+        util_min=0.6,
+        util_max=0.95,
+        new_capacity_cost=400.0,
+        closed_capacity_cost=400.0,
+        export_cost=4.0,
+    )
+    solution = solve_trade_lp_problem(problem, 2)
+    # the expensive region produces at minimum utilization and imports the rest
+    assert solution["production"] == pytest.approx([80.0, 60.0])
+    assert solution["imports"] == pytest.approx([0.0, 10.0])
+    assert solution["exports"] == pytest.approx([10.0, 0.0])
+    assert list(solution["plants_required"]) == [0, 0]
+    assert list(solution["plants_to_close"]) == [0, 0]
+
+
+def test_trade_lp_balances_market():
+    trade_inputs = create_synthetic_trade_inputs(
+        [f"Region {idx}" for idx in range(30)], plants_per_region=5
+    )
+    engine_run = run_trade_engine("lp", trade_inputs)
+    assert not engine_run["error"]
+    results = engine_run["results"]
+    demand = sum(
+        trade_inputs["steel_demand_index"].get_steel_demand(
+            year=trade_inputs["year"], metric="crude", region=region
+        )
+        for region in trade_inputs["region_list"]
+    )
+    assert results["production"].sum() == pytest.approx(demand)
+    assert results["exports"].sum() == pytest.approx(results["imports"].sum())
+    assert results["utilization"].between(0.6 - 1e-6, 0.95 + 1e-6).all()
@@ -1,5 +1,6 @@
 from . import (
     utils,
+    random_utility,
     timeseries_extender,
     transform_units,
     log_utility,
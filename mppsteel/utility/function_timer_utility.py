@@ -1,7 +1,17 @@
 """Script to time key functions at runtime"""
 
+import json
+import multiprocessing.util
+import os
+import threading
 import time
-from typing import Union
+from typing import List, NamedTuple, Union
+
+import pandas as pd
+
+SPAN_TRACE_FILENAME = "span_trace.json"
+SPAN_SUMMARY_FILENAME = "span_summary.csv"
+SPAN_PATH_SEPARATOR = "/"
 
 
 def format_times(start_t: float, end_t: float, formatted: bool = True) -> str:
@@ -59,8 +69,234 @@ class TimeContainerClass:
 TIME_CONTAINER = TimeContainerClass()
 
 
+class SpanRecord(NamedTuple):
+    name: str
+    path: str
+    year: Union[int, None]
+    depth: int
+    start: float
+    duration: float
+    self_duration: float
+    thread_id: int
+
+
+class NullSpan:
+    """Context manager that does nothing, returned by a disabled SpanProfiler."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Span:
+    """Context manager that opens a span of a SpanProfiler on entry and closes it on exit."""
+
+    __slots__ = ("profiler", "name", "year")
+
+    def __init__(self, profiler: "SpanProfiler", name: str, year: Union[int, None]):
+        self.profiler = profiler
+        self.name = name
+        self.year = year
+
+    def __enter__(self):
+        self.profiler.start_span(self.name, self.year)
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self.profiler.end_span()
+        return False
+
+
+class SpanProfiler:
+    """Description
+    A profiler that records nested, named spans of wall-clock time (e.g. model year -> solver phase).
+
+    Important Points
+    1) Spans are opened with the `span` context manager (or the `timer_func` decorator). A span inherits the year of its parent span if it is not given one, so the phases of a model year are attributed to that year.
+    2) The profiler is disabled by default. A disabled profiler returns a shared NullSpan from `span` and does not record anything, so the spans can stay in the hot paths of the model.
+    3) Every closed span is stored as a SpanRecord, which can be exported as a Chrome trace (chrome://tracing or Perfetto) or summarised per span path and year.
+    4) Each thread has its own stack of open spans. Each process has its own profiler: the profilers of multiprocessing workers are started with `start_worker`, and write their spans to files suffixed with the process id when the worker exits.
+
+    Main Class Attributes
+        enabled: Flag for whether spans are recorded.
+        records: The SpanRecords of the closed spans, in the order they were closed.
+        worker_folder: The folder that the profilers of worker processes write their spans to.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.records: List[SpanRecord] = []
+        self.worker_folder: Union[str, None] = None
+        self.local = threading.local()
+        self.origin = time.perf_counter()
+
+    def __repr__(self):
+        return "Span Profiler"
+
+    def __str__(self):
+        return f"Span Profiler: {'Enabled' if self.enabled else 'Disabled'} | {len(self.records)} spans"
+
+    def enable(self, worker_folder: Union[str, None] = None) -> None:
+        self.enabled = True
+        if worker_folder is not None:
+            self.worker_folder = worker_folder
+
+    def start_worker(self, folder: str) -> None:
+        """Enables the profiler of a worker process. The spans recorded by the worker are written to `folder` (with the process id as a file suffix) when the worker exits.
+
+        Args:
+            folder (str): The folder to write the files to.
+        """
+        # forked workers inherit the records of the parent process
+        self.reset()
+        self.enable(folder)
+        multiprocessing.util.Finalize(
+            self,
+            self.export_spans,
+            args=(folder, f"_pid{os.getpid()}"),
+            exitpriority=20,
+        )
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        self.records = []
+        self.local = threading.local()
+        self.origin = time.perf_counter()
+
+    def return_open_spans(self) -> list:
+        if not hasattr(self.local, "open_spans"):
+            self.local.open_spans = []
+        return self.local.open_spans
+
+    def span(self, name: str, year: Union[int, None] = None) -> Union[Span, NullSpan]:
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, year)
+
+    def start_span(self, name: str, year: Union[int, None] = None) -> None:
+        open_spans = self.return_open_spans()
+        path = name
+        if open_spans:
+            parent = open_spans[-1]
+            path = f"{parent['path']}{SPAN_PATH_SEPARATOR}{name}"
+            year = parent["year"] if year is None else year
+        open_spans.append(
+            {
+                "name": name,
+                "path": path,
+                "year": year,
+                "start": time.perf_counter(),
+                "child_duration": 0.0,
+            }
+        )
+
+    def end_span(self) -> None:
+        end = time.perf_counter()
+        open_spans = self.return_open_spans()
+        span = open_spans.pop()
+        duration = end - span["start"]
+        if open_spans:
+            open_spans[-1]["child_duration"] += duration
+        self.records.append(
+            SpanRecord(
+                name=span["name"],
+                path=span["path"],
+                year=span["year"],
+                depth=len(open_spans),
+                start=span["start"] - self.origin,
+                duration=duration,
+                self_duration=duration - span["child_duration"],
+                thread_id=threading.get_ident(),
+            )
+        )
+
+    def return_chrome_trace(self) -> dict:
+        """Returns the recorded spans as complete ("X") events of the Chrome trace event format.
+
+        Returns:
+            dict: The Chrome trace, with times in microseconds.
+        """
+        process_id = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": record.name,
+                    "cat": record.path.split(SPAN_PATH_SEPARATOR)[0],
+                    "ph": "X",
+                    "ts": record.start * 1e6,
+                    "dur": record.duration * 1e6,
+                    "pid": process_id,
+                    "tid": record.thread_id,
+                    "args": {"path": record.path, "year": record.year},
+                }
+                for record in self.records
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def return_span_summary(self) -> pd.DataFrame:
+        """Summarises the recorded spans by span path and year.
+
+        Returns:
+            pd.DataFrame: A DataFrame with the number of calls, the total time, the time excluding child spans (self time) and the mean time of each span path and year.
+        """
+        summary_columns = ["path", "name", "year", "depth"]
+        if not self.records:
+            return pd.DataFrame(
+                columns=summary_columns
+                + ["calls", "total_seconds", "self_seconds", "mean_seconds"]
+            )
+        records_df = pd.DataFrame(self.records, columns=SpanRecord._fields)
+        records_df["year"] = records_df["year"].astype("Int64")
+        summary_df = (
+            records_df.groupby(summary_columns, dropna=False, sort=False)
+            .agg(
+                calls=("duration", "size"),
+                total_seconds=("duration", "sum"),
+                self_seconds=("self_duration", "sum"),
+            )
+            .reset_index()
+        )
+        summary_df["mean_seconds"] = (
+            summary_df["total_seconds"] / summary_df["calls"]
+        )
+        return summary_df
+
+    def export_spans(self, folder: str, file_suffix: str = "") -> None:
+        """Writes the recorded spans to a Chrome trace JSON file and a flat CSV summary in `folder`.
+
+        Args:
+            folder (str): The folder to write the files to.
+            file_suffix (str, optional): A suffix for the filenames (e.g. the process id of a worker). Defaults to "".
+        """
+        os.makedirs(folder, exist_ok=True)
+        trace_filepath, summary_filepath = [
+            os.path.join(folder, f"{stem}{file_suffix}{extension}")
+            for stem, extension in [
+                os.path.splitext(SPAN_TRACE_FILENAME),
+                os.path.splitext(SPAN_SUMMARY_FILENAME),
+            ]
+        ]
+        with open(trace_filepath, "w") as f:
+            json.dump(self.return_chrome_trace(), f)
+        self.return_span_summary().to_csv(summary_filepath, index=False)
+
+
+SPAN_PROFILER = SpanProfiler()
+
+
 def timer_func(func):
     """Decorater function that times a function that is passed to it using a TimeContainerClass object.
+    Each call is also recorded as a span of the SPAN_PROFILER, if it is enabled.
 
     Args:
         func: A function that you want to time.
@@ -68,7 +304,8 @@ def timer_func(func):
 
     def wrap_func(*args, **kwargs):
         starttime = time.time()
-        result = func(*args, **kwargs)
+        with SPAN_PROFILER.span(func.__name__):
+            result = func(*args, **kwargs)
         endtime = time.time()
         TIME_CONTAINER.update_time(func.__name__, starttime, endtime)
         return result
@@ -1,7 +1,7 @@
 """Utility library for managing location"""
 
 import itertools
-import random
+from typing import Union
 
 import pandas as pd
 import pycountry
@@ -9,6 +9,7 @@ from mppsteel.config.model_config import PKL_DATA_IMPORTS, MAIN_REGIONAL_SCHEMA
 
 from mppsteel.utility.log_utility import get_logger
 from mppsteel.utility.file_handling_utility import read_pickle_folder
+from mppsteel.utility.random_utility import RandomStreams, random_choice
 
 logger = get_logger(__name__)
 
@@ -138,7 +139,11 @@ def create_country_mapper(country_ref: pd.DataFrame, schema: str = "rmi") -> dic
 
 
 def pick_random_country_from_region(
-    country_df: pd.DataFrame, region: str, region_schema: str
+    country_df: pd.DataFrame,
+    region: str,
+    region_schema: str,
+    random_streams: Union[RandomStreams, None] = None,
+    stream_key: tuple = (),
 ) -> str:
     """Selects a random country from a country metadata dataframe based on a selected region_schema and region.
 
@@ -146,20 +151,29 @@ def pick_random_country_from_region(
         country_df (pd.DataFrame): The Country Metadata DataFrame.
         region (str): The region to select a random country from. Must exist in the region schema.
         region_schema (str): The schema of the region to select a random country from.
+        random_streams (Union[RandomStreams, None], optional): The random streams to pick the country with. The global `random` module is used if None. Defaults to None.
+        stream_key (tuple, optional): The keys of the stream within `random_streams`. Defaults to ().
 
     Returns:
         str: The random country choice from a list.
     """
     country_list = get_countries_from_group(country_df, region_schema, region)
-    return random.choice(country_list)
+    return random_choice(country_list, random_streams, stream_key)
 
 
-def pick_random_country_from_region_subset(plant_df: pd.DataFrame, region: str) -> str:
+def pick_random_country_from_region_subset(
+    plant_df: pd.DataFrame,
+    region: str,
+    random_streams: Union[RandomStreams, None] = None,
+    stream_key: tuple = (),
+) -> str:
     """Picks a random country from a list of countries present in a Plant DataFrame for a specified region.
 
     Args:
         plant_df (pd.DataFrame): The plant_df containing the region and country metadata.
         region (str): The region to select a random country from. Must exist in the plant_df
+        random_streams (Union[RandomStreams, None], optional): The random streams to pick the country with. The global `random` module is used if None. Defaults to None.
+        stream_key (tuple, optional): The keys of the stream within `random_streams`. Defaults to ().
 
     Returns:
         str: The random country choice from a list.
@@ -167,4 +181,4 @@ def pick_random_country_from_region_subset(plant_df: pd.DataFrame, region: str)
     country_list = plant_df[plant_df[MAIN_REGIONAL_SCHEMA] == region][
         "country_code"
     ].unique()
-    return random.choice(country_list)
+    return random_choice(country_list, random_streams, stream_key)
@@ -1,19 +1,50 @@
 """Utility Script for logger"""
 
+import atexit
 import logging
+import multiprocessing.util
 import os
+import queue
+import re
 import sys
+import threading
 
 from pathlib import Path
+from typing import Set, Union
 
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 
-from mppsteel.config.model_config import DATETIME_FORMAT, LOG_PATH
+from mppsteel.config.model_config import (
+    BATCH_RUN_LOG_LEVEL,
+    DATETIME_FORMAT,
+    LOG_LEVEL,
+    LOG_PATH,
+)
 
 LOG_FORMATTER = logging.Formatter(
     "%(asctime)s — %(name)s — %(levelname)s — %(message)s"
 )
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+
+def return_log_level(level: Union[str, int]) -> int:
+    """Converts a log level name (e.g. `WARNING`) to its logging level number.
+
+    Args:
+        level (Union[str, int]): The log level name or number.
+
+    Raises:
+        ValueError: If the log level name is not in LOG_LEVELS.
+
+    Returns:
+        int: The logging level number.
+    """
+    if isinstance(level, int):
+        return level
+    if str(level).upper() not in LOG_LEVELS:
+        raise ValueError(f"Invalid log level {level}, please choose from {LOG_LEVELS}")
+    return logging.getLevelName(str(level).upper())
 
 
 def get_console_handler() -> logging.StreamHandler:
@@ -27,9 +58,12 @@ def get_console_handler() -> logging.StreamHandler:
     return console_handler
 
 
-def get_file_handler() -> TimedRotatingFileHandler:
+def get_file_handler(file_suffix: str = "") -> TimedRotatingFileHandler:
     """Formats the log for file output.
 
+    Args:
+        file_suffix (str, optional): A suffix for the log filename (e.g. the name of the run or worker). Defaults to "".
+
     Returns:
         [type]: A formatted file handler.
     """
@@ -39,30 +73,182 @@ def get_file_handler() -> TimedRotatingFileHandler:
             os.mkdir(LOG_PATH)
         except OSError as error:
             print(error)
-    log_filepath = f"{LOG_PATH}/mppsteel_{today_time}.log"
-    file_handler = TimedRotatingFileHandler(log_filepath, when="midnight")
+    log_filepath = f"{LOG_PATH}/mppsteel_{today_time}{file_suffix}.log"
+    file_handler = TimedRotatingFileHandler(log_filepath, when="midnight", delay=True)
     file_handler.setFormatter(LOG_FORMATTER)
     return file_handler
 
 
-def get_logger(logger_name: str, create_logfile: bool = True) -> logging.Logger:
-    """Creates a log object that can be outputted to file or console output.
+class ProcessQueueHandler(QueueHandler):
+    """A QueueHandler that puts log records on the queue of the current process of a LogPipeline."""
+
+    def __init__(self, log_pipeline: "LogPipeline"):
+        super().__init__(None)
+        self.log_pipeline = log_pipeline
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # the message is merged with its arguments now, the rest of the formatting is left to the listener
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.log_pipeline.return_queue().put_nowait(record)
+
+
+class LogPipeline:
+    """Description
+    The logging subsystem of a process, which writes the records of all the model's loggers through one queue.
+
+    Important Points
+    1) Every logger created with `get_logger` shares the same ProcessQueueHandler, which puts the log records on the queue of the process. A QueueListener thread writes the records to the console and to the log file of the run, so the model does not wait for console or file I/O.
+    2) The listener is started by the first record of a process. Worker processes start their own queue, listener and log file (named after the run and the process id), and can be set to a quieter level with `configure_worker_logging`.
+    3) `set_log_run_name` is called at the start of each model run, so the records of each run (in the main process or a worker) are written to their own log file.
+    4) The level of the pipeline is set on every logger, so records below it are not created. Messages with %-style arguments (e.g. `logger.info("Year %s", year)`) are only formatted if they are recorded.
+    5) The listener is stopped, and its queue flushed, when the process exits or the pipeline is reconfigured.
+
+    Main Class Attributes
+        level: The logging level of the loggers.
+        batch_level: The logging level of the worker processes of batch runs.
+        run_name: The name of the run, added to the log filename.
+        create_logfile: Flag for whether the records are written to a log file as well as the console.
+        logger_names: The names of the loggers that use the pipeline.
+    """
+
+    def __init__(
+        self,
+        level: Union[str, int] = LOG_LEVEL,
+        batch_level: Union[str, int] = BATCH_RUN_LOG_LEVEL,
+        run_name: str = "",
+        create_logfile: bool = True,
+    ):
+        self.level = return_log_level(level)
+        self.batch_level = return_log_level(batch_level)
+        self.run_name = run_name
+        self.create_logfile = create_logfile
+        self.logger_names: Set[str] = set()
+        self.queue_handler = ProcessQueueHandler(self)
+        self.queue: Union[queue.SimpleQueue, None] = None
+        self.listener: Union[QueueListener, None] = None
+        self.process_id: Union[int, None] = None
+        self.exit_process_ids: Set[int] = set()
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return "Log Pipeline"
+
+    def __str__(self):
+        return f"Log Pipeline: {logging.getLevelName(self.level)} | Run {self.run_name} | {len(self.logger_names)} loggers"
+
+    def register_logger(self, generic_logger: logging.Logger) -> logging.Logger:
+        if self.queue_handler not in generic_logger.handlers:
+            generic_logger.addHandler(self.queue_handler)
+        generic_logger.setLevel(self.level)
+        generic_logger.propagate = (
+            False  # rarely necessary to propagate the error up to parent
+        )
+        self.logger_names.add(generic_logger.name)
+        return generic_logger
+
+    def return_file_suffix(self) -> str:
+        file_suffix = f"_{self.run_name}" if self.run_name else ""
+        if multiprocessing.parent_process() is not None:
+            file_suffix = f"{file_suffix}_pid{os.getpid()}"
+        return file_suffix
+
+    def return_queue(self) -> queue.SimpleQueue:
+        if self.process_id != os.getpid():
+            with self.lock:
+                if self.process_id != os.getpid():
+                    self.start()
+        return self.queue
+
+    def start(self) -> None:
+        handlers = [get_console_handler()]
+        if self.create_logfile:
+            handlers.append(get_file_handler(self.return_file_suffix()))
+        self.queue = queue.SimpleQueue()
+        self.listener = QueueListener(self.queue, *handlers)
+        self.listener.start()
+        self.process_id = os.getpid()
+        if self.process_id not in self.exit_process_ids:
+            if multiprocessing.parent_process() is None:
+                atexit.register(self.stop)
+            else:
+                # worker processes exit without running the atexit functions
+                multiprocessing.util.Finalize(self, self.stop, exitpriority=10)
+            self.exit_process_ids.add(self.process_id)
+
+    def stop(self) -> None:
+        if (self.listener is not None) and (self.process_id == os.getpid()):
+            self.listener.stop()
+            for handler in self.listener.handlers:
+                handler.close()
+        self.listener = None
+        self.process_id = None
+
+    def configure(
+        self,
+        level: Union[str, int, None] = None,
+        batch_level: Union[str, int, None] = None,
+        run_name: Union[str, None] = None,
+        create_logfile: Union[bool, None] = None,
+    ) -> None:
+        """Changes the settings of the pipeline. The records after the change are written by a new listener (and log file) if the run name or log file setting changed.
+
+        Args:
+            level (Union[str, int, None], optional): The new logging level. Unchanged if None. Defaults to None.
+            batch_level (Union[str, int, None], optional): The new logging level of the worker processes of batch runs. Unchanged if None. Defaults to None.
+            run_name (Union[str, None], optional): The new run name. Unchanged if None. Defaults to None.
+            create_logfile (Union[bool, None], optional): The new log file setting. Unchanged if None. Defaults to None.
+        """
+        if level is not None:
+            self.level = return_log_level(level)
+            for logger_name in self.logger_names:
+                logging.getLogger(logger_name).setLevel(self.level)
+        if batch_level is not None:
+            self.batch_level = return_log_level(batch_level)
+        if ((run_name is not None) and (run_name != self.run_name)) or (
+            (create_logfile is not None) and (create_logfile != self.create_logfile)
+        ):
+            with self.lock:
+                self.stop()
+                self.run_name = self.run_name if run_name is None else run_name
+                self.create_logfile = (
+                    self.create_logfile if create_logfile is None else create_logfile
+                )
+
+
+LOG_PIPELINE = LogPipeline()
+
+
+def configure_worker_logging(level: Union[str, int] = BATCH_RUN_LOG_LEVEL) -> None:
+    """Sets the logging level of a worker process of a batch run. Called by the initializer of multiprocessing pools.
+
+    Args:
+        level (Union[str, int], optional): The logging level of the worker. Defaults to BATCH_RUN_LOG_LEVEL.
+    """
+    LOG_PIPELINE.configure(level=level)
+
+
+def set_log_run_name(scenario_name: str, model_run: str = "") -> None:
+    """Writes the following records of the process to the log file of a model run, named after the scenario and the run. Called at the start of the model runs (including the runs of worker processes).
+
+    Args:
+        scenario_name (str): The name of the scenario.
+        model_run (str, optional): The run of the scenario. Defaults to "".
+    """
+    run_name = f"{scenario_name}_run{model_run}" if model_run else scenario_name
+    LOG_PIPELINE.configure(run_name=re.sub(r"[^\w\-]", "_", run_name))
+
+
+def get_logger(logger_name: str) -> logging.Logger:
+    """Creates a log object whose records are written to the console and the log file of the run by the process's LogPipeline.
 
     Args:
         logger_name (str): Defines the name of the log based on the user input.
-        create_logfile (bool, optional): Determines whether to create a logfile. Defaults to False.
 
     Returns:
         logging.Logger: A logger that can used to log runtime code.
     """
-    generic_logger = logging.getLogger(logger_name)
-    generic_logger.setLevel(
-        logging.DEBUG
-    )  # better to have too much log than not enough
-    generic_logger.addHandler(get_console_handler())
-    if create_logfile:
-        generic_logger.addHandler(get_file_handler())
-    generic_logger.propagate = (
-        False  # rarely necessary to propagate the error up to parent
-    )
-    return generic_logger
+    return LOG_PIPELINE.register_logger(logging.getLogger(logger_name))
@@ -0,0 +1,124 @@
+"""Seeded, hierarchical random number streams for the model"""
+
+import random
+import zlib
+from typing import Hashable, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from mppsteel.config.model_config import MODEL_RANDOM_SEED
+
+
+def return_stream_key(key: Hashable) -> int:
+    """Converts a stream key to a non-negative integer that does not depend on the interpreter's hash seed.
+
+    Args:
+        key (Hashable): An integer, boolean or string key.
+
+    Returns:
+        int: The integer stream key.
+    """
+    if isinstance(key, (bool, np.bool_)):
+        return int(key)
+    if isinstance(key, (int, np.integer)):
+        return int(key) if key >= 0 else zlib.crc32(str(key).encode())
+    return zlib.crc32(str(key).encode())
+
+
+class RandomStreams:
+    """Description
+    Seeded random number service that derives independent random streams from a run seed and a hierarchy of keys (e.g. run -> year -> plant).
+
+    Important Points
+    1) A stream only depends on the seed and its keys, not on the order in which streams are requested. So solvers that process the plants of a year in a different order (or in parallel) make the same random choices as the sequential solver.
+    2) `child` returns the streams of a level of the hierarchy (e.g. `random_streams.child(year)`), and `generator` returns a NumPy Generator for a set of keys below that level (e.g. `year_streams.generator("best_tech", plant_name)`).
+    3) The streams are created lazily, so keys can be passed around cheaply and a generator is only created when a random choice is needed.
+
+    Main Class Attributes
+        seed: The seed of the run.
+        keys: The keys of the level of the hierarchy.
+    """
+
+    def __init__(self, seed: int = MODEL_RANDOM_SEED, keys: Tuple = ()):
+        self.seed = int(seed)
+        self.keys = tuple(keys)
+
+    def __repr__(self):
+        return "Random Streams"
+
+    def __str__(self):
+        return f"Random Streams: Seed {self.seed} | Keys {self.keys}"
+
+    def child(self, *keys: Hashable) -> "RandomStreams":
+        return RandomStreams(self.seed, self.keys + keys)
+
+    def generator(self, *keys: Hashable) -> np.random.Generator:
+        seed_sequence = np.random.SeedSequence(
+            self.seed,
+            spawn_key=tuple(return_stream_key(key) for key in self.keys + keys),
+        )
+        return np.random.Generator(np.random.PCG64(seed_sequence))
+
+    def choice(self, options: Sequence, *keys: Hashable):
+        return options[int(self.generator(*keys).integers(len(options)))]
+
+    def randrange(self, start: int, stop: int, *keys: Hashable) -> int:
+        return int(self.generator(*keys).integers(start, stop))
+
+    def shuffle_df(self, df: pd.DataFrame, *keys: Hashable) -> pd.DataFrame:
+        return df.sample(frac=1, random_state=self.generator(*keys))
+
+
+def return_scenario_random_streams(scenario_dict: dict) -> RandomStreams:
+    """Returns the random streams of a scenario, seeded with its `random_seed` setting (or `MODEL_RANDOM_SEED` if it has none).
+
+    Args:
+        scenario_dict (dict): The scenario settings.
+
+    Returns:
+        RandomStreams: The random streams of the scenario.
+    """
+    return RandomStreams(scenario_dict.get("random_seed", MODEL_RANDOM_SEED))
+
+
+def random_choice(
+    options: Sequence,
+    random_streams: Union[RandomStreams, None] = None,
+    stream_key: Tuple = (),
+):
+    """Picks a random option from the stream of `stream_key`, or from the global `random` module if there are no random streams.
+
+    Args:
+        options (Sequence): The options to choose from.
+        random_streams (Union[RandomStreams, None], optional): The random streams to use. Defaults to None.
+        stream_key (Tuple, optional): The keys of the stream within `random_streams`. Defaults to ().
+
+    Returns:
+        The random option.
+    """
+    if random_streams is None:
+        return random.choice(options)
+    return random_streams.choice(options, *stream_key)
+
+
+def random_range(
+    start: int,
+    stop: int,
+    random_streams: Union[RandomStreams, None] = None,
+    stream_key: Tuple = (),
+) -> int:
+    """Picks a random integer in [`start`, `stop`) from the stream of `stream_key`, or from the global `random` module if there are no random streams.
+
+    Args:
+        start (int): The lowest integer.
+        stop (int): The integer above the highest integer.
+        random_streams (Union[RandomStreams, None], optional): The random streams to use. Defaults to None.
+        stream_key (Tuple, optional): The keys of the stream within `random_streams`. Defaults to ().
+
+    Returns:
+        int: The random integer.
+    """
+    if random_streams is None:
+        return random.randrange(start, stop, 1)
+    return random_streams.randrange(start, stop, *stream_key)
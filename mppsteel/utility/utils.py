@@ -12,6 +12,7 @@ from typing import Any, List, Sequence, Sized, Union
 
 from currency_converter import CurrencyConverter
 from mppsteel.config.model_config import NUMBER_OF_TECHNOLOGIES_PER_BIN_GROUP
+from mppsteel.utility.random_utility import RandomStreams
 
 from mppsteel.utility.log_utility import get_logger
 
@@ -67,10 +68,14 @@ def stdout_query(
         choice = input().lower()
         if choice == "":
             return default
-        elif choice in options:
-            return choice
+        elif isinstance(options, range):
+            if choice.isdigit() and (int(choice) in options):
+                return int(choice)
         else:
-            sys.stdout.write(f"Please respond with a choice from {options}.\n")
+            for option in options:
+                if choice == str(option).lower():
+                    return option
+        sys.stdout.write(f"Please respond with a choice from {options}.\n")
 
 
 def get_currency_rate(base: str, target: str) -> float:
@@ -293,17 +298,28 @@ def get_intersection_of_ordered_list(
 
 
 def generate_random_string_with_prefix(
-    prefix: str = "MPP", chars: str = string.digits, n: int = 5
+    prefix: str = "MPP",
+    chars: str = string.digits,
+    n: int = 5,
+    random_streams: Union[RandomStreams, None] = None,
+    stream_key: tuple = (),
 ) -> str:
     """Generates a unique ID with an "MPP" prefix from the collection of characters.
 
     Args:
         chars (str, optional): The characters to select at random from. Defaults to string.digits.
         n (int, optional): The number of characters in the random part of the ID. Defaults to 5.
+        random_streams (Union[RandomStreams, None], optional): The random streams to draw the characters from. The global `random` module is used if None. Defaults to None.
+        stream_key (tuple, optional): The keys of the stream within `random_streams`. Defaults to ().
 
     Returns:
         str: A randomised plant ID.
     """
+    if random_streams is not None:
+        char_positions = random_streams.generator(*stream_key).integers(
+            len(chars), size=n
+        )
+        return f"{prefix}" + "".join(chars[position] for position in char_positions)
     return f"{prefix}" + "".join(random.choice(chars) for _ in range(n))
 
 
@@ -0,0 +1,78 @@
+"""Tests for the span profiler"""
+
+import json
+import multiprocessing as mp
+
+from mppsteel.multi_run_module.multiprocessing_functions import initialize_worker
+from mppsteel.utility.function_timer_utility import (
+    NULL_SPAN,
+    SPAN_PROFILER,
+    SPAN_SUMMARY_FILENAME,
+    SPAN_TRACE_FILENAME,
+    SpanProfiler,
+)
+
+
+def create_profiler_with_spans() -> SpanProfiler:
+    profiler = SpanProfiler()
+    profiler.enable()
+    for year in [2030, 2031]:
+        with profiler.span("year", year=year):
+            with profiler.span("open_close"):
+                with profiler.span("trade_flow"):
+                    pass
+            for _ in range(3):
+                with profiler.span("main_cycle_decisions"):
+                    pass
+    return profiler
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = SpanProfiler()
+    assert profiler.span("year", year=2030) is NULL_SPAN
+    with profiler.span("year", year=2030):
+        pass
+    assert profiler.records == []
+
+
+def test_spans_are_nested_and_attributed_to_years():
+    profiler = create_profiler_with_spans()
+    summary = profiler.return_span_summary().set_index(["path", "year"])
+    assert summary.loc[("year/main_cycle_decisions", 2031), "calls"] == 3
+    assert summary.loc[("year/open_close/trade_flow", 2030), "depth"] == 2
+    year_row = summary.loc[("year", 2030)]
+    assert year_row["self_seconds"] <= year_row["total_seconds"]
+    assert profiler.return_open_spans() == []
+
+
+def test_export_spans(tmp_path):
+    profiler = create_profiler_with_spans()
+    profiler.export_spans(str(tmp_path))
+    with open(tmp_path / SPAN_TRACE_FILENAME) as f:
+        trace = json.load(f)
+    assert len(trace["traceEvents"]) == len(profiler.records) == 12
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+    assert (tmp_path / SPAN_SUMMARY_FILENAME).exists()
+
+
+def record_worker_span(year: int) -> None:
+    with SPAN_PROFILER.span("year", year=year):
+        pass
+
+
+def test_worker_processes_export_their_spans(tmp_path):
+    pool = mp.Pool(
+        processes=2, initializer=initialize_worker, initargs=("WARNING", str(tmp_path))
+    )
+    pool.map(record_worker_span, range(2030, 2036))
+    pool.close()
+    pool.join()
+    trace_files = sorted(tmp_path.glob("span_trace_pid*.json"))
+    assert trace_files
+    assert len(list(tmp_path.glob("span_summary_pid*.csv"))) == len(trace_files)
+    span_count = 0
+    for trace_file in trace_files:
+        with open(trace_file) as f:
+            span_count += len(json.load(f)["traceEvents"])
+    assert span_count == 6
+    assert not SPAN_PROFILER.enabled
@@ -0,0 +1,71 @@
+"""Tests for the logging pipeline"""
+
+import logging
+import os
+import queue
+
+import pytest
+
+from mppsteel.utility.log_utility import (
+    LOG_PIPELINE,
+    LogPipeline,
+    ProcessQueueHandler,
+    return_log_level,
+    set_log_run_name,
+)
+
+
+def test_loggers_share_the_pipeline_handler():
+    pipeline = LogPipeline(level="INFO", create_logfile=False)
+    loggers = [
+        pipeline.register_logger(logging.getLogger(f"log_pipeline_test_{idx}"))
+        for idx in range(2)
+    ]
+    assert all(pipeline.queue_handler in logger.handlers for logger in loggers)
+    assert all(not logger.propagate for logger in loggers)
+    pipeline.configure(level="WARNING", batch_level="ERROR")
+    assert all(logger.level == logging.WARNING for logger in loggers)
+    assert not loggers[0].isEnabledFor(logging.INFO)
+    assert pipeline.batch_level == logging.ERROR
+
+
+def test_records_reach_the_queue_with_formatted_messages():
+    pipeline = LogPipeline(level="INFO", create_logfile=False)
+    logger = pipeline.register_logger(logging.getLogger("log_pipeline_test_queue"))
+    # a queue without a listener, so that the records stay on it
+    pipeline.queue = queue.SimpleQueue()
+    pipeline.process_id = os.getpid()
+    logger.info("Year %s | Capacity % .2f", 2030, 1.234)
+    logger.debug("Not recorded %s", 2030)
+    assert pipeline.return_queue().qsize() == 1
+    record = pipeline.return_queue().get_nowait()
+    assert record.msg == "Year 2030 | Capacity  1.23"
+    assert record.args is None
+
+
+def test_process_queue_handler_merges_message_arguments():
+    handler = ProcessQueueHandler(LogPipeline(create_logfile=False))
+    record = logging.LogRecord(
+        "test", logging.INFO, __file__, 1, "%s plants in %s", (3, 2030), None
+    )
+    prepared = handler.prepare(record)
+    assert prepared.getMessage() == "3 plants in 2030"
+    assert prepared.args is None
+
+
+def test_return_log_level():
+    assert return_log_level("warning") == logging.WARNING
+    assert return_log_level(logging.DEBUG) == logging.DEBUG
+    with pytest.raises(ValueError):
+        return_log_level("LOUD")
+
+
+def test_set_log_run_name_names_the_log_file_after_the_run():
+    previous_run_name = LOG_PIPELINE.run_name
+    try:
+        set_log_run_name("baseline high", "3")
+        assert LOG_PIPELINE.run_name == "baseline_high_run3"
+        assert LOG_PIPELINE.listener is None
+        assert LOG_PIPELINE.return_file_suffix() == "_baseline_high_run3"
+    finally:
+        LOG_PIPELINE.configure(run_name=previous_run_name)
@@ -0,0 +1,36 @@
+"""Tests for the random streams of the model"""
+
+import pandas as pd
+
+from mppsteel.utility.random_utility import RandomStreams
+
+PLANT_NAMES = [f"plant_{idx}" for idx in range(20)]
+TECHNOLOGIES = ["Avg BF-BOF", "BAT BF-BOF", "DRI-EAF", "EAF"]
+
+
+def test_streams_are_reproducible_and_independent_of_call_order():
+    year_streams = RandomStreams(seed=3).child(2030)
+    forward = {
+        plant_name: year_streams.choice(TECHNOLOGIES, "best_tech", plant_name)
+        for plant_name in PLANT_NAMES
+    }
+    year_streams = RandomStreams(seed=3).child(2030)
+    backward = {
+        plant_name: year_streams.choice(TECHNOLOGIES, "best_tech", plant_name)
+        for plant_name in reversed(PLANT_NAMES)
+    }
+    assert forward == backward
+    assert RandomStreams(seed=3).child(2030).generator("best_tech").integers(
+        1000
+    ) == RandomStreams(seed=3).generator(2030, "best_tech").integers(1000)
+
+
+def test_streams_differ_by_seed_and_key():
+    df = pd.DataFrame({"plant_name": PLANT_NAMES})
+    shuffled = RandomStreams(seed=3).shuffle_df(df, "switchers")
+    assert shuffled.equals(RandomStreams(seed=3).shuffle_df(df, "switchers"))
+    assert not shuffled.equals(RandomStreams(seed=4).shuffle_df(df, "switchers"))
+    assert not shuffled.equals(
+        RandomStreams(seed=3).shuffle_df(df, "primary_switchers")
+    )
+    assert sorted(shuffled["plant_name"]) == sorted(PLANT_NAMES)